@@ -7,10 +7,17 @@ __date__ = "2026-07-24"
 
 from .address import EURID, BaseAddress, BroadcastAddress, SenderAddress
 from .device import Device
-from .eep import DEVICE_TYPES, EEP_SPECIFICATIONS, DeviceType, device_type_for_eep
+from .eep import (
+    DEVICE_TYPES,
+    EEP_SPECIFICATIONS,
+    DeviceType,
+    device_type_for_eep,
+    register_definitions,
+)
 from .eep.id import EEP
 from .eep.manufacturer import Manufacturer
 from .gateway import DeviceTaughtInCallback, Gateway
+from .polling import PollJob, PollScheduler
 from .semantics.device_spec import DeviceSpec
 from .semantics.entity import (
     BoolOption,
@@ -52,6 +59,8 @@ __all__ = [
     # Gateway
     "Gateway",
     "DeviceTaughtInCallback",
+    "PollJob",
+    "PollScheduler",
     # Addresses
     "BaseAddress",
     "BroadcastAddress",
@@ -63,6 +72,7 @@ __all__ = [
     "DeviceType",
     "DEVICE_TYPES",
     "device_type_for_eep",
+    "register_definitions",
     "Entity",
     "EntityCategory",
     "EntityType",
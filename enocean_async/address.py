@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Self
+
 type SenderAddress = EURID | BaseAddress
 """Addresses that can be used as the sender of a telegram. This includes both EURIDs (device addresses) and Base IDs, hence ranges from 00:00:00:00 to FF:FF:FF:FE."""
 
@@ -5,6 +8,8 @@ type SenderAddress = EURID | BaseAddress
 class Address:
     """EnOcean four byte (32 bit) address to identify devices, usually denoted as a colon-separated string (e.g., 00:00:00:00)."""
 
+    __slots__ = ("_address",)
+
     def __init__(self, value: int | str | bytes | bytearray | list[int]) -> None:
         """Create an address from an integer, a colon-separated hex string (e.g. ``"AB:CD:EF:01"``), or a 4-byte sequence."""
         if isinstance(value, (bytes, bytearray, list)):
@@ -28,6 +33,16 @@ class Address:
             )
         self._address = value
 
+    @classmethod
+    def _trusted(cls, value: int) -> Self:
+        """Create an address from an integer that is already known to be in the range of ``cls``, skipping all validation.
+
+        Intended for wire data that has been range-checked by the caller; use :func:`sender_address` to get interned instances.
+        """
+        address = object.__new__(cls)
+        address._address = value
+        return address
+
     @property
     def is_eurid(self) -> bool:
         """Return ``True`` if this address is in the EURID range (00:00:00:00–FF:7F:FF:FF)."""
@@ -67,10 +82,10 @@ class Address:
         return self._address
 
     def __eq__(self, other: object) -> bool:
-        """Compare by integer value, regardless of subclass."""
-        if not isinstance(other, Address):
-            return NotImplemented
-        return int(self) == int(other)
+        """Compare by integer value, regardless of subclass; addresses never compare equal to other types (use ``int(address)`` to compare with integers)."""
+        if isinstance(other, Address):
+            return self._address == other._address
+        return NotImplemented
 
     def __repr__(self) -> str:
         """Colon-separated hex string representation (e.g. ``"AB:CD:EF:01"``)."""
@@ -80,6 +95,8 @@ class Address:
 class EURID(Address):
     """Representation of an EnOcean device address (EnOcean Unique Radio Identifier / EURID) - range ``00:00:00:00`` to ``FF:7F:FF:FF``."""
 
+    __slots__ = ()
+
     def __init__(self, value: int | str | bytes | bytearray | list[int]) -> None:
         """Create a EURID; raises ``ValueError`` if the value is outside the EURID range."""
         super().__init__(value)
@@ -92,6 +109,8 @@ class EURID(Address):
 class BaseAddress(Address):
     """Representation of an EnOcean base address - range ``FF:80:00:00`` to ``FF:FF:FF:FE``."""
 
+    __slots__ = ()
+
     def __init__(self, value: int | str | bytes | bytearray | list[int]) -> None:
         """Create a BaseAddress; raises ``ValueError`` if the value is outside the base address range."""
         super().__init__(value)
@@ -104,6 +123,28 @@ class BaseAddress(Address):
 class BroadcastAddress(Address):
     """Representation of the EnOcean broadcast address (FF:FF:FF:FF)."""
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Create the broadcast address (FF:FF:FF:FF)."""
         super().__init__(0xFFFFFFFF)
+
+
+@lru_cache(maxsize=4096)
+def sender_address(value: int) -> EURID | BaseAddress:
+    """Return the canonical (interned) sender address for a 32-bit integer, e.g. from received wire data.
+
+    Repeated calls with the same value return the same instance; validation is done once per distinct value.
+
+    Raises:
+        ValueError: If the value is the broadcast address or out of the 32-bit range.
+    """
+    if 0 <= value <= 0xFF7FFFFF:
+        return EURID._trusted(value)
+    if 0xFF800000 <= value <= 0xFFFFFFFE:
+        return BaseAddress._trusted(value)
+    raise ValueError(f"Not a sender address: {value:08X}.")
+
+
+BROADCAST: BroadcastAddress = BroadcastAddress()
+"""Shared instance of the broadcast address."""
@@ -0,0 +1,156 @@
+"""Bounded table of unknown senders heard on air, with traffic statistics (RF census)."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import time
+
+from .address import SenderAddress
+from .protocol.erp1.rorg import RORG
+from .protocol.erp1.telegram import ERP1Telegram
+
+
+@dataclass
+class CensusEntry:
+    """Traffic statistics of one unknown sender."""
+
+    address: SenderAddress
+    rorg: RORG
+    """RORG of the most recent telegram."""
+
+    data_length: int
+    """Telegram data length (bytes, without RORG, sender and status) of the most recent telegram."""
+
+    first_seen: float
+    """Timestamp (seconds since the epoch) of the first telegram."""
+
+    last_seen: float
+    """Timestamp (seconds since the epoch) of the most recent telegram."""
+
+    telegrams: int = 0
+    learn_telegrams: int = 0
+    """Number of telegrams with the learn bit set (teach-in telegrams of 1BS/4BS senders, UTE telegrams)."""
+
+    rssi_min: int | None = None
+    """Strongest RSSI seen (as reported by the module, i.e. -dBm; lower is stronger)."""
+
+    rssi_max: int | None = None
+    """Weakest RSSI seen."""
+
+    rssi_total: int = 0
+    rssi_samples: int = 0
+
+    @property
+    def rssi_mean(self) -> float | None:
+        return self.rssi_total / self.rssi_samples if self.rssi_samples else None
+
+    @property
+    def rate(self) -> float | None:
+        """Average telegrams per hour between the first and the most recent telegram; None until two telegrams have been seen."""
+        span = self.last_seen - self.first_seen
+        if self.telegrams < 2 or span <= 0:
+            return None
+        return (self.telegrams - 1) * 3600 / span
+
+
+class SenderCensus:
+    """Least recently heard senders are evicted once ``max_senders`` is reached.
+
+    Recording a telegram is a dict lookup plus an ``OrderedDict.move_to_end``;
+    memory is bounded by ``max_senders`` entries.
+    """
+
+    def __init__(self, max_senders: int = 1024) -> None:
+        self.max_senders: int = max_senders
+        """Maximum number of senders kept; the least recently heard sender is evicted first."""
+
+        self.__entries: OrderedDict[int, CensusEntry] = OrderedDict()
+        self.__evictions: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, address: object) -> bool:
+        return int(address) in self.__entries
+
+    @property
+    def evictions(self) -> int:
+        """Number of senders evicted because the table was full."""
+        return self.__evictions
+
+    def record(self, telegram: ERP1Telegram) -> bool:
+        """Record a telegram of an unknown sender; returns True if the sender was not in the table."""
+        now = time.time()
+        key = telegram.sender_int
+        entry = self.__entries.get(key)
+        new = entry is None
+        if new:
+            entry = self.__entries[key] = CensusEntry(
+                address=telegram.sender,
+                rorg=telegram.rorg,
+                data_length=len(telegram.telegram_data),
+                first_seen=now,
+                last_seen=now,
+            )
+            while len(self.__entries) > self.max_senders:
+                self.__entries.popitem(last=False)
+                self.__evictions += 1
+        else:
+            self.__entries.move_to_end(key)
+            entry.rorg = telegram.rorg
+            entry.data_length = len(telegram.telegram_data)
+            entry.last_seen = now
+
+        entry.telegrams += 1
+        if telegram.rorg == RORG.RORG_UTE or telegram.is_learning_telegram:
+            entry.learn_telegrams += 1
+        rssi = telegram.rssi
+        if rssi is not None:
+            entry.rssi_total += rssi
+            entry.rssi_samples += 1
+            if entry.rssi_min is None or rssi < entry.rssi_min:
+                entry.rssi_min = rssi
+            if entry.rssi_max is None or rssi > entry.rssi_max:
+                entry.rssi_max = rssi
+        return new
+
+    def get(self, address: SenderAddress | int) -> CensusEntry | None:
+        """Statistics of a sender, or None if it is not in the table."""
+        return self.__entries.get(int(address))
+
+    def forget(self, address: SenderAddress | int) -> None:
+        """Remove a sender, e.g. once it has been registered as device."""
+        self.__entries.pop(int(address), None)
+
+    def entries(
+        self,
+        *,
+        rorg: RORG | None = None,
+        learning: bool = False,
+        min_telegrams: int = 1,
+        max_rssi: int | None = None,
+        since: float | None = None,
+    ) -> list[CensusEntry]:
+        """Senders matching all given filters, most recently heard first.
+
+        Args:
+            rorg: Only senders whose most recent telegram had this RORG.
+            learning: Only senders that sent at least one teach-in telegram.
+            min_telegrams: Only senders with at least this many telegrams.
+            max_rssi: Only senders whose strongest RSSI is at most this value (i.e. at least this strong).
+            since: Only senders heard at or after this timestamp (seconds since the epoch).
+        """
+        result = []
+        for entry in reversed(self.__entries.values()):
+            if since is not None and entry.last_seen < since:
+                break  # ordered by last_seen
+            if (
+                entry.telegrams >= min_telegrams
+                and (rorg is None or entry.rorg == rorg)
+                and (not learning or entry.learn_telegrams > 0)
+                and (
+                    max_rssi is None
+                    or (entry.rssi_min is not None and entry.rssi_min <= max_rssi)
+                )
+            ):
+                result.append(entry)
+        return result
@@ -0,0 +1,90 @@
+"""Time-bounded caches used to drop duplicate ERP1 telegrams (repeater echoes and repeated copies)."""
+
+from collections import deque
+import time
+
+from .metrics import CacheStats
+
+
+class FingerprintCache[T]:
+    """Set of telegram fingerprints that expire ``ttl`` seconds after they were added, each with an optional value.
+
+    Lookups are a single dict access. Entries are also kept in insertion order in a
+    deque, so expired and excess entries are removed from its left end as new
+    fingerprints are added (amortized O(1) per telegram, independent of ``max_size``).
+    Adding a fingerprint again refreshes it (its older deque entries become stale and
+    are skipped); at most the ``max_size`` most recently added or refreshed
+    fingerprints are kept.
+    """
+
+    def __init__(self, ttl: float = 2.0, max_size: int = 64) -> None:
+        self.ttl: float = ttl
+        """Seconds after which a fingerprint is no longer considered a duplicate."""
+
+        self.max_size: int = max_size
+        """Maximum number of fingerprints kept; the oldest are evicted first."""
+
+        self.__added: dict[bytes, tuple[float, T | None]] = {}
+        self.__order: deque[tuple[bytes, tuple[float, T | None]]] = deque()
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__added)
+
+    def __evict(self, now: float) -> None:
+        """Drop entries from the left of the order deque that are stale, expired or exceed ``max_size``."""
+        cutoff = now - self.ttl
+        order = self.__order
+        added = self.__added
+        while order:
+            fingerprint, entry = order[0]
+            if added.get(fingerprint) is entry:
+                if entry[0] > cutoff and len(added) <= self.max_size:
+                    break
+                del added[fingerprint]
+            # else: stale, the fingerprint was added again and has a newer entry further right
+            order.popleft()
+        if len(order) > 2 * self.max_size:
+            # refreshed fingerprints piled up stale entries behind a live one: rebuild
+            self.__order = deque(sorted(added.items(), key=lambda item: item[1][0]))
+
+    def add(self, fingerprint: bytes, value: T | None = None) -> None:
+        """Add (or refresh) a fingerprint, optionally with a value that ``get`` returns while it is cached."""
+        now = time.monotonic()
+        entry = self.__added[fingerprint] = (now, value)
+        self.__order.append((fingerprint, entry))
+        self.__evict(now)
+
+    def __contains__(self, fingerprint: bytes) -> bool:
+        """Return True if the fingerprint was added within the last ``ttl`` seconds; counts a hit or miss."""
+        entry = self.__added.get(fingerprint)
+        if entry is not None and entry[0] > time.monotonic() - self.ttl:
+            self.__hits += 1
+            return True
+        self.__misses += 1
+        return False
+
+    def get(self, fingerprint: bytes) -> T | None:
+        """Return the value of a fingerprint added within the last ``ttl`` seconds, or None; counts a hit or miss like ``in``."""
+        entry = self.__added.get(fingerprint)
+        if entry is not None and entry[0] > time.monotonic() - self.ttl:
+            self.__hits += 1
+            return entry[1]
+        self.__misses += 1
+        return None
+
+    def clear(self) -> None:
+        """Remove all fingerprints (counters are kept)."""
+        self.__added.clear()
+        self.__order.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit/miss counters (a hit is a dropped duplicate) and current size."""
+        return CacheStats(
+            hits=self.__hits,
+            misses=self.__misses,
+            size=len(self.__added),
+            max_size=self.max_size,
+        )
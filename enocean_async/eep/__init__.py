@@ -1,254 +1,85 @@
 """EEP (EnOcean Equipment Profile) - Central registry of all supported profiles.
 
-This module imports all EEP definitions organized by RORG (Radio Telegram Type)
-and provides them in a single dictionary for easy lookup by eep.
+This module provides all EEP definitions, organized by RORG (Radio Telegram Type)
+in subpackages, in a single mapping for easy lookup by eep.
 """
 
-from .a5 import (
-    EEP_A5_02_0A,
-    EEP_A5_02_0B,
-    EEP_A5_02_01,
-    EEP_A5_02_02,
-    EEP_A5_02_03,
-    EEP_A5_02_04,
-    EEP_A5_02_05,
-    EEP_A5_02_06,
-    EEP_A5_02_07,
-    EEP_A5_02_08,
-    EEP_A5_02_09,
-    EEP_A5_02_1A,
-    EEP_A5_02_1B,
-    EEP_A5_02_10,
-    EEP_A5_02_11,
-    EEP_A5_02_12,
-    EEP_A5_02_13,
-    EEP_A5_02_14,
-    EEP_A5_02_15,
-    EEP_A5_02_16,
-    EEP_A5_02_17,
-    EEP_A5_02_18,
-    EEP_A5_02_19,
-    EEP_A5_02_20,
-    EEP_A5_02_30,
-    EEP_A5_04_01,
-    EEP_A5_04_02,
-    EEP_A5_04_03,
-    EEP_A5_06_01,
-    EEP_A5_06_01_ELTAKO,
-    EEP_A5_06_02,
-    EEP_A5_06_03,
-    EEP_A5_06_04,
-    EEP_A5_06_05,
-    EEP_A5_07_03,
-    EEP_A5_08_01,
-    EEP_A5_08_01_ELTAKO,
-    EEP_A5_08_02,
-    EEP_A5_08_03,
-    EEP_A5_7F_3F_ELTAKO_FSB,
-    EEP_A5_10_0A,
-    EEP_A5_10_0B,
-    EEP_A5_10_0C,
-    EEP_A5_10_0D,
-    EEP_A5_10_01,
-    EEP_A5_10_02,
-    EEP_A5_10_03,
-    EEP_A5_10_04,
-    EEP_A5_10_05,
-    EEP_A5_10_06,
-    EEP_A5_10_07,
-    EEP_A5_10_08,
-    EEP_A5_10_09,
-    EEP_A5_10_1A,
-    EEP_A5_10_1B,
-    EEP_A5_10_1C,
-    EEP_A5_10_1D,
-    EEP_A5_10_1E,
-    EEP_A5_10_1F,
-    EEP_A5_10_10,
-    EEP_A5_10_11,
-    EEP_A5_10_12,
-    EEP_A5_10_13,
-    EEP_A5_10_14,
-    EEP_A5_10_15,
-    EEP_A5_10_16,
-    EEP_A5_10_17,
-    EEP_A5_10_18,
-    EEP_A5_10_19,
-    EEP_A5_10_20,
-    EEP_A5_10_21,
-    EEP_A5_10_22,
-    EEP_A5_10_23,
-    EEP_A5_12_00,
-    EEP_A5_12_01,
-    EEP_A5_12_02,
-    EEP_A5_12_03,
-    EEP_A5_20_01,
-    EEP_A5_38_08,
-    EEP_A5_38_08_ELTAKO,
-)
-from .d2 import (
-    EEP_D2_01_0A,
-    EEP_D2_01_0B,
-    EEP_D2_01_0C,
-    EEP_D2_01_0D,
-    EEP_D2_01_0E,
-    EEP_D2_01_0F,
-    EEP_D2_01_00,
-    EEP_D2_01_01,
-    EEP_D2_01_02,
-    EEP_D2_01_03,
-    EEP_D2_01_04,
-    EEP_D2_01_05,
-    EEP_D2_01_06,
-    EEP_D2_01_07,
-    EEP_D2_01_08,
-    EEP_D2_01_09,
-    EEP_D2_01_10,
-    EEP_D2_01_11,
-    EEP_D2_01_12,
-    EEP_D2_01_13,
-    EEP_D2_01_14,
-    EEP_D2_01_15,
-    EEP_D2_01_16,
-    EEP_D2_05_00,
-    EEP_D2_05_01,
-    EEP_D2_05_02,
-    EEP_D2_20_02,
-)
+from functools import partial
+import os
+
+from ._index import INDEX
 from .device_type import _MANUFACTURER_TYPES, DeviceType
-from .f6 import EEP_F6_02_01, EEP_F6_02_02, EEP_F6_10_00, EEP_F6_10_00_ELTAKO
 from .id import EEP
 from .manufacturer import Manufacturer
 from .profile import EEPSpecification
+from .registry import EEPIndexEntry, EEPRegistry, load_index, package_attribute
 
-EEP_SPECIFICATIONS: dict[EEP, EEPSpecification] = {
-    EEP_A5_02_01.eep: EEP_A5_02_01,
-    EEP_A5_02_02.eep: EEP_A5_02_02,
-    EEP_A5_02_03.eep: EEP_A5_02_03,
-    EEP_A5_02_04.eep: EEP_A5_02_04,
-    EEP_A5_02_05.eep: EEP_A5_02_05,
-    EEP_A5_02_06.eep: EEP_A5_02_06,
-    EEP_A5_02_07.eep: EEP_A5_02_07,
-    EEP_A5_02_08.eep: EEP_A5_02_08,
-    EEP_A5_02_09.eep: EEP_A5_02_09,
-    EEP_A5_02_0A.eep: EEP_A5_02_0A,
-    EEP_A5_02_0B.eep: EEP_A5_02_0B,
-    EEP_A5_02_10.eep: EEP_A5_02_10,
-    EEP_A5_02_11.eep: EEP_A5_02_11,
-    EEP_A5_02_12.eep: EEP_A5_02_12,
-    EEP_A5_02_13.eep: EEP_A5_02_13,
-    EEP_A5_02_14.eep: EEP_A5_02_14,
-    EEP_A5_02_15.eep: EEP_A5_02_15,
-    EEP_A5_02_16.eep: EEP_A5_02_16,
-    EEP_A5_02_17.eep: EEP_A5_02_17,
-    EEP_A5_02_18.eep: EEP_A5_02_18,
-    EEP_A5_02_19.eep: EEP_A5_02_19,
-    EEP_A5_02_1A.eep: EEP_A5_02_1A,
-    EEP_A5_02_1B.eep: EEP_A5_02_1B,
-    EEP_A5_02_20.eep: EEP_A5_02_20,
-    EEP_A5_02_30.eep: EEP_A5_02_30,
-    EEP_A5_04_01.eep: EEP_A5_04_01,
-    EEP_A5_04_02.eep: EEP_A5_04_02,
-    EEP_A5_04_03.eep: EEP_A5_04_03,
-    EEP_A5_06_01.eep: EEP_A5_06_01,
-    EEP_A5_06_01_ELTAKO.eep: EEP_A5_06_01_ELTAKO,
-    EEP_A5_06_02.eep: EEP_A5_06_02,
-    EEP_A5_06_03.eep: EEP_A5_06_03,
-    EEP_A5_06_04.eep: EEP_A5_06_04,
-    EEP_A5_06_05.eep: EEP_A5_06_05,
-    EEP_A5_07_03.eep: EEP_A5_07_03,
-    EEP_A5_08_01.eep: EEP_A5_08_01,
-    EEP_A5_08_01_ELTAKO.eep: EEP_A5_08_01_ELTAKO,
-    EEP_A5_08_02.eep: EEP_A5_08_02,
-    EEP_A5_08_03.eep: EEP_A5_08_03,
-    EEP_A5_10_01.eep: EEP_A5_10_01,
-    EEP_A5_10_02.eep: EEP_A5_10_02,
-    EEP_A5_10_03.eep: EEP_A5_10_03,
-    EEP_A5_10_04.eep: EEP_A5_10_04,
-    EEP_A5_10_05.eep: EEP_A5_10_05,
-    EEP_A5_10_06.eep: EEP_A5_10_06,
-    EEP_A5_10_07.eep: EEP_A5_10_07,
-    EEP_A5_10_08.eep: EEP_A5_10_08,
-    EEP_A5_10_09.eep: EEP_A5_10_09,
-    EEP_A5_10_0A.eep: EEP_A5_10_0A,
-    EEP_A5_10_0B.eep: EEP_A5_10_0B,
-    EEP_A5_10_0C.eep: EEP_A5_10_0C,
-    EEP_A5_10_0D.eep: EEP_A5_10_0D,
-    EEP_A5_10_10.eep: EEP_A5_10_10,
-    EEP_A5_10_11.eep: EEP_A5_10_11,
-    EEP_A5_10_12.eep: EEP_A5_10_12,
-    EEP_A5_10_13.eep: EEP_A5_10_13,
-    EEP_A5_10_14.eep: EEP_A5_10_14,
-    EEP_A5_10_15.eep: EEP_A5_10_15,
-    EEP_A5_10_16.eep: EEP_A5_10_16,
-    EEP_A5_10_17.eep: EEP_A5_10_17,
-    EEP_A5_10_18.eep: EEP_A5_10_18,
-    EEP_A5_10_19.eep: EEP_A5_10_19,
-    EEP_A5_10_1A.eep: EEP_A5_10_1A,
-    EEP_A5_10_1B.eep: EEP_A5_10_1B,
-    EEP_A5_10_1C.eep: EEP_A5_10_1C,
-    EEP_A5_10_1D.eep: EEP_A5_10_1D,
-    EEP_A5_10_1E.eep: EEP_A5_10_1E,
-    EEP_A5_10_1F.eep: EEP_A5_10_1F,
-    EEP_A5_10_20.eep: EEP_A5_10_20,
-    EEP_A5_10_21.eep: EEP_A5_10_21,
-    EEP_A5_10_22.eep: EEP_A5_10_22,
-    EEP_A5_10_23.eep: EEP_A5_10_23,
-    EEP_A5_12_00.eep: EEP_A5_12_00,
-    EEP_A5_12_01.eep: EEP_A5_12_01,
-    EEP_A5_12_02.eep: EEP_A5_12_02,
-    EEP_A5_12_03.eep: EEP_A5_12_03,
-    EEP_A5_20_01.eep: EEP_A5_20_01,
-    EEP_A5_38_08.eep: EEP_A5_38_08,
-    EEP_A5_38_08_ELTAKO.eep: EEP_A5_38_08_ELTAKO,
-    EEP_A5_7F_3F_ELTAKO_FSB.eep: EEP_A5_7F_3F_ELTAKO_FSB,
-    EEP_F6_02_01.eep: EEP_F6_02_01,
-    EEP_F6_02_02.eep: EEP_F6_02_02,
-    EEP_F6_10_00.eep: EEP_F6_10_00,
-    EEP_F6_10_00_ELTAKO.eep: EEP_F6_10_00_ELTAKO,
-    EEP_D2_01_00.eep: EEP_D2_01_00,
-    EEP_D2_01_01.eep: EEP_D2_01_01,
-    EEP_D2_01_02.eep: EEP_D2_01_02,
-    EEP_D2_01_03.eep: EEP_D2_01_03,
-    EEP_D2_01_04.eep: EEP_D2_01_04,
-    EEP_D2_01_05.eep: EEP_D2_01_05,
-    EEP_D2_01_06.eep: EEP_D2_01_06,
-    EEP_D2_01_07.eep: EEP_D2_01_07,
-    EEP_D2_01_08.eep: EEP_D2_01_08,
-    EEP_D2_01_09.eep: EEP_D2_01_09,
-    EEP_D2_01_0A.eep: EEP_D2_01_0A,
-    EEP_D2_01_0B.eep: EEP_D2_01_0B,
-    EEP_D2_01_0C.eep: EEP_D2_01_0C,
-    EEP_D2_01_0D.eep: EEP_D2_01_0D,
-    EEP_D2_01_0E.eep: EEP_D2_01_0E,
-    EEP_D2_01_0F.eep: EEP_D2_01_0F,
-    EEP_D2_01_10.eep: EEP_D2_01_10,
-    EEP_D2_01_11.eep: EEP_D2_01_11,
-    EEP_D2_01_12.eep: EEP_D2_01_12,
-    EEP_D2_01_13.eep: EEP_D2_01_13,
-    EEP_D2_01_14.eep: EEP_D2_01_14,
-    EEP_D2_01_15.eep: EEP_D2_01_15,
-    EEP_D2_01_16.eep: EEP_D2_01_16,
-    EEP_D2_05_00.eep: EEP_D2_05_00,
-    EEP_D2_05_01.eep: EEP_D2_05_01,
-    EEP_D2_05_02.eep: EEP_D2_05_02,
-    EEP_D2_20_02.eep: EEP_D2_20_02,
-}
-"""A simple in-memory database of supported EEP profiles, indexed by EEP. 
+EEP_SPECIFICATIONS: EEPRegistry = EEPRegistry(load_index(INDEX))
+"""A simple in-memory database of supported EEP profiles, indexed by EEP.
 
-This allows for efficient lookup of the corresponding EEPSpecification for a given EEP when processing incoming telegrams. 
+This allows for efficient lookup of the corresponding EEPSpecification for a given EEP when processing incoming telegrams.
+The profile module defining a specification is imported on its first lookup; names of all supported EEPs are available
+without importing any profile module via ``EEP_SPECIFICATIONS.index``.
 """
 
 DEVICE_TYPES: dict[str, DeviceType] = {
     dt.id: dt
     for dt in (
-        [DeviceType(None, spec.name, spec.eep) for spec in EEP_SPECIFICATIONS.values()]
+        [
+            DeviceType(None, entry.name, entry.eep)
+            for entry in EEP_SPECIFICATIONS.index.values()
+        ]
         + _MANUFACTURER_TYPES
     )
 }
 """Full catalog of supported devices keyed by :attr:`DeviceType.id` for O(1) lookup by stable string ID."""
 
 
+def __getattr__(name: str):
+    if name == "load_definitions":
+        # imported on first use: the definition module needs hashlib, json and marshal
+        from .definition import load_definitions
+
+        return load_definitions
+    # EEP_* specifications used to be imported eagerly into this module
+    return package_attribute(__name__, name)
+
+
+def register_definitions(
+    path: str | os.PathLike,
+    *,
+    cache: bool = True,
+    cache_dir: str | os.PathLike | None = None,
+) -> list[EEP]:
+    """Add the EEPs of a definition file (see :mod:`enocean_async.eep.definition`) to :data:`EEP_SPECIFICATIONS` and :data:`DEVICE_TYPES`.
+
+    Only the EEPs and names are read from the (cached) compiled form of the file; a
+    specification is built on its first lookup, like the built-in profiles.
+
+    Raises:
+        OSError: If the definition file cannot be read.
+        ValueError: If the file is not a valid definition file, or defines an EEP that is already registered or more than once; nothing is registered then.
+    """
+    from .definition import build_specification, compiled_definitions
+
+    compiled = compiled_definitions(path, cache=cache, cache_dir=cache_dir)
+    eeps = [EEP(profile[0]) for profile in compiled]
+    seen: set[EEP] = set()
+    for eep in eeps:
+        if eep in EEP_SPECIFICATIONS:
+            raise ValueError(f"{path}: EEP {eep} is already registered")
+        if eep in seen:
+            raise ValueError(f"{path}: EEP {eep} is defined more than once")
+        seen.add(eep)
+    for eep, profile in zip(eeps, compiled):
+        EEP_SPECIFICATIONS.register(
+            eep, profile[1], os.fspath(path), partial(build_specification, profile)
+        )
+        device_type = DeviceType(None, profile[1], eep)
+        DEVICE_TYPES[device_type.id] = device_type
+    return eeps
+
+
 def device_type_for_eep(eep: EEP) -> DeviceType:
     """Return the DeviceType for the given EEP.
 
@@ -269,7 +100,11 @@ __all__ = [
     "DeviceType",
     "EEP_SPECIFICATIONS",
     "EEP",
+    "EEPIndexEntry",
+    "EEPRegistry",
     "EEPSpecification",
     "Manufacturer",
     "device_type_for_eep",
+    "load_definitions",
+    "register_definitions",
 ]
@@ -0,0 +1,8510 @@
+"""Ahead-of-time compiled decode and encode functions of all EEP telegram types.
+
+Generated by scripts/generate_decoders.py — do not edit manually.
+
+DECODERS and ENCODERS map (EEP, telegram type) to (source digest, function);
+EEPHandler uses an entry only if its digest matches the code generated from the
+current specification (see enocean_async.eep.codegen).
+"""
+
+import logging
+
+from .message import ValueWithContext as VWC
+
+_logger = logging.getLogger("enocean_async.eep.packer")
+from_bytes = int.from_bytes
+
+
+def _decoder_0(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    O0 = fields[0].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 0) & 255
+        raw = {'TMP': f0}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['TMP'] = d0
+        values = msg.values
+        values[O0] = d0
+    return decode
+
+
+def _encoder_1(label):
+    M0 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 0
+        return bits.to_bytes(3, "big")
+    return pack
+
+
+def _decoder_2(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    O0 = fields[0].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 0) & 1023
+        raw = {'TMP': f0}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = VWC(-0.05004887585532747 * (f0 - 1023) + -10.0, '°C', 'Temperature')
+        decoded['TMP'] = d0
+        values = msg.values
+        values[O0] = d0
+    return decode
+
+
+def _encoder_3(label):
+    M0 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 1023:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 1023")
+            bits |= x << 0
+        return bits.to_bytes(3, "big")
+    return pack
+
+
+def _decoder_4(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    O0 = fields[0].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 0) & 1023
+        raw = {'TMP': f0}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = VWC(-0.09999999999999999 * (f0 - 1023) + -40.0, '°C', 'Temperature')
+        decoded['TMP'] = d0
+        values = msg.values
+        values[O0] = d0
+    return decode
+
+
+def _decoder_5(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 1) & 1
+        raw = {'HUM': f0, 'TMP': f1, 'TSN': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['HUM'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['TSN'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+    return decode
+
+
+def _encoder_6(label):
+    M0 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TSN' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('TSN')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TSN' must be between 0 and 1")
+            bits |= x << 1
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_7(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 1023
+        f2 = (v >> 1) & 1
+        raw = {'HUM': f0, 'TMP': f1, 'TTP': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['HUM'] = d0
+        d1 = VWC(0.07820136852394917 * (f1 - 0) + -20.0, '°C', 'Temperature')
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['TTP'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+    return decode
+
+
+def _encoder_8(label):
+    M0 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TTP' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1023:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 1023")
+            bits |= x << 8
+        x = raw.get('TTP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TTP' must be between 0 and 1")
+            bits |= x << 1
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_9(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    RO0, R0 = resolvers[0]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 0) & 1
+        raw = {'SVC': f0, 'ILL2': f1, 'ILL1': f2, 'RS': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SVC'] = d0
+        d1 = T1[f1]
+        decoded['ILL2'] = d1
+        d2 = T2[f2]
+        decoded['ILL1'] = d2
+        d3 = T3[f3]
+        decoded['RS'] = d3
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+    return decode
+
+
+def _encoder_10(label):
+    M0 = "encode: field 'SVC' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ILL2' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'ILL1' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'RS' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SVC')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SVC' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('ILL2')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL2' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('ILL1')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL1' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('RS')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RS' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_11(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 255
+        f1 = (v >> 6) & 1023
+        raw = {'SVC': f0, 'ILL': f1}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SVC'] = d0
+        d1 = VWC(0.9775171065493646 * (f1 - 0) + 0.0, 'lx', 'Illumination')
+        decoded['ILL'] = d1
+        values = msg.values
+        values[O1] = d1
+    return decode
+
+
+def _encoder_12(label):
+    M0 = "encode: field 'SVC' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ILL' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SVC')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SVC' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('ILL')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1023:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL' must be between 0 and 1023")
+            bits |= x << 6
+        return bits.to_bytes(3, "big")
+    return pack
+
+
+def _decoder_13(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 65535
+        f2 = (v >> 4) & 15
+        f3 = (v >> 1) & 1
+        f4 = (v >> 0) & 1
+        raw = {'TEMP': f0, 'ILL': f1, 'SV': f2, 'TMPAV': f3, 'ENAV': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['TEMP'] = d0
+        d1 = VWC(1.0 * (f1 - 0) + 0.0, 'lx', 'Illuminance')
+        decoded['ILL'] = d1
+        d2 = T2[f2]
+        decoded['SV'] = d2
+        d3 = T3[f3]
+        decoded['TMPAV'] = d3
+        d4 = T4[f4]
+        decoded['ENAV'] = d4
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+    return decode
+
+
+def _encoder_14(label):
+    M0 = "encode: field 'TEMP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ILL' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'SV' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'TMPAV' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'ENAV' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('TEMP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TEMP' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('ILL')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 65535:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL' must be between 0 and 65535")
+            bits |= x << 8
+        x = raw.get('SV')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SV' must be between 0 and 15")
+            bits |= x << 4
+        x = raw.get('TMPAV')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMPAV' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('ENAV')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ENAV' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_15(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    RO0, R0 = resolvers[0]
+    def decode(data, msg, cfg):
+        extra = len(data) - 2
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 255
+        f1 = (v >> 0) & 255
+        raw = {'ILL1': f0, 'ILL2': f1}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['ILL1'] = d0
+        d1 = T1[f1]
+        decoded['ILL2'] = d1
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+    return decode
+
+
+def _encoder_16(label):
+    M0 = "encode: field 'ILL1' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ILL2' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('ILL1')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL1' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('ILL2')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL2' must be between 0 and 255")
+            bits |= x << 0
+        return bits.to_bytes(2, "big")
+    return pack
+
+
+def _decoder_17(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 14) & 1023
+        f2 = (v >> 7) & 1
+        raw = {'SVC': f0, 'ILL': f1, 'PIR': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SVC'] = d0
+        d1 = VWC(1.0 * (f1 - 0) + 0.0, 'lx', 'Illumination')
+        decoded['ILL'] = d1
+        d2 = T2[f2]
+        decoded['PIR'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+    return decode
+
+
+def _encoder_18(label):
+    M0 = "encode: field 'SVC' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ILL' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'PIR' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SVC')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SVC' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('ILL')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1023:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL' must be between 0 and 1023")
+            bits |= x << 14
+        x = raw.get('PIR')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'PIR' must be between 0 and 1")
+            bits |= x << 7
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_19(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O3 = fields[3].observable
+    O4 = fields[4].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 1) & 1
+        f4 = (v >> 0) & 1
+        raw = {'SVC': f0, 'ILL': f1, 'TMP': f2, 'PIRS': f3, 'OCC': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SVC'] = d0
+        d1 = T1[f1]
+        decoded['ILL'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['PIRS'] = d3
+        d4 = T4[f4]
+        decoded['OCC'] = d4
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O3] = d3
+        values[O4] = d4
+    return decode
+
+
+def _encoder_20(label):
+    M0 = "encode: field 'SVC' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ILL' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'PIRS' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SVC')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SVC' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('ILL')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('PIRS')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'PIRS' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_21(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 0) & 255
+        raw = {'SVC': f0, 'ILL': f1, 'PIRS': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SVC'] = d0
+        d1 = T1[f1]
+        decoded['ILL'] = d1
+        d2 = T2[f2]
+        decoded['PIRS'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+    return decode
+
+
+def _encoder_22(label):
+    M0 = "encode: field 'SVC' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ILL' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'PIRS' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SVC')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SVC' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('ILL')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('PIRS')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'PIRS' must be between 0 and 255")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_23(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O4 = fields[4].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 3) & 1
+        f4 = (v >> 0) & 1
+        raw = {'FAN': f0, 'SP': f1, 'TMP': f2, 'LRNB': f3, 'OCC': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['FAN'] = d0
+        d1 = T1[f1]
+        decoded['SP'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['LRNB'] = d3
+        d4 = T4[f4]
+        decoded['OCC'] = d4
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O4] = d4
+    return decode
+
+
+def _encoder_24(label):
+    M0 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_25(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O4 = fields[4].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 3) & 1
+        f4 = (v >> 0) & 1
+        raw = {'FAN': f0, 'SP': f1, 'TMP': f2, 'LRNB': f3, 'SLSW': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['FAN'] = d0
+        d1 = T1[f1]
+        decoded['SP'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['LRNB'] = d3
+        d4 = T4[f4]
+        decoded['SLSW'] = d4
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O4] = d4
+    return decode
+
+
+def _encoder_26(label):
+    M0 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'SLSW' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('SLSW')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SLSW' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_27(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        raw = {'SP': f0, 'TMP': f1, 'LRNB': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+    return decode
+
+
+def _encoder_28(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_29(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 3) & 1
+        raw = {'FAN': f0, 'SP': f1, 'TMP': f2, 'LRNB': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['FAN'] = d0
+        d1 = T1[f1]
+        decoded['SP'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['LRNB'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+    return decode
+
+
+def _encoder_30(label):
+    M0 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_31(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O3 = fields[3].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        f3 = (v >> 0) & 1
+        raw = {'SP': f0, 'TMP': f1, 'LRNB': f2, 'OCC': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['OCC'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O3] = d3
+    return decode
+
+
+def _encoder_32(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_33(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O3 = fields[3].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        f3 = (v >> 0) & 1
+        raw = {'SP': f0, 'TMP': f1, 'LRNB': f2, 'SLSW': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['SLSW'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O3] = d3
+    return decode
+
+
+def _encoder_34(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'SLSW' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('SLSW')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SLSW' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_35(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        raw = {'FAN': f0, 'TMP': f1, 'LRNB': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['FAN'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+    return decode
+
+
+def _encoder_36(label):
+    M0 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_37(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O3 = fields[3].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        f3 = (v >> 0) & 1
+        raw = {'FAN': f0, 'TMP': f1, 'LRNB': f2, 'OCC': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['FAN'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['OCC'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O3] = d3
+    return decode
+
+
+def _encoder_38(label):
+    M0 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_39(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O3 = fields[3].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        f3 = (v >> 0) & 1
+        raw = {'FAN': f0, 'TMP': f1, 'LRNB': f2, 'SLSW': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['FAN'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['SLSW'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O3] = d3
+    return decode
+
+
+def _encoder_40(label):
+    M0 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'SLSW' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('SLSW')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SLSW' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_41(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O3 = fields[3].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        f3 = (v >> 0) & 1
+        raw = {'SP': f0, 'TMP': f1, 'LRNB': f2, 'CTST': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['CTST'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O3] = d3
+    return decode
+
+
+def _encoder_42(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'CTST' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('CTST')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CTST' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_43(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O2 = fields[2].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 255
+        f1 = (v >> 3) & 1
+        f2 = (v >> 0) & 1
+        raw = {'TMP': f0, 'LRNB': f1, 'CTST': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['TMP'] = d0
+        d1 = T1[f1]
+        decoded['LRNB'] = d1
+        d2 = T2[f2]
+        decoded['CTST'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O2] = d2
+    return decode
+
+
+def _encoder_44(label):
+    M0 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'CTST' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('CTST')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CTST' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_45(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O2 = fields[2].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 255
+        f1 = (v >> 3) & 1
+        f2 = (v >> 0) & 1
+        raw = {'TMP': f0, 'LRNB': f1, 'OCC': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['TMP'] = d0
+        d1 = T1[f1]
+        decoded['LRNB'] = d1
+        d2 = T2[f2]
+        decoded['OCC'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O2] = d2
+    return decode
+
+
+def _encoder_46(label):
+    M0 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_47(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O2 = fields[2].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 255
+        f1 = (v >> 3) & 1
+        f2 = (v >> 0) & 1
+        raw = {'TMP': f0, 'LRNB': f1, 'SLSW': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['TMP'] = d0
+        d1 = T1[f1]
+        decoded['LRNB'] = d1
+        d2 = T2[f2]
+        decoded['SLSW'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O2] = d2
+    return decode
+
+
+def _encoder_48(label):
+    M0 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'SLSW' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('SLSW')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SLSW' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_49(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O4 = fields[4].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 3) & 1
+        f4 = (v >> 0) & 1
+        raw = {'SP': f0, 'HUM': f1, 'TMP': f2, 'LRNB': f3, 'OCC': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['HUM'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['LRNB'] = d3
+        d4 = T4[f4]
+        decoded['OCC'] = d4
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O4] = d4
+    return decode
+
+
+def _encoder_50(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_51(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O4 = fields[4].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 3) & 1
+        f4 = (v >> 0) & 1
+        raw = {'SP': f0, 'HUM': f1, 'TMP': f2, 'LRNB': f3, 'SLSW': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['HUM'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['LRNB'] = d3
+        d4 = T4[f4]
+        decoded['SLSW'] = d4
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O4] = d4
+    return decode
+
+
+def _encoder_52(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'SLSW' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('SLSW')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SLSW' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_53(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 3) & 1
+        raw = {'SP': f0, 'HUM': f1, 'TMP': f2, 'LRNB': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['HUM'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['LRNB'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+    return decode
+
+
+def _encoder_54(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_55(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O3 = fields[3].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        f3 = (v >> 0) & 1
+        raw = {'HUM': f0, 'TMP': f1, 'LRNB': f2, 'OCC': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['HUM'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['OCC'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O3] = d3
+    return decode
+
+
+def _encoder_56(label):
+    M0 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_57(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O3 = fields[3].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        f3 = (v >> 0) & 1
+        raw = {'HUM': f0, 'TMP': f1, 'LRNB': f2, 'SLSW': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['HUM'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['SLSW'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O3] = d3
+    return decode
+
+
+def _encoder_58(label):
+    M0 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'SLSW' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('SLSW')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SLSW' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_59(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 18) & 63
+        f1 = (v >> 8) & 1023
+        f2 = (v >> 3) & 1
+        raw = {'SP': f0, 'TMP': f1, 'LRNB': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = VWC(-0.05004887585532747 * (f1 - 1023) + -10.0, '°C', 'Temperature')
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+    return decode
+
+
+def _encoder_60(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 63:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 63")
+            bits |= x << 18
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1023:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 1023")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_61(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O3 = fields[3].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 18) & 63
+        f1 = (v >> 8) & 1023
+        f2 = (v >> 3) & 1
+        f3 = (v >> 0) & 1
+        raw = {'SP': f0, 'TMP': f1, 'LRNB': f2, 'OCC': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = VWC(-0.05004887585532747 * (f1 - 1023) + -10.0, '°C', 'Temperature')
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['OCC'] = d3
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O3] = d3
+    return decode
+
+
+def _encoder_62(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 63:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 63")
+            bits |= x << 18
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1023:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 1023")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_63(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    O0 = fields[0].observable
+    O2 = fields[2].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 1023
+        f1 = (v >> 3) & 1
+        f2 = (v >> 0) & 1
+        raw = {'TMP': f0, 'LRNB': f1, 'OCC': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = VWC(-0.05004887585532747 * (f0 - 1023) + -10.0, '°C', 'Temperature')
+        decoded['TMP'] = d0
+        d1 = T1[f1]
+        decoded['LRNB'] = d1
+        d2 = T2[f2]
+        decoded['OCC'] = d2
+        values = msg.values
+        values[O0] = d0
+        values[O2] = d2
+    return decode
+
+
+def _encoder_64(label):
+    M0 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 1023:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 1023")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_65(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O3 = fields[3].observable
+    O6 = fields[6].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 4) & 7
+        f4 = (v >> 3) & 1
+        f5 = (v >> 1) & 1
+        f6 = (v >> 0) & 1
+        raw = {'ILL': f0, 'TMPSP': f1, 'TMP': f2, 'FAN': f3, 'LRNB': f4, 'OED': f5, 'OB': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['ILL'] = d0
+        d1 = T1[f1]
+        decoded['TMPSP'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['FAN'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['OED'] = d5
+        d6 = T6[f6]
+        decoded['OB'] = d6
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O3] = d3
+        values[O6] = d6
+    return decode
+
+
+def _encoder_66(label):
+    M0 = "encode: field 'ILL' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMPSP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'OED' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'OB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('ILL')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('TMPSP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMPSP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 7")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OED')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OED' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('OB')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OB' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_67(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O3 = fields[3].observable
+    O5 = fields[5].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 4) & 7
+        f4 = (v >> 3) & 1
+        f5 = (v >> 1) & 1
+        f6 = (v >> 0) & 1
+        raw = {'HUM': f0, 'TMPSP': f1, 'TMP': f2, 'FAN': f3, 'LRNB': f4, 'OB': f5, 'OED': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['HUM'] = d0
+        d1 = T1[f1]
+        decoded['TMPSP'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['FAN'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['OB'] = d5
+        d6 = T6[f6]
+        decoded['OED'] = d6
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O3] = d3
+        values[O5] = d5
+    return decode
+
+
+def _encoder_68(label):
+    M0 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMPSP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'OB' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'OED' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('TMPSP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMPSP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 7")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OB')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OB' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('OED')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OED' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_69(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O3 = fields[3].observable
+    O6 = fields[6].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 4) & 7
+        f4 = (v >> 3) & 1
+        f5 = (v >> 1) & 1
+        f6 = (v >> 0) & 1
+        raw = {'SV': f0, 'TMPSP': f1, 'TMP': f2, 'FAN': f3, 'LRNB': f4, 'OED': f5, 'OB': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SV'] = d0
+        d1 = T1[f1]
+        decoded['TMPSP'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['FAN'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['OED'] = d5
+        d6 = T6[f6]
+        decoded['OB'] = d6
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O3] = d3
+        values[O6] = d6
+    return decode
+
+
+def _encoder_70(label):
+    M0 = "encode: field 'SV' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMPSP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'OED' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'OB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SV')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SV' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('TMPSP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMPSP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 7")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OED')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OED' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('OB')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OB' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_71(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O3 = fields[3].observable
+    O6 = fields[6].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 24) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 4) & 7
+        f4 = (v >> 3) & 1
+        f5 = (v >> 1) & 1
+        f6 = (v >> 0) & 1
+        raw = {'SV': f0, 'ILL': f1, 'TMP': f2, 'FAN': f3, 'LRNB': f4, 'OED': f5, 'OB': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SV'] = d0
+        d1 = T1[f1]
+        decoded['ILL'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['FAN'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['OED'] = d5
+        d6 = T6[f6]
+        decoded['OB'] = d6
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O3] = d3
+        values[O6] = d6
+    return decode
+
+
+def _encoder_72(label):
+    M0 = "encode: field 'SV' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ILL' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'OED' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'OB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SV')
+        if x is None:
+            _logger.debug(M0)
+            bits &= -4278190081
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SV' must be between 0 and 255")
+            bits &= -4278190081
+            bits |= x << 24
+        x = raw.get('ILL')
+        if x is None:
+            _logger.debug(M1)
+            bits &= -4278190081
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL' must be between 0 and 255")
+            bits &= -4278190081
+            bits |= x << 24
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+            bits &= -65281
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits &= -65281
+            bits |= x << 8
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M3)
+            bits &= -113
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 7")
+            bits &= -113
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+            bits &= -9
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits &= -9
+            bits |= x << 3
+        x = raw.get('OED')
+        if x is None:
+            _logger.debug(M5)
+            bits &= -3
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OED' must be between 0 and 1")
+            bits &= -3
+            bits |= x << 1
+        x = raw.get('OB')
+        if x is None:
+            _logger.debug(M6)
+            bits &= -2
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OB' must be between 0 and 1")
+            bits &= -2
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_73(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    O0 = fields[0].observable
+    O2 = fields[2].observable
+    O3 = fields[3].observable
+    O6 = fields[6].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 4) & 7
+        f4 = (v >> 3) & 1
+        f5 = (v >> 1) & 1
+        f6 = (v >> 0) & 1
+        raw = {'ILL': f0, 'ILLSP': f1, 'TMP': f2, 'FAN': f3, 'LRNB': f4, 'OED': f5, 'OB': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['ILL'] = d0
+        d1 = T1[f1]
+        decoded['ILLSP'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['FAN'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['OED'] = d5
+        d6 = T6[f6]
+        decoded['OB'] = d6
+        values = msg.values
+        values[O0] = d0
+        values[O2] = d2
+        values[O3] = d3
+        values[O6] = d6
+    return decode
+
+
+def _encoder_74(label):
+    M0 = "encode: field 'ILL' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ILLSP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'OED' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'OB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('ILL')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILL' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('ILLSP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ILLSP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 7")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OED')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OED' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('OB')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OB' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_75(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    O0 = fields[0].observable
+    O2 = fields[2].observable
+    O3 = fields[3].observable
+    O6 = fields[6].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 4) & 7
+        f4 = (v >> 3) & 1
+        f5 = (v >> 1) & 1
+        f6 = (v >> 0) & 1
+        raw = {'HUM': f0, 'HUMSP': f1, 'TMP': f2, 'FAN': f3, 'LRNB': f4, 'OED': f5, 'OB': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['HUM'] = d0
+        d1 = T1[f1]
+        decoded['HUMSP'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['FAN'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['OED'] = d5
+        d6 = T6[f6]
+        decoded['OB'] = d6
+        values = msg.values
+        values[O0] = d0
+        values[O2] = d2
+        values[O3] = d3
+        values[O6] = d6
+    return decode
+
+
+def _encoder_76(label):
+    M0 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'HUMSP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'OED' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'OB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('HUMSP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUMSP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 7")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OED')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OED' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('OB')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OB' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_77(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    T8 = fields[8].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O8 = fields[8].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 6) & 1
+        f4 = (v >> 5) & 1
+        f5 = (v >> 4) & 1
+        f6 = (v >> 3) & 1
+        f7 = (v >> 1) & 1
+        f8 = (v >> 0) & 1
+        raw = {'FAN': f0, 'SP': f1, 'TMP': f2, 'TMP_F': f3, 'SP_F': f4, 'FAN_F': f5, 'LRNB': f6, 'UNOCC': f7, 'OCC': f8}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['FAN'] = d0
+        d1 = T1[f1]
+        decoded['SP'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['TMP_F'] = d3
+        d4 = T4[f4]
+        decoded['SP_F'] = d4
+        d5 = T5[f5]
+        decoded['FAN_F'] = d5
+        d6 = T6[f6]
+        decoded['LRNB'] = d6
+        d7 = T7[f7]
+        decoded['UNOCC'] = d7
+        d8 = T8[f8]
+        decoded['OCC'] = d8
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O8] = d8
+    return decode
+
+
+def _encoder_78(label):
+    M0 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'TMP_F' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'SP_F' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'FAN_F' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M7 = "encode: field 'UNOCC' not provided for " + label + '; defaulting to 0.'
+    M8 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('TMP_F')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP_F' must be between 0 and 1")
+            bits |= x << 6
+        x = raw.get('SP_F')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP_F' must be between 0 and 1")
+            bits |= x << 5
+        x = raw.get('FAN_F')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN_F' must be between 0 and 1")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('UNOCC')
+        if x is None:
+            _logger.debug(M7)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'UNOCC' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M8)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_79(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 5) & 3
+        f3 = (v >> 4) & 1
+        f4 = (v >> 3) & 1
+        f5 = (v >> 0) & 1
+        raw = {'SP': f0, 'TMP': f1, 'SPM': f2, 'BATT': f3, 'LRNB': f4, 'ACT': f5}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['TMP'] = d1
+        d2 = T2[f2]
+        decoded['SPM'] = d2
+        d3 = T3[f3]
+        decoded['BATT'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['ACT'] = d5
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+    return decode
+
+
+def _encoder_80(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'SPM' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'BATT' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'ACT' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('SPM')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SPM' must be between 0 and 3")
+            bits |= x << 5
+        x = raw.get('BATT')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'BATT' must be between 0 and 1")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('ACT')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ACT' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_81(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 5) & 3
+        f4 = (v >> 4) & 1
+        f5 = (v >> 3) & 1
+        f6 = (v >> 0) & 1
+        raw = {'SP': f0, 'HUM': f1, 'TMP': f2, 'SPM': f3, 'BATT': f4, 'LRNB': f5, 'ACT': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['HUM'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['SPM'] = d3
+        d4 = T4[f4]
+        decoded['BATT'] = d4
+        d5 = T5[f5]
+        decoded['LRNB'] = d5
+        d6 = T6[f6]
+        decoded['ACT'] = d6
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+    return decode
+
+
+def _encoder_82(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'SPM' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'BATT' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'ACT' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('SPM')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SPM' must be between 0 and 3")
+            bits |= x << 5
+        x = raw.get('BATT')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'BATT' must be between 0 and 1")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('ACT')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ACT' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_83(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O3 = fields[3].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 5) & 7
+        f4 = (v >> 3) & 1
+        raw = {'SP': f0, 'HUM': f1, 'TMP': f2, 'FAN': f3, 'LRNB': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['HUM'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['FAN'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O3] = d3
+    return decode
+
+
+def _encoder_84(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 7")
+            bits |= x << 5
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_85(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    O3 = fields[3].observable
+    O5 = fields[5].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 5) & 7
+        f4 = (v >> 3) & 1
+        f5 = (v >> 0) & 1
+        raw = {'SP': f0, 'HUM': f1, 'TMP': f2, 'FAN': f3, 'LRNB': f4, 'OCC': f5}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['SP'] = d0
+        d1 = T1[f1]
+        decoded['HUM'] = d1
+        d2 = T2[f2]
+        decoded['TMP'] = d2
+        d3 = T3[f3]
+        decoded['FAN'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['OCC'] = d5
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+        values[O2] = d2
+        values[O3] = d3
+        values[O5] = d5
+    return decode
+
+
+def _encoder_86(label):
+    M0 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'HUM' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FAN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'OCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('HUM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HUM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('FAN')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FAN' must be between 0 and 7")
+            bits |= x << 5
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('OCC')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OCC' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_87(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    F0 = fields[0]
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 16777215
+        f1 = (v >> 4) & 15
+        f2 = (v >> 2) & 1
+        f3 = (v >> 0) & 3
+        raw = {'MR': f0, 'CH': f1, 'DT': f2, 'DIV': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = VWC(F0.scaled_value(f0, raw), None, 'Meter reading')
+        decoded['MR'] = d0
+        d1 = T1[f1]
+        decoded['CH'] = d1
+        d2 = T2[f2]
+        decoded['DT'] = d2
+        d3 = T3[f3]
+        decoded['DIV'] = d3
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+    return decode
+
+
+def _encoder_88(label):
+    M0 = "encode: field 'MR' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'CH' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'DT' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'DIV' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('MR')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 16777215:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MR' must be between 0 and 16777215")
+            bits |= x << 8
+        x = raw.get('CH')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CH' must be between 0 and 15")
+            bits |= x << 4
+        x = raw.get('DT')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DT' must be between 0 and 1")
+            bits |= x << 2
+        x = raw.get('DIV')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DIV' must be between 0 and 3")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_89(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    F0 = fields[0]
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 16777215
+        f1 = (v >> 4) & 15
+        f2 = (v >> 2) & 1
+        f3 = (v >> 0) & 3
+        raw = {'MR': f0, 'TI': f1, 'DT': f2, 'DIV': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = VWC(F0.scaled_value(f0, raw), None, 'Meter reading')
+        decoded['MR'] = d0
+        d1 = T1[f1]
+        decoded['TI'] = d1
+        d2 = T2[f2]
+        decoded['DT'] = d2
+        d3 = T3[f3]
+        decoded['DIV'] = d3
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+    return decode
+
+
+def _encoder_90(label):
+    M0 = "encode: field 'MR' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TI' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'DT' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'DIV' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('MR')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 16777215:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MR' must be between 0 and 16777215")
+            bits |= x << 8
+        x = raw.get('TI')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TI' must be between 0 and 15")
+            bits |= x << 4
+        x = raw.get('DT')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DT' must be between 0 and 1")
+            bits |= x << 2
+        x = raw.get('DIV')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DIV' must be between 0 and 3")
+            bits |= x << 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_91(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    T8 = fields[8].value_table
+    T9 = fields[9].value_table
+    T10 = fields[10].value_table
+    O0 = fields[0].observable
+    O9 = fields[9].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 23) & 1
+        f2 = (v >> 22) & 1
+        f3 = (v >> 21) & 1
+        f4 = (v >> 20) & 1
+        f5 = (v >> 19) & 1
+        f6 = (v >> 18) & 1
+        f7 = (v >> 17) & 1
+        f8 = (v >> 16) & 1
+        f9 = (v >> 8) & 255
+        f10 = (v >> 3) & 1
+        raw = {'CV': f0, 'SO': f1, 'ENIE': f2, 'ES': f3, 'BCAP': f4, 'CCO': f5, 'FTS': f6, 'DWO': f7, 'ACO': f8, 'TMP': f9, 'LRNB': f10}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CV'] = d0
+        d1 = T1[f1]
+        decoded['SO'] = d1
+        d2 = T2[f2]
+        decoded['ENIE'] = d2
+        d3 = T3[f3]
+        decoded['ES'] = d3
+        d4 = T4[f4]
+        decoded['BCAP'] = d4
+        d5 = T5[f5]
+        decoded['CCO'] = d5
+        d6 = T6[f6]
+        decoded['FTS'] = d6
+        d7 = T7[f7]
+        decoded['DWO'] = d7
+        d8 = T8[f8]
+        decoded['ACO'] = d8
+        d9 = T9[f9]
+        decoded['TMP'] = d9
+        d10 = T10[f10]
+        decoded['LRNB'] = d10
+        values = msg.values
+        values[O0] = d0
+        values[O9] = d9
+    return decode
+
+
+def _encoder_92(label):
+    M0 = "encode: field 'CV' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'SO' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'ENIE' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'ES' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'BCAP' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'CCO' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'FTS' not provided for " + label + '; defaulting to 0.'
+    M7 = "encode: field 'DWO' not provided for " + label + '; defaulting to 0.'
+    M8 = "encode: field 'ACO' not provided for " + label + '; defaulting to 0.'
+    M9 = "encode: field 'TMP' not provided for " + label + '; defaulting to 0.'
+    M10 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CV')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CV' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('SO')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SO' must be between 0 and 1")
+            bits |= x << 23
+        x = raw.get('ENIE')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ENIE' must be between 0 and 1")
+            bits |= x << 22
+        x = raw.get('ES')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ES' must be between 0 and 1")
+            bits |= x << 21
+        x = raw.get('BCAP')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'BCAP' must be between 0 and 1")
+            bits |= x << 20
+        x = raw.get('CCO')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CCO' must be between 0 and 1")
+            bits |= x << 19
+        x = raw.get('FTS')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FTS' must be between 0 and 1")
+            bits |= x << 18
+        x = raw.get('DWO')
+        if x is None:
+            _logger.debug(M7)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DWO' must be between 0 and 1")
+            bits |= x << 17
+        x = raw.get('ACO')
+        if x is None:
+            _logger.debug(M8)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ACO' must be between 0 and 1")
+            bits |= x << 16
+        x = raw.get('TMP')
+        if x is None:
+            _logger.debug(M9)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M10)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_93(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 65535
+        f2 = (v >> 3) & 1
+        f3 = (v >> 2) & 1
+        f4 = (v >> 1) & 1
+        f5 = (v >> 0) & 1
+        raw = {'CMD': f0, 'TIM': f1, 'LRNB': f2, 'LCK': f3, 'DEL': f4, 'SW': f5}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = VWC(0.1 * (f1 - 0) + 0.0, 's', 'Time')
+        decoded['TIM'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['LCK'] = d3
+        d4 = T4[f4]
+        decoded['DEL'] = d4
+        d5 = T5[f5]
+        decoded['SW'] = d5
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _encoder_94(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'TIM' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LCK' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'DEL' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'SW' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('TIM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 65535:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TIM' must be between 0 and 65535")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('LCK')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LCK' must be between 0 and 1")
+            bits |= x << 2
+        x = raw.get('DEL')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DEL' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('SW')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SW' must be between 0 and 1")
+            bits |= x << 0
+        bits = (bits & -4278190081) | 16777216
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_95(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 3) & 1
+        f4 = (v >> 2) & 1
+        f5 = (v >> 1) & 1
+        f6 = (v >> 0) & 1
+        raw = {'CMD': f0, 'EDIM': f1, 'RMP': f2, 'LRNB': f3, 'EDIMR': f4, 'STR': f5, 'SW': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['EDIM'] = d1
+        d2 = T2[f2]
+        decoded['RMP'] = d2
+        d3 = T3[f3]
+        decoded['LRNB'] = d3
+        d4 = T4[f4]
+        decoded['EDIMR'] = d4
+        d5 = T5[f5]
+        decoded['STR'] = d5
+        d6 = T6[f6]
+        decoded['SW'] = d6
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _encoder_96(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'EDIM' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'RMP' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'EDIMR' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'STR' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'SW' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('EDIM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'EDIM' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('RMP')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RMP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('EDIMR')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'EDIMR' must be between 0 and 1")
+            bits |= x << 2
+        x = raw.get('STR')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'STR' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('SW')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SW' must be between 0 and 1")
+            bits |= x << 0
+        bits = (bits & -4278190081) | 33554432
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_97(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        raw = {'CMD': f0, 'SP': f1, 'LRNB': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['SP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _encoder_98(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'SP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('SP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        bits = (bits & -4278190081) | 50331648
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_99(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        raw = {'CMD': f0, 'BSP': f1, 'LRNB': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['BSP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _encoder_100(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'BSP' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('BSP')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'BSP' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        bits = (bits & -4278190081) | 67108864
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_101(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 5) & 3
+        f3 = (v >> 4) & 1
+        f4 = (v >> 3) & 1
+        f5 = (v >> 2) & 1
+        f6 = (v >> 0) & 3
+        raw = {'CMD': f0, 'CVOV': f1, 'CM': f2, 'CS': f3, 'LRNB': f4, 'ENHO': f5, 'RMOCC': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['CVOV'] = d1
+        d2 = T2[f2]
+        decoded['CM'] = d2
+        d3 = T3[f3]
+        decoded['CS'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['ENHO'] = d5
+        d6 = T6[f6]
+        decoded['RMOCC'] = d6
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _encoder_102(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'CVOV' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'CM' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'CS' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'ENHO' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'RMOCC' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('CVOV')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CVOV' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('CM')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CM' must be between 0 and 3")
+            bits |= x << 5
+        x = raw.get('CS')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CS' must be between 0 and 1")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('ENHO')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ENHO' must be between 0 and 1")
+            bits |= x << 2
+        x = raw.get('RMOCC')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RMOCC' must be between 0 and 3")
+            bits |= x << 0
+        bits = (bits & -4278190081) | 83886080
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_103(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        raw = {'CMD': f0, 'FO': f1, 'LRNB': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['FO'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _encoder_104(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'FO' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('FO')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FO' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        bits = (bits & -4278190081) | 100663296
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_105(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 4) & 15
+        f4 = (v >> 3) & 1
+        f5 = (v >> 2) & 1
+        f6 = (v >> 1) & 1
+        f7 = (v >> 0) & 1
+        raw = {'CMD': f0, 'P1': f1, 'P2': f2, 'FUNC': f3, 'LRNB': f4, 'SSF': f5, 'PAF': f6, 'SMF': f7}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['P1'] = d1
+        d2 = T2[f2]
+        decoded['P2'] = d2
+        d3 = T3[f3]
+        decoded['FUNC'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['SSF'] = d5
+        d6 = T6[f6]
+        decoded['PAF'] = d6
+        d7 = T7[f7]
+        decoded['SMF'] = d7
+        values = msg.values
+        values[O1] = d1
+        values[O2] = d2
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _encoder_106(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'P1' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'P2' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FUNC' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'SSF' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'PAF' not provided for " + label + '; defaulting to 0.'
+    M7 = "encode: field 'SMF' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('P1')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'P1' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('P2')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'P2' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('FUNC')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FUNC' must be between 0 and 15")
+            bits |= x << 4
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('SSF')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SSF' must be between 0 and 1")
+            bits |= x << 2
+        x = raw.get('PAF')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'PAF' must be between 0 and 1")
+            bits |= x << 1
+        x = raw.get('SMF')
+        if x is None:
+            _logger.debug(M7)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SMF' must be between 0 and 1")
+            bits |= x << 0
+        bits = (bits & -4278190081) | 117440512
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_107(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    RO4, R4 = resolvers[4]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 65535
+        f2 = (v >> 3) & 1
+        f3 = (v >> 2) & 1
+        f4 = (v >> 1) & 1
+        f5 = (v >> 0) & 1
+        raw = {'CMD': f0, 'TIM': f1, 'LRNB': f2, 'LCK': f3, 'DEL': f4, 'SW': f5}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = VWC(0.1 * (f1 - 0) + 0.0, 's', 'Time')
+        decoded['TIM'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        d3 = T3[f3]
+        decoded['LCK'] = d3
+        d4 = T4[f4]
+        decoded['DEL'] = d4
+        d5 = T5[f5]
+        decoded['SW'] = d5
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+        r = R4(raw, decoded, cfg)
+        if r is not None:
+            values[RO4] = r
+    return decode
+
+
+def _decoder_108(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    RO4, R4 = resolvers[4]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 3) & 1
+        f4 = (v >> 2) & 1
+        f5 = (v >> 1) & 1
+        f6 = (v >> 0) & 1
+        raw = {'CMD': f0, 'EDIM': f1, 'RMP': f2, 'LRNB': f3, 'EDIMR': f4, 'STR': f5, 'SW': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['EDIM'] = d1
+        d2 = T2[f2]
+        decoded['RMP'] = d2
+        d3 = T3[f3]
+        decoded['LRNB'] = d3
+        d4 = T4[f4]
+        decoded['EDIMR'] = d4
+        d5 = T5[f5]
+        decoded['STR'] = d5
+        d6 = T6[f6]
+        decoded['SW'] = d6
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+        r = R4(raw, decoded, cfg)
+        if r is not None:
+            values[RO4] = r
+    return decode
+
+
+def _decoder_109(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    RO4, R4 = resolvers[4]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        raw = {'CMD': f0, 'SP': f1, 'LRNB': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['SP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+        r = R4(raw, decoded, cfg)
+        if r is not None:
+            values[RO4] = r
+    return decode
+
+
+def _decoder_110(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    RO4, R4 = resolvers[4]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        raw = {'CMD': f0, 'BSP': f1, 'LRNB': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['BSP'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+        r = R4(raw, decoded, cfg)
+        if r is not None:
+            values[RO4] = r
+    return decode
+
+
+def _decoder_111(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    RO4, R4 = resolvers[4]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 5) & 3
+        f3 = (v >> 4) & 1
+        f4 = (v >> 3) & 1
+        f5 = (v >> 2) & 1
+        f6 = (v >> 0) & 3
+        raw = {'CMD': f0, 'CVOV': f1, 'CM': f2, 'CS': f3, 'LRNB': f4, 'ENHO': f5, 'RMOCC': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['CVOV'] = d1
+        d2 = T2[f2]
+        decoded['CM'] = d2
+        d3 = T3[f3]
+        decoded['CS'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['ENHO'] = d5
+        d6 = T6[f6]
+        decoded['RMOCC'] = d6
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+        r = R4(raw, decoded, cfg)
+        if r is not None:
+            values[RO4] = r
+    return decode
+
+
+def _decoder_112(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    RO4, R4 = resolvers[4]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 1
+        raw = {'CMD': f0, 'FO': f1, 'LRNB': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['FO'] = d1
+        d2 = T2[f2]
+        decoded['LRNB'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+        r = R4(raw, decoded, cfg)
+        if r is not None:
+            values[RO4] = r
+    return decode
+
+
+def _decoder_113(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    O1 = fields[1].observable
+    O2 = fields[2].observable
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    RO4, R4 = resolvers[4]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 4) & 15
+        f4 = (v >> 3) & 1
+        f5 = (v >> 2) & 1
+        f6 = (v >> 1) & 1
+        f7 = (v >> 0) & 1
+        raw = {'CMD': f0, 'P1': f1, 'P2': f2, 'FUNC': f3, 'LRNB': f4, 'SSF': f5, 'PAF': f6, 'SMF': f7}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['P1'] = d1
+        d2 = T2[f2]
+        decoded['P2'] = d2
+        d3 = T3[f3]
+        decoded['FUNC'] = d3
+        d4 = T4[f4]
+        decoded['LRNB'] = d4
+        d5 = T5[f5]
+        decoded['SSF'] = d5
+        d6 = T6[f6]
+        decoded['PAF'] = d6
+        d7 = T7[f7]
+        decoded['SMF'] = d7
+        values = msg.values
+        values[O1] = d1
+        values[O2] = d2
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+        r = R4(raw, decoded, cfg)
+        if r is not None:
+            values[RO4] = r
+    return decode
+
+
+def _decoder_114(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    RO0, R0 = resolvers[0]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 255
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 255
+        f3 = (v >> 3) & 1
+        f4 = (v >> 2) & 1
+        f5 = (v >> 1) & 1
+        raw = {'RTS': f0, 'RTL': f1, 'DIR': f2, 'LRNB': f3, 'BLK': f4, 'TUNIT': f5}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['RTS'] = d0
+        d1 = T1[f1]
+        decoded['RTL'] = d1
+        d2 = T2[f2]
+        decoded['DIR'] = d2
+        d3 = T3[f3]
+        decoded['LRNB'] = d3
+        d4 = T4[f4]
+        decoded['BLK'] = d4
+        d5 = T5[f5]
+        decoded['TUNIT'] = d5
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+    return decode
+
+
+def _encoder_115(label):
+    M0 = "encode: field 'RTS' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'RTL' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'DIR' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LRNB' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'BLK' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'TUNIT' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('RTS')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RTS' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('RTL')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RTL' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('DIR')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DIR' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('LRNB')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LRNB' must be between 0 and 1")
+            bits |= x << 3
+        x = raw.get('BLK')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'BLK' must be between 0 and 1")
+            bits |= x << 2
+        x = raw.get('TUNIT')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'TUNIT' must be between 0 and 1")
+            bits |= x << 1
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_116(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 15
+        f1 = (v >> 13) & 7
+        f2 = (v >> 8) & 31
+        f3 = (v >> 0) & 127
+        raw = {'CMD': f0, 'DV': f1, 'I/O': f2, 'OV': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['DV'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        d3 = T3[f3]
+        decoded['OV'] = d3
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_117(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'DV' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'OV' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 16
+        x = raw.get('DV')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DV' must be between 0 and 7")
+            bits |= x << 13
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 8
+        x = raw.get('OV')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OV' must be between 0 and 127")
+            bits |= x << 0
+        bits = (bits & -983041) | 65536
+        return bits.to_bytes(3, "big")
+    return pack
+
+
+def _decoder_118(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    T8 = fields[8].value_table
+    T9 = fields[9].value_table
+    T10 = fields[10].value_table
+    T11 = fields[11].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 31) & 1
+        f1 = (v >> 24) & 15
+        f2 = (v >> 23) & 1
+        f3 = (v >> 22) & 1
+        f4 = (v >> 21) & 1
+        f5 = (v >> 16) & 31
+        f6 = (v >> 12) & 15
+        f7 = (v >> 8) & 15
+        f8 = (v >> 7) & 1
+        f9 = (v >> 6) & 1
+        f10 = (v >> 4) & 3
+        f11 = (v >> 0) & 15
+        raw = {'d/e': f0, 'CMD': f1, 'OC': f2, 'RO': f3, 'LC': f4, 'I/O': f5, 'DT2': f6, 'DT3': f7, 'd/n': f8, 'PF': f9, 'DS': f10, 'DT1': f11}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['d/e'] = d0
+        d1 = T1[f1]
+        decoded['CMD'] = d1
+        d2 = T2[f2]
+        decoded['OC'] = d2
+        d3 = T3[f3]
+        decoded['RO'] = d3
+        d4 = T4[f4]
+        decoded['LC'] = d4
+        d5 = T5[f5]
+        decoded['I/O'] = d5
+        d6 = T6[f6]
+        decoded['DT2'] = d6
+        d7 = T7[f7]
+        decoded['DT3'] = d7
+        d8 = T8[f8]
+        decoded['d/n'] = d8
+        d9 = T9[f9]
+        decoded['PF'] = d9
+        d10 = T10[f10]
+        decoded['DS'] = d10
+        d11 = T11[f11]
+        decoded['DT1'] = d11
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_119(label):
+    M0 = "encode: field 'd/e' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'OC' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'RO' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'LC' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'DT2' not provided for " + label + '; defaulting to 0.'
+    M7 = "encode: field 'DT3' not provided for " + label + '; defaulting to 0.'
+    M8 = "encode: field 'd/n' not provided for " + label + '; defaulting to 0.'
+    M9 = "encode: field 'PF' not provided for " + label + '; defaulting to 0.'
+    M10 = "encode: field 'DS' not provided for " + label + '; defaulting to 0.'
+    M11 = "encode: field 'DT1' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('d/e')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'd/e' must be between 0 and 1")
+            bits |= x << 31
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 24
+        x = raw.get('OC')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OC' must be between 0 and 1")
+            bits |= x << 23
+        x = raw.get('RO')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RO' must be between 0 and 1")
+            bits |= x << 22
+        x = raw.get('LC')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LC' must be between 0 and 1")
+            bits |= x << 21
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 16
+        x = raw.get('DT2')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DT2' must be between 0 and 15")
+            bits |= x << 12
+        x = raw.get('DT3')
+        if x is None:
+            _logger.debug(M7)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DT3' must be between 0 and 15")
+            bits |= x << 8
+        x = raw.get('d/n')
+        if x is None:
+            _logger.debug(M8)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'd/n' must be between 0 and 1")
+            bits |= x << 7
+        x = raw.get('PF')
+        if x is None:
+            _logger.debug(M9)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'PF' must be between 0 and 1")
+            bits |= x << 6
+        x = raw.get('DS')
+        if x is None:
+            _logger.debug(M10)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DS' must be between 0 and 3")
+            bits |= x << 4
+        x = raw.get('DT1')
+        if x is None:
+            _logger.debug(M11)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DT1' must be between 0 and 15")
+            bits |= x << 0
+        bits = (bits & -251658241) | 33554432
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_120(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 2
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 15
+        f1 = (v >> 0) & 31
+        raw = {'CMD': f0, 'I/O': f1}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['I/O'] = d1
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_121(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 8
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 0
+        bits = (bits & -3841) | 768
+        return bits.to_bytes(2, "big")
+    return pack
+
+
+def _decoder_122(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    O4 = fields[4].observable
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 23) & 1
+        f1 = (v >> 22) & 1
+        f2 = (v >> 16) & 15
+        f3 = (v >> 15) & 1
+        f4 = (v >> 13) & 3
+        f5 = (v >> 8) & 31
+        f6 = (v >> 7) & 1
+        f7 = (v >> 0) & 127
+        raw = {'PF': f0, 'PFD': f1, 'CMD': f2, 'OC': f3, 'EL': f4, 'I/O': f5, 'LC': f6, 'OV': f7}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['PF'] = d0
+        d1 = T1[f1]
+        decoded['PFD'] = d1
+        d2 = T2[f2]
+        decoded['CMD'] = d2
+        d3 = T3[f3]
+        decoded['OC'] = d3
+        d4 = T4[f4]
+        decoded['EL'] = d4
+        d5 = T5[f5]
+        decoded['I/O'] = d5
+        d6 = T6[f6]
+        decoded['LC'] = d6
+        d7 = T7[f7]
+        decoded['OV'] = d7
+        values = msg.values
+        values[O4] = d4
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_123(label):
+    M0 = "encode: field 'PF' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'PFD' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'OC' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'EL' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'LC' not provided for " + label + '; defaulting to 0.'
+    M7 = "encode: field 'OV' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('PF')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'PF' must be between 0 and 1")
+            bits |= x << 23
+        x = raw.get('PFD')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'PFD' must be between 0 and 1")
+            bits |= x << 22
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 16
+        x = raw.get('OC')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OC' must be between 0 and 1")
+            bits |= x << 15
+        x = raw.get('EL')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'EL' must be between 0 and 3")
+            bits |= x << 13
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 8
+        x = raw.get('LC')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LC' must be between 0 and 1")
+            bits |= x << 7
+        x = raw.get('OV')
+        if x is None:
+            _logger.debug(M7)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'OV' must be between 0 and 127")
+            bits |= x << 0
+        bits = (bits & -983041) | 262144
+        return bits.to_bytes(3, "big")
+    return pack
+
+
+def _decoder_124(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    T8 = fields[8].value_table
+    T9 = fields[9].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 6
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 40) & 15
+        f1 = (v >> 39) & 1
+        f2 = (v >> 38) & 1
+        f3 = (v >> 37) & 1
+        f4 = (v >> 32) & 31
+        f5 = (v >> 28) & 15
+        f6 = (v >> 24) & 7
+        f7 = (v >> 16) & 255
+        f8 = (v >> 8) & 255
+        f9 = (v >> 0) & 255
+        raw = {'CMD': f0, 'RM': f1, 'RE': f2, 'e_p': f3, 'I/O': f4, 'MD_LSB': f5, 'UN': f6, 'MD_MSB': f7, 'MAT': f8, 'MIT': f9}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['RM'] = d1
+        d2 = T2[f2]
+        decoded['RE'] = d2
+        d3 = T3[f3]
+        decoded['e_p'] = d3
+        d4 = T4[f4]
+        decoded['I/O'] = d4
+        d5 = T5[f5]
+        decoded['MD_LSB'] = d5
+        d6 = T6[f6]
+        decoded['UN'] = d6
+        d7 = T7[f7]
+        decoded['MD_MSB'] = d7
+        d8 = T8[f8]
+        decoded['MAT'] = d8
+        d9 = T9[f9]
+        decoded['MIT'] = d9
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_125(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'RM' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'RE' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'e_p' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'MD_LSB' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'UN' not provided for " + label + '; defaulting to 0.'
+    M7 = "encode: field 'MD_MSB' not provided for " + label + '; defaulting to 0.'
+    M8 = "encode: field 'MAT' not provided for " + label + '; defaulting to 0.'
+    M9 = "encode: field 'MIT' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 40
+        x = raw.get('RM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RM' must be between 0 and 1")
+            bits |= x << 39
+        x = raw.get('RE')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RE' must be between 0 and 1")
+            bits |= x << 38
+        x = raw.get('e_p')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'e_p' must be between 0 and 1")
+            bits |= x << 37
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 32
+        x = raw.get('MD_LSB')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MD_LSB' must be between 0 and 15")
+            bits |= x << 28
+        x = raw.get('UN')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'UN' must be between 0 and 7")
+            bits |= x << 24
+        x = raw.get('MD_MSB')
+        if x is None:
+            _logger.debug(M7)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MD_MSB' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('MAT')
+        if x is None:
+            _logger.debug(M8)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MAT' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('MIT')
+        if x is None:
+            _logger.debug(M9)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MIT' must be between 0 and 255")
+            bits |= x << 0
+        bits = (bits & -16492674416641) | 5497558138880
+        return bits.to_bytes(6, "big")
+    return pack
+
+
+def _decoder_126(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 2
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 15
+        f1 = (v >> 5) & 1
+        f2 = (v >> 0) & 31
+        raw = {'CMD': f0, 'qu': f1, 'I/O': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['qu'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_127(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'qu' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 8
+        x = raw.get('qu')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'qu' must be between 0 and 1")
+            bits |= x << 5
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 0
+        bits = (bits & -3841) | 1536
+        return bits.to_bytes(2, "big")
+    return pack
+
+
+def _decoder_128(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 6
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 40) & 15
+        f1 = (v >> 37) & 7
+        f2 = (v >> 32) & 31
+        f3 = (v >> 0) & 4294967295
+        raw = {'CMD': f0, 'UN': f1, 'I/O': f2, 'MV': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['UN'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        d3 = VWC(1.0 * (f3 - 0) + 0.0, None, 'Measurement value')
+        decoded['MV'] = d3
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_129(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'UN' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'MV' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 40
+        x = raw.get('UN')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'UN' must be between 0 and 7")
+            bits |= x << 37
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 32
+        x = raw.get('MV')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 4294967295:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MV' must be between 0 and 4294967295")
+            bits |= x << 0
+        bits = (bits & -16492674416641) | 7696581394432
+        return bits.to_bytes(6, "big")
+    return pack
+
+
+def _decoder_130(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 2
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 15
+        f1 = (v >> 0) & 7
+        raw = {'CMD': f0, 'PM': f1}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['PM'] = d1
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_131(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'PM' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 8
+        x = raw.get('PM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'PM' must be between 0 and 7")
+            bits |= x << 0
+        bits = (bits & -3841) | 2048
+        return bits.to_bytes(2, "big")
+    return pack
+
+
+def _decoder_132(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 1
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 0) & 15
+        raw = {'CMD': f0}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_133(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 0
+        bits = (bits & -16) | 9
+        return bits.to_bytes(1, "big")
+    return pack
+
+
+def _decoder_134(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    O1 = fields[1].observable
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 2
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 15
+        f1 = (v >> 0) & 7
+        raw = {'CMD': f0, 'PM': f1}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['PM'] = d1
+        values = msg.values
+        values[O1] = d1
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_135(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'PM' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 8
+        x = raw.get('PM')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'PM' must be between 0 and 7")
+            bits |= x << 0
+        bits = (bits & -3841) | 2560
+        return bits.to_bytes(2, "big")
+    return pack
+
+
+def _decoder_136(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    E2 = fields[2].range_enum
+    E3 = fields[3].range_enum
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 7
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 48) & 15
+        f1 = (v >> 40) & 31
+        f2 = (v >> 24) & 65535
+        f3 = (v >> 8) & 65535
+        f4 = (v >> 6) & 3
+        f5 = (v >> 5) & 1
+        f6 = (v >> 0) & 31
+        raw = {'CMD': f0, 'I/O': f1, 'AOT': f2, 'DOT': f3, 'EBM': f4, 'SWT': f5, 'n/a': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['I/O'] = d1
+        d2 = VWC((E2[f2] if f2 in E2 else f"Unknown({f2})"), None, 'Auto OFF timer')
+        decoded['AOT'] = d2
+        d3 = VWC((E3[f3] if f3 in E3 else f"Unknown({f3})"), None, 'Delay OFF timer')
+        decoded['DOT'] = d3
+        d4 = T4[f4]
+        decoded['EBM'] = d4
+        d5 = T5[f5]
+        decoded['SWT'] = d5
+        d6 = T6[f6]
+        decoded['n/a'] = d6
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_137(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'AOT' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'DOT' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'EBM' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'SWT' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'n/a' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 48
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 40
+        x = raw.get('AOT')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 65535:
+                raise ValueError(label + ': value ' + str(x) + " of field 'AOT' must be between 0 and 65535")
+            bits |= x << 24
+        x = raw.get('DOT')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 65535:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DOT' must be between 0 and 65535")
+            bits |= x << 8
+        x = raw.get('EBM')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'EBM' must be between 0 and 3")
+            bits |= x << 6
+        x = raw.get('SWT')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SWT' must be between 0 and 1")
+            bits |= x << 5
+        x = raw.get('n/a')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'n/a' must be between 0 and 31")
+            bits |= x << 0
+        bits = (bits & -4222124650659841) | 3096224743817216
+        return bits.to_bytes(7, "big")
+    return pack
+
+
+def _encoder_138(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 8
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 0
+        bits = (bits & -3841) | 3072
+        return bits.to_bytes(2, "big")
+    return pack
+
+
+def _encoder_139(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'AOT' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'DOT' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'EBM' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'SWT' not provided for " + label + '; defaulting to 0.'
+    M6 = "encode: field 'n/a' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 48
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 40
+        x = raw.get('AOT')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 65535:
+                raise ValueError(label + ': value ' + str(x) + " of field 'AOT' must be between 0 and 65535")
+            bits |= x << 24
+        x = raw.get('DOT')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 65535:
+                raise ValueError(label + ': value ' + str(x) + " of field 'DOT' must be between 0 and 65535")
+            bits |= x << 8
+        x = raw.get('EBM')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'EBM' must be between 0 and 3")
+            bits |= x << 6
+        x = raw.get('SWT')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SWT' must be between 0 and 1")
+            bits |= x << 5
+        x = raw.get('n/a')
+        if x is None:
+            _logger.debug(M6)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'n/a' must be between 0 and 31")
+            bits |= x << 0
+        bits = (bits & -4222124650659841) | 3659174697238528
+        return bits.to_bytes(7, "big")
+    return pack
+
+
+def _decoder_140(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 5
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 32) & 15
+        f1 = (v >> 24) & 255
+        f2 = (v >> 19) & 31
+        f3 = (v >> 8) & 127
+        f4 = (v >> 0) & 127
+        raw = {'CMD': f0, 'ECID': f1, 'I/O': f2, 'MAXV': f3, 'MINV': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['ECID'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        d3 = T3[f3]
+        decoded['MAXV'] = d3
+        d4 = T4[f4]
+        decoded['MINV'] = d4
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_141(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ECID' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'MAXV' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'MINV' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 32
+        x = raw.get('ECID')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ECID' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 19
+        x = raw.get('MAXV')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MAXV' must be between 0 and 127")
+            bits |= x << 8
+        x = raw.get('MINV')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MINV' must be between 0 and 127")
+            bits |= x << 0
+        bits = (bits & -68702699521) | 64424509440
+        return bits.to_bytes(5, "big")
+    return pack
+
+
+def _decoder_142(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    RO3, R3 = resolvers[3]
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 15
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 31
+        raw = {'CMD': f0, 'ECID': f1, 'I/O': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['ECID'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+        r = R3(raw, decoded, cfg)
+        if r is not None:
+            values[RO3] = r
+    return decode
+
+
+def _encoder_143(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ECID' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 16
+        x = raw.get('ECID')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ECID' must be between 0 and 255")
+            bits |= x << 8
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 3
+        bits = (bits & -1048321) | 983296
+        return bits.to_bytes(3, "big")
+    return pack
+
+
+def _encoder_144(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ECID' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'I/O' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'MAXV' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'MINV' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 32
+        x = raw.get('ECID')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ECID' must be between 0 and 255")
+            bits |= x << 24
+        x = raw.get('I/O')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 31:
+                raise ValueError(label + ': value ' + str(x) + " of field 'I/O' must be between 0 and 31")
+            bits |= x << 19
+        x = raw.get('MAXV')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MAXV' must be between 0 and 127")
+            bits |= x << 8
+        x = raw.get('MINV')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'MINV' must be between 0 and 127")
+            bits |= x << 0
+        bits = (bits & -68702699521) | 64458063872
+        return bits.to_bytes(5, "big")
+    return pack
+
+
+def _decoder_145(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 15
+        f1 = (v >> 13) & 7
+        f2 = (v >> 8) & 31
+        f3 = (v >> 0) & 127
+        raw = {'CMD': f0, 'DV': f1, 'I/O': f2, 'OV': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['DV'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        d3 = T3[f3]
+        decoded['OV'] = d3
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_146(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    T8 = fields[8].value_table
+    T9 = fields[9].value_table
+    T10 = fields[10].value_table
+    T11 = fields[11].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 31) & 1
+        f1 = (v >> 24) & 15
+        f2 = (v >> 23) & 1
+        f3 = (v >> 22) & 1
+        f4 = (v >> 21) & 1
+        f5 = (v >> 16) & 31
+        f6 = (v >> 12) & 15
+        f7 = (v >> 8) & 15
+        f8 = (v >> 7) & 1
+        f9 = (v >> 6) & 1
+        f10 = (v >> 4) & 3
+        f11 = (v >> 0) & 15
+        raw = {'d/e': f0, 'CMD': f1, 'OC': f2, 'RO': f3, 'LC': f4, 'I/O': f5, 'DT2': f6, 'DT3': f7, 'd/n': f8, 'PF': f9, 'DS': f10, 'DT1': f11}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['d/e'] = d0
+        d1 = T1[f1]
+        decoded['CMD'] = d1
+        d2 = T2[f2]
+        decoded['OC'] = d2
+        d3 = T3[f3]
+        decoded['RO'] = d3
+        d4 = T4[f4]
+        decoded['LC'] = d4
+        d5 = T5[f5]
+        decoded['I/O'] = d5
+        d6 = T6[f6]
+        decoded['DT2'] = d6
+        d7 = T7[f7]
+        decoded['DT3'] = d7
+        d8 = T8[f8]
+        decoded['d/n'] = d8
+        d9 = T9[f9]
+        decoded['PF'] = d9
+        d10 = T10[f10]
+        decoded['DS'] = d10
+        d11 = T11[f11]
+        decoded['DT1'] = d11
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_147(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 2
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 15
+        f1 = (v >> 0) & 31
+        raw = {'CMD': f0, 'I/O': f1}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['I/O'] = d1
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_148(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    O4 = fields[4].observable
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 23) & 1
+        f1 = (v >> 22) & 1
+        f2 = (v >> 16) & 15
+        f3 = (v >> 15) & 1
+        f4 = (v >> 13) & 3
+        f5 = (v >> 8) & 31
+        f6 = (v >> 7) & 1
+        f7 = (v >> 0) & 127
+        raw = {'PF': f0, 'PFD': f1, 'CMD': f2, 'OC': f3, 'EL': f4, 'I/O': f5, 'LC': f6, 'OV': f7}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['PF'] = d0
+        d1 = T1[f1]
+        decoded['PFD'] = d1
+        d2 = T2[f2]
+        decoded['CMD'] = d2
+        d3 = T3[f3]
+        decoded['OC'] = d3
+        d4 = T4[f4]
+        decoded['EL'] = d4
+        d5 = T5[f5]
+        decoded['I/O'] = d5
+        d6 = T6[f6]
+        decoded['LC'] = d6
+        d7 = T7[f7]
+        decoded['OV'] = d7
+        values = msg.values
+        values[O4] = d4
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_149(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    T7 = fields[7].value_table
+    T8 = fields[8].value_table
+    T9 = fields[9].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 6
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 40) & 15
+        f1 = (v >> 39) & 1
+        f2 = (v >> 38) & 1
+        f3 = (v >> 37) & 1
+        f4 = (v >> 32) & 31
+        f5 = (v >> 28) & 15
+        f6 = (v >> 24) & 7
+        f7 = (v >> 16) & 255
+        f8 = (v >> 8) & 255
+        f9 = (v >> 0) & 255
+        raw = {'CMD': f0, 'RM': f1, 'RE': f2, 'e_p': f3, 'I/O': f4, 'MD_LSB': f5, 'UN': f6, 'MD_MSB': f7, 'MAT': f8, 'MIT': f9}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['RM'] = d1
+        d2 = T2[f2]
+        decoded['RE'] = d2
+        d3 = T3[f3]
+        decoded['e_p'] = d3
+        d4 = T4[f4]
+        decoded['I/O'] = d4
+        d5 = T5[f5]
+        decoded['MD_LSB'] = d5
+        d6 = T6[f6]
+        decoded['UN'] = d6
+        d7 = T7[f7]
+        decoded['MD_MSB'] = d7
+        d8 = T8[f8]
+        decoded['MAT'] = d8
+        d9 = T9[f9]
+        decoded['MIT'] = d9
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_150(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 2
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 15
+        f1 = (v >> 5) & 1
+        f2 = (v >> 0) & 31
+        raw = {'CMD': f0, 'qu': f1, 'I/O': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['qu'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_151(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 6
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 40) & 15
+        f1 = (v >> 37) & 7
+        f2 = (v >> 32) & 31
+        f3 = (v >> 0) & 4294967295
+        raw = {'CMD': f0, 'UN': f1, 'I/O': f2, 'MV': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['UN'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        d3 = VWC(1.0 * (f3 - 0) + 0.0, None, 'Measurement value')
+        decoded['MV'] = d3
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_152(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 2
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 15
+        f1 = (v >> 0) & 7
+        raw = {'CMD': f0, 'PM': f1}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['PM'] = d1
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_153(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 1
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 0) & 15
+        raw = {'CMD': f0}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_154(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    O1 = fields[1].observable
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 2
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 8) & 15
+        f1 = (v >> 0) & 7
+        raw = {'CMD': f0, 'PM': f1}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['PM'] = d1
+        values = msg.values
+        values[O1] = d1
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_155(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    E2 = fields[2].range_enum
+    E3 = fields[3].range_enum
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    T6 = fields[6].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 7
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 48) & 15
+        f1 = (v >> 40) & 31
+        f2 = (v >> 24) & 65535
+        f3 = (v >> 8) & 65535
+        f4 = (v >> 6) & 3
+        f5 = (v >> 5) & 1
+        f6 = (v >> 0) & 31
+        raw = {'CMD': f0, 'I/O': f1, 'AOT': f2, 'DOT': f3, 'EBM': f4, 'SWT': f5, 'n/a': f6}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['I/O'] = d1
+        d2 = VWC((E2[f2] if f2 in E2 else f"Unknown({f2})"), None, 'Auto OFF timer')
+        decoded['AOT'] = d2
+        d3 = VWC((E3[f3] if f3 in E3 else f"Unknown({f3})"), None, 'Delay OFF timer')
+        decoded['DOT'] = d3
+        d4 = T4[f4]
+        decoded['EBM'] = d4
+        d5 = T5[f5]
+        decoded['SWT'] = d5
+        d6 = T6[f6]
+        decoded['n/a'] = d6
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_156(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 5
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 32) & 15
+        f1 = (v >> 24) & 255
+        f2 = (v >> 19) & 31
+        f3 = (v >> 8) & 127
+        f4 = (v >> 0) & 127
+        raw = {'CMD': f0, 'ECID': f1, 'I/O': f2, 'MAXV': f3, 'MINV': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['ECID'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        d3 = T3[f3]
+        decoded['MAXV'] = d3
+        d4 = T4[f4]
+        decoded['MINV'] = d4
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_157(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    RO0, R0 = resolvers[0]
+    RO1, R1 = resolvers[1]
+    RO2, R2 = resolvers[2]
+    def decode(data, msg, cfg):
+        extra = len(data) - 3
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 16) & 15
+        f1 = (v >> 8) & 255
+        f2 = (v >> 3) & 31
+        raw = {'CMD': f0, 'ECID': f1, 'I/O': f2}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['ECID'] = d1
+        d2 = T2[f2]
+        decoded['I/O'] = d2
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+        r = R1(raw, decoded, cfg)
+        if r is not None:
+            values[RO1] = r
+        r = R2(raw, decoded, cfg)
+        if r is not None:
+            values[RO2] = r
+    return decode
+
+
+def _decoder_158(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    T5 = fields[5].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 127
+        f1 = (v >> 16) & 127
+        f2 = (v >> 12) & 7
+        f3 = (v >> 8) & 7
+        f4 = (v >> 4) & 15
+        f5 = (v >> 0) & 15
+        raw = {'POS': f0, 'ANG': f1, 'REPO': f2, 'LOCK': f3, 'CHN': f4, 'CMD': f5}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['POS'] = d0
+        d1 = T1[f1]
+        decoded['ANG'] = d1
+        d2 = T2[f2]
+        decoded['REPO'] = d2
+        d3 = T3[f3]
+        decoded['LOCK'] = d3
+        d4 = T4[f4]
+        decoded['CHN'] = d4
+        d5 = T5[f5]
+        decoded['CMD'] = d5
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+    return decode
+
+
+def _encoder_159(label):
+    M0 = "encode: field 'POS' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ANG' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'REPO' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'LOCK' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'CHN' not provided for " + label + '; defaulting to 0.'
+    M5 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('POS')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'POS' must be between 0 and 127")
+            bits |= x << 24
+        x = raw.get('ANG')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ANG' must be between 0 and 127")
+            bits |= x << 16
+        x = raw.get('REPO')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'REPO' must be between 0 and 7")
+            bits |= x << 12
+        x = raw.get('LOCK')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LOCK' must be between 0 and 7")
+            bits |= x << 8
+        x = raw.get('CHN')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CHN' must be between 0 and 15")
+            bits |= x << 4
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M5)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 0
+        bits = (bits & -16) | 1
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_160(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    def decode(data, msg, cfg):
+        extra = len(data) - 1
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 4) & 15
+        f1 = (v >> 0) & 15
+        raw = {'CHN': f0, 'CMD': f1}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CHN'] = d0
+        d1 = T1[f1]
+        decoded['CMD'] = d1
+    return decode
+
+
+def _encoder_161(label):
+    M0 = "encode: field 'CHN' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CHN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CHN' must be between 0 and 15")
+            bits |= x << 4
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 0
+        bits = (bits & -16) | 2
+        return bits.to_bytes(1, "big")
+    return pack
+
+
+def _encoder_162(label):
+    M0 = "encode: field 'CHN' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CHN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CHN' must be between 0 and 15")
+            bits |= x << 4
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 0
+        bits = (bits & -16) | 3
+        return bits.to_bytes(1, "big")
+    return pack
+
+
+def _decoder_163(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    O0 = fields[0].observable
+    O1 = fields[1].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 127
+        f1 = (v >> 16) & 127
+        f2 = (v >> 8) & 7
+        f3 = (v >> 4) & 15
+        f4 = (v >> 0) & 15
+        raw = {'POS': f0, 'ANG': f1, 'LOCK': f2, 'CHN': f3, 'CMD': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['POS'] = d0
+        d1 = T1[f1]
+        decoded['ANG'] = d1
+        d2 = T2[f2]
+        decoded['LOCK'] = d2
+        d3 = T3[f3]
+        decoded['CHN'] = d3
+        d4 = T4[f4]
+        decoded['CMD'] = d4
+        values = msg.values
+        values[O0] = d0
+        values[O1] = d1
+    return decode
+
+
+def _encoder_164(label):
+    M0 = "encode: field 'POS' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ANG' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'LOCK' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'CHN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('POS')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'POS' must be between 0 and 127")
+            bits |= x << 24
+        x = raw.get('ANG')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ANG' must be between 0 and 127")
+            bits |= x << 16
+        x = raw.get('LOCK')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'LOCK' must be between 0 and 7")
+            bits |= x << 8
+        x = raw.get('CHN')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CHN' must be between 0 and 15")
+            bits |= x << 4
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 0
+        bits = (bits & -16) | 4
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_165(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    T4 = fields[4].value_table
+    def decode(data, msg, cfg):
+        extra = len(data) - 5
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 32767
+        f1 = (v >> 16) & 255
+        f2 = (v >> 8) & 7
+        f3 = (v >> 4) & 15
+        f4 = (v >> 0) & 15
+        raw = {'VERT': f0, 'ROT': f1, 'AA': f2, 'CHN': f3, 'CMD': f4}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = VWC(1.0 * (f0 - 0) + 0.0, 'ms', 'Set vertical run time')
+        decoded['VERT'] = d0
+        d1 = T1[f1]
+        decoded['ROT'] = d1
+        d2 = T2[f2]
+        decoded['AA'] = d2
+        d3 = T3[f3]
+        decoded['CHN'] = d3
+        d4 = T4[f4]
+        decoded['CMD'] = d4
+    return decode
+
+
+def _encoder_166(label):
+    M0 = "encode: field 'VERT' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'ROT' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'AA' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'CHN' not provided for " + label + '; defaulting to 0.'
+    M4 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('VERT')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 32767:
+                raise ValueError(label + ': value ' + str(x) + " of field 'VERT' must be between 0 and 32767")
+            bits |= x << 24
+        x = raw.get('ROT')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'ROT' must be between 0 and 255")
+            bits |= x << 16
+        x = raw.get('AA')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'AA' must be between 0 and 7")
+            bits |= x << 8
+        x = raw.get('CHN')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CHN' must be between 0 and 15")
+            bits |= x << 4
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M4)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 15")
+            bits |= x << 0
+        bits = (bits & -16) | 5
+        return bits.to_bytes(5, "big")
+    return pack
+
+
+def _decoder_167(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    RO0, R0 = resolvers[0]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 127
+        f1 = (v >> 20) & 3
+        f2 = (v >> 16) & 15
+        f3 = (v >> 0) & 255
+        raw = {'CMD': f0, 'RSR': f1, 'RS': f2, 'FS': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['RSR'] = d1
+        d2 = T2[f2]
+        decoded['RS'] = d2
+        d3 = T3[f3]
+        decoded['FS'] = d3
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+    return decode
+
+
+def _encoder_168(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'RSR' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'RS' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FS' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 127")
+            bits |= x << 24
+        x = raw.get('RSR')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RSR' must be between 0 and 3")
+            bits |= x << 20
+        x = raw.get('RS')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RS' must be between 0 and 15")
+            bits |= x << 16
+        x = raw.get('FS')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FS' must be between 0 and 255")
+            bits |= x << 0
+        bits = (bits & -2130706433) | 0
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_169(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    RO0, R0 = resolvers[0]
+    def decode(data, msg, cfg):
+        extra = len(data) - 4
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 24) & 127
+        f1 = (v >> 22) & 3
+        f2 = (v >> 16) & 15
+        f3 = (v >> 0) & 255
+        raw = {'CMD': f0, 'HCS': f1, 'RS': f2, 'FS': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['CMD'] = d0
+        d1 = T1[f1]
+        decoded['HCS'] = d1
+        d2 = T2[f2]
+        decoded['RS'] = d2
+        d3 = T3[f3]
+        decoded['FS'] = d3
+        values = msg.values
+        r = R0(raw, decoded, cfg)
+        if r is not None:
+            values[RO0] = r
+    return decode
+
+
+def _encoder_170(label):
+    M0 = "encode: field 'CMD' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'HCS' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'RS' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'FS' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('CMD')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 127:
+                raise ValueError(label + ': value ' + str(x) + " of field 'CMD' must be between 0 and 127")
+            bits |= x << 24
+        x = raw.get('HCS')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'HCS' must be between 0 and 3")
+            bits |= x << 22
+        x = raw.get('RS')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 15:
+                raise ValueError(label + ': value ' + str(x) + " of field 'RS' must be between 0 and 15")
+            bits |= x << 16
+        x = raw.get('FS')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'FS' must be between 0 and 255")
+            bits |= x << 0
+        bits = (bits & -2130706433) | 16777216
+        return bits.to_bytes(4, "big")
+    return pack
+
+
+def _decoder_171(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    T1 = fields[1].value_table
+    T2 = fields[2].value_table
+    T3 = fields[3].value_table
+    def decode(data, msg, cfg):
+        extra = len(data) - 1
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 5) & 7
+        f1 = (v >> 4) & 1
+        f2 = (v >> 1) & 7
+        f3 = (v >> 0) & 1
+        raw = {'R1': f0, 'EB': f1, 'R2': f2, 'SA': f3}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['R1'] = d0
+        d1 = T1[f1]
+        decoded['EB'] = d1
+        d2 = T2[f2]
+        decoded['R2'] = d2
+        d3 = T3[f3]
+        decoded['SA'] = d3
+    return decode
+
+
+def _encoder_172(label):
+    M0 = "encode: field 'R1' not provided for " + label + '; defaulting to 0.'
+    M1 = "encode: field 'EB' not provided for " + label + '; defaulting to 0.'
+    M2 = "encode: field 'R2' not provided for " + label + '; defaulting to 0.'
+    M3 = "encode: field 'SA' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('R1')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'R1' must be between 0 and 7")
+            bits |= x << 5
+        x = raw.get('EB')
+        if x is None:
+            _logger.debug(M1)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'EB' must be between 0 and 1")
+            bits |= x << 4
+        x = raw.get('R2')
+        if x is None:
+            _logger.debug(M2)
+        else:
+            if x < 0 or x > 7:
+                raise ValueError(label + ': value ' + str(x) + " of field 'R2' must be between 0 and 7")
+            bits |= x << 1
+        x = raw.get('SA')
+        if x is None:
+            _logger.debug(M3)
+        else:
+            if x < 0 or x > 1:
+                raise ValueError(label + ': value ' + str(x) + " of field 'SA' must be between 0 and 1")
+            bits |= x << 0
+        return bits.to_bytes(1, "big")
+    return pack
+
+
+def _decoder_173(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    O0 = fields[0].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 1
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 4) & 3
+        raw = {'WIN': f0}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['WIN'] = d0
+        values = msg.values
+        values[O0] = d0
+    return decode
+
+
+def _encoder_174(label):
+    M0 = "encode: field 'WIN' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('WIN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 3:
+                raise ValueError(label + ': value ' + str(x) + " of field 'WIN' must be between 0 and 3")
+            bits |= x << 4
+        return bits.to_bytes(1, "big")
+    return pack
+
+
+def _decoder_175(telegram, resolvers, fallback):
+    fields = telegram.datafields
+    T0 = fields[0].value_table
+    O0 = fields[0].observable
+    def decode(data, msg, cfg):
+        extra = len(data) - 1
+        if extra < 0:
+            return fallback(data, msg, cfg)
+        v = from_bytes(data, "big") >> (extra << 3)
+        f0 = (v >> 0) & 255
+        raw = {'WIN': f0}
+        msg.raw = raw
+        decoded = msg.decoded
+        d0 = T0[f0]
+        decoded['WIN'] = d0
+        values = msg.values
+        values[O0] = d0
+    return decode
+
+
+def _encoder_176(label):
+    M0 = "encode: field 'WIN' not provided for " + label + '; defaulting to 0.'
+    def pack(raw):
+        bits = 0
+        x = raw.get('WIN')
+        if x is None:
+            _logger.debug(M0)
+        else:
+            if x < 0 or x > 255:
+                raise ValueError(label + ': value ' + str(x) + " of field 'WIN' must be between 0 and 255")
+            bits |= x << 0
+        return bits.to_bytes(1, "big")
+    return pack
+
+
+DECODERS = {
+    ('A5-02-01', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-02', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-03', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-04', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-05', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-06', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-07', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-08', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-09', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-0A', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-0B', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-10', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-11', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-12', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-13', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-14', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-15', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-16', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-17', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-18', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-19', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-1A', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-1B', 0): ('5bf41035a3963cb7', _decoder_0),
+    ('A5-02-20', 0): ('5ac1be4332367cf0', _decoder_2),
+    ('A5-02-30', 0): ('2faedab341a7e9ac', _decoder_4),
+    ('A5-04-01', 0): ('b65a7e862030957a', _decoder_5),
+    ('A5-04-02', 0): ('b65a7e862030957a', _decoder_5),
+    ('A5-04-03', 0): ('40586d4879696535', _decoder_7),
+    ('A5-06-01', 0): ('852afa2506de9a4d', _decoder_9),
+    ('A5-06-02', 0): ('852afa2506de9a4d', _decoder_9),
+    ('A5-06-05', 0): ('852afa2506de9a4d', _decoder_9),
+    ('A5-06-03', 0): ('a5b1070e15e5940e', _decoder_11),
+    ('A5-06-04', 0): ('6f6e189812276f9b', _decoder_13),
+    ('A5-06-01.ELTAKO', 0): ('1b7ba3b41c234c31', _decoder_15),
+    ('A5-07-03', 0): ('5ed3fd02bd167ddb', _decoder_17),
+    ('A5-08-01', 0): ('20070c7cb0d7ca6b', _decoder_19),
+    ('A5-08-02', 0): ('20070c7cb0d7ca6b', _decoder_19),
+    ('A5-08-03', 0): ('20070c7cb0d7ca6b', _decoder_19),
+    ('A5-08-01.ELTAKO', 0): ('b3cd58de43761ba4', _decoder_21),
+    ('A5-10-01', 0): ('3aac65c52102e27e', _decoder_23),
+    ('A5-10-02', 0): ('d0e0c71a09219ace', _decoder_25),
+    ('A5-10-03', 0): ('7cb545f0d131c8c8', _decoder_27),
+    ('A5-10-04', 0): ('fe174acb7837391b', _decoder_29),
+    ('A5-10-05', 0): ('2a157229436f5e86', _decoder_31),
+    ('A5-10-06', 0): ('a6b4ca5cc4ff70e7', _decoder_33),
+    ('A5-10-07', 0): ('710330b6c2598169', _decoder_35),
+    ('A5-10-08', 0): ('87c7c8374ddc6f93', _decoder_37),
+    ('A5-10-09', 0): ('1d6980bbff343726', _decoder_39),
+    ('A5-10-0A', 0): ('a42d132b545ef4d9', _decoder_41),
+    ('A5-10-0B', 0): ('8e87556607d8a03a', _decoder_43),
+    ('A5-10-0C', 0): ('13987b151ba9608c', _decoder_45),
+    ('A5-10-0D', 0): ('d0b3623fc907bd59', _decoder_47),
+    ('A5-10-10', 0): ('f45650dc60fbf85e', _decoder_49),
+    ('A5-10-11', 0): ('0f4644f27ce4d3b8', _decoder_51),
+    ('A5-10-12', 0): ('f891b718763506ea', _decoder_53),
+    ('A5-10-13', 0): ('333c14464c1a260e', _decoder_55),
+    ('A5-10-14', 0): ('831b866137285ce3', _decoder_57),
+    ('A5-10-15', 0): ('ace7858f5ad584d4', _decoder_59),
+    ('A5-10-16', 0): ('a846f9d01a507bf9', _decoder_61),
+    ('A5-10-17', 0): ('0e66012cb3409a5f', _decoder_63),
+    ('A5-10-18', 0): ('bb234115c3393c75', _decoder_65),
+    ('A5-10-19', 0): ('49a3d03d29278d18', _decoder_67),
+    ('A5-10-1A', 0): ('6f38e4217c7446fa', _decoder_69),
+    ('A5-10-1B', 0): ('dcc68009d84bbd9a', _decoder_71),
+    ('A5-10-1C', 0): ('b51e2e9981bbbd01', _decoder_73),
+    ('A5-10-1D', 0): ('b32663fde9d493aa', _decoder_75),
+    ('A5-10-1E', 0): ('dcc68009d84bbd9a', _decoder_71),
+    ('A5-10-1F', 0): ('8b7d0a9689b87394', _decoder_77),
+    ('A5-10-20', 0): ('d61e2ecd1f96be12', _decoder_79),
+    ('A5-10-21', 0): ('dda53c4399e792b6', _decoder_81),
+    ('A5-10-22', 0): ('ca82df6a7d547dd6', _decoder_83),
+    ('A5-10-23', 0): ('54fde6139cef58f1', _decoder_85),
+    ('A5-12-00', 0): ('29588618136cf1dd', _decoder_87),
+    ('A5-12-01', 0): ('4fc2c156db2808e5', _decoder_89),
+    ('A5-12-02', 0): ('4fc2c156db2808e5', _decoder_89),
+    ('A5-12-03', 0): ('4fc2c156db2808e5', _decoder_89),
+    ('A5-20-01', 0): ('08798054288ce2a7', _decoder_91),
+    ('A5-38-08', 1): ('f6fab82aefc1b0a6', _decoder_93),
+    ('A5-38-08', 2): ('483637cec9ffc853', _decoder_95),
+    ('A5-38-08', 3): ('471e1ad8577e2158', _decoder_97),
+    ('A5-38-08', 4): ('55119cd0c0fece6d', _decoder_99),
+    ('A5-38-08', 5): ('ecc77f7f35860953', _decoder_101),
+    ('A5-38-08', 6): ('77fb337bf8a9768e', _decoder_103),
+    ('A5-38-08', 7): ('d01fda47ab3128a2', _decoder_105),
+    ('A5-38-08.ELTAKO', 1): ('45546179f0339aa3', _decoder_107),
+    ('A5-38-08.ELTAKO', 2): ('705dcbc50c5b1d57', _decoder_108),
+    ('A5-38-08.ELTAKO', 3): ('339ea07a792ea7f6', _decoder_109),
+    ('A5-38-08.ELTAKO', 4): ('a76eab67573ff231', _decoder_110),
+    ('A5-38-08.ELTAKO', 5): ('2a546c7f0e4abcd5', _decoder_111),
+    ('A5-38-08.ELTAKO', 6): ('665fc4e81e69676c', _decoder_112),
+    ('A5-38-08.ELTAKO', 7): ('9e5bc55b955345e0', _decoder_113),
+    ('A5-7F-3F.ELTAKO.FSB', 0): ('c45a7a5e2c3fdabf', _decoder_114),
+    ('D2-01-00', 1): ('744f238fcaf157c6', _decoder_116),
+    ('D2-01-00', 2): ('f845aa87c38b6d19', _decoder_118),
+    ('D2-01-00', 3): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-00', 4): ('11637ce9553976b0', _decoder_122),
+    ('D2-01-00', 5): ('a9c39ba603edc489', _decoder_124),
+    ('D2-01-00', 6): ('4000fc6dd9ee1dc2', _decoder_126),
+    ('D2-01-00', 7): ('9064d2e337f8ff2e', _decoder_128),
+    ('D2-01-00', 8): ('eae1fbf9284dd7c1', _decoder_130),
+    ('D2-01-00', 9): ('1140c11667fdfa82', _decoder_132),
+    ('D2-01-00', 10): ('99a17ce5532a8d9c', _decoder_134),
+    ('D2-01-00', 11): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-00', 12): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-00', 13): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-00', (15, 0)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-00', (15, 1)): ('f205a080ebe4d98e', _decoder_142),
+    ('D2-01-00', (15, 2)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-01', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-01', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-01', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-01', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-01', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-01', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-01', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-01', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-01', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-01', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-01', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-01', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-01', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-01', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-01', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-01', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-02', 1): ('744f238fcaf157c6', _decoder_116),
+    ('D2-01-02', 2): ('f845aa87c38b6d19', _decoder_118),
+    ('D2-01-02', 3): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-02', 4): ('11637ce9553976b0', _decoder_122),
+    ('D2-01-02', 5): ('a9c39ba603edc489', _decoder_124),
+    ('D2-01-02', 6): ('4000fc6dd9ee1dc2', _decoder_126),
+    ('D2-01-02', 7): ('9064d2e337f8ff2e', _decoder_128),
+    ('D2-01-02', 8): ('eae1fbf9284dd7c1', _decoder_130),
+    ('D2-01-02', 9): ('1140c11667fdfa82', _decoder_132),
+    ('D2-01-02', 10): ('99a17ce5532a8d9c', _decoder_134),
+    ('D2-01-02', 11): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-02', 12): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-02', 13): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-02', (15, 0)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-02', (15, 1)): ('f205a080ebe4d98e', _decoder_142),
+    ('D2-01-02', (15, 2)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-03', 1): ('744f238fcaf157c6', _decoder_116),
+    ('D2-01-03', 2): ('f845aa87c38b6d19', _decoder_118),
+    ('D2-01-03', 3): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-03', 4): ('11637ce9553976b0', _decoder_122),
+    ('D2-01-03', 5): ('a9c39ba603edc489', _decoder_124),
+    ('D2-01-03', 6): ('4000fc6dd9ee1dc2', _decoder_126),
+    ('D2-01-03', 7): ('9064d2e337f8ff2e', _decoder_128),
+    ('D2-01-03', 8): ('eae1fbf9284dd7c1', _decoder_130),
+    ('D2-01-03', 9): ('1140c11667fdfa82', _decoder_132),
+    ('D2-01-03', 10): ('99a17ce5532a8d9c', _decoder_134),
+    ('D2-01-03', 11): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-03', 12): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-03', 13): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-03', (15, 0)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-03', (15, 1)): ('f205a080ebe4d98e', _decoder_142),
+    ('D2-01-03', (15, 2)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-04', 1): ('744f238fcaf157c6', _decoder_116),
+    ('D2-01-04', 2): ('f845aa87c38b6d19', _decoder_118),
+    ('D2-01-04', 3): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-04', 4): ('11637ce9553976b0', _decoder_122),
+    ('D2-01-04', 5): ('a9c39ba603edc489', _decoder_124),
+    ('D2-01-04', 6): ('4000fc6dd9ee1dc2', _decoder_126),
+    ('D2-01-04', 7): ('9064d2e337f8ff2e', _decoder_128),
+    ('D2-01-04', 8): ('eae1fbf9284dd7c1', _decoder_130),
+    ('D2-01-04', 9): ('1140c11667fdfa82', _decoder_132),
+    ('D2-01-04', 10): ('99a17ce5532a8d9c', _decoder_134),
+    ('D2-01-04', 11): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-04', 12): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-04', 13): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-04', (15, 0)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-04', (15, 1)): ('f205a080ebe4d98e', _decoder_142),
+    ('D2-01-04', (15, 2)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-05', 1): ('744f238fcaf157c6', _decoder_116),
+    ('D2-01-05', 2): ('f845aa87c38b6d19', _decoder_118),
+    ('D2-01-05', 3): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-05', 4): ('11637ce9553976b0', _decoder_122),
+    ('D2-01-05', 5): ('a9c39ba603edc489', _decoder_124),
+    ('D2-01-05', 6): ('4000fc6dd9ee1dc2', _decoder_126),
+    ('D2-01-05', 7): ('9064d2e337f8ff2e', _decoder_128),
+    ('D2-01-05', 8): ('eae1fbf9284dd7c1', _decoder_130),
+    ('D2-01-05', 9): ('1140c11667fdfa82', _decoder_132),
+    ('D2-01-05', 10): ('99a17ce5532a8d9c', _decoder_134),
+    ('D2-01-05', 11): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-05', 12): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-05', 13): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-05', (15, 0)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-05', (15, 1)): ('f205a080ebe4d98e', _decoder_142),
+    ('D2-01-05', (15, 2)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-06', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-06', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-06', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-06', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-06', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-06', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-06', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-06', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-06', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-06', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-06', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-06', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-06', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-06', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-06', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-06', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-07', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-07', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-07', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-07', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-07', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-07', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-07', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-07', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-07', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-07', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-07', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-07', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-07', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-07', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-07', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-07', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-08', 1): ('744f238fcaf157c6', _decoder_116),
+    ('D2-01-08', 2): ('f845aa87c38b6d19', _decoder_118),
+    ('D2-01-08', 3): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-08', 4): ('11637ce9553976b0', _decoder_122),
+    ('D2-01-08', 5): ('a9c39ba603edc489', _decoder_124),
+    ('D2-01-08', 6): ('4000fc6dd9ee1dc2', _decoder_126),
+    ('D2-01-08', 7): ('9064d2e337f8ff2e', _decoder_128),
+    ('D2-01-08', 8): ('eae1fbf9284dd7c1', _decoder_130),
+    ('D2-01-08', 9): ('1140c11667fdfa82', _decoder_132),
+    ('D2-01-08', 10): ('99a17ce5532a8d9c', _decoder_134),
+    ('D2-01-08', 11): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-08', 12): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-08', 13): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-08', (15, 0)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-08', (15, 1)): ('f205a080ebe4d98e', _decoder_142),
+    ('D2-01-08', (15, 2)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-09', 1): ('744f238fcaf157c6', _decoder_116),
+    ('D2-01-09', 2): ('f845aa87c38b6d19', _decoder_118),
+    ('D2-01-09', 3): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-09', 4): ('11637ce9553976b0', _decoder_122),
+    ('D2-01-09', 5): ('a9c39ba603edc489', _decoder_124),
+    ('D2-01-09', 6): ('4000fc6dd9ee1dc2', _decoder_126),
+    ('D2-01-09', 7): ('9064d2e337f8ff2e', _decoder_128),
+    ('D2-01-09', 8): ('eae1fbf9284dd7c1', _decoder_130),
+    ('D2-01-09', 9): ('1140c11667fdfa82', _decoder_132),
+    ('D2-01-09', 10): ('99a17ce5532a8d9c', _decoder_134),
+    ('D2-01-09', 11): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-09', 12): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-09', 13): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-09', (15, 0)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-09', (15, 1)): ('f205a080ebe4d98e', _decoder_142),
+    ('D2-01-09', (15, 2)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-0A', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-0A', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-0A', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0A', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-0A', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-0A', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-0A', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-0A', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-0A', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-0A', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-0A', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-0A', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0A', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-0A', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0A', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-0A', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0B', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-0B', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-0B', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0B', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-0B', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-0B', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-0B', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-0B', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-0B', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-0B', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-0B', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-0B', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0B', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-0B', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0B', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-0B', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0C', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-0C', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-0C', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0C', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-0C', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-0C', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-0C', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-0C', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-0C', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-0C', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-0C', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-0C', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0C', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-0C', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0C', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-0C', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0D', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-0D', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-0D', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0D', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-0D', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-0D', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-0D', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-0D', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-0D', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-0D', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-0D', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-0D', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0D', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-0D', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0D', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-0D', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0E', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-0E', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-0E', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0E', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-0E', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-0E', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-0E', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-0E', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-0E', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-0E', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-0E', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-0E', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0E', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-0E', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0E', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-0E', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0F', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-0F', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-0F', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0F', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-0F', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-0F', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-0F', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-0F', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-0F', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-0F', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-0F', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-0F', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-0F', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-0F', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-0F', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-0F', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-10', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-10', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-10', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-10', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-10', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-10', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-10', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-10', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-10', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-10', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-10', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-10', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-10', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-10', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-10', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-10', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-11', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-11', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-11', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-11', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-11', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-11', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-11', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-11', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-11', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-11', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-11', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-11', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-11', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-11', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-11', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-11', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-12', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-12', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-12', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-12', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-12', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-12', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-12', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-12', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-12', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-12', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-12', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-12', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-12', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-12', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-12', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-12', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-13', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-13', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-13', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-13', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-13', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-13', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-13', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-13', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-13', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-13', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-13', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-13', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-13', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-13', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-13', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-13', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-14', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-14', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-14', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-14', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-14', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-14', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-14', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-14', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-14', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-14', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-14', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-14', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-14', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-14', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-14', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-14', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-15', 1): ('02a8544b075166f1', _decoder_145),
+    ('D2-01-15', 2): ('6842c1946c8a0082', _decoder_146),
+    ('D2-01-15', 3): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-15', 4): ('040ab7a487bfeef0', _decoder_148),
+    ('D2-01-15', 5): ('4c67a81c37a09557', _decoder_149),
+    ('D2-01-15', 6): ('5a867b99aac6afff', _decoder_150),
+    ('D2-01-15', 7): ('4184bc8eb475d679', _decoder_151),
+    ('D2-01-15', 8): ('4ce9b40bc7b52ee2', _decoder_152),
+    ('D2-01-15', 9): ('aee6e33a2739695a', _decoder_153),
+    ('D2-01-15', 10): ('9b8a32b6fb89e5da', _decoder_154),
+    ('D2-01-15', 11): ('095afd03da660968', _decoder_155),
+    ('D2-01-15', 12): ('3494a31008dcd85d', _decoder_147),
+    ('D2-01-15', 13): ('095afd03da660968', _decoder_155),
+    ('D2-01-15', (15, 0)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-15', (15, 1)): ('ec620fd8e52598a3', _decoder_157),
+    ('D2-01-15', (15, 2)): ('5eaa5e196a8f2378', _decoder_156),
+    ('D2-01-16', 1): ('744f238fcaf157c6', _decoder_116),
+    ('D2-01-16', 2): ('f845aa87c38b6d19', _decoder_118),
+    ('D2-01-16', 3): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-16', 4): ('11637ce9553976b0', _decoder_122),
+    ('D2-01-16', 5): ('a9c39ba603edc489', _decoder_124),
+    ('D2-01-16', 6): ('4000fc6dd9ee1dc2', _decoder_126),
+    ('D2-01-16', 7): ('9064d2e337f8ff2e', _decoder_128),
+    ('D2-01-16', 8): ('eae1fbf9284dd7c1', _decoder_130),
+    ('D2-01-16', 9): ('1140c11667fdfa82', _decoder_132),
+    ('D2-01-16', 10): ('99a17ce5532a8d9c', _decoder_134),
+    ('D2-01-16', 11): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-16', 12): ('16448cb662bf9014', _decoder_120),
+    ('D2-01-16', 13): ('9195dbba62fa6b4e', _decoder_136),
+    ('D2-01-16', (15, 0)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-01-16', (15, 1)): ('f205a080ebe4d98e', _decoder_142),
+    ('D2-01-16', (15, 2)): ('5173782f9c75eb98', _decoder_140),
+    ('D2-05-00', 1): ('c5c16890048a8623', _decoder_158),
+    ('D2-05-00', 2): ('47c74a279f9729af', _decoder_160),
+    ('D2-05-00', 3): ('47c74a279f9729af', _decoder_160),
+    ('D2-05-00', 4): ('c6ca21515919427c', _decoder_163),
+    ('D2-05-00', 5): ('3e27d67e47b1f7ea', _decoder_165),
+    ('D2-05-01', 1): ('c5c16890048a8623', _decoder_158),
+    ('D2-05-01', 2): ('47c74a279f9729af', _decoder_160),
+    ('D2-05-01', 3): ('47c74a279f9729af', _decoder_160),
+    ('D2-05-01', 4): ('c6ca21515919427c', _decoder_163),
+    ('D2-05-01', 5): ('3e27d67e47b1f7ea', _decoder_165),
+    ('D2-05-02', 1): ('c5c16890048a8623', _decoder_158),
+    ('D2-05-02', 2): ('47c74a279f9729af', _decoder_160),
+    ('D2-05-02', 3): ('47c74a279f9729af', _decoder_160),
+    ('D2-05-02', 4): ('c6ca21515919427c', _decoder_163),
+    ('D2-20-02', 0): ('11ae7d08988b0cef', _decoder_167),
+    ('D2-20-02', 1): ('ea2e3c5ee926f8ec', _decoder_169),
+    ('F6-02-01', 0): ('ed80fbe700c1aa27', _decoder_171),
+    ('F6-02-02', 0): ('ed80fbe700c1aa27', _decoder_171),
+    ('F6-10-00', 0): ('640755de0944ddda', _decoder_173),
+    ('F6-10-00.ELTAKO', 0): ('891ded9dff85d259', _decoder_175),
+}
+
+
+ENCODERS = {
+    ('A5-02-01', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-02', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-03', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-04', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-05', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-06', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-07', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-08', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-09', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-0A', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-0B', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-10', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-11', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-12', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-13', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-14', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-15', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-16', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-17', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-18', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-19', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-1A', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-1B', 0): ('ac042e47862541f8', _encoder_1),
+    ('A5-02-20', 0): ('0b51594de7a9b8a1', _encoder_3),
+    ('A5-02-30', 0): ('0b51594de7a9b8a1', _encoder_3),
+    ('A5-04-01', 0): ('4cf953d0c39c1792', _encoder_6),
+    ('A5-04-02', 0): ('4cf953d0c39c1792', _encoder_6),
+    ('A5-04-03', 0): ('b0e8f63d52a22812', _encoder_8),
+    ('A5-06-01', 0): ('d628ee9fa59a1b94', _encoder_10),
+    ('A5-06-02', 0): ('d628ee9fa59a1b94', _encoder_10),
+    ('A5-06-05', 0): ('d628ee9fa59a1b94', _encoder_10),
+    ('A5-06-03', 0): ('01b8f64c7427b5d6', _encoder_12),
+    ('A5-06-04', 0): ('0f4fe14f76f2e1c1', _encoder_14),
+    ('A5-06-01.ELTAKO', 0): ('6c69acd4d2f7105a', _encoder_16),
+    ('A5-07-03', 0): ('e6420bd5c5cbaa13', _encoder_18),
+    ('A5-08-01', 0): ('1d5057f1067c105c', _encoder_20),
+    ('A5-08-02', 0): ('1d5057f1067c105c', _encoder_20),
+    ('A5-08-03', 0): ('1d5057f1067c105c', _encoder_20),
+    ('A5-08-01.ELTAKO', 0): ('0c851c5c328f3e44', _encoder_22),
+    ('A5-10-01', 0): ('aa452ad70d44abda', _encoder_24),
+    ('A5-10-02', 0): ('8663f6d04486bcd8', _encoder_26),
+    ('A5-10-03', 0): ('ed0d683ae0e64425', _encoder_28),
+    ('A5-10-04', 0): ('b0c23cce9e8d1420', _encoder_30),
+    ('A5-10-05', 0): ('3b28b9fc041384a5', _encoder_32),
+    ('A5-10-06', 0): ('47fdbf2d2c4ebcd9', _encoder_34),
+    ('A5-10-07', 0): ('1301270587e3c1f9', _encoder_36),
+    ('A5-10-08', 0): ('16aa4301ca1d9d35', _encoder_38),
+    ('A5-10-09', 0): ('ef23829c88387e84', _encoder_40),
+    ('A5-10-0A', 0): ('6496e7c84618ae9a', _encoder_42),
+    ('A5-10-0B', 0): ('29fceca81f7b2391', _encoder_44),
+    ('A5-10-0C', 0): ('f2c7b2df6c9697e8', _encoder_46),
+    ('A5-10-0D', 0): ('390393a28afced15', _encoder_48),
+    ('A5-10-10', 0): ('70f1b93cbc23a9bf', _encoder_50),
+    ('A5-10-11', 0): ('1c721f59763c3674', _encoder_52),
+    ('A5-10-12', 0): ('dc4eb7c08ce25f91', _encoder_54),
+    ('A5-10-13', 0): ('0ef3851d49ed329e', _encoder_56),
+    ('A5-10-14', 0): ('352843789d76bb10', _encoder_58),
+    ('A5-10-15', 0): ('909e8501de33963c', _encoder_60),
+    ('A5-10-16', 0): ('fd3219b1397eb233', _encoder_62),
+    ('A5-10-17', 0): ('ba33d353e3ea3a0f', _encoder_64),
+    ('A5-10-18', 0): ('dab22d54b6b44df7', _encoder_66),
+    ('A5-10-19', 0): ('b370a6b2ed810402', _encoder_68),
+    ('A5-10-1A', 0): ('e7ebbbae368f00a3', _encoder_70),
+    ('A5-10-1B', 0): ('6400bb20af5a4c52', _encoder_72),
+    ('A5-10-1C', 0): ('d123b9e2c145b265', _encoder_74),
+    ('A5-10-1D', 0): ('9c65e7b295ca634f', _encoder_76),
+    ('A5-10-1E', 0): ('6400bb20af5a4c52', _encoder_72),
+    ('A5-10-1F', 0): ('afb1a400031e1884', _encoder_78),
+    ('A5-10-20', 0): ('3562f0c6a785a376', _encoder_80),
+    ('A5-10-21', 0): ('a28fc67ecf21745b', _encoder_82),
+    ('A5-10-22', 0): ('11919374cd2b717e', _encoder_84),
+    ('A5-10-23', 0): ('61b5199b43f9a76a', _encoder_86),
+    ('A5-12-00', 0): ('45ff5bd89b666ab7', _encoder_88),
+    ('A5-12-01', 0): ('da61730856dbc45a', _encoder_90),
+    ('A5-12-02', 0): ('da61730856dbc45a', _encoder_90),
+    ('A5-12-03', 0): ('da61730856dbc45a', _encoder_90),
+    ('A5-20-01', 0): ('c4cd1aea309fbd93', _encoder_92),
+    ('A5-38-08', 1): ('8a0f874600206491', _encoder_94),
+    ('A5-38-08', 2): ('6437c6b2b0799a6e', _encoder_96),
+    ('A5-38-08', 3): ('691ace5e54dc5e54', _encoder_98),
+    ('A5-38-08', 4): ('3d6752404a64dee3', _encoder_100),
+    ('A5-38-08', 5): ('3f12e5b54fe15974', _encoder_102),
+    ('A5-38-08', 6): ('70af60fb16224635', _encoder_104),
+    ('A5-38-08', 7): ('d52a0bc8ee2594d6', _encoder_106),
+    ('A5-38-08.ELTAKO', 1): ('8a0f874600206491', _encoder_94),
+    ('A5-38-08.ELTAKO', 2): ('6437c6b2b0799a6e', _encoder_96),
+    ('A5-38-08.ELTAKO', 3): ('691ace5e54dc5e54', _encoder_98),
+    ('A5-38-08.ELTAKO', 4): ('3d6752404a64dee3', _encoder_100),
+    ('A5-38-08.ELTAKO', 5): ('3f12e5b54fe15974', _encoder_102),
+    ('A5-38-08.ELTAKO', 6): ('70af60fb16224635', _encoder_104),
+    ('A5-38-08.ELTAKO', 7): ('d52a0bc8ee2594d6', _encoder_106),
+    ('A5-7F-3F.ELTAKO.FSB', 0): ('a5b026403f61a4e7', _encoder_115),
+    ('D2-01-00', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-00', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-00', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-00', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-00', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-00', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-00', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-00', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-00', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-00', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-00', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-00', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-00', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-00', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-00', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-00', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-01', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-01', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-01', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-01', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-01', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-01', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-01', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-01', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-01', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-01', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-01', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-01', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-01', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-01', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-01', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-01', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-02', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-02', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-02', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-02', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-02', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-02', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-02', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-02', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-02', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-02', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-02', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-02', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-02', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-02', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-02', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-02', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-03', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-03', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-03', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-03', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-03', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-03', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-03', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-03', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-03', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-03', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-03', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-03', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-03', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-03', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-03', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-03', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-04', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-04', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-04', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-04', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-04', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-04', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-04', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-04', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-04', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-04', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-04', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-04', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-04', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-04', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-04', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-04', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-05', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-05', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-05', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-05', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-05', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-05', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-05', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-05', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-05', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-05', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-05', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-05', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-05', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-05', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-05', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-05', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-06', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-06', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-06', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-06', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-06', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-06', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-06', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-06', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-06', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-06', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-06', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-06', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-06', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-06', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-06', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-06', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-07', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-07', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-07', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-07', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-07', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-07', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-07', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-07', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-07', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-07', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-07', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-07', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-07', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-07', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-07', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-07', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-08', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-08', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-08', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-08', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-08', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-08', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-08', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-08', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-08', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-08', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-08', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-08', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-08', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-08', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-08', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-08', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-09', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-09', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-09', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-09', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-09', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-09', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-09', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-09', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-09', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-09', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-09', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-09', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-09', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-09', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-09', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-09', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-0A', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-0A', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-0A', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-0A', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-0A', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-0A', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-0A', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-0A', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-0A', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-0A', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-0A', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-0A', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-0A', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-0A', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-0A', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-0A', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-0B', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-0B', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-0B', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-0B', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-0B', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-0B', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-0B', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-0B', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-0B', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-0B', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-0B', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-0B', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-0B', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-0B', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-0B', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-0B', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-0C', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-0C', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-0C', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-0C', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-0C', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-0C', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-0C', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-0C', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-0C', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-0C', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-0C', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-0C', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-0C', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-0C', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-0C', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-0C', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-0D', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-0D', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-0D', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-0D', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-0D', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-0D', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-0D', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-0D', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-0D', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-0D', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-0D', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-0D', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-0D', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-0D', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-0D', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-0D', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-0E', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-0E', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-0E', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-0E', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-0E', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-0E', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-0E', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-0E', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-0E', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-0E', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-0E', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-0E', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-0E', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-0E', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-0E', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-0E', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-0F', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-0F', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-0F', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-0F', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-0F', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-0F', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-0F', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-0F', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-0F', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-0F', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-0F', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-0F', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-0F', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-0F', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-0F', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-0F', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-10', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-10', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-10', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-10', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-10', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-10', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-10', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-10', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-10', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-10', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-10', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-10', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-10', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-10', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-10', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-10', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-11', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-11', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-11', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-11', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-11', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-11', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-11', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-11', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-11', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-11', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-11', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-11', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-11', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-11', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-11', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-11', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-12', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-12', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-12', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-12', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-12', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-12', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-12', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-12', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-12', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-12', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-12', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-12', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-12', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-12', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-12', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-12', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-13', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-13', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-13', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-13', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-13', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-13', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-13', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-13', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-13', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-13', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-13', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-13', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-13', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-13', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-13', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-13', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-14', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-14', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-14', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-14', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-14', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-14', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-14', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-14', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-14', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-14', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-14', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-14', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-14', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-14', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-14', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-14', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-15', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-15', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-15', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-15', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-15', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-15', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-15', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-15', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-15', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-15', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-15', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-15', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-15', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-15', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-15', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-15', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-01-16', 1): ('10d67d4afcc16642', _encoder_117),
+    ('D2-01-16', 2): ('22ed4f67c6da35c2', _encoder_119),
+    ('D2-01-16', 3): ('3c1618aa478c3f2c', _encoder_121),
+    ('D2-01-16', 4): ('9e521b6a55c8875f', _encoder_123),
+    ('D2-01-16', 5): ('9cd88ef9a5c0f9d5', _encoder_125),
+    ('D2-01-16', 6): ('ecb09d977f2a757d', _encoder_127),
+    ('D2-01-16', 7): ('79856aeb540c2ca0', _encoder_129),
+    ('D2-01-16', 8): ('1f102c5318e60671', _encoder_131),
+    ('D2-01-16', 9): ('0dfec8a023235ae2', _encoder_133),
+    ('D2-01-16', 10): ('5c78001b1b5dd5f0', _encoder_135),
+    ('D2-01-16', 11): ('3d6268704d379aba', _encoder_137),
+    ('D2-01-16', 12): ('5b8f123cd5394005', _encoder_138),
+    ('D2-01-16', 13): ('a29983042292906c', _encoder_139),
+    ('D2-01-16', (15, 0)): ('c232a7b8428e58f9', _encoder_141),
+    ('D2-01-16', (15, 1)): ('55f615784c2b0c05', _encoder_143),
+    ('D2-01-16', (15, 2)): ('e3300142a37df393', _encoder_144),
+    ('D2-05-00', 1): ('ce988a204a3ef75e', _encoder_159),
+    ('D2-05-00', 2): ('0c9e1a33c1c567a5', _encoder_161),
+    ('D2-05-00', 3): ('69b54b6c7d01ce4c', _encoder_162),
+    ('D2-05-00', 4): ('b03bbae5b6f5f534', _encoder_164),
+    ('D2-05-00', 5): ('0f03749e03aa55be', _encoder_166),
+    ('D2-05-01', 1): ('ce988a204a3ef75e', _encoder_159),
+    ('D2-05-01', 2): ('0c9e1a33c1c567a5', _encoder_161),
+    ('D2-05-01', 3): ('69b54b6c7d01ce4c', _encoder_162),
+    ('D2-05-01', 4): ('b03bbae5b6f5f534', _encoder_164),
+    ('D2-05-01', 5): ('0f03749e03aa55be', _encoder_166),
+    ('D2-05-02', 1): ('ce988a204a3ef75e', _encoder_159),
+    ('D2-05-02', 2): ('0c9e1a33c1c567a5', _encoder_161),
+    ('D2-05-02', 3): ('69b54b6c7d01ce4c', _encoder_162),
+    ('D2-05-02', 4): ('b03bbae5b6f5f534', _encoder_164),
+    ('D2-20-02', 0): ('d1b4d5a2ae4fb982', _encoder_168),
+    ('D2-20-02', 1): ('6214473170e0d391', _encoder_170),
+    ('F6-02-01', 0): ('6660a9ad6da63a75', _encoder_172),
+    ('F6-02-02', 0): ('6660a9ad6da63a75', _encoder_172),
+    ('F6-10-00', 0): ('0166f9a452950f1e', _encoder_174),
+    ('F6-10-00.ELTAKO', 0): ('2f091cc8188d7aff', _encoder_176),
+}
@@ -0,0 +1,673 @@
+"""Precomputed index of all supported EEPs: (eep, name, module, attribute).
+
+Generated by scripts/generate_eep_index.py — do not edit manually.
+"""
+
+INDEX: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "A5-02-01",
+        "Temperature sensor, range -40.0°C to 0.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_01",
+    ),
+    (
+        "A5-02-02",
+        "Temperature sensor, range -30.0°C to 10.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_02",
+    ),
+    (
+        "A5-02-03",
+        "Temperature sensor, range -20.0°C to 20.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_03",
+    ),
+    (
+        "A5-02-04",
+        "Temperature sensor, range -10.0°C to 30.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_04",
+    ),
+    (
+        "A5-02-05",
+        "Temperature sensor, range 0.0°C to 40.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_05",
+    ),
+    (
+        "A5-02-06",
+        "Temperature sensor, range 10.0°C to 50.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_06",
+    ),
+    (
+        "A5-02-07",
+        "Temperature sensor, range 20.0°C to 60.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_07",
+    ),
+    (
+        "A5-02-08",
+        "Temperature sensor, range 30.0°C to 70.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_08",
+    ),
+    (
+        "A5-02-09",
+        "Temperature sensor, range 40.0°C to 80.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_09",
+    ),
+    (
+        "A5-02-0A",
+        "Temperature sensor, range 50.0°C to 90.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_0A",
+    ),
+    (
+        "A5-02-0B",
+        "Temperature sensor, range 60.0°C to 100.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_0B",
+    ),
+    (
+        "A5-02-10",
+        "Temperature sensor, range -60.0°C to 20.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_10",
+    ),
+    (
+        "A5-02-11",
+        "Temperature sensor, range -50.0°C to 30.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_11",
+    ),
+    (
+        "A5-02-12",
+        "Temperature sensor, range -40.0°C to 40.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_12",
+    ),
+    (
+        "A5-02-13",
+        "Temperature sensor, range -30.0°C to 50.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_13",
+    ),
+    (
+        "A5-02-14",
+        "Temperature sensor, range -20.0°C to 60.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_14",
+    ),
+    (
+        "A5-02-15",
+        "Temperature sensor, range -10.0°C to 70.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_15",
+    ),
+    (
+        "A5-02-16",
+        "Temperature sensor, range 0.0°C to 80.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_16",
+    ),
+    (
+        "A5-02-17",
+        "Temperature sensor, range 10.0°C to 90.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_17",
+    ),
+    (
+        "A5-02-18",
+        "Temperature sensor, range 20.0°C to 100.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_18",
+    ),
+    (
+        "A5-02-19",
+        "Temperature sensor, range 30.0°C to 110.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_19",
+    ),
+    (
+        "A5-02-1A",
+        "Temperature sensor, range 40.0°C to 120.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_1A",
+    ),
+    (
+        "A5-02-1B",
+        "Temperature sensor, range 50.0°C to 130.0°C",
+        "a5.a5_02",
+        "EEP_A5_02_1B",
+    ),
+    (
+        "A5-02-20",
+        "10 bit temperature sensor, range -10.0°C to 41.2°C",
+        "a5.a5_02",
+        "EEP_A5_02_20",
+    ),
+    (
+        "A5-02-30",
+        "10 bit temperature sensor, range -40.0°C to 62.3°C",
+        "a5.a5_02",
+        "EEP_A5_02_30",
+    ),
+    (
+        "A5-04-01",
+        "Temperature and humidity sensor, range 0.0°C to 40.0°C and 0% to 100%",
+        "a5.a5_04",
+        "EEP_A5_04_01",
+    ),
+    (
+        "A5-04-02",
+        "Temperature and humidity sensor, range -20.0°C to 60.0°C and 0% to 100%",
+        "a5.a5_04",
+        "EEP_A5_04_02",
+    ),
+    (
+        "A5-04-03",
+        "Temperature and humidity sensor, range -20°C to 60°C 10bit-measurement and 0% to 100%",
+        "a5.a5_04",
+        "EEP_A5_04_03",
+    ),
+    (
+        "A5-06-01",
+        "Light sensor, range 300.0lx to 60000.0lx",
+        "a5.a5_06",
+        "EEP_A5_06_01",
+    ),
+    (
+        "A5-06-02",
+        "Light sensor, range 0.0lx to 1020.0lx",
+        "a5.a5_06",
+        "EEP_A5_06_02",
+    ),
+    (
+        "A5-06-05",
+        "Light sensor, range 0.0lx to 10200.0lx",
+        "a5.a5_06",
+        "EEP_A5_06_05",
+    ),
+    (
+        "A5-06-03",
+        "Light sensor, 10-bit measurement, range 0lx to 1000lx",
+        "a5.a5_06",
+        "EEP_A5_06_03",
+    ),
+    (
+        "A5-06-04",
+        "Curtain wall brightness sensor",
+        "a5.a5_06",
+        "EEP_A5_06_04",
+    ),
+    (
+        "A5-06-01.ELTAKO",
+        "Light sensor (Eltako variant), dual-range 0–100lx / 300–30000lx",
+        "a5.a5_06",
+        "EEP_A5_06_01_ELTAKO",
+    ),
+    (
+        "A5-07-03",
+        "Occupancy with supply voltage monitor and 10-bit illumination measurement",
+        "a5.a5_07_03",
+        "EEP_A5_07_03",
+    ),
+    (
+        "A5-08-01",
+        "Light, temperature and occupancy sensor, range 0lx to 510lx, 0.0°C to 51.0°C and occupancy button",
+        "a5.a5_08",
+        "EEP_A5_08_01",
+    ),
+    (
+        "A5-08-02",
+        "Light, temperature and occupancy sensor, range 0lx to 1020lx, 0.0°C to 51.0°C and occupancy button",
+        "a5.a5_08",
+        "EEP_A5_08_02",
+    ),
+    (
+        "A5-08-03",
+        "Light, temperature and occupancy sensor, range 0lx to 1530lx, -30.0°C to 50.0°C and occupancy button",
+        "a5.a5_08",
+        "EEP_A5_08_03",
+    ),
+    (
+        "A5-08-01.ELTAKO",
+        "Light and occupancy sensor, range 0lx to 510lx, Eltako variant (FABH65S, FBH65, FBH65TF, FBH65SB, FBH55SB, FBHF65SB, F4USM61B)",
+        "a5.a5_08",
+        "EEP_A5_08_01_ELTAKO",
+    ),
+    (
+        "A5-10-01",
+        "Room operating panel – temperature sensor, set point, fan speed and occupancy control",
+        "a5.a5_10",
+        "EEP_A5_10_01",
+    ),
+    (
+        "A5-10-02",
+        "Room operating panel – temperature sensor, set point, fan speed and day/night control",
+        "a5.a5_10",
+        "EEP_A5_10_02",
+    ),
+    (
+        "A5-10-03",
+        "Room operating panel – temperature sensor and set point control",
+        "a5.a5_10",
+        "EEP_A5_10_03",
+    ),
+    (
+        "A5-10-04",
+        "Room operating panel – temperature sensor, set point and fan speed control",
+        "a5.a5_10",
+        "EEP_A5_10_04",
+    ),
+    (
+        "A5-10-05",
+        "Room operating panel – temperature sensor, set point and occupancy control",
+        "a5.a5_10",
+        "EEP_A5_10_05",
+    ),
+    (
+        "A5-10-06",
+        "Room operating panel – temperature sensor, set point and day/night control",
+        "a5.a5_10",
+        "EEP_A5_10_06",
+    ),
+    (
+        "A5-10-07",
+        "Room operating panel – temperature sensor and fan speed control",
+        "a5.a5_10",
+        "EEP_A5_10_07",
+    ),
+    (
+        "A5-10-08",
+        "Room operating panel – temperature sensor, fan speed and occupancy control",
+        "a5.a5_10",
+        "EEP_A5_10_08",
+    ),
+    (
+        "A5-10-09",
+        "Room operating panel – temperature sensor, fan speed and day/night control",
+        "a5.a5_10",
+        "EEP_A5_10_09",
+    ),
+    (
+        "A5-10-0A",
+        "Room operating panel – temperature sensor, set point adjust and single input contact",
+        "a5.a5_10",
+        "EEP_A5_10_0A",
+    ),
+    (
+        "A5-10-0B",
+        "Room operating panel – temperature sensor and single input contact",
+        "a5.a5_10",
+        "EEP_A5_10_0B",
+    ),
+    (
+        "A5-10-0C",
+        "Room operating panel – temperature sensor and occupancy control",
+        "a5.a5_10",
+        "EEP_A5_10_0C",
+    ),
+    (
+        "A5-10-0D",
+        "Room operating panel – temperature sensor and day/night control",
+        "a5.a5_10",
+        "EEP_A5_10_0D",
+    ),
+    (
+        "A5-10-10",
+        "Room operating panel – temperature and humidity sensor, set point and occupancy control",
+        "a5.a5_10",
+        "EEP_A5_10_10",
+    ),
+    (
+        "A5-10-11",
+        "Room operating panel – temperature and humidity sensor, set point and day/night control",
+        "a5.a5_10",
+        "EEP_A5_10_11",
+    ),
+    (
+        "A5-10-12",
+        "Room operating panel – temperature and humidity sensor and set point",
+        "a5.a5_10",
+        "EEP_A5_10_12",
+    ),
+    (
+        "A5-10-13",
+        "Room operating panel – temperature and humidity sensor, occupancy control",
+        "a5.a5_10",
+        "EEP_A5_10_13",
+    ),
+    (
+        "A5-10-14",
+        "Room operating panel – temperature and humidity sensor, day/night control",
+        "a5.a5_10",
+        "EEP_A5_10_14",
+    ),
+    (
+        "A5-10-15",
+        "Room operating panel – 10-bit temperature sensor and 6-bit set point",
+        "a5.a5_10",
+        "EEP_A5_10_15",
+    ),
+    (
+        "A5-10-16",
+        "Room operating panel – 10-bit temperature sensor, 6-bit set point and occupancy control",
+        "a5.a5_10",
+        "EEP_A5_10_16",
+    ),
+    (
+        "A5-10-17",
+        "Room operating panel – 10-bit temperature sensor and occupancy control",
+        "a5.a5_10",
+        "EEP_A5_10_17",
+    ),
+    (
+        "A5-10-18",
+        "Room operating panel – illumination, temperature set point, temperature, fan speed, occupancy",
+        "a5.a5_10",
+        "EEP_A5_10_18",
+    ),
+    (
+        "A5-10-19",
+        "Room operating panel – humidity, temperature set point, temperature, fan speed, occupancy",
+        "a5.a5_10",
+        "EEP_A5_10_19",
+    ),
+    (
+        "A5-10-1A",
+        "Room operating panel – supply voltage, temperature set point, temperature, fan speed, occupancy",
+        "a5.a5_10",
+        "EEP_A5_10_1A",
+    ),
+    (
+        "A5-10-1B",
+        "Room operating panel – supply voltage, illumination, temperature, fan speed, occupancy",
+        "a5.a5_10",
+        "EEP_A5_10_1B",
+    ),
+    (
+        "A5-10-1C",
+        "Room operating panel – illumination, illumination set point, temperature, fan speed, occupancy",
+        "a5.a5_10",
+        "EEP_A5_10_1C",
+    ),
+    (
+        "A5-10-1D",
+        "Room operating panel – humidity, humidity set point, temperature, fan speed, occupancy",
+        "a5.a5_10",
+        "EEP_A5_10_1D",
+    ),
+    (
+        "A5-10-1E",
+        "Room operating panel – supply voltage, illumination, temperature, fan speed, occupancy (alias for 1B)",
+        "a5.a5_10",
+        "EEP_A5_10_1E",
+    ),
+    (
+        "A5-10-1F",
+        "Room operating panel – fan speed, set point, temperature, occupancy and unoccupancy",
+        "a5.a5_10",
+        "EEP_A5_10_1F",
+    ),
+    (
+        "A5-10-20",
+        "Room operating panel – set point, temperature, set point mode, battery, user activity",
+        "a5.a5_10",
+        "EEP_A5_10_20",
+    ),
+    (
+        "A5-10-21",
+        "Room operating panel – set point, humidity, temperature, set point mode, battery, user activity",
+        "a5.a5_10",
+        "EEP_A5_10_21",
+    ),
+    (
+        "A5-10-22",
+        "Room operating panel – temperature, set point, humidity, fan speed",
+        "a5.a5_10",
+        "EEP_A5_10_22",
+    ),
+    (
+        "A5-10-23",
+        "Room operating panel – temperature, set point, humidity, fan speed, occupancy",
+        "a5.a5_10",
+        "EEP_A5_10_23",
+    ),
+    (
+        "A5-12-00",
+        "Automated meter reading (AMR), counter",
+        "a5.a5_12_00_03",
+        "EEP_A5_12_00",
+    ),
+    (
+        "A5-12-01",
+        "Automated meter reading (AMR), electricity",
+        "a5.a5_12_00_03",
+        "EEP_A5_12_01",
+    ),
+    (
+        "A5-12-02",
+        "Automated meter reading (AMR), gas",
+        "a5.a5_12_00_03",
+        "EEP_A5_12_02",
+    ),
+    (
+        "A5-12-03",
+        "Automated meter reading (AMR), water",
+        "a5.a5_12_00_03",
+        "EEP_A5_12_03",
+    ),
+    (
+        "A5-20-01",
+        "HVAC component – battery powered actuator (BI-DIR)",
+        "a5.a5_20_01",
+        "EEP_A5_20_01",
+    ),
+    (
+        "A5-38-08",
+        "Central command - gateway",
+        "a5.a5_38_08",
+        "EEP_A5_38_08",
+    ),
+    (
+        "A5-38-08.ELTAKO",
+        "Central command - gateway (Eltako FUD/FSR)",
+        "a5.a5_38_08",
+        "EEP_A5_38_08_ELTAKO",
+    ),
+    (
+        "A5-7F-3F.ELTAKO.FSB",
+        "Eltako FSB roller-shutter / blind actuator (FSB14, FSB61, FSB71)",
+        "a5.a5_7f_3f",
+        "EEP_A5_7F_3F_ELTAKO_FSB",
+    ),
+    (
+        "D2-01-00",
+        "Electronic switches and dimmers with local control – Type 0x00 – 1 channel, switching + dimming",
+        "d2.d2_01",
+        "EEP_D2_01_00",
+    ),
+    (
+        "D2-01-01",
+        "Electronic switches and dimmers with local control – Type 0x01 – 1 channel, switching",
+        "d2.d2_01",
+        "EEP_D2_01_01",
+    ),
+    (
+        "D2-01-02",
+        "Electronic switches and dimmers with local control – Type 0x02 – 1 channel, switching + dimming + metering",
+        "d2.d2_01",
+        "EEP_D2_01_02",
+    ),
+    (
+        "D2-01-03",
+        "Electronic switches and dimmers with local control – Type 0x03 – 1 channel, switching + dimming + metering",
+        "d2.d2_01",
+        "EEP_D2_01_03",
+    ),
+    (
+        "D2-01-04",
+        "Electronic switches and dimmers with local control – Type 0x04 – 1 channel, switching + dimming (configurable)",
+        "d2.d2_01",
+        "EEP_D2_01_04",
+    ),
+    (
+        "D2-01-05",
+        "Electronic switches and dimmers with local control – Type 0x05 – 1 channel, switching + dimming (configurable) + metering",
+        "d2.d2_01",
+        "EEP_D2_01_05",
+    ),
+    (
+        "D2-01-06",
+        "Electronic switches and dimmers with local control – Type 0x06 – 1 channel, switching (no local control)",
+        "d2.d2_01",
+        "EEP_D2_01_06",
+    ),
+    (
+        "D2-01-07",
+        "Electronic switches and dimmers with local control – Type 0x07 – 1 channel, switching (no local control) + metering",
+        "d2.d2_01",
+        "EEP_D2_01_07",
+    ),
+    (
+        "D2-01-08",
+        "Electronic switches and dimmers with local control – Type 0x08 – 1 channel, switching + dimming (local control)",
+        "d2.d2_01",
+        "EEP_D2_01_08",
+    ),
+    (
+        "D2-01-09",
+        "Electronic switches and dimmers with local control – Type 0x09 – 1 channel, switching + dimming + pilot wire",
+        "d2.d2_01",
+        "EEP_D2_01_09",
+    ),
+    (
+        "D2-01-0A",
+        "Electronic switches and dimmers with local control – Type 0x0A – 1 channel, switching (full feature set)",
+        "d2.d2_01",
+        "EEP_D2_01_0A",
+    ),
+    (
+        "D2-01-0B",
+        "Electronic switches and dimmers with local control – Type 0x0B – 1 channel, switching + metering (full feature set)",
+        "d2.d2_01",
+        "EEP_D2_01_0B",
+    ),
+    (
+        "D2-01-0C",
+        "Electronic switches and dimmers with local control – Type 0x0C – 1 channel, heating module with pilot wire + metering",
+        "d2.d2_01",
+        "EEP_D2_01_0C",
+    ),
+    (
+        "D2-01-0D",
+        "Electronic switches and dimmers with local control – Type 0x0D – micro smart plug, 1 channel, no metering",
+        "d2.d2_01",
+        "EEP_D2_01_0D",
+    ),
+    (
+        "D2-01-0E",
+        "Electronic switches and dimmers with local control – Type 0x0E – micro smart plug, 1 channel, with metering",
+        "d2.d2_01",
+        "EEP_D2_01_0E",
+    ),
+    (
+        "D2-01-0F",
+        "Electronic switches and dimmers with local control – Type 0x0F – slot-in module, 1 channel, no metering",
+        "d2.d2_01",
+        "EEP_D2_01_0F",
+    ),
+    (
+        "D2-01-10",
+        "Electronic switches and dimmers with local control – Type 0x10 – 2 channels, switching",
+        "d2.d2_01",
+        "EEP_D2_01_10",
+    ),
+    (
+        "D2-01-11",
+        "Electronic switches and dimmers with local control – Type 0x11 – 2 channels, switching",
+        "d2.d2_01",
+        "EEP_D2_01_11",
+    ),
+    (
+        "D2-01-12",
+        "Electronic switches and dimmers with local control – Type 0x12 – slot-in module, 2 channels, no metering",
+        "d2.d2_01",
+        "EEP_D2_01_12",
+    ),
+    (
+        "D2-01-13",
+        "Electronic switches and dimmers with local control – Type 0x13 – 4 channels, switching",
+        "d2.d2_01",
+        "EEP_D2_01_13",
+    ),
+    (
+        "D2-01-14",
+        "Electronic switches and dimmers with local control – Type 0x14 – 8 channels, switching",
+        "d2.d2_01",
+        "EEP_D2_01_14",
+    ),
+    (
+        "D2-01-15",
+        "Electronic switches and dimmers with local control – Type 0x15 – 4 channels, switching",
+        "d2.d2_01",
+        "EEP_D2_01_15",
+    ),
+    (
+        "D2-01-16",
+        "Electronic switches and dimmers with local control – Type 0x16 – 2 channels, dimming with configurable limits",
+        "d2.d2_01",
+        "EEP_D2_01_16",
+    ),
+    (
+        "D2-05-00",
+        "Blinds control for position and angle – Type 0x00 – 1 channel",
+        "d2.d2_05",
+        "EEP_D2_05_00",
+    ),
+    (
+        "D2-05-01",
+        "Blinds control for position and angle – Type 0x01 – 4 channels",
+        "d2.d2_05",
+        "EEP_D2_05_01",
+    ),
+    (
+        "D2-05-02",
+        "Blinds control for position and angle – Type 0x02 – 1 channel, reduced command set",
+        "d2.d2_05",
+        "EEP_D2_05_02",
+    ),
+    (
+        "D2-20-02",
+        "Fan control, type 0x02",
+        "d2.d2_20_02",
+        "EEP_D2_20_02",
+    ),
+    (
+        "F6-02-01",
+        "Light and blind control - application style 1",
+        "f6.f6_02_01_02",
+        "EEP_F6_02_01",
+    ),
+    (
+        "F6-02-02",
+        "Light and blind control - application style 2",
+        "f6.f6_02_01_02",
+        "EEP_F6_02_02",
+    ),
+    (
+        "F6-10-00",
+        "Window handle",
+        "f6.f6_10_00",
+        "EEP_F6_10_00",
+    ),
+    (
+        "F6-10-00.ELTAKO",
+        "Window handle (Eltako variant)",
+        "f6.f6_10_00",
+        "EEP_F6_10_00_ELTAKO",
+    ),
+)
@@ -1,82 +1,12 @@
 """4BS telegram (A5) EEP definitions."""
 
-from .a5_02 import (
-    EEP_A5_02_0A,
-    EEP_A5_02_0B,
-    EEP_A5_02_01,
-    EEP_A5_02_02,
-    EEP_A5_02_03,
-    EEP_A5_02_04,
-    EEP_A5_02_05,
-    EEP_A5_02_06,
-    EEP_A5_02_07,
-    EEP_A5_02_08,
-    EEP_A5_02_09,
-    EEP_A5_02_1A,
-    EEP_A5_02_1B,
-    EEP_A5_02_10,
-    EEP_A5_02_11,
-    EEP_A5_02_12,
-    EEP_A5_02_13,
-    EEP_A5_02_14,
-    EEP_A5_02_15,
-    EEP_A5_02_16,
-    EEP_A5_02_17,
-    EEP_A5_02_18,
-    EEP_A5_02_19,
-    EEP_A5_02_20,
-    EEP_A5_02_30,
-)
-from .a5_04 import EEP_A5_04_01, EEP_A5_04_02, EEP_A5_04_03
-from .a5_06 import (
-    EEP_A5_06_01,
-    EEP_A5_06_01_ELTAKO,
-    EEP_A5_06_02,
-    EEP_A5_06_03,
-    EEP_A5_06_04,
-    EEP_A5_06_05,
-)
-from .a5_07_03 import EEP_A5_07_03
-from .a5_08 import EEP_A5_08_01, EEP_A5_08_01_ELTAKO, EEP_A5_08_02, EEP_A5_08_03
-from .a5_7f_3f import EEP_A5_7F_3F_ELTAKO_FSB
-from .a5_10 import (
-    EEP_A5_10_0A,
-    EEP_A5_10_0B,
-    EEP_A5_10_0C,
-    EEP_A5_10_0D,
-    EEP_A5_10_01,
-    EEP_A5_10_02,
-    EEP_A5_10_03,
-    EEP_A5_10_04,
-    EEP_A5_10_05,
-    EEP_A5_10_06,
-    EEP_A5_10_07,
-    EEP_A5_10_08,
-    EEP_A5_10_09,
-    EEP_A5_10_1A,
-    EEP_A5_10_1B,
-    EEP_A5_10_1C,
-    EEP_A5_10_1D,
-    EEP_A5_10_1E,
-    EEP_A5_10_1F,
-    EEP_A5_10_10,
-    EEP_A5_10_11,
-    EEP_A5_10_12,
-    EEP_A5_10_13,
-    EEP_A5_10_14,
-    EEP_A5_10_15,
-    EEP_A5_10_16,
-    EEP_A5_10_17,
-    EEP_A5_10_18,
-    EEP_A5_10_19,
-    EEP_A5_10_20,
-    EEP_A5_10_21,
-    EEP_A5_10_22,
-    EEP_A5_10_23,
-)
-from .a5_12_00_03 import EEP_A5_12_00, EEP_A5_12_01, EEP_A5_12_02, EEP_A5_12_03
-from .a5_20_01 import EEP_A5_20_01
-from .a5_38_08 import EEP_A5_38_08, EEP_A5_38_08_ELTAKO
+from ..registry import package_attribute
+
+
+def __getattr__(name: str):
+    # profile modules are only imported on first access (see enocean_async.eep.registry)
+    return package_attribute(__name__, name)
+
 
 __all__ = [
     "EEP_A5_02_01",
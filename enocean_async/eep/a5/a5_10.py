@@ -2,6 +2,7 @@
 
 from ...semantics.observable import Observable
 from ...semantics.observers.scalar import scalar_factory
+from ..enum_table import enum_table
 from ..id import EEP
 from ..profile import EEPDataField, Entity, SimpleProfileSpecification
 
@@ -9,13 +10,15 @@ from ..profile import EEPDataField, Entity, SimpleProfileSpecification
 # Shared enumerations
 # ---------------------------------------------------------------------------
 
-_FAN8_ENUM: dict[int, str] = {
-    **{i: "Stage Auto" for i in range(210, 256)},
-    **{i: "Stage 0" for i in range(190, 210)},
-    **{i: "Stage 1" for i in range(165, 190)},
-    **{i: "Stage 2" for i in range(145, 165)},
-    **{i: "Stage 3" for i in range(0, 145)},
-}
+_FAN8_ENUM = enum_table(
+    {
+        range(210, 256): "Stage Auto",
+        range(190, 210): "Stage 0",
+        range(165, 190): "Stage 1",
+        range(145, 165): "Stage 2",
+        range(0, 145): "Stage 3",
+    }
+)
 
 _FAN3_ENUM: dict[int, str] = {
     0: "Auto",
@@ -0,0 +1,279 @@
+"""Columnar batch decoding of many telegrams of one EEP telegram type, e.g. for offline analysis of recorded telemetry.
+
+With NumPy installed (optional dependency: ``pip install enocean-async[numpy]``), all
+telegram data of a batch is decoded at once with vectorized shifts, masks and linear
+scaling, and the columns are NumPy arrays. Without NumPy, the same columns are
+computed telegram by telegram and returned as lists.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+import math
+from typing import Any
+
+from .message import TelegramKey
+from .profile import EEPDataField, EEPSpecification, TelegramRawValues
+from .unpacker import TelegramUnpacker
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+NUMPY_AVAILABLE: bool = np is not None
+"""Whether NumPy is installed, i.e. ``BatchDecoder`` can decode vectorized."""
+
+
+@dataclass(frozen=True)
+class FieldColumn:
+    """Decoded values of one data field for all telegrams of a batch, in telegram order.
+
+    Columns are NumPy arrays if the batch was decoded with NumPy, lists otherwise.
+    """
+
+    field: EEPDataField
+
+    raw: Any
+    """Raw values (int64); for enumerated fields the enumeration codes."""
+
+    values: Any | None
+    """Scaled values (float64), NaN where the scaling parameters are invalid (where ``EEPHandler.decode`` raises ValueError); None for enumerated fields."""
+
+    unit: Any
+    """Unit of the values (None if there is none), or a column of units if the unit depends on other fields."""
+
+    def labels(self) -> Any:
+        """Enumeration labels of the raw values (``Unknown(<raw>)`` for codes not in the enumeration, as in ``EEPMessage.decoded``).
+
+        Raises:
+            ValueError: If the field is not enumerated.
+        """
+        enum = self.field.range_enum
+        if enum is None:
+            raise ValueError(f"Field '{self.field.id}' is not enumerated")
+        if np is not None and isinstance(self.raw, np.ndarray):
+            # format each distinct code once
+            codes, inverse = np.unique(self.raw, return_inverse=True)
+            table = np.array([_label(enum, c) for c in codes.tolist()], dtype=object)
+            return table[inverse.reshape(-1)]
+        return [_label(enum, c) for c in self.raw]
+
+
+class BatchDecoder:
+    """Decodes batches of telegram data of one EEP telegram type into one column per data field.
+
+    Decoded values equal those of ``EEPHandler.decode`` (``msg.raw`` and
+    ``msg.decoded``), but no message objects are created.
+    """
+
+    def __init__(
+        self, eep: EEPSpecification, cmd_value: TelegramKey = 0, use_numpy: bool = True
+    ) -> None:
+        """Create a batch decoder for a telegram type.
+
+        Args:
+            eep: The EEP specification.
+            cmd_value: The telegram type (0 for single-telegram EEPs); all telegram data of a batch must be of this type.
+            use_numpy: Decode vectorized if NumPy is installed; if False, always decode telegram by telegram (columns are lists).
+
+        Raises:
+            KeyError: If the telegram type is unknown.
+        """
+        self.__telegram = eep.telegrams[cmd_value]
+        self.__numpy = use_numpy and np is not None
+        self.__unpacker = TelegramUnpacker(self.__telegram)
+
+    @property
+    def uses_numpy(self) -> bool:
+        """Whether batches are decoded vectorized with NumPy."""
+        return self.__numpy
+
+    def decode(self, payloads: Sequence[bytes] | Any) -> dict[str, FieldColumn]:
+        """Decode the telegram data (``ERP1Telegram.telegram_data``) of many telegrams.
+
+        Args:
+            payloads: Telegram data of each telegram; with NumPy also a 2-D uint8 array with one row per telegram. Data may be longer than the data fields (e.g. 4BS data whose fields end in the third byte).
+
+        Returns:
+            One column per data field, keyed by field id.
+
+        Raises:
+            ValueError: If telegram data is too short for the data fields or, when decoding with NumPy, not all of the same length.
+        """
+        if self.__numpy:
+            return self.__decode_vectorized(payloads)
+        return self.__decode_per_telegram(payloads)
+
+    def __decode_vectorized(self, payloads: Any) -> dict[str, FieldColumn]:
+        if isinstance(payloads, np.ndarray):
+            data = payloads
+            if data.ndim != 2 or data.dtype != np.uint8:
+                raise ValueError("Telegram data array must be 2-D with dtype uint8")
+        else:
+            lengths = set(map(len, payloads))
+            if len(lengths) > 1:
+                raise ValueError(
+                    f"Telegram data of a batch must have the same length, got {sorted(lengths)} bytes"
+                )
+            length = lengths.pop() if lengths else self.__telegram.byte_size
+            data = np.frombuffer(b"".join(payloads), dtype=np.uint8)
+            data = data.reshape(len(payloads), length)
+
+        min_bits = max((f.bit_end for f in self.__telegram.datafields), default=0)
+        if data.shape[1] * 8 < min_bits:
+            raise ValueError(
+                f"Telegram data of {data.shape[1]} bytes is too short for data fields up to bit {min_bits}"
+            )
+
+        datafields = self.__telegram.datafields
+        raw = {f.id: _extract(data, f) for f in datafields}
+
+        columns = {}
+        for f in datafields:
+            values = None
+            unit = None if f._unit is None else f._unit[0]
+            dynamic_scaling = f.range_enum is None and f._scaling is None
+            if f.range_enum is None and f._scaling is not None:
+                multiplier, range_min, scale_min = _scaling_or_nan(f, {})
+                values = multiplier * (raw[f.id] - range_min) + scale_min
+
+            if dynamic_scaling or f._unit is None:
+                # scale or unit depends on other fields
+                results, inverse = _per_distinct_inputs(
+                    raw,
+                    lambda row: (
+                        _scaling_or_nan(f, row) if dynamic_scaling else None,
+                        f.unit_for(row) if f._unit is None else None,
+                    ),
+                )
+                if dynamic_scaling:
+                    scalings = np.array(
+                        [scaling for scaling, _ in results], dtype=np.float64
+                    ).reshape(-1, 3)
+                    multiplier, range_min, scale_min = scalings[inverse].T
+                    values = multiplier * (raw[f.id] - range_min) + scale_min
+                if f._unit is None:
+                    unit = np.array([u for _, u in results], dtype=object)[inverse]
+
+            columns[f.id] = FieldColumn(f, raw[f.id], values, unit)
+        return columns
+
+    def __decode_per_telegram(
+        self, payloads: Sequence[bytes]
+    ) -> dict[str, FieldColumn]:
+        unpack = self.__unpacker.unpack
+        rows = [unpack(data) for data in payloads]
+
+        columns = {}
+        for f in self.__telegram.datafields:
+            raw = [row[f.id] for row in rows]
+            values = None
+            if f.range_enum is None:
+                if f._scaling is not None:
+                    multiplier, range_min, scale_min = _scaling_or_nan(f, {})
+                    values = [multiplier * (x - range_min) + scale_min for x in raw]
+                else:
+                    values = []
+                    for x, row in zip(raw, rows):
+                        multiplier, range_min, scale_min = _scaling_or_nan(f, row)
+                        values.append(multiplier * (x - range_min) + scale_min)
+
+            if f._unit is not None:
+                unit = f._unit[0]
+            else:
+                unit = [f.unit_for(row) for row in rows]
+
+            columns[f.id] = FieldColumn(f, raw, values, unit)
+        return columns
+
+
+def _label(enum: dict[int, str], code: int) -> str:
+    return enum.get(code, f"Unknown({code})")
+
+
+def _scaling_or_nan(
+    field: EEPDataField, raw_values: TelegramRawValues
+) -> tuple[float, float, float]:
+    """The field's scaling for the given raw values; NaN parameters if they are invalid."""
+    try:
+        return field.scaling(raw_values)
+    except ValueError:
+        return (math.nan, 0, math.nan)
+
+
+def _extract(data: Any, field: EEPDataField) -> Any:
+    """Raw values of a field from a uint8 array with one row of telegram data per telegram."""
+    # only the bytes the field spans (at most 5 for fields of up to 32 bits)
+    first, last = field.offset // 8, (field.bit_end - 1) // 8
+    value = data[:, first].astype(np.int64)
+    for i in range(first + 1, last + 1):
+        value = (value << 8) | data[:, i]
+    return (value >> ((last + 1) * 8 - field.bit_end)) & field.mask
+
+
+class _RecordingRawValues(dict):
+    """Raw values of one telegram that record which fields a scale or unit function reads."""
+
+    def __init__(self, values: TelegramRawValues, read: set[str]) -> None:
+        super().__init__(values)
+        self.__read = read
+
+    def __getitem__(self, key):
+        self.__read.add(key)
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.__read.add(key)
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        self.__read.add(key)
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self.__read.update(super().keys())
+        return super().__iter__()
+
+    def keys(self):
+        self.__read.update(super().keys())
+        return super().keys()
+
+    def values(self):
+        self.__read.update(super().keys())
+        return super().values()
+
+    def items(self):
+        self.__read.update(super().keys())
+        return super().items()
+
+
+def _per_distinct_inputs(
+    raw: dict[str, Any], fn: Callable[[TelegramRawValues], Any]
+) -> tuple[list[Any], Any]:
+    """Evaluate ``fn`` (a function of a telegram's raw values) once per distinct combination of the fields it reads.
+
+    Returns the results and, per telegram, the index of its result. Telegrams are
+    grouped by the fields read so far until evaluating ``fn`` once per group reads
+    no other field; the results within a group are then equal.
+    """
+    count = len(next(iter(raw.values()))) if raw else 0
+    keys: list[str] = []
+    while True:
+        if keys:
+            _, first, inverse = np.unique(
+                np.stack([raw[k] for k in keys], axis=1),
+                axis=0,
+                return_index=True,
+                return_inverse=True,
+            )
+        else:
+            first = np.zeros(min(count, 1), dtype=np.intp)
+            inverse = np.zeros(count, dtype=np.intp)
+        read: set[str] = set()
+        results = [
+            fn(_RecordingRawValues({k: int(v[i]) for k, v in raw.items()}, read))
+            for i in first.tolist()
+        ]
+        if read <= set(keys):
+            return results, inverse.reshape(-1)
+        keys = [k for k in raw if k in read or k in keys]
@@ -0,0 +1,224 @@
+"""Generation of specialized decode (and encode) functions per EEP telegram type.
+
+Decode functions are generated as Python source of a factory that binds the
+telegram's fields, tables and resolvers and returns the decode function. The
+factory source is either compiled at runtime (``compile_decoder``) or taken from
+the ahead-of-time compiled module ``_compiled.py`` (generated by
+``scripts/generate_decoders.py``), which needs no runtime code generation. The
+compiled module also holds straight-line encode functions (see
+``TelegramPacker.source``); encoders are never generated at runtime.
+"""
+
+from collections.abc import Callable, Mapping
+import hashlib
+import logging
+from typing import Any
+
+from ..semantics.observable import Observable
+from ..semantics.types import SemanticResolver
+from .message import EEPMessage, TelegramKey, ValueWithContext
+from .profile import EEPTelegram
+
+_logger = logging.getLogger(__name__)
+
+type FieldDecoder = Callable[[bytes, EEPMessage, dict[str, Any]], None]
+"""Fills ``raw``, ``decoded`` and ``values`` of a message from telegram data (data, message, device config)."""
+
+ALLOW_RUNTIME_CODEGEN: bool = True
+"""Whether decode functions missing from (or out of date in) the ahead-of-time compiled module may be generated at runtime.
+
+Set to False before creating handlers where runtime code generation is not
+permitted; such telegram types are then decoded by the generic interpreter.
+"""
+
+GLOBALS: dict[str, Any] = {"VWC": ValueWithContext, "from_bytes": int.from_bytes}
+"""Globals referenced by generated decoder code (defined identically in ``_compiled.py``)."""
+
+
+def decoder_source(
+    telegram: EEPTelegram,
+    resolver_count: int,
+    name: str = "make_decoder",
+    fields: frozenset[str] | None = None,
+) -> str:
+    """Return the source of a factory ``name(telegram, resolvers, fallback)`` that returns the decode function of a telegram type.
+
+    The decode function is straight-line code for telegram data of at least the
+    telegram's ``byte_size`` (e.g. 4BS data is always 4 bytes, even if the
+    fields end in the third byte): every field is extracted with a literal shift and
+    mask, fields with a ``value_table`` are decoded by indexing it, constant
+    scales and units (see ``EEPDataField.scaled_value``) of other fields are
+    folded into the code, and only the observable assignments and semantic
+    resolvers that exist are emitted. Shorter telegram data is passed to
+    ``fallback``.
+
+    Args:
+        telegram: The telegram definition.
+        resolver_count: Number of semantic resolvers of the EEP (passed to the factory as ``(observable, resolver)`` items).
+        name: Name of the factory function.
+        fields: If given, only these and observable fields get a decoded value (see ``EEPHandler.decode``).
+    """
+    byte_size = telegram.byte_size
+    bits = byte_size * 8
+    datafields = telegram.datafields
+
+    head = [
+        f"def {name}(telegram, resolvers, fallback):",
+        "    fields = telegram.datafields",
+    ]
+    body = [
+        "    def decode(data, msg, cfg):",
+        f"        extra = len(data) - {byte_size}",
+        "        if extra < 0:",
+        "            return fallback(data, msg, cfg)",
+        '        v = from_bytes(data, "big") >> (extra << 3)',
+    ]
+    for i, f in enumerate(datafields):
+        body.append(f"        f{i} = (v >> {bits - f.bit_end}) & {f.mask}")
+    body.append(
+        "        raw = {"
+        + ", ".join(f"{f.id!r}: f{i}" for i, f in enumerate(datafields))
+        + "}"
+    )
+    body.append("        msg.raw = raw")
+    body.append("        decoded = msg.decoded")
+
+    for i, f in enumerate(datafields):
+        if fields is not None and f.observable is None and f.id not in fields:
+            continue  # nobody reads its decoded value
+
+        if f.value_table is not None:
+            head.append(f"    T{i} = fields[{i}].value_table")
+            body.append(f"        d{i} = T{i}[f{i}]")
+            body.append(f"        decoded[{f.id!r}] = d{i}")
+            continue
+
+        needs_field = False
+        if f.range_enum is not None:
+            head.append(f"    E{i} = fields[{i}].range_enum")
+            value = f'(E{i}[f{i}] if f{i} in E{i} else f"Unknown({{f{i}}})")'
+        elif f._scaling is None:
+            needs_field = True
+            value = f"F{i}.scaled_value(f{i}, raw)"
+        elif isinstance(f._scaling, str):
+            body.append(f"        raise ValueError({f._scaling!r})")
+            break  # the interpreter fails at the same field
+        else:
+            multiplier, range_min, scale_min = f._scaling
+            value = f"{multiplier!r} * (f{i} - {range_min!r}) + {scale_min!r}"
+
+        if f._unit is not None:
+            unit = repr(f._unit[0])
+        else:
+            needs_field = True
+            unit = f"F{i}.unit_for(raw)"
+        if needs_field:
+            head.append(f"    F{i} = fields[{i}]")
+
+        body.append(f"        d{i} = VWC({value}, {unit}, {(f.name or f.id)!r})")
+        body.append(f"        decoded[{f.id!r}] = d{i}")
+
+    else:
+        observed = [i for i, f in enumerate(datafields) if f.observable is not None]
+        if observed or resolver_count:
+            body.append("        values = msg.values")
+        for i in observed:
+            head.append(f"    O{i} = fields[{i}].observable")
+            body.append(f"        values[O{i}] = d{i}")
+        for j in range(resolver_count):
+            head.append(f"    RO{j}, R{j} = resolvers[{j}]")
+            body.append(f"        r = R{j}(raw, decoded, cfg)")
+            body.append("        if r is not None:")
+            body.append(f"            values[RO{j}] = r")
+
+    return "\n".join(head + body + ["    return decode"]) + "\n"
+
+
+def source_digest(source: str) -> str:
+    """Short digest of generated source, used to detect out-of-date entries of the compiled module."""
+    return hashlib.blake2b(source.encode(), digest_size=8).hexdigest()
+
+
+def compile_decoder(
+    telegram: EEPTelegram,
+    semantic_resolvers: Mapping[Observable, SemanticResolver],
+    fallback: FieldDecoder,
+    label: str = "",
+    fields: frozenset[str] | None = None,
+) -> FieldDecoder:
+    """Generate and compile the decode function of a telegram type at runtime (see ``decoder_source``).
+
+    Args:
+        telegram: The telegram definition.
+        semantic_resolvers: The EEP's semantic resolvers, called after all fields are decoded.
+        fallback: Decoder used for telegram data shorter than ``telegram.byte_size``.
+        label: Used in the file name of the generated code (visible in tracebacks and profiles).
+        fields: If given, only these and observable fields get a decoded value.
+    """
+    resolvers = tuple(semantic_resolvers.items())
+    source = decoder_source(telegram, len(resolvers), fields=fields)
+    namespace = dict(GLOBALS)
+    exec(compile(source, f"<decoder {label}>", "exec"), namespace)
+    decoder = namespace["make_decoder"](telegram, resolvers, fallback)
+    decoder.source = source
+    return decoder
+
+
+def specialized_decoder(
+    key: tuple[str, TelegramKey],
+    telegram: EEPTelegram,
+    semantic_resolvers: Mapping[Observable, SemanticResolver],
+    fallback: FieldDecoder,
+    fields: frozenset[str] | None = None,
+) -> FieldDecoder | None:
+    """Return the specialized decode function of a telegram type, preferring the ahead-of-time compiled module.
+
+    Falls back to runtime generation (if ``ALLOW_RUNTIME_CODEGEN``) when the
+    compiled module has no up-to-date entry for ``key`` (``(str(eep), cmd_value)``);
+    returns None if neither is available. The compiled module only holds decoders
+    of all fields; for a subset of ``fields`` without runtime generation, the
+    compiled decoder of all fields is returned (it decodes more than needed).
+    """
+    resolvers = tuple(semantic_resolvers.items())
+    entry = compiled_entries("DECODERS").get(key)
+    if entry is not None:
+        source = decoder_source(telegram, len(resolvers), fields=fields)
+        if entry[0] == source_digest(source):
+            return entry[1](telegram, resolvers, fallback)
+        if fields is None:
+            _logger.debug(
+                f"Compiled decoder for {key[0]} telegram {key[1]} is out of date; run scripts/generate_decoders.py."
+            )
+    if ALLOW_RUNTIME_CODEGEN:
+        return compile_decoder(
+            telegram,
+            semantic_resolvers,
+            fallback,
+            label=f"{key[0]} {key[1]}",
+            fields=fields,
+        )
+    if fields is not None:
+        return specialized_decoder(key, telegram, semantic_resolvers, fallback)
+    return None
+
+
+def compiled_encoder(
+    key: tuple[str, TelegramKey], source: str, label: str
+) -> Callable[[Mapping[str, int]], bytes] | None:
+    """Return the encode function of the ahead-of-time compiled module for ``key`` if it was generated from ``source`` (see ``TelegramPacker.source``), else None."""
+    entry = compiled_entries("ENCODERS").get(key)
+    if entry is not None and entry[0] == source_digest(source):
+        return entry[1](label)
+    return None
+
+
+def compiled_entries(name: str) -> dict[tuple[str, TelegramKey], tuple[str, Any]]:
+    """``DECODERS`` or ``ENCODERS`` of the ahead-of-time compiled module: ``(str(eep), cmd_value) -> (source digest, function)``.
+
+    The module is imported on first use; empty if it is missing.
+    """
+    try:
+        from . import _compiled
+    except ImportError:
+        return {}
+    return getattr(_compiled, name)
@@ -5,12 +5,14 @@ command subset differs per device.
 
 Extended commands (CMD 0xF / ECID 0x00–0x02)
 ---------------------------------------------
-The current EEPHandler dispatches on cmd_value only.  ECID sub-dispatch is not yet
-implemented, so dimming-limits sub-telegrams are registered under synthetic keys
-0xF0 / 0xF1 / 0xF2 for future use.
+The dimming-limits telegrams are selected by CMD 0xF and the ECID byte that follows
+it.  They are keyed by ``(CMD, ECID)`` (``(0xF, 0x00)`` to ``(0xF, 0x02)``, see
+``EEPSpecification.telegram_key``), which EEPHandler dispatches on for both decoding
+and encoding.
 """
 
 from dataclasses import dataclass
+from functools import cache
 
 from ...semantics.instructable import Instructable
 from ...semantics.instructions.switch import (
@@ -20,9 +22,16 @@ from ...semantics.instructions.switch import (
 )
 from ...semantics.observable import Observable
 from ...semantics.observers.scalar import scalar_factory
+from ..enum_table import enum_table
 from ..id import EEP
-from ..message import EEPMessageType, RawEEPMessage, ValueWithContext
-from ..profile import EEPDataField, EEPSpecification, EEPTelegram, Entity
+from ..message import EEPMessageType, RawEEPMessage, TelegramKey, ValueWithContext
+from ..profile import (
+    EEPConfirmation,
+    EEPDataField,
+    EEPSpecification,
+    EEPTelegram,
+    Entity,
+)
 from ._util import channel_from_entity_id
 
 # ---------------------------------------------------------------------------
@@ -80,6 +89,15 @@ def _ecid(ecid_id: int) -> EEPDataField:
     )
 
 
+def _output_channel(i: int) -> str:
+    return f"Output channel {i + 1}"
+
+
+def _percent(i: int) -> str:
+    return f"{i}%"
+
+
+@cache
 def _io(offset: int = 11, *, not_applicable_at_1e: bool = False) -> EEPDataField:
     """I/O channel field.  Response telegrams use not_applicable_at_1e=True."""
     return EEPDataField(
@@ -87,11 +105,15 @@ def _io(offset: int = 11, *, not_applicable_at_1e: bool = False) -> EEPDataField
         name="I/O channel",
         offset=offset,
         size=5,
-        range_enum={
-            **{i: f"Output channel {i + 1}" for i in range(0x1E)},
-            0x1E: "Not applicable" if not_applicable_at_1e else "All output channels",
-            0x1F: "Input channel",
-        },
+        range_enum=enum_table(
+            {
+                range(0x1E): _output_channel,
+                0x1E: (
+                    "Not applicable" if not_applicable_at_1e else "All output channels"
+                ),
+                0x1F: "Input channel",
+            }
+        ),
     )
 
 
@@ -99,16 +121,20 @@ def _io(offset: int = 11, *, not_applicable_at_1e: bool = False) -> EEPDataField
 # Shared field enumerations
 # ---------------------------------------------------------------------------
 
-_DIM_TIMER_ENUM: dict[int, str] = {
-    0x00: "Not used",
-    **{i: f"{i * 0.5:.1f} s" for i in range(1, 16)},  # 0x01–0x0F → 0.5–7.5 s
-}
-_OUTPUT_VALUE_ENUM: dict[int, str] = {
-    0x00: "0% / OFF",
-    **{i: f"{i}% / ON" for i in range(1, 0x65)},
-    **{i: "Not used" for i in range(0x65, 0x7F)},
-    0x7F: "Output value not valid / not applicable",
-}
+_DIM_TIMER_ENUM = enum_table(
+    {
+        0x00: "Not used",
+        range(1, 16): lambda i: f"{i * 0.5:.1f} s",  # 0x01–0x0F → 0.5–7.5 s
+    }
+)
+_OUTPUT_VALUE_ENUM = enum_table(
+    {
+        0x00: "0% / OFF",
+        range(1, 0x65): lambda i: f"{i}% / ON",
+        range(0x65, 0x7F): "Not used",
+        0x7F: "Output value not valid / not applicable",
+    }
+)
 _UNIT_ENUM: dict[int, str] = {
     0x00: "Energy [Ws]",
     0x01: "Energy [Wh]",
@@ -127,25 +153,24 @@ _PILOT_WIRE_ENUM: dict[int, str] = {
     0x04: "Comfort-1",
     0x05: "Comfort-2",
 }
-_TIMER_ENUM: dict[int, str] = {
-    0x0000: "Timer deactivated",
-    **{i: f"{i * 0.1:.1f} s" for i in range(1, 0xFFFF)},  # 0x0001–0xFFFE → 0.1–6553.4 s
-    0xFFFF: "Does not modify saved value",
-}
-_MAXV_ENUM: dict[int, str] = {
-    0x00: "Reserved",
-    **{i: f"{i}%" for i in range(1, 101)},
-    **{i: "Reserved" for i in range(101, 128)},
-}
-_MINV_ENUM: dict[int, str] = {
-    **{i: f"{i}%" for i in range(100)},
-    **{i: "Reserved" for i in range(100, 128)},
-}
-_DIMMING_LIMITS_IO_ENUM: dict[int, str] = {
-    **{i: f"Output channel {i + 1}" for i in range(0x1E)},
-    0x1E: "All output channels",
-    0x1F: "Reserved",
-}
+_TIMER_ENUM = enum_table(
+    {
+        0x0000: "Timer deactivated",
+        range(1, 0xFFFF): lambda i: f"{i * 0.1:.1f} s",  # 0x0001–0xFFFE → 0.1–6553.4 s
+        0xFFFF: "Does not modify saved value",
+    }
+)
+_MAXV_ENUM = enum_table(
+    {0x00: "Reserved", range(1, 101): _percent, range(101, 128): "Reserved"}
+)
+_MINV_ENUM = enum_table({range(100): _percent, range(100, 128): "Reserved"})
+_DIMMING_LIMITS_IO_ENUM = enum_table(
+    {
+        range(0x1E): _output_channel,
+        0x1E: "All output channels",
+        0x1F: "Reserved",
+    }
+)
 
 # ---------------------------------------------------------------------------
 # Telegram definitions
@@ -396,20 +421,18 @@ _CMD_0x5_ActuatorSetMeasurement = EEPTelegram(
             name="Maximum time between actuator messages",
             offset=32,
             size=8,
-            range_enum={
-                0x00: "Reserved",
-                **{i: f"{i * 10} s" for i in range(1, 256)},
-            },
+            range_enum=enum_table(
+                {0x00: "Reserved", range(1, 256): lambda i: f"{i * 10} s"}
+            ),
         ),
         EEPDataField(
             id="MIT",
             name="Minimum time between actuator messages",
             offset=40,
             size=8,
-            range_enum={
-                0x00: "Reserved",
-                **{i: f"{i} s" for i in range(1, 256)},
-            },
+            range_enum=enum_table(
+                {0x00: "Reserved", range(1, 256): lambda i: f"{i} s"}
+            ),
         ),
     ],
 )
@@ -538,7 +561,7 @@ _CMD_0xD_ActuatorExternalInterfaceSettingsResponse = EEPTelegram(
     ],
 )
 
-# CMD 0xF / ECID 0x00–0x02 — Dimming Limits (synthetic keys 0xF0/0xF1/0xF2)
+# CMD 0xF / ECID 0x00–0x02 — Dimming Limits (keys (0xF, 0x00) to (0xF, 0x02))
 _DIMMING_IO = EEPDataField(
     id="I/O", name="I/O channel", offset=16, size=5, range_enum=_DIMMING_LIMITS_IO_ENUM
 )
@@ -565,7 +588,7 @@ _CMD_0xF_ECID_0x02_ActuatorDimmingLimitsResponse = EEPTelegram(
 # ---------------------------------------------------------------------------
 # Master telegram dictionary (shared by all type variants)
 # ---------------------------------------------------------------------------
-EEP_D2_01_TELEGRAMS: dict[int, EEPTelegram] = {
+EEP_D2_01_TELEGRAMS: dict[TelegramKey, EEPTelegram] = {
     0x01: _CMD_0x1_ActuatorSetOutput,
     0x02: _CMD_0x2_ActuatorSetLocal,
     0x03: _CMD_0x3_ActuatorStatusQuery,
@@ -579,9 +602,9 @@ EEP_D2_01_TELEGRAMS: dict[int, EEPTelegram] = {
     0x0B: _CMD_0xB_ActuatorSetExternalInterfaceSettings,
     0x0C: _CMD_0xC_ActuatorExternalInterfaceSettingsQuery,
     0x0D: _CMD_0xD_ActuatorExternalInterfaceSettingsResponse,
-    0xF0: _CMD_0xF_ECID_0x00_ActuatorSetDimmingLimits,
-    0xF1: _CMD_0xF_ECID_0x01_ActuatorDimmingLimitsQuery,
-    0xF2: _CMD_0xF_ECID_0x02_ActuatorDimmingLimitsResponse,  # extended commands (pending ECID dispatch)
+    (0xF, 0x00): _CMD_0xF_ECID_0x00_ActuatorSetDimmingLimits,
+    (0xF, 0x01): _CMD_0xF_ECID_0x01_ActuatorDimmingLimitsQuery,
+    (0xF, 0x02): _CMD_0xF_ECID_0x02_ActuatorDimmingLimitsResponse,
 }
 
 # ---------------------------------------------------------------------------
@@ -628,6 +651,20 @@ _COMMAND_ENCODERS = {
     Instructable.QUERY_ACTUATOR_MEASUREMENT: lambda a, _: _encode_query_measurement(a),
 }
 
+# Status (CMD 0x4) and measurement (CMD 0x7) responses echo the I/O channel;
+# 0x1E = all output channels (sent) / not applicable (received).
+_CONFIRMATIONS = {
+    Instructable.SET_SWITCH_OUTPUT: EEPConfirmation(
+        reply_cmd=0x4, channel_field="I/O", all_channels=0x1E, query=QueryActuatorStatus
+    ),
+    Instructable.QUERY_ACTUATOR_STATUS: EEPConfirmation(
+        reply_cmd=0x4, channel_field="I/O", all_channels=0x1E
+    ),
+    Instructable.QUERY_ACTUATOR_MEASUREMENT: EEPConfirmation(
+        reply_cmd=0x7, channel_field="I/O", all_channels=0x1E
+    ),
+}
+
 
 # ---------------------------------------------------------------------------
 # Semantic resolvers
@@ -808,6 +845,7 @@ def _spec(
         ecid_size=8,
         telegrams=EEP_D2_01_TELEGRAMS,
         encoders=_COMMAND_ENCODERS,
+        confirmations=_CONFIRMATIONS,
         semantic_resolvers=_DIMMER_RESOLVERS if dimming else _BASE_RESOLVERS,
         observers=_factories(dimming=dimming, metering=metering, pilot_wire=pilot_wire),
         entities=_entities(
@@ -23,7 +23,13 @@ from ...semantics.observable import Observable
 from ...semantics.observers.cover import cover_factory
 from ..id import EEP
 from ..message import EEPMessageType, RawEEPMessage
-from ..profile import EEPDataField, EEPSpecification, EEPTelegram, Entity
+from ..profile import (
+    EEPConfirmation,
+    EEPDataField,
+    EEPSpecification,
+    EEPTelegram,
+    Entity,
+)
 from ._util import channel_from_entity_id
 
 # ---------------------------------------------------------------------------
@@ -332,6 +338,25 @@ _COVER_ACTIONS = frozenset(
 )
 
 
+# ---------------------------------------------------------------------------
+# Confirmations
+# ---------------------------------------------------------------------------
+
+# CMD 4 (Reply position and angle) carries the channel; CHN=15 addresses all channels.
+_REPLY_CONFIRMATION = EEPConfirmation(
+    reply_cmd=4, channel_field="CHN", all_channels=15, query=CoverQueryPositionAndAngle
+)
+_CONFIRMATIONS = {
+    Instructable.COVER_SET_POSITION_AND_ANGLE: _REPLY_CONFIRMATION,
+    Instructable.COVER_STOP: _REPLY_CONFIRMATION,
+    Instructable.COVER_OPEN: _REPLY_CONFIRMATION,
+    Instructable.COVER_CLOSE: _REPLY_CONFIRMATION,
+    Instructable.COVER_QUERY_POSITION_AND_ANGLE: EEPConfirmation(
+        reply_cmd=4, channel_field="CHN", all_channels=15
+    ),
+}
+
+
 # ---------------------------------------------------------------------------
 # Entities / observers
 # ---------------------------------------------------------------------------
@@ -420,6 +445,7 @@ def _spec(
         telegrams=telegrams,
         observers=_observers(channels),
         encoders=encoders,
+        confirmations=_CONFIRMATIONS,
         entities=_entities(channels, supports_set_parameters=supports_set_parameters),
     )
 
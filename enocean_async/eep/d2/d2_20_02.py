@@ -4,10 +4,21 @@ from ...semantics.instructable import Instructable
 from ...semantics.instructions.fan import SetFanSpeed
 from ...semantics.observable import Observable
 from ...semantics.observers.scalar import scalar_factory
+from ..enum_table import enum_table
 from ..id import EEP
 from ..message import EEPMessageType, RawEEPMessage, ValueWithContext
 from ..profile import EEPDataField, EEPSpecification, EEPTelegram, Entity
 
+_FAN_SPEED_ENUM = enum_table(
+    {
+        range(101): lambda i: f"{i}%",
+        range(101, 253): "Reserved",
+        253: "Auto",
+        254: "Default",
+        255: "No change",
+    }
+)
+
 
 def _fan_speed_resolver(
     raw: dict[str, int], scaled: dict[str, ValueWithContext], _config: dict
@@ -91,13 +102,7 @@ EEP_D2_20_02 = EEPSpecification(
                     name="Fan speed",
                     offset=24,
                     size=8,
-                    range_enum={
-                        **{i: f"{i}%" for i in range(101)},
-                        **{i: "Reserved" for i in range(101, 253)},
-                        253: "Auto",
-                        254: "Default",
-                        255: "No change",
-                    },
+                    range_enum=_FAN_SPEED_ENUM,
                 ),
             ],
         ),
@@ -152,13 +157,7 @@ EEP_D2_20_02 = EEPSpecification(
                     name="Fan speed",
                     offset=24,
                     size=8,
-                    range_enum={
-                        **{i: f"{i}%" for i in range(101)},
-                        **{i: "Reserved" for i in range(101, 253)},
-                        253: "Auto",
-                        254: "Default",
-                        255: "No change",
-                    },
+                    range_enum=_FAN_SPEED_ENUM,
                 ),
             ],
         ),
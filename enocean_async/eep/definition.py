@@ -0,0 +1,498 @@
+"""Loading of EEP specifications from declarative definition files.
+
+A definition file is a compact JSON description of the telegram layout of one or
+more EEPs (fields, enumerations, linear scaling, units, observables). Profiles
+whose behaviour goes beyond that (semantic resolvers, encoders, custom observers)
+are written in Python as before.
+
+Parsing and validating a file produces a *compiled* form: nested tuples of plain
+values, stored with ``marshal`` in a cache directory under the SHA-256 of the
+file's content. Later loads of an unchanged file read the compiled form instead
+of parsing the JSON again; edited files get a new hash and are compiled anew.
+``enocean_async.eep.register_definitions`` adds the EEPs of a file to
+``EEP_SPECIFICATIONS`` and builds each specification on its first lookup, so
+registering many EEPs only costs reading the compiled form.
+
+Format (``"format": 1``)::
+
+    {
+      "format": 1,
+      "profiles": [
+        {
+          "eep": "A5-02-05",
+          "name": "Temperature sensor, range 0°C to 40°C",
+          "fields": [
+            {"id": "TMP", "name": "Temperature", "offset": 16, "size": 8,
+             "range": [255, 0], "scale": [0, 40], "unit": "°C",
+             "observable": "temperature"}
+          ],
+          "observers": ["temperature"]
+        }
+      ]
+    }
+
+Profile keys: ``eep`` (as accepted by ``EEP``, e.g. ``"A5-06-01.ELTAKO"``) and
+``name`` are required. A profile has either ``fields`` (a single telegram type)
+or ``telegrams``, an object keyed by the telegram's CMD value (``"0x1"``) with
+``name`` and ``fields``, together with ``cmd`` (``{"offset": .., "size": ..}``) and
+optionally ``ecid`` for extended commands, whose telegrams are keyed
+``"<cmd>/<ecid>"`` (e.g. ``"0xF/0x02"``). ``observers`` lists the observables
+that get a ``ScalarObserver``; ``entities`` (``{"<entity id>": [observables]}``)
+defaults to one entity per observer. ``addressed_sending`` (default true) maps to
+``EEPSpecification.uses_addressed_sending``.
+
+Field keys: ``id``, ``offset`` and ``size`` are required; ``name``, ``range``
+(``[range_min, range_max]``), ``scale`` (``[scale_min, scale_max]``), ``unit``,
+``enum`` and ``observable`` are optional. ``enum`` maps raw values (``"3"``) or
+inclusive ranges of raw values (``"1-9"``) to labels; a label containing ``{}``
+is formatted with the raw value.
+"""
+
+from collections.abc import Callable
+import hashlib
+import json
+import logging
+import marshal
+import os
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from ..semantics.entity import Entity
+from ..semantics.observable import Observable
+from ..semantics.observers.scalar import scalar_factory
+from .id import EEP
+from .message import TelegramKey
+from .profile import EEPDataField, EEPSpecification, EEPTelegram
+
+_logger = logging.getLogger(__name__)
+
+DEFINITION_FORMAT = 1
+"""Version of the definition file format understood by this loader."""
+
+COMPILED_FORMAT = 2
+"""Version of the compiled form; part of the cache file name, so that cached files of other versions are ignored."""
+
+type CompiledField = tuple[
+    str,  # id
+    str,  # name
+    int,  # offset
+    int,  # size
+    int | None,  # range_min
+    int | None,  # range_max
+    float | None,  # scale_min
+    float | None,  # scale_max
+    str | None,  # unit
+    tuple[tuple[int, int, str], ...] | None,  # enum: (start, stop, label)
+    str | None,  # observable
+]
+type CompiledTelegram = tuple[TelegramKey, str | None, tuple[CompiledField, ...]]
+type CompiledProfile = tuple[
+    str,  # eep
+    str,  # name
+    tuple[int, int] | None,  # cmd (size, offset)
+    tuple[int, int] | None,  # ecid (size, offset)
+    bool,  # uses_addressed_sending
+    tuple[CompiledTelegram, ...],
+    tuple[str, ...],  # observers
+    tuple[tuple[str, tuple[str, ...]], ...],  # entities
+]
+
+_PROFILE_KEYS = frozenset(
+    {"eep", "name", "fields", "telegrams", "cmd", "ecid", "observers", "entities"}
+    | {"addressed_sending"}
+)
+_FIELD_KEYS = frozenset(
+    {"id", "name", "offset", "size", "range", "scale", "unit", "enum", "observable"}
+)
+
+
+def default_cache_dir() -> Path:
+    """Default directory for compiled definitions: ``$XDG_CACHE_HOME/enocean_async`` (``~/.cache/enocean_async``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "enocean_async"
+
+
+def load_definitions(
+    path: str | os.PathLike,
+    *,
+    cache: bool = True,
+    cache_dir: str | os.PathLike | None = None,
+) -> list[EEPSpecification]:
+    """Load the EEP specifications of a definition file.
+
+    See ``compiled_definitions`` for the cache; to build specifications only when
+    they are first looked up, use ``enocean_async.eep.register_definitions``.
+
+    Raises:
+        OSError: If the definition file cannot be read.
+        ValueError: If the file is not a valid definition file.
+    """
+    return [
+        build_specification(profile)
+        for profile in compiled_definitions(path, cache=cache, cache_dir=cache_dir)
+    ]
+
+
+def compiled_definitions(
+    path: str | os.PathLike,
+    *,
+    cache: bool = True,
+    cache_dir: str | os.PathLike | None = None,
+) -> tuple[CompiledProfile, ...]:
+    """Return the compiled form of a definition file.
+
+    The compiled form is read from ``cache_dir`` (default: ``default_cache_dir()``)
+    if the file was compiled before, and written there otherwise; a cache that
+    cannot be read or written is ignored.
+
+    Raises:
+        OSError: If the definition file cannot be read.
+        ValueError: If the file is not a valid definition file.
+    """
+    content = Path(path).read_bytes()
+    cache_file = None
+    if cache:
+        digest = hashlib.sha256(content).hexdigest()
+        cache_file = Path(cache_dir or default_cache_dir()) / (
+            f"{digest}.v{COMPILED_FORMAT}.m{marshal.version}.eepc"
+        )
+        compiled = _read_compiled(cache_file)
+        if compiled is not None:
+            return compiled
+
+    try:
+        document = json.loads(content)
+    except ValueError as e:
+        raise ValueError(f"{path}: invalid JSON: {e}") from None
+    try:
+        compiled = compile_definitions(document)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
+    if cache_file is not None:
+        _write_compiled(cache_file, compiled)
+    return compiled
+
+
+def compile_definitions(document: Any) -> tuple[CompiledProfile, ...]:
+    """Validate a parsed definition file and return its compiled form.
+
+    Raises:
+        ValueError: If the document is not a valid definition.
+    """
+    if not isinstance(document, dict) or "profiles" not in document:
+        raise ValueError("expected an object with 'format' and 'profiles'")
+    if document.get("format") != DEFINITION_FORMAT:
+        raise ValueError(
+            f"unsupported format {document.get('format')!r}, expected {DEFINITION_FORMAT}"
+        )
+    profiles = _expect(document["profiles"], list, "profiles")
+    return tuple(_compile_profile(profile, i) for i, profile in enumerate(profiles))
+
+
+def build_specification(compiled: CompiledProfile) -> EEPSpecification:
+    """Build the EEP specification of a compiled profile."""
+    (
+        eep,
+        name,
+        cmd,
+        ecid,
+        addressed_sending,
+        telegrams,
+        observers,
+        entities,
+    ) = compiled
+    cmd_size, cmd_offset = cmd or (0, None)
+    ecid_size, ecid_offset = ecid or (0, None)
+    return EEPSpecification(
+        eep=EEP(eep),
+        name=name,
+        cmd_size=cmd_size,
+        cmd_offset=cmd_offset,
+        ecid_size=ecid_size,
+        ecid_offset=ecid_offset,
+        telegrams={
+            key: EEPTelegram(
+                name=telegram_name, datafields=[_build_field(f) for f in fields]
+            )
+            for key, telegram_name, fields in telegrams
+        },
+        observers=[scalar_factory(Observable(o)) for o in observers],
+        entities=[
+            Entity(
+                id=entity_id,
+                observables=frozenset(Observable(o) for o in observables),
+            )
+            for entity_id, observables in entities
+        ],
+        uses_addressed_sending=addressed_sending,
+    )
+
+
+def _build_field(compiled: CompiledField) -> EEPDataField:
+    (
+        id_,
+        name,
+        offset,
+        size,
+        range_min,
+        range_max,
+        scale_min,
+        scale_max,
+        unit,
+        enum,
+        observable,
+    ) = compiled
+    kwargs: dict[str, Any] = {}
+    if range_min is not None:
+        kwargs["range_min"] = range_min
+    if range_max is not None:
+        kwargs["range_max"] = range_max
+    if scale_min is not None:
+        kwargs["scale_min_fn"] = _constant(scale_min)
+    if scale_max is not None:
+        kwargs["scale_max_fn"] = _constant(scale_max)
+    if unit is not None:
+        kwargs["unit_fn"] = _constant(unit)
+    if enum is not None:
+        kwargs["range_enum"] = {
+            (start if stop == start + 1 else range(start, stop)): (
+                _formatter(label) if "{}" in label else label
+            )
+            for start, stop, label in enum
+        }
+    if observable is not None:
+        kwargs["observable"] = Observable(observable)
+    return EEPDataField(id=id_, name=name, offset=offset, size=size, **kwargs)
+
+
+def _constant(value: Any) -> Callable[[Any], Any]:
+    return lambda _: value
+
+
+def _formatter(label: str) -> Callable[[int], str]:
+    return lambda raw: label.format(raw)
+
+
+def _compile_profile(profile: Any, index: int) -> CompiledProfile:
+    where = f"profiles[{index}]"
+    profile = _expect(profile, dict, where)
+    _check_keys(profile, _PROFILE_KEYS, where)
+    eep = _expect(profile.get("eep"), str, f"{where}.eep")
+    where = f"profile {eep}"
+    try:
+        EEP(eep)
+    except ValueError as e:
+        raise ValueError(f"{where}: {e}") from None
+    name = _expect(profile.get("name"), str, f"{where}.name")
+    addressed_sending = _expect(
+        profile.get("addressed_sending", True), bool, f"{where}.addressed_sending"
+    )
+
+    cmd = _compile_selector(profile.get("cmd"), f"{where}.cmd")
+    ecid = _compile_selector(profile.get("ecid"), f"{where}.ecid")
+    if ecid is not None and cmd is None:
+        raise ValueError(f"{where}: 'ecid' requires 'cmd'")
+    if ("fields" in profile) == ("telegrams" in profile):
+        raise ValueError(f"{where}: expected either 'fields' or 'telegrams'")
+    if "fields" in profile:
+        if cmd is not None:
+            raise ValueError(f"{where}: 'cmd' requires 'telegrams'")
+        telegrams = ((0, None, _compile_fields(profile["fields"], where)),)
+    else:
+        if cmd is None:
+            raise ValueError(f"{where}: 'telegrams' requires 'cmd'")
+        telegrams = tuple(
+            _compile_telegram(key, telegram, cmd, ecid, where)
+            for key, telegram in _expect(
+                profile["telegrams"], dict, f"{where}.telegrams"
+            ).items()
+        )
+
+    observers = tuple(
+        _observable(o, f"{where}.observers")
+        for o in _expect(profile.get("observers", []), list, f"{where}.observers")
+    )
+    if "entities" in profile:
+        entities = tuple(
+            (
+                entity_id,
+                tuple(
+                    _observable(o, f"{where}.entities.{entity_id}")
+                    for o in _expect(observables, list, f"{where}.entities.{entity_id}")
+                ),
+            )
+            for entity_id, observables in _expect(
+                profile["entities"], dict, f"{where}.entities"
+            ).items()
+        )
+    else:
+        entities = tuple((o, (o,)) for o in observers)
+    return (eep, name, cmd, ecid, addressed_sending, telegrams, observers, entities)
+
+
+def _compile_selector(selector: Any, where: str) -> tuple[int, int] | None:
+    if selector is None:
+        return None
+    selector = _expect(selector, dict, where)
+    _check_keys(selector, frozenset({"offset", "size"}), where)
+    return (
+        _expect(selector.get("size"), int, f"{where}.size"),
+        _expect(selector.get("offset"), int, f"{where}.offset"),
+    )
+
+
+def _compile_telegram(
+    key: str,
+    telegram: Any,
+    cmd: tuple[int, int],
+    ecid: tuple[int, int] | None,
+    where: str,
+) -> CompiledTelegram:
+    where = f"{where}.telegrams[{key!r}]"
+    telegram = _expect(telegram, dict, where)
+    _check_keys(telegram, frozenset({"name", "fields"}), where)
+    cmd_part, extended, ecid_part = key.partition("/")
+    try:
+        cmd_value = int(cmd_part, 0)
+        ecid_value = int(ecid_part, 0) if extended else None
+    except ValueError:
+        raise ValueError(
+            f"{where}: invalid key, expected '<cmd>' or '<cmd>/<ecid>'"
+        ) from None
+    if extended and ecid is None:
+        raise ValueError(f"{where}: extended command key requires 'ecid'")
+    if cmd_value >> cmd[0] or (ecid_value or 0) >> (ecid or (0,))[0]:
+        raise ValueError(f"{where}: key does not fit the CMD/ECID size")
+    key_value = EEPSpecification.telegram_key(cmd_value, ecid_value)
+    name = telegram.get("name")
+    if name is not None:
+        _expect(name, str, f"{where}.name")
+    return (key_value, name, _compile_fields(telegram.get("fields"), where))
+
+
+def _compile_fields(fields: Any, where: str) -> tuple[CompiledField, ...]:
+    return tuple(
+        _compile_field(f, f"{where}.fields[{i}]")
+        for i, f in enumerate(_expect(fields, list, f"{where}.fields"))
+    )
+
+
+def _compile_field(field: Any, where: str) -> CompiledField:
+    field = _expect(field, dict, where)
+    _check_keys(field, _FIELD_KEYS, where)
+    id_ = _expect(field.get("id"), str, f"{where}.id")
+    where = f"{where} ({id_})"
+    offset = _expect(field.get("offset"), int, f"{where}.offset")
+    size = _expect(field.get("size"), int, f"{where}.size")
+    if offset < 0 or size <= 0:
+        raise ValueError(f"{where}: offset must be >= 0 and size > 0")
+    range_min, range_max = _pair(field.get("range"), int, f"{where}.range")
+    scale_min, scale_max = _pair(field.get("scale"), int | float, f"{where}.scale")
+    unit = field.get("unit")
+    if unit is not None:
+        _expect(unit, str, f"{where}.unit")
+    observable = field.get("observable")
+    if observable is not None:
+        observable = _observable(observable, f"{where}.observable")
+    enum = None
+    if "enum" in field:
+        enum = tuple(
+            sorted(
+                _compile_enum_entry(key, label, size, f"{where}.enum")
+                for key, label in _expect(field["enum"], dict, f"{where}.enum").items()
+            )
+        )
+    return (
+        id_,
+        _expect(field.get("name", ""), str, f"{where}.name"),
+        offset,
+        size,
+        range_min,
+        range_max,
+        None if scale_min is None else float(scale_min),
+        None if scale_max is None else float(scale_max),
+        unit,
+        enum,
+        observable,
+    )
+
+
+def _compile_enum_entry(
+    key: str, label: Any, size: int, where: str
+) -> tuple[int, int, str]:
+    label = _expect(label, str, f"{where}[{key!r}]")
+    first, dash, last = key.partition("-")
+    try:
+        start = int(first, 0)
+        stop = (int(last, 0) if dash else start) + 1
+    except ValueError:
+        raise ValueError(
+            f"{where}: invalid key {key!r}, expected '<raw>' or '<first>-<last>'"
+        ) from None
+    if not 0 <= start < stop <= 1 << size:
+        raise ValueError(f"{where}: {key!r} does not fit a {size}-bit field")
+    return (start, stop, label)
+
+
+def _pair(value: Any, type_: Any, where: str) -> tuple[Any, Any]:
+    if value is None:
+        return None, None
+    value = _expect(value, list, where)
+    if len(value) != 2:
+        raise ValueError(f"{where}: expected [min, max]")
+    return tuple(_expect(v, type_, where) for v in value)
+
+
+def _observable(value: Any, where: str) -> str:
+    try:
+        return Observable(_expect(value, str, where)).value
+    except ValueError:
+        raise ValueError(f"{where}: unknown observable {value!r}") from None
+
+
+def _expect(value: Any, type_: Any, where: str) -> Any:
+    # bool is an int, but never a valid offset, size or value
+    if not isinstance(value, type_) or (isinstance(value, bool) and type_ is not bool):
+        raise ValueError(f"{where}: expected {getattr(type_, '__name__', type_)}")
+    return value
+
+
+def _check_keys(obj: dict, allowed: frozenset[str], where: str) -> None:
+    unknown = obj.keys() - allowed
+    if unknown:
+        raise ValueError(f"{where}: unknown keys {sorted(unknown)}")
+
+
+def _read_compiled(cache_file: Path) -> tuple[CompiledProfile, ...] | None:
+    try:
+        compiled = marshal.loads(cache_file.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        _logger.debug(f"Ignoring unreadable compiled definitions {cache_file}: {e}")
+        return None
+    # only the file name is checked against the content; guard against truncated or foreign files
+    if not (
+        isinstance(compiled, tuple)
+        and all(isinstance(p, tuple) and len(p) == 8 for p in compiled)
+    ):
+        _logger.debug(f"Ignoring invalid compiled definitions {cache_file}")
+        return None
+    return compiled
+
+
+def _write_compiled(cache_file: Path, compiled: tuple[CompiledProfile, ...]) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, so that concurrent loads never see a partial file
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(compiled, f)
+            os.replace(tmp, cache_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError as e:
+        _logger.debug(f"Cannot write compiled definitions {cache_file}: {e}")
@@ -0,0 +1,187 @@
+"""Compact, shared enumerations of raw field values (``EEPDataField.range_enum``).
+
+Many profiles enumerate hundreds or thousands of raw values with few distinct
+labels (e.g. fan stages over 256 values) or labels that follow a formula (e.g.
+D2-01 timers, 65536 values). An ``EnumTable`` stores such an enumeration as a
+tuple of ranges of raw values instead of one dict entry per value, and
+``enum_table`` returns one shared instance per distinct enumeration.
+"""
+
+from bisect import bisect_right
+from collections.abc import Callable, Iterator, Mapping
+import sys
+from typing import Any
+
+type EnumLabel = str | tuple[str, ...] | Callable[[int], str]
+"""Labels of a range of raw values: one label for all, one label per value, or a function formatting the label of a value."""
+
+_RUN_MIN = 4
+"""Runs of at least this many consecutive raw values with equal labels are stored as a single range."""
+
+_MISSING = object()
+
+
+class EnumTable(Mapping[int, str]):
+    """Immutable enumeration of raw values to labels, stored as sorted, non-overlapping ranges of raw values.
+
+    Behaves like a read-only ``dict[int, str]`` (iteration is in ascending order
+    of raw values) and compares equal to dicts with the same items; two tables
+    are equal if they have the same ranges. Create instances with
+    ``enum_table``, which shares equal tables.
+    """
+
+    __slots__ = ("__starts", "__stops", "__labels", "__len", "__hash")
+
+    def __init__(self, ranges: tuple[tuple[int, int, EnumLabel], ...]) -> None:
+        """Create a table from ``(start, stop, labels)`` ranges, sorted and not overlapping."""
+        self.__starts = tuple(start for start, _, _ in ranges)
+        self.__stops = tuple(stop for _, stop, _ in ranges)
+        self.__labels = tuple(labels for _, _, labels in ranges)
+        self.__len = sum(stop - start for start, stop, _ in ranges)
+        self.__hash = hash(ranges)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            i = bisect_right(self.__starts, key) - 1
+        except TypeError:
+            return default
+        if i < 0 or key >= self.__stops[i]:
+            return default
+        labels = self.__labels[i]
+        if labels.__class__ is str:
+            return labels
+        if labels.__class__ is tuple:
+            return labels[key - self.__starts[i]]
+        return labels(key)
+
+    def __getitem__(self, key: int) -> str:
+        label = self.get(key, _MISSING)
+        if label is _MISSING:
+            raise KeyError(key)
+        return label
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[int]:
+        for start, stop in zip(self.__starts, self.__stops):
+            yield from range(start, stop)
+
+    def __len__(self) -> int:
+        return self.__len
+
+    @property
+    def min_value(self) -> int:
+        """Smallest enumerated raw value.
+
+        Raises:
+            ValueError: If the table is empty.
+        """
+        if not self.__starts:
+            raise ValueError("Empty enumeration")
+        return self.__starts[0]
+
+    @property
+    def max_value(self) -> int:
+        """Largest enumerated raw value.
+
+        Raises:
+            ValueError: If the table is empty.
+        """
+        if not self.__stops:
+            raise ValueError("Empty enumeration")
+        return self.__stops[-1] - 1
+
+    def __ranges(self) -> tuple[tuple[int, int, EnumLabel], ...]:
+        return tuple(zip(self.__starts, self.__stops, self.__labels))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EnumTable):  # consistent with __hash__
+            return self.__ranges() == other.__ranges()
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __repr__(self) -> str:
+        parts = []
+        for start, stop, labels in self.__ranges():
+            key = str(start) if stop == start + 1 else f"range({start}, {stop})"
+            parts.append(f"{key}: {labels if callable(labels) else repr(labels)}")
+        return f"EnumTable({{{', '.join(parts)}}})"
+
+
+_TABLES: dict[EnumTable, EnumTable] = {}
+"""Shared instance of every distinct table created by ``enum_table``."""
+
+
+def enum_table(
+    labels: Mapping[int, str] | Mapping[int | range, str | Callable[[int], str]],
+) -> EnumTable:
+    """Return the shared ``EnumTable`` of an enumeration.
+
+    Args:
+        labels: Label per raw value; keys may also be ranges of raw values (step 1) mapping to one label for all values or to a function formatting the label of a value, e.g. ``{0: "Off", range(1, 101): lambda i: f"{i}%"}``.
+
+    Raises:
+        ValueError: If ranges overlap or have a step other than 1.
+    """
+    if isinstance(labels, EnumTable):
+        return _TABLES.setdefault(labels, labels)
+
+    ranges: list[tuple[int, int, EnumLabel]] = []
+    single: dict[int, str] = {}
+    for key, label in labels.items():
+        if isinstance(key, range):
+            if key.step != 1:
+                raise ValueError(f"Enumeration range {key} must have step 1")
+            if key:
+                if isinstance(label, str):
+                    label = sys.intern(label)
+                ranges.append((key.start, key.stop, label))
+        else:
+            single[key] = label
+    ranges += _compress(single)
+    ranges.sort(key=lambda r: r[0])
+    for (_, stop, _), (start, _, _) in zip(ranges, ranges[1:]):
+        if start < stop:
+            raise ValueError(f"Enumeration ranges overlap at raw value {start}")
+
+    table = EnumTable(tuple(ranges))
+    return _TABLES.setdefault(table, table)
+
+
+def _compress(labels: Mapping[int, str]) -> list[tuple[int, int, EnumLabel]]:
+    """Ranges of consecutive raw values: runs of equal labels as one label, other values as a tuple of labels."""
+    ranges: list[tuple[int, int, EnumLabel]] = []
+    pending: list[str] = []  # labels of consecutive values not in a run yet
+    pending_start = 0
+
+    def flush(stop: int) -> None:
+        if pending:
+            ranges.append((pending_start, stop, tuple(pending)))
+            pending.clear()
+
+    keys = sorted(labels)
+    i = 0
+    while i < len(keys):
+        key, label = keys[i], labels[keys[i]]
+        run = i + 1
+        while (
+            run < len(keys)
+            and keys[run] == keys[run - 1] + 1
+            and labels[keys[run]] == label
+        ):
+            run += 1
+        if pending and key != pending_start + len(pending):
+            flush(pending_start + len(pending))
+        if run - i >= _RUN_MIN:
+            flush(key)
+            ranges.append((key, key + run - i, sys.intern(label)))
+        else:
+            if not pending:
+                pending_start = key
+            pending.extend(sys.intern(labels[k]) for k in keys[i:run])
+        i = run
+    flush(pending_start + len(pending))
+    return ranges
@@ -1,6 +1,11 @@
 """RPS telegram (F6) EEP definitions."""
 
-from .f6_02_01_02 import EEP_F6_02_01, EEP_F6_02_02
-from .f6_10_00 import EEP_F6_10_00, EEP_F6_10_00_ELTAKO
+from ..registry import package_attribute
+
+
+def __getattr__(name: str):
+    # profile modules are only imported on first access (see enocean_async.eep.registry)
+    return package_attribute(__name__, name)
+
 
 __all__ = ["EEP_F6_02_01", "EEP_F6_02_02", "EEP_F6_10_00", "EEP_F6_10_00_ELTAKO"]
@@ -1,111 +1,264 @@
+from collections.abc import Callable, Iterable, Mapping
 import logging
 from typing import Any
 
 from enocean_async.address import BroadcastAddress
 
 from ..protocol.erp1.telegram import RORG, ERP1Telegram
-from .message import EEPMessage, EEPMessageType, RawEEPMessage, ValueWithContext
+from .codegen import FieldDecoder, compiled_encoder, specialized_decoder
+from .message import (
+    EEPMessage,
+    EEPMessageType,
+    RawEEPMessage,
+    TelegramKey,
+    ValueWithContext,
+)
+from .packer import TelegramPacker
 from .profile import EEPSpecification
+from .unpacker import TelegramUnpacker
 
 
 class EEPHandler:
     """An EEP handler is responsible for encoding and decoding messages for a specific EEP."""
 
-    def __init__(self, eep: EEPSpecification):
+    def __init__(self, eep: EEPSpecification, specialized: bool = True):
+        """Create a handler for an EEP.
+
+        Args:
+            eep: The EEP specification.
+            specialized: Decode and encode with functions specialized per telegram type, taken from the ahead-of-time compiled module or generated on first use (see ``codegen``); if False, the generic interpreter and packers are used.
+        """
         self.__eep = eep
+        self.__specialized = specialized
         self.__logger = logging.getLogger(__name__)
+        self.__rorg = RORG(eep.eep.rorg)
+        self.__packers: dict[TelegramKey, TelegramPacker] = {
+            cmd_value: TelegramPacker(
+                telegram,
+                cmd_value=eep.selector_values(cmd_value)[0],
+                cmd_size=eep.cmd_size,
+                cmd_offset=eep.cmd_offset,
+                label=f"EEP {eep.eep}",
+                ecid_value=eep.selector_values(cmd_value)[1],
+                ecid_size=eep.ecid_size,
+                ecid_offset=eep.ecid_offset,
+            )
+            for cmd_value, telegram in eep.telegrams.items()
+        }
+        # CMD values followed by an ECID (extended commands); telegram types of these
+        # are keyed by CMD and ECID value (see EEPSpecification.telegram_key)
+        self.__extended: frozenset[int] = frozenset(
+            key[0]
+            for key in eep.telegrams
+            if isinstance(key, tuple) and eep.ecid_offset is not None
+        )
+        self.__unpackers: dict[TelegramKey, TelegramUnpacker] = {
+            cmd_value: TelegramUnpacker(telegram)
+            for cmd_value, telegram in eep.telegrams.items()
+        }
+        self.__descriptions: dict[TelegramKey, str] = {
+            cmd_value: telegram.name if telegram.name else f"Telegram {cmd_value}"
+            for cmd_value, telegram in eep.telegrams.items()
+        }
+        self.__resolvers: bool = bool(eep.semantic_resolvers)
+        # looked up or generated lazily, the first time a telegram type is received or sent
+        self.__decoders: dict[
+            TelegramKey | tuple[TelegramKey, frozenset[str]], FieldDecoder
+        ] = {}
+        self.__encoders: dict[TelegramKey, Callable[[Mapping[str, int]], bytes]] = {}
 
     def decode(
-        self, telegram: ERP1Telegram, config: dict[str, Any] | None = None
+        self,
+        telegram: ERP1Telegram,
+        config: dict[str, Any] | None = None,
+        fields: frozenset[str] | None = None,
     ) -> EEPMessage:
-        """Convert an ERP1Telegram into an EEPMessage."""
+        """Convert an ERP1Telegram into an EEPMessage.
+
+        Args:
+            telegram: The telegram to decode.
+            config: Device config passed to semantic resolvers.
+            fields: Data fields whose decoded value is needed in ``msg.decoded`` besides the observable fields (which feed ``msg.values``); None (default) decodes all fields. Ignored for EEPs with semantic resolvers, which may read any decoded field. ``msg.raw`` always holds all fields.
+        """
+
+        msg = self.__envelope(telegram)
+
+        # determine the telegram type based on the EEP's CMD (and, for extended commands,
+        # ECID) field; unknown types are rejected before any field is decoded
+        cmd_value: TelegramKey | None = 0
+
+        if self.__eep.cmd_size > 0 and self.__eep.cmd_offset is not None:
+            cmd_value = self.__selector(
+                telegram, self.__eep.cmd_offset, self.__eep.cmd_size
+            )
+            if cmd_value in self.__extended:
+                ecid_value = self.__selector(
+                    telegram, self.__eep.ecid_offset, self.__eep.ecid_size
+                )
+                cmd_value = (
+                    None
+                    if ecid_value is None
+                    else self.__eep.telegram_key(cmd_value, ecid_value)
+                )
+            if cmd_value is None:
+                self.__logger.debug(
+                    f"Telegram data too short for the telegram command of EEP {self.__eep.eep}; ignoring telegram."
+                )
+                return msg
+
+        description = self.__descriptions.get(cmd_value)
+        if description is None:
+            cmd, ecid = self.__eep.selector_values(cmd_value)
+            command = f"0x{cmd:02X}" if ecid is None else f"0x{cmd:02X}/0x{ecid:02X}"
+            self.__logger.debug(
+                f"Unknown telegram command {command} for EEP {self.__eep.eep}; ignoring telegram."
+            )
+            return msg
+
+        msg.message_type = EEPMessageType(id=cmd_value, description=description)
+
+        key = cmd_value if fields is None or self.__resolvers else (cmd_value, fields)
+        decoder = self.__decoders.get(key)
+        if decoder is None:
+            decoder = self.__decoder(key)
+        decoder(telegram.telegram_data, msg, config or {})
 
+        return msg
+
+    def reuse(self, message: EEPMessage, telegram: ERP1Telegram) -> EEPMessage:
+        """Return the message ``decode`` would return for ``telegram``, whose telegram data (and device config) equal those ``message`` was decoded from.
+
+        Only the envelope (sender, destination, RSSI) is taken from ``telegram``; the
+        decoded content is copied from ``message`` without decoding any field. The
+        ``raw``, ``decoded`` and ``values`` dicts are shallow copies: their entries
+        (e.g. the immutable ``ValueWithContext`` tuples) are shared with ``message``.
+        """
+        # clone without running the dataclass constructor, which costs more than
+        # decoding many telegram types
+        msg = object.__new__(EEPMessage)
+        destination = (
+            telegram.destination
+            if telegram.destination is not None
+            and not telegram.destination.is_broadcast
+            else BroadcastAddress()
+        )
+        vars(msg).update(
+            vars(message),
+            sender=telegram.sender,
+            destination=destination,
+            rssi=telegram.rssi,
+            raw=message.raw.copy(),
+            decoded=message.decoded.copy(),
+            values=message.values.copy(),
+        )
+        return msg
+
+    def __envelope(self, telegram: ERP1Telegram) -> EEPMessage:
+        """Message with the envelope of a telegram and no decoded content."""
         msg = EEPMessage(
             sender=telegram.sender,
             eep=self.__eep.eep,
             rssi=telegram.rssi,
         )
-
         if telegram.destination is not None and not telegram.destination.is_broadcast:
             msg.destination = telegram.destination
+        return msg
 
-        # determine the command/telegram type based on the EEP's cmd_size and cmd_offset, if applicable
-        cmd_value = 0
+    @staticmethod
+    def __selector(telegram: ERP1Telegram, offset: int, size: int) -> int | None:
+        """Value of a CMD or ECID field (negative offsets count from the end of the telegram data); None if the telegram data is too short."""
+        if offset < 0:
+            offset += len(telegram.telegram_data) * 8
+        if offset < 0 or offset + size > len(telegram.telegram_data) * 8:
+            return None
+        return telegram.bitstring_raw_value(offset=offset, size=size)
 
-        if self.__eep.cmd_size > 0 and self.__eep.cmd_offset is not None:
-            offset = (
-                self.__eep.cmd_offset
-                if self.__eep.cmd_offset >= 0
-                else len(telegram.telegram_data) * 8 + self.__eep.cmd_offset
-            )
+    def __decoder(
+        self, key: TelegramKey | tuple[TelegramKey, frozenset[str]]
+    ) -> FieldDecoder:
+        """Return the decode function for a telegram type (and set of needed fields), generating it on first use."""
+        cmd_value, fields = (
+            key
+            if isinstance(key, tuple) and isinstance(key[1], frozenset)
+            else (key, None)
+        )
+        telegram = self.__eep.telegrams[cmd_value]
+        if fields is not None and all(
+            f.observable is not None or f.id in fields for f in telegram.datafields
+        ):
+            fields = None  # all fields are needed anyway
 
-            cmd_value = telegram.bitstring_raw_value(
-                offset=offset, size=self.__eep.cmd_size
-            )
+        def interpret(data: bytes, msg: EEPMessage, cfg: dict[str, Any]) -> None:
+            self.__interpret(cmd_value, data, msg, cfg, fields)
 
-        if cmd_value not in self.__eep.telegrams:
-            self.__logger.debug(
-                f"Unknown telegram command 0x{cmd_value:02X} for EEP {self.__eep.eep}; ignoring telegram."
+        decoder: FieldDecoder | None = None
+        if self.__specialized:
+            decoder = specialized_decoder(
+                (str(self.__eep.eep), cmd_value),
+                telegram,
+                self.__eep.semantic_resolvers,
+                fallback=interpret,
+                fields=fields,
             )
-            return msg
+        decoder = self.__decoders[key] = decoder or interpret
+        return decoder
 
-        msg.message_type = EEPMessageType(
-            id=cmd_value,
-            description=self.__eep.telegrams[cmd_value].name
-            if self.__eep.telegrams[cmd_value].name
-            else f"Telegram {cmd_value}",
-        )
+    def __interpret(
+        self,
+        cmd_value: TelegramKey,
+        data: bytes,
+        msg: EEPMessage,
+        cfg: dict[str, Any],
+        fields: frozenset[str] | None = None,
+    ) -> None:
+        """Decode the telegram data of a telegram type generically, walking its data fields."""
 
-        # First pass: collect all raw values
-        for field in self.__eep.telegrams[cmd_value].datafields:
-            msg.raw[field.id] = telegram.bitstring_raw_value(
-                offset=field.offset, size=field.size
-            )
+        # First pass: collect all raw values (one precompiled extraction for all fields)
+        raw = msg.raw = self.__unpackers[cmd_value].unpack(data)
 
-        # Second pass: decode scaled values with context (for field interdependencies)
+        # Second pass: decode scaled values with context (for field interdependencies);
+        # entity observable propagation — copy scaled values to semantic entity keys
+        decoded = msg.decoded
         for field in self.__eep.telegrams[cmd_value].datafields:
-            raw_value = msg.raw[field.id]
-            value = None
+            if (
+                fields is not None
+                and field.observable is None
+                and field.id not in fields
+            ):
+                continue  # nobody reads its decoded value
+
+            raw_value = raw[field.id]
+
+            table = field.value_table
+            if table is not None:
+                decoded[field.id] = table[raw_value]
+                continue
 
             if field.range_enum is not None:
                 value = field.range_enum.get(raw_value, f"Unknown({raw_value})")
-            elif field.range_min is not None and field.range_max is not None:
-                value = telegram.bitstring_scaled_value(
-                    offset=field.offset,
-                    size=field.size,
-                    range_min=field.range_min,
-                    range_max=field.range_max,
-                    scale_min=field.scale_min_fn(msg.raw),
-                    scale_max=field.scale_max_fn(msg.raw),
-                )
             else:
-                value = raw_value
+                value = field.scaled_value(raw_value, raw)
 
-            unit = field.unit_fn(msg.raw) or None  # "" treated as None (no unit)
-            msg.decoded[field.id] = ValueWithContext(
-                name=field.name or field.id, value=value, unit=unit
+            decoded[field.id] = ValueWithContext(
+                name=field.name or field.id, value=value, unit=field.unit_for(raw)
             )
 
-        # Third pass: entity observable propagation — copy scaled values to semantic entity keys
         for field in self.__eep.telegrams[cmd_value].datafields:
-            if field.observable is not None and field.id in msg.decoded:
-                msg.values[field.observable] = msg.decoded[field.id]
+            if field.observable is not None:
+                msg.values[field.observable] = decoded[field.id]
 
         # Fourth pass: semantic resolvers — combine multiple fields into a single entity value
-        cfg = config or {}
         for observable, resolver in self.__eep.semantic_resolvers.items():
             result = resolver(msg.raw, msg.decoded, cfg)
             if result is not None:
                 msg.values[observable] = result
 
-        return msg
-
     def encode(self, message: RawEEPMessage) -> ERP1Telegram:
         """Convert a RawEEPMessage into an ERP1Telegram.
 
         The message must have:
         - message.sender set to a valid sender address (BaseAddress or EURID) for the gateway
-        - message.message_type.id set to the telegram command value (0 for single-telegram EEPs)
+        - message.message_type.id set to the telegram type key (see EEPSpecification.telegram_key; 0 for single-telegram EEPs)
         - message.raw_values[field_id] = <int> for each field to encode
 
         Raises:
@@ -116,49 +269,47 @@ class EEPHandler:
 
         cmd_value = message.message_type.id if message.message_type else 0
 
-        if cmd_value not in self.__eep.telegrams:
+        packer = self.__packers.get(cmd_value)
+        if packer is None:
             raise ValueError(
                 f"Unknown telegram type {cmd_value} for EEP {self.__eep.eep}"
             )
 
-        telegram_def = self.__eep.telegrams[cmd_value]
-        datafields = telegram_def.datafields
-        buffer_size = telegram_def.byte_size
+        pack = self.__encoders.get(cmd_value)
+        if pack is None:
+            pack = self.__encoders[cmd_value] = (
+                self.__specialized
+                and compiled_encoder(
+                    (str(self.__eep.eep), cmd_value),
+                    packer.source(),
+                    label=f"EEP {self.__eep.eep}",
+                )
+            ) or packer.pack
 
-        rorg = RORG(self.__eep.eep.rorg)
-        erp1 = ERP1Telegram(
-            rorg=rorg,
-            telegram_data=bytes(buffer_size),
+        return ERP1Telegram(
+            rorg=self.__rorg,
+            telegram_data=pack(message.raw),
             sender=message.sender,
             destination=message.destination,
         )
 
-        # Write each field's raw value
-        for f in datafields:
-            raw = message.raw.get(f.id)
-            if raw is None:
-                self.__logger.debug(
-                    f"encode: field '{f.id}' not provided for EEP {self.__eep.eep}; defaulting to 0."
-                )
-                raw = 0
-            erp1.set_bitstring_raw_value(offset=f.offset, size=f.size, value=raw)
+    def encode_many(self, messages: Iterable[RawEEPMessage]) -> list[ERP1Telegram]:
+        """Convert several RawEEPMessages into ERP1Telegrams (see ``encode``)."""
+        return [self.encode(message) for message in messages]
 
-        # Write CMD bits last so they are never overwritten by the field loop
-        # (the CMD field may also appear in datafields for decoding purposes).
-        if self.__eep.cmd_size > 0 and self.__eep.cmd_offset is not None:
-            cmd_bit_offset = (
-                self.__eep.cmd_offset
-                if self.__eep.cmd_offset >= 0
-                else buffer_size * 8 + self.__eep.cmd_offset
-            )
-            erp1.set_bitstring_raw_value(
-                offset=cmd_bit_offset, size=self.__eep.cmd_size, value=cmd_value
-            )
+    def packer(self, cmd_value: TelegramKey = 0) -> TelegramPacker:
+        """Return the precompiled packer for a telegram type, e.g. for bulk encoding of raw field values via ``TelegramPacker.pack_many``.
 
-        return erp1
+        Raises:
+            KeyError: if the telegram type is unknown.
+        """
+        return self.__packers[cmd_value]
 
     def __call__(
-        self, telegram: ERP1Telegram, config: dict[str, Any] | None = None
+        self,
+        telegram: ERP1Telegram,
+        config: dict[str, Any] | None = None,
+        fields: frozenset[str] | None = None,
     ) -> EEPMessage:
         """Allow decoder instances to be called like functions."""
-        return self.decode(telegram, config)
+        return self.decode(telegram, config, fields)
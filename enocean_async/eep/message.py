@@ -23,12 +23,16 @@ class ValueWithContext(NamedTuple):
     """
 
 
+type TelegramKey = int | tuple[int, int]
+"""Key of a telegram type in ``EEPSpecification.telegrams``: the CMD value, or ``(CMD, ECID)`` for extended commands."""
+
+
 @dataclass
 class EEPMessageType:
     """Representation of an EEP message type."""
 
-    id: int
-    """A unique identifier for the message type."""
+    id: TelegramKey
+    """A unique identifier for the message type (its key in ``EEPSpecification.telegrams``)."""
 
     description: str
     """A human-readable description of the message type."""
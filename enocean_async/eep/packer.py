@@ -0,0 +1,174 @@
+"""Precompiled encoders that pack raw field values into EEP telegram data."""
+
+from collections.abc import Iterable, Mapping
+import logging
+
+from .profile import EEPTelegram
+
+_logger = logging.getLogger(__name__)
+
+
+class TelegramPacker:
+    """Packs raw field values of one EEP telegram type into telegram data bytes.
+
+    Shifts and masks of all data fields are computed once at construction, so
+    packing a message is a single pass over the fields that assembles one
+    integer and converts it to bytes once.
+    """
+
+    __slots__ = ("__byte_size", "__fields", "__overlapping", "__cmd", "__label")
+
+    def __init__(
+        self,
+        telegram: EEPTelegram,
+        cmd_value: int = 0,
+        cmd_size: int = 0,
+        cmd_offset: int | None = None,
+        label: str = "",
+        ecid_value: int | None = None,
+        ecid_size: int = 0,
+        ecid_offset: int | None = None,
+    ) -> None:
+        """Compile a packer for ``telegram``.
+
+        Args:
+            telegram: The telegram definition.
+            cmd_value: Command value written into the CMD bits (if ``cmd_size > 0``).
+            cmd_size: Size of the CMD field in bits; 0 if the EEP has a single telegram type.
+            cmd_offset: Bit offset of the CMD field; negative values count from the end of the telegram data.
+            label: Name used in log and error messages (typically the EEP).
+            ecid_value: Extended command value written into the ECID bits; None if the telegram type is not an extended command.
+            ecid_size: Size of the ECID field in bits.
+            ecid_offset: Bit offset of the ECID field; negative values count from the end of the telegram data.
+
+        Raises:
+            ValueError: If a data field, the CMD field or the ECID field does not fit into the telegram data.
+        """
+        self.__label = label or (telegram.name or "telegram")
+        self.__byte_size = telegram.byte_size
+        total_bits = self.__byte_size * 8
+
+        # (field id, shift, max value, clear mask); clear masks are only needed when fields overlap
+        self.__fields: tuple[tuple[str, int, int, int], ...] = tuple(
+            (
+                f.id,
+                total_bits - (f.offset + f.size),
+                (1 << f.size) - 1,
+                ~(((1 << f.size) - 1) << (total_bits - (f.offset + f.size))),
+            )
+            for f in telegram.datafields
+        )
+        for f in telegram.datafields:
+            if f.offset < 0 or f.size < 1 or f.offset + f.size > total_bits:
+                raise ValueError(
+                    f"{self.__label}: field '{f.id}' (offset {f.offset}, size {f.size}) does not fit into {self.__byte_size} bytes"
+                )
+
+        covered = 0
+        self.__overlapping = False
+        for _, shift, max_value, _ in self.__fields:
+            mask = max_value << shift
+            if covered & mask:
+                self.__overlapping = True
+            covered |= mask
+
+        # CMD (and ECID) bits are written last so they are never overwritten by the fields
+        # (the CMD field may also appear in datafields for decoding purposes).
+        # Stored as (clear mask, bits) or an error message if a value does not fit.
+        self.__cmd: tuple[int, int] | str | None = None
+        selectors = []
+        if cmd_size > 0 and cmd_offset is not None:
+            selectors.append(("CMD", cmd_value, cmd_size, cmd_offset))
+        if ecid_value is not None and ecid_size > 0 and ecid_offset is not None:
+            selectors.append(("ECID", ecid_value, ecid_size, ecid_offset))
+        for name, value, size, offset in selectors:
+            offset = offset if offset >= 0 else total_bits + offset
+            if offset < 0 or offset + size > total_bits:
+                raise ValueError(
+                    f"{self.__label}: {name} field (offset {offset}, size {size}) does not fit into {self.__byte_size} bytes"
+                )
+            max_value = (1 << size) - 1
+            shift = total_bits - (offset + size)
+            if not 0 <= value <= max_value:
+                self.__cmd = f"Value must be between 0 and {max_value} for size {size}"
+                break
+            clear, bits = self.__cmd or (-1, 0)
+            self.__cmd = (clear & ~(max_value << shift), bits | value << shift)
+
+    @property
+    def byte_size(self) -> int:
+        """Length of the packed telegram data in bytes."""
+        return self.__byte_size
+
+    def pack(self, raw: Mapping[str, int]) -> bytes:
+        """Pack raw field values into telegram data. Missing fields default to 0.
+
+        Raises:
+            ValueError: If a value does not fit into its field.
+        """
+        bits = 0
+        overlapping = self.__overlapping
+        for field_id, shift, max_value, clear in self.__fields:
+            value = raw.get(field_id)
+            if value is None:
+                _logger.debug(
+                    f"encode: field '{field_id}' not provided for {self.__label}; defaulting to 0."
+                )
+                if overlapping:
+                    bits &= clear
+                continue
+            if value < 0 or value > max_value:
+                raise ValueError(
+                    f"{self.__label}: value {value} of field '{field_id}' must be between 0 and {max_value}"
+                )
+            if overlapping:
+                bits &= clear
+            bits |= value << shift
+
+        cmd = self.__cmd
+        if cmd is not None:
+            if isinstance(cmd, str):
+                raise ValueError(cmd)
+            bits = (bits & cmd[0]) | cmd[1]
+
+        return bits.to_bytes(self.__byte_size, "big")
+
+    def source(self, name: str = "make_packer") -> str:
+        """Return the source of a factory ``name(label)`` that returns a function equivalent to ``pack``, with all shifts and masks folded into straight-line code.
+
+        The code refers to the global ``_logger`` (the logger of this module). Used
+        to generate the ahead-of-time compiled module ``_compiled.py``; the label
+        only appears in messages, so telegram types with the same layout share code.
+        """
+        head = [f"def {name}(label):"]
+        body = ["    def pack(raw):", "        bits = 0"]
+        for i, (field_id, shift, max_value, clear) in enumerate(self.__fields):
+            missing = f"encode: field '{field_id}' not provided for "
+            invalid = f" of field '{field_id}' must be between 0 and {max_value}"
+            head.append(f"    M{i} = {missing!r} + label + '; defaulting to 0.'")
+            clear_line = [f"            bits &= {clear}"] if self.__overlapping else []
+            body += [
+                f"        x = raw.get({field_id!r})",
+                "        if x is None:",
+                f"            _logger.debug(M{i})",
+                *clear_line,
+                "        else:",
+                f"            if x < 0 or x > {max_value}:",
+                f"                raise ValueError(label + ': value ' + str(x) + {invalid!r})",
+                *clear_line,
+                f"            bits |= x << {shift}",
+            ]
+
+        cmd = self.__cmd
+        if isinstance(cmd, str):
+            body.append(f"        raise ValueError({cmd!r})")
+        else:
+            if cmd is not None:
+                body.append(f"        bits = (bits & {cmd[0]}) | {cmd[1]}")
+            body.append(f'        return bits.to_bytes({self.__byte_size}, "big")')
+        return "\n".join(head + body + ["    return pack"]) + "\n"
+
+    def pack_many(self, raws: Iterable[Mapping[str, int]]) -> list[bytes]:
+        """Pack several messages of this telegram type at once."""
+        pack = self.pack
+        return [pack(raw) for raw in raws]
@@ -1,28 +1,93 @@
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cached_property
 import logging
 import math
-from typing import Callable
+from typing import Any, Callable
 
 _logger = logging.getLogger(__name__)
 
 from ..semantics.entity import Entity  # noqa: F401  (re-exported for EEP files)
 from ..semantics.instructable import Instructable
+from ..semantics.instruction import Instruction
 from ..semantics.observable import Observable
 from ..semantics.observer_factory import ObserverFactory  # noqa: F401  (re-exported)
 from ..semantics.types import (  # noqa: F401  (re-exported)
     InstructionEncoder,
     SemanticResolver,
 )
+from .enum_table import enum_table
 from .id import EEP
+from .message import TelegramKey, ValueWithContext
 
 type TelegramRawValues = dict[str, int]
 type ScaleFunction = Callable[[TelegramRawValues], float]
 type UnitFunction = Callable[[TelegramRawValues], str]
 
+_VALUE_TABLE_MAX_BITS = 8
+"""Fields up to this size (at most 256 raw values) get a precomputed table of decoded values."""
 
-@dataclass
+
+class _DependsOnRawValues(Exception):
+    pass
+
+
+class _RawValuesProbe(dict):
+    """Empty raw values that raise on any access; used to detect scale and unit functions that are constant."""
+
+    def __getitem__(self, key):
+        raise _DependsOnRawValues
+
+    def get(self, key, default=None):
+        raise _DependsOnRawValues
+
+    def __contains__(self, key):
+        raise _DependsOnRawValues
+
+    def __iter__(self):
+        raise _DependsOnRawValues
+
+    def __len__(self):
+        raise _DependsOnRawValues
+
+    def keys(self):
+        raise _DependsOnRawValues
+
+    def values(self):
+        raise _DependsOnRawValues
+
+    def items(self):
+        raise _DependsOnRawValues
+
+
+def _constant_result(fn: Callable[[TelegramRawValues], Any]) -> tuple[Any] | None:
+    """Return ``(fn(...),)`` if ``fn`` does not look at the raw values, else None."""
+    try:
+        return (fn(_RawValuesProbe()),)
+    except Exception:
+        return None
+
+
+def _linear_scaling(
+    size: int, range_min: int, range_max: int, scale_min: float, scale_max: float
+) -> tuple[float, int, float] | str:
+    """Return ``(multiplier, range_min, scale_min)`` of the EEP scaling formula, or an error message if the parameters are invalid."""
+    if range_max == range_min:
+        return "range_max must differ from range_min"
+    if scale_max <= scale_min:
+        return "scale_max must be greater than scale_min"
+    max_raw = (1 << size) - 1
+    if max(range_min, range_max) > max_raw:
+        return f"range min/max cannot exceed {max_raw} for size {size}"
+    return ((scale_max - scale_min) / (range_max - range_min), range_min, scale_min)
+
+
+@dataclass(frozen=True)
 class EEPDataField:
-    """An EEP data field represents a single data point within an EEP, such as a sensor value or a control command."""
+    """An EEP data field represents a single data point within an EEP, such as a sensor value or a control command.
+
+    Data fields are immutable; identical definitions are shared between telegrams and profiles (see ``shared_field``).
+    """
 
     id: str
     """Unique identifier for the data field, typically a short string like 'R1', 'POS' etc."""
@@ -52,36 +117,166 @@ class EEPDataField:
     unit_fn: UnitFunction = lambda _: ""
     """Function to compute unit based on message values. Defaults to empty string."""
 
-    range_enum: dict[int, str] | None = None
-    """Enumeration of possible values for the data field, if applicable."""
+    range_enum: Mapping[int, str] | None = None
+    """Enumeration of possible values for the data field, if applicable. Given as a dict (or any mapping accepted by ``enum_table``);
+    stored as the shared ``EnumTable`` of the enumeration."""
 
     observable: Observable | None = None
     """Observable type to which this field's decoded value is propagated (e.g. Observable.TEMPERATURE).
     When set, EEPHandler copies msg.interpreted_values[field.id] → msg.values[observable] after decoding."""
 
+    mask: int = field(init=False, repr=False, compare=False)
+    """Mask of the field's bits once shifted to the least significant position (``2**size - 1``). Computed once."""
+
+    bit_end: int = field(init=False, repr=False, compare=False)
+    """Bit position just after the field (``offset + size``); in telegram data of ``n`` bits the field is at shift ``n - bit_end``. Computed once."""
+
+    _scaling: tuple[float, int, float] | str | None = field(
+        init=False, repr=False, compare=False
+    )
+    # (multiplier, range_min, scale_min) or error message if the scale functions are constant; None otherwise
+
+    _unit: tuple[str | None] | None = field(init=False, repr=False, compare=False)
+    # (unit,) if the unit function is constant; None otherwise
+
     def __post_init__(self):
+        # frozen: attributes are resolved once here
+        set_ = object.__setattr__
+        if self.range_enum is not None:
+            set_(self, "range_enum", enum_table(self.range_enum))
         if self.range_enum:
             # If an enumeration is provided, range_min and range_max are derived from the enum keys
-            enum_keys = self.range_enum.keys()
             if self.range_min != 0 or self.range_max is not None:
                 _logger.warning(
                     f"EEPDataField '{self.id}': range_min/range_max are ignored when range_enum is provided."
                 )
-            self.range_min = min(enum_keys)
-            self.range_max = max(enum_keys)
+            set_(self, "range_min", self.range_enum.min_value)
+            set_(self, "range_max", self.range_enum.max_value)
         else:
             # If no enumeration, ensure range_max is set based on size if not provided
             bit_max = (1 << self.size) - 1
             if self.range_max is None:
-                self.range_max = bit_max
+                set_(self, "range_max", bit_max)
             elif self.range_max > bit_max:
                 _logger.warning(
                     f"EEPDataField '{self.id}': range_max {self.range_max} exceeds maximum for {self.size}-bit field ({bit_max}); clamping."
                 )
-                self.range_max = bit_max
+                set_(self, "range_max", bit_max)
 
         if self.scale_max_fn is None:
-            self.scale_max_fn = lambda _: float(self.range_max)
+            set_(self, "scale_max_fn", lambda _: float(self.range_max))
+
+        set_(self, "mask", (1 << self.size) - 1)
+        set_(self, "bit_end", self.offset + self.size)
+
+        # precompute scaling and unit unless they depend on other fields' raw values
+        scaling = None
+        if not self.range_enum:
+            scale_min = _constant_result(self.scale_min_fn)
+            scale_max = _constant_result(self.scale_max_fn)
+            if scale_min is not None and scale_max is not None:
+                scaling = _linear_scaling(
+                    self.size,
+                    self.range_min,
+                    self.range_max,
+                    scale_min[0],
+                    scale_max[0],
+                )
+        set_(self, "_scaling", scaling)
+        unit = _constant_result(self.unit_fn)
+        set_(self, "_unit", None if unit is None else (unit[0] or None,))
+
+    def scaling(self, raw_values: TelegramRawValues) -> tuple[float, int, float]:
+        """Return ``(multiplier, range_min, scale_min)`` of the EEP scaling formula ``multiplier * (raw - range_min) + scale_min`` of this field; ``raw_values`` (all raw values of the telegram) are only consulted if the scale depends on other fields.
+
+        Raises:
+            ValueError: If the scaling parameters are invalid.
+        """
+        scaling = self._scaling
+        if scaling is None:
+            scaling = _linear_scaling(
+                self.size,
+                self.range_min,
+                self.range_max,
+                self.scale_min_fn(raw_values),
+                self.scale_max_fn(raw_values),
+            )
+        if isinstance(scaling, str):
+            raise ValueError(scaling)
+        return scaling
+
+    def scaled_value(self, raw: int, raw_values: TelegramRawValues) -> float:
+        """Scale a raw value of this field as given in the EEP specification; ``raw_values`` (all raw values of the telegram) are only consulted if the scale depends on other fields.
+
+        Raises:
+            ValueError: If the scaling parameters are invalid.
+        """
+        multiplier, range_min, scale_min = self.scaling(raw_values)
+        return multiplier * (raw - range_min) + scale_min
+
+    def unit_for(self, raw_values: TelegramRawValues) -> str | None:
+        """Unit of this field's value (``None`` if it has none); ``raw_values`` are only consulted if the unit depends on other fields."""
+        if self._unit is not None:
+            return self._unit[0]
+        return self.unit_fn(raw_values) or None
+
+    @cached_property
+    def value_table(self) -> tuple[ValueWithContext, ...] | None:
+        """Decoded value of every raw value of this field, indexed by raw value; built on first access.
+
+        Only available for fields of up to 8 bits whose enumeration or scale and unit
+        do not depend on other fields (None otherwise, e.g. for A5-12's ``MR`` whose
+        scale depends on ``DIV``).
+        """
+        if self.size > _VALUE_TABLE_MAX_BITS or self._unit is None:
+            return None
+        unit = self._unit[0]
+        name = self.name or self.id
+        if self.range_enum is not None:
+            enum = self.range_enum
+            return tuple(
+                ValueWithContext(enum.get(raw, f"Unknown({raw})"), unit, name)
+                for raw in range(1 << self.size)
+            )
+        if self._scaling is None or isinstance(self._scaling, str):
+            return None
+        multiplier, range_min, scale_min = self._scaling
+        return tuple(
+            ValueWithContext(multiplier * (raw - range_min) + scale_min, unit, name)
+            for raw in range(1 << self.size)
+        )
+
+
+_FIELDS: dict[tuple, EEPDataField] = {}
+"""Shared instance of every distinct data field definition (see ``shared_field``)."""
+
+
+def shared_field(datafield: EEPDataField) -> EEPDataField:
+    """Return the shared instance of a data field definition.
+
+    That is the first field seen with the same id, name, layout, enumeration and
+    observable whose scale and unit functions are identical or return the same
+    constants, else ``datafield`` itself.
+    """
+    scale = (
+        _constant_result(datafield.scale_min_fn),
+        _constant_result(datafield.scale_max_fn),
+    )
+    if None in scale:
+        scale = (datafield.scale_min_fn, datafield.scale_max_fn)
+    key = (
+        datafield.id,
+        datafield.name,
+        datafield.offset,
+        datafield.size,
+        datafield.range_min,
+        datafield.range_max,
+        datafield.range_enum,
+        datafield.observable,
+        scale,
+        datafield._unit or datafield.unit_fn,
+    )
+    return _FIELDS.setdefault(key, datafield)
 
 
 @dataclass
@@ -92,15 +287,40 @@ class EEPTelegram:
     """Human-readable name for the telegram, describing its purpose or function."""
 
     datafields: list[EEPDataField] = field(default_factory=list)
-    """List of data fields within the telegram, including the CMD selector field if applicable."""
+    """List of data fields within the telegram, including the CMD selector field if applicable.
+    Identical field definitions are replaced by their shared instance (see ``shared_field``)."""
+
+    def __post_init__(self):
+        self.datafields = [shared_field(f) for f in self.datafields]
 
-    @property
+    @cached_property
     def byte_size(self) -> int:
-        """Minimum number of bytes required to hold all data fields (including the CMD field if present)."""
+        """Minimum number of bytes required to hold all data fields (including the CMD field if present). Computed once."""
         max_bit = max((f.offset + f.size for f in self.datafields), default=0)
         return math.ceil(max_bit / 8)
 
 
+@dataclass(frozen=True)
+class EEPConfirmation:
+    """Describes the status telegram by which a bidirectional actuator confirms an instruction.
+
+    Used by ``Gateway.send_command(..., confirm=True)`` to correlate received telegrams with sent instructions.
+    """
+
+    reply_cmd: int
+    """Telegram command identifier of the status reply (e.g. ``0x4`` for D2-01 "Actuator status response")."""
+
+    channel_field: str | None = None
+    """Raw field carrying the channel in both the sent and the reply telegram. ``None`` if any reply confirms the instruction."""
+
+    all_channels: int | None = None
+    """Channel value addressing all channels in the sent telegram; such instructions are confirmed by a reply for any channel."""
+
+    query: type[Instruction] | None = None
+    """Status query instruction sent as follow-up if the reply does not arrive within half of the confirmation timeout.
+    Instantiated with the ``entity_id`` of the confirmed instruction."""
+
+
 @dataclass
 class EEPSpecification:
     """A full specification of an EnOcean Equipment Profile (EEP). This contains all information to fully de- and encode messages according to the EEP."""
@@ -123,8 +343,9 @@ class EEPSpecification:
     ecid_offset: int | None = None
     """Bit offset of the telegram's extended command/message identifier within the EEP; either measured from left (if ecid_offset is non-negative) or from right (if ecid_offset is negative)."""
 
-    telegrams: dict[int, EEPTelegram] = field(default_factory=dict)
-    """Dictionary of telegrams defined for this EEP, keyed by their command/message identifier, each with its own structure and data fields."""
+    telegrams: dict[TelegramKey, EEPTelegram] = field(default_factory=dict)
+    """Dictionary of telegrams defined for this EEP, keyed by their command/message identifier, each with its own structure and data fields.
+    Extended commands (CMD value followed by an ECID) are keyed by ``telegram_key(cmd_value, ecid_value)``, i.e. ``(cmd_value, ecid_value)``."""
 
     semantic_resolvers: dict[Observable, SemanticResolver] = field(default_factory=dict)
     """Dict mapping Observable → resolver function. Each resolver receives (raw_values: dict[str, int],
@@ -156,6 +377,27 @@ class EEPSpecification:
     The gateway's send_command() detects LEARN_TELEGRAM and sends this payload directly as a 4BS ERP1
     telegram, bypassing EEPHandler.encode()."""
 
+    confirmations: dict[Instructable, EEPConfirmation] = field(default_factory=dict)
+    """Dict mapping Instructable → the status reply that confirms it (bidirectional actuators only).
+    Instructables without an entry cannot be sent with ``confirm=True``."""
+
+    reuse_unchanged_payloads: bool = True
+    """If True (default), the gateway reuses the decoded message of a device's previous telegram when the
+    telegram data is byte-identical and the device config is unchanged, instead of decoding it again
+    (e.g. for sensors that periodically retransmit the same values). Observers and callbacks still
+    receive every telegram. Set to False if decoding depends on more than the telegram data and the
+    device config."""
+
+    @staticmethod
+    def telegram_key(cmd_value: int, ecid_value: int | None = None) -> TelegramKey:
+        """Key in ``telegrams`` of the telegram type with a CMD value and, for extended commands, an ECID value."""
+        return cmd_value if ecid_value is None else (cmd_value, ecid_value)
+
+    @staticmethod
+    def selector_values(key: TelegramKey) -> tuple[int, int | None]:
+        """CMD value and ECID value (None if it is not an extended command) of a key in ``telegrams``; inverse of ``telegram_key``."""
+        return key if isinstance(key, tuple) else (key, None)
+
 
 @dataclass
 class SimpleProfileSpecification(EEPSpecification):
@@ -172,6 +414,7 @@ class SimpleProfileSpecification(EEPSpecification):
         entities: list[Entity] | None = None,
         uses_addressed_sending: bool = True,
         learn_telegram_payload: bytes | None = None,
+        reuse_unchanged_payloads: bool = True,
     ):
         """Initialize a single-telegram EEP.
 
@@ -185,6 +428,7 @@ class SimpleProfileSpecification(EEPSpecification):
             entities: Optional list of Entity declarations for this EEP.
             uses_addressed_sending: See EEPSpecification.uses_addressed_sending.
             learn_telegram_payload: See EEPSpecification.learn_telegram_payload.
+            reuse_unchanged_payloads: See EEPSpecification.reuse_unchanged_payloads.
         """
 
         super().__init__(
@@ -199,4 +443,5 @@ class SimpleProfileSpecification(EEPSpecification):
             entities=entities or [],
             uses_addressed_sending=uses_addressed_sending,
             learn_telegram_payload=learn_telegram_payload,
+            reuse_unchanged_payloads=reuse_unchanged_payloads,
         )
@@ -0,0 +1,163 @@
+"""Lazily loaded registry of EEP specifications.
+
+Building the specifications (data fields, enumerations, resolvers) of all
+supported EEPs at import time is slow. The registry instead starts from a
+precomputed index (``_index.py``, generated by ``scripts/generate_eep_index.py``)
+that lists every supported EEP with its name and the profile module defining it.
+A profile module is imported the first time one of its specifications is looked up.
+Specifications loaded at runtime, e.g. from definition files (see ``definition.py``),
+are added with ``EEPRegistry.register``.
+"""
+
+from collections.abc import Callable, Iterator, Mapping
+import importlib
+import pkgutil
+from typing import NamedTuple
+
+from .id import EEP
+from .profile import EEPSpecification
+
+PROFILE_PACKAGES = ("a5", "d2", "f6")
+"""Subpackages (relative to ``enocean_async.eep``) holding the profile modules."""
+
+
+class EEPIndexEntry(NamedTuple):
+    """An entry of the precomputed EEP index."""
+
+    eep: EEP
+    name: str
+    """Name of the EEP (``EEPSpecification.name``), e.g. for catalog UIs."""
+
+    module: str
+    """Profile module defining the specification, relative to ``enocean_async.eep`` (e.g. ``a5.a5_02``);
+    for registered specifications the source they were loaded from (e.g. a definition file)."""
+
+    attribute: str
+    """Name of the specification in its profile module (e.g. ``EEP_A5_02_01``)."""
+
+
+class EEPRegistry(Mapping[EEP, EEPSpecification]):
+    """Read-only mapping from EEP to EEPSpecification that imports profile modules on first lookup.
+
+    Membership tests, iteration, ``len`` and the ``index`` (names for catalogs) only
+    use the precomputed index and never import a profile module.
+    """
+
+    def __init__(self, index: Mapping[EEP, EEPIndexEntry]) -> None:
+        self.__index = dict(index)
+        self.__loaded: dict[EEP, EEPSpecification] = {}
+        self.__builders: dict[EEP, Callable[[], EEPSpecification]] = {}
+
+    def __getitem__(self, eep: EEP) -> EEPSpecification:
+        spec = self.__loaded.get(eep)
+        if spec is None:
+            entry = self.__index[eep]
+            build = self.__builders.get(eep)
+            if build is not None:
+                spec = build()
+            else:
+                module = importlib.import_module(f"{__package__}.{entry.module}")
+                spec = getattr(module, entry.attribute)
+            if spec.eep != eep:
+                raise LookupError(
+                    f"EEP index is out of date: {entry.module}.{entry.attribute} is {spec.eep}, not {eep}; run scripts/generate_eep_index.py."
+                )
+            self.__loaded[eep] = spec
+            self.__builders.pop(eep, None)
+        return spec
+
+    def __contains__(self, eep: object) -> bool:
+        return eep in self.__index
+
+    def __iter__(self) -> Iterator[EEP]:
+        return iter(self.__index)
+
+    def __len__(self) -> int:
+        return len(self.__index)
+
+    @property
+    def index(self) -> Mapping[EEP, EEPIndexEntry]:
+        """The precomputed index: name and defining module of every supported EEP."""
+        return self.__index
+
+    def is_loaded(self, eep: EEP) -> bool:
+        """Return True if the specification of an EEP has already been looked up."""
+        return eep in self.__loaded
+
+    def register(
+        self,
+        eep: EEP,
+        name: str,
+        source: str,
+        build: Callable[[], EEPSpecification],
+    ) -> None:
+        """Add an EEP that is not part of the precomputed index, e.g. one from a definition file.
+
+        Like a profile module, ``build`` is only called on the first lookup of the EEP;
+        ``source`` (e.g. the definition file) is stored as the index entry's ``module``.
+
+        Raises:
+            ValueError: If the EEP is already in the registry.
+        """
+        if eep in self.__index:
+            raise ValueError(f"EEP {eep} is already registered")
+        self.__index[eep] = EEPIndexEntry(eep, name, source, "")
+        self.__builders[eep] = build
+
+    def load_all(self) -> None:
+        """Import all profile modules, e.g. to move the cost to startup."""
+        for eep in self.__index:
+            self[eep]
+
+
+def load_index(
+    entries: tuple[tuple[str, str, str, str], ...],
+) -> dict[EEP, EEPIndexEntry]:
+    """Build the index from ``(eep, name, module, attribute)`` tuples as stored in ``_index.py``."""
+    index = {}
+    for eep_str, name, module, attribute in entries:
+        eep = EEP(eep_str)
+        index[eep] = EEPIndexEntry(eep, name, module, attribute)
+    return index
+
+
+def discover_specifications() -> list[EEPIndexEntry]:
+    """Import all profile modules and return an index entry for every EEP specification defined at module level.
+
+    Used to (re)generate ``_index.py``; entries are ordered by package, module and definition order.
+    """
+    entries: dict[EEP, EEPIndexEntry] = {}
+    for package_name in PROFILE_PACKAGES:
+        package = importlib.import_module(f"{__package__}.{package_name}")
+        for module_info in sorted(
+            pkgutil.iter_modules(package.__path__), key=lambda m: m.name
+        ):
+            module_name = f"{package_name}.{module_info.name}"
+            module = importlib.import_module(f"{__package__}.{module_name}")
+            for attribute, value in vars(module).items():
+                if (
+                    attribute.startswith("EEP_")
+                    and isinstance(value, EEPSpecification)
+                    and value.eep not in entries
+                ):
+                    entries[value.eep] = EEPIndexEntry(
+                        value.eep, value.name, module_name, attribute
+                    )
+    return list(entries.values())
+
+
+def package_attribute(package: str, name: str) -> EEPSpecification:
+    """Resolve ``EEP_*`` attributes of a profile package (its ``__getattr__``) by importing only the defining module.
+
+    Raises:
+        AttributeError: If the package defines no such specification.
+    """
+    from ._index import INDEX
+
+    prefix = package.removeprefix(f"{__package__}.")
+    for _, _, module, attribute in INDEX:
+        if attribute == name and (
+            package == __package__ or module.startswith(f"{prefix}.")
+        ):
+            return getattr(importlib.import_module(f"{__package__}.{module}"), name)
+    raise AttributeError(f"module {package!r} has no attribute {name!r}")
@@ -0,0 +1,42 @@
+"""Precompiled decoders that extract raw field values from EEP telegram data."""
+
+from .profile import EEPTelegram
+
+
+class TelegramUnpacker:
+    """Extracts the raw values of all data fields of one EEP telegram type.
+
+    The telegram data is converted to an integer once per telegram; the shift of
+    every field is computed once per telegram data length, so extracting a field
+    is a shift and a mask.
+    """
+
+    __slots__ = ("__fields", "__min_bits", "__by_bits")
+
+    def __init__(self, telegram: EEPTelegram) -> None:
+        self.__fields: tuple[tuple[str, int, int], ...] = tuple(
+            (f.id, f.bit_end, f.mask) for f in telegram.datafields
+        )
+        self.__min_bits: int = max((f.bit_end for f in telegram.datafields), default=0)
+        # (field id, shift, mask) per telegram data length in bits
+        self.__by_bits: dict[int, tuple[tuple[str, int, int], ...]] = {}
+
+    def unpack(self, data: bytes) -> dict[str, int]:
+        """Return the raw values of all data fields, keyed by field id.
+
+        Raises:
+            ValueError: If the telegram data is too short for the data fields.
+        """
+        bits = len(data) * 8
+        fields = self.__by_bits.get(bits)
+        if fields is None:
+            if bits < self.__min_bits:
+                raise ValueError(
+                    f"Telegram data of {len(data)} bytes is too short for data fields up to bit {self.__min_bits}"
+                )
+            fields = self.__by_bits[bits] = tuple(
+                (field_id, bits - bit_end, mask)
+                for field_id, bit_end, mask in self.__fields
+            )
+        value = int.from_bytes(data, "big")
+        return {field_id: (value >> shift) & mask for field_id, shift, mask in fields}
@@ -1,6 +1,8 @@
 import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass
 import logging
+import random
 import time
 from typing import Any, Callable
 
@@ -8,13 +10,25 @@ import serialx
 
 from enocean_async.semantics.instructions.learning import LearningToggle
 
-from .address import EURID, BaseAddress, SenderAddress
+from .address import EURID, BaseAddress, SenderAddress, sender_address
+from .census import SenderCensus
+from .dedupe import FingerprintCache
 from .device import Device
 from .eep import EEP_SPECIFICATIONS, device_type_for_eep
 from .eep.device_type import DeviceType
 from .eep.handler import EEPHandler
 from .eep.id import EEP
 from .eep.message import EEPMessage
+from .eep.profile import EEPConfirmation
+from .metrics import (
+    CacheStats,
+    LatencySnapshot,
+    LatencyWindow,
+    LinkStats,
+    TransmitMetrics,
+    TransmitStats,
+    erp1_airtime_bytes,
+)
 from .protocol.erp1.fourbs import (
     FourBSLearnStatus,
     FourBSLearnType,
@@ -33,6 +47,7 @@ from .protocol.esp3.packet import ESP3Packet, ESP3PacketType
 from .protocol.esp3.protocol import EnOceanSerialProtocol3
 from .protocol.esp3.response import ResponseCode, ResponseTelegram
 from .protocol.version import VersionIdentifier, VersionInfo
+from .ratelimit import FloodState, SenderRateLimiter
 from .semantics.device_spec import DeviceSpec
 from .semantics.entity import Entity, EntityCategory, EnumOptions
 from .semantics.instructable import Instructable
@@ -40,6 +55,9 @@ from .semantics.instruction import Instruction
 from .semantics.observable import Observable
 from .semantics.observation import Observation, ObservationCallback, ObservationSource
 from .semantics.observers.metadata import MetaDataObserver
+from .semantics.observers.observer import Observer
+from .semantics.observers.scalar import ScalarObserver
+from .semantics.reporting import ReportPolicy
 
 type RSSI = int
 
@@ -142,11 +160,115 @@ _GATEWAY_ENTITIES: list[Entity] = [
     ),
 ]
 
+# optional transmit diagnostics of the gateway device (see Gateway.transmit_diagnostics)
+_TRANSMIT_ENTITIES: list[Entity] = [
+    Entity(
+        id="send_latency",
+        observables=frozenset({Observable.SEND_LATENCY}),
+        category=EntityCategory.DIAGNOSTIC,
+    ),
+    Entity(
+        id="send_failures",
+        observables=frozenset({Observable.SEND_FAILURES}),
+        category=EntityCategory.DIAGNOSTIC,
+    ),
+    Entity(
+        id="airtime",
+        observables=frozenset({Observable.AIRTIME}),
+        category=EntityCategory.DIAGNOSTIC,
+    ),
+]
+
+# device diagnostics of the flood protection (see Gateway.rate_limiter)
+_FLOOD_ENTITIES: list[Entity] = [
+    Entity(
+        id="telegrams_dropped",
+        observables=frozenset({Observable.TELEGRAMS_DROPPED}),
+        category=EntityCategory.DIAGNOSTIC,
+    ),
+    Entity(
+        id="flood_state",
+        observables=frozenset({Observable.FLOOD_STATE}),
+        category=EntityCategory.DIAGNOSTIC,
+    ),
+]
+
+# minimum interval between flood diagnostics observations of a sender while its state does not change
+_FLOOD_REPORT_INTERVAL: float = 1.0
+
 
 @dataclass
 class SendResult:
     response: ResponseTelegram | None
     duration_ms: float | None
+    attempts: int = 1
+    """Number of times the packet was written to the module (1 = no retry)."""
+    confirmation: EEPMessage | None = None
+    """Status telegram that confirmed the instruction (``send_command(..., confirm=True)`` only); None if it did not arrive in time."""
+    actuation_ms: float | None = None
+    """Time in ms from sending the instruction until the confirming status telegram arrived."""
+
+
+@dataclass
+class _PendingConfirmation:
+    """An instruction sent with ``confirm=True`` that awaits its status reply."""
+
+    confirmation: EEPConfirmation
+    channel: int | None
+    future: asyncio.Future
+
+
+@dataclass(slots=True)
+class _DeviceRoute:
+    """Everything the receive path needs for telegrams from one registered device, resolved once per registry change."""
+
+    device: Device
+    handler: EEPHandler | None
+    config: dict[str, Any]
+    capabilities: tuple[Observer, ...]
+    eep_callbacks: tuple[EEPMessageCallback, ...]
+    """EEP message callbacks without sender filter or with a filter matching the device, in registration order."""
+    observe: bool
+    """Whether the capabilities run at all: False if there are none or no observation callback would receive their observations."""
+    fields: frozenset[str] | None
+    """Data fields the capabilities read from ``EEPMessage.decoded`` besides the observable fields; None if any may be read (see ``EEPHandler.decode``)."""
+    reuse_payloads: bool
+    """Whether the decoded message of the previous telegram is reused for byte-identical telegram data (``EEPSpecification.reuse_unchanged_payloads``)."""
+    last_payload: bytes | None = None
+    """Telegram data of the previous telegram decoded for this route; the route is rebuilt (and this reset) when the device config changes."""
+    last_fields: frozenset[str] | None = None
+    """``fields`` argument the previous telegram was decoded with."""
+    last_message: EEPMessage | None = None
+    """Message decoded from ``last_payload``."""
+
+
+@dataclass(slots=True)
+class _TelegramCopies:
+    """Repeat filter entry of a processed telegram; later copies are merged into the link statistics of its sender."""
+
+    link: LinkStats | None
+    """Link statistics of the sender, or None if the sender is not a registered device."""
+
+
+@dataclass(slots=True)
+class _AbandonedAttempt:
+    """A written frame whose response did not arrive within the (adaptive) timeout, but may still arrive within the 500 ms of the ESP3 specification."""
+
+    send: object
+    """Identifies the ``send_esp3_packet`` call the attempt belongs to."""
+    start: float
+    """``time.perf_counter()`` when the frame was written."""
+    latency: LatencyWindow
+    response: asyncio.Future
+    """Resolved with the late response and its duration in ms."""
+
+
+# response timeout handling (ESP3 specification: the module answers within 500 ms)
+_RESPONSE_TIMEOUT_MAX: float = 0.5
+_RESPONSE_TIMEOUT_MIN: float = 0.05
+_ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = 20
+_ADAPTIVE_TIMEOUT_FACTOR: float = 4.0
+_RETRY_BASE_DELAY: float = 0.02
 
 
 def _sender_to_slot_string(
@@ -220,9 +342,11 @@ class Gateway:
         self.__base_id: BaseAddress | None = None
 
         # device and EEP management
-        self.__known_senders: set[SenderAddress] = set()
+        self.__census: SenderCensus = SenderCensus()
         self.__eep_handlers: dict[EEP, EEPHandler] = {}
         self.__devices: dict[EURID, Device] = {}
+        # receive routes of registered devices, keyed by the 32-bit address
+        self.__routes: dict[int, _DeviceRoute] = {}
         self.__observation_callbacks: list[ObservationCallback] = []
 
         # callbacks
@@ -239,6 +363,29 @@ class Gateway:
         # send handling
         self.__send_lock: asyncio.Lock = asyncio.Lock()
         self.__send_future: asyncio.Future | None = None
+        # RESPONSE packets carry no reference to their frame: after a timed-out attempt, the next frame
+        # is only written once the attempt's response arrived or the spec's window has passed
+        self.__abandoned_attempt: _AbandonedAttempt | None = None
+        self.__response_latency: dict[ESP3PacketType, LatencyWindow] = {}
+        self.__regular_sends: int = 0
+        self.__regular_sends_idle: asyncio.Event = asyncio.Event()
+        self.__regular_sends_idle.set()
+
+        # transmit metrics: all packets, and RADIO_ERP1 packets per device / per sender address (int)
+        self.__transmit_total: TransmitStats = TransmitStats()
+        self.__transmit_by_device: dict[EURID, TransmitStats] = {}
+        self.__transmit_by_sender: dict[int, TransmitStats] = {}
+
+        # encode cache: fully serialized frames of recently sent instructions, keyed by
+        # (destination int, instruction type, instruction field values, sender int)
+        self.__encode_cache: OrderedDict[
+            tuple, tuple[ESP3Packet, bytes, dict[str, int]]
+        ] = OrderedDict()
+        self.__encode_cache_hits: int = 0
+        self.__encode_cache_misses: int = 0
+
+        # instructions awaiting a confirming status telegram, indexed by device address (int)
+        self.__pending_confirmations: dict[int, list[_PendingConfirmation]] = {}
 
         # learning
         self.__is_learning: bool = False
@@ -268,21 +415,40 @@ class Gateway:
         # background tasks (teach-in response sends); tracked for clean cancellation on stop()
         self.__background_tasks: set[asyncio.Task] = set()
 
-        # echo filter: cache of recently sent ERP1 fingerprints (RORG + data + sender bytes)
+        # echo filter: recently sent ERP1 fingerprints (RORG + data + sender bytes)
         # used to detect and drop our own packets echoed back by repeaters
-        self.__sent_erp1_cache: list[tuple[bytes, float]] = []
-        self.__sent_erp1_cache_ttl: float = 2.0
-        self.__sent_erp1_cache_max: int = 32
+        self.__echo_filter: FingerprintCache = FingerprintCache(ttl=2.0, max_size=32)
 
-        # repeat filter: cache of recently received original ERP1 fingerprints
+        # repeat filter: recently received original ERP1 fingerprints
         # used to detect and drop repeated copies relayed by repeaters
-        self.__received_erp1_cache: list[tuple[bytes, float]] = []
-        self.__received_erp1_cache_ttl: float = 2.0
-        self.__received_erp1_cache_max: int = 64
+        self.__repeat_filter: FingerprintCache[_TelegramCopies] = FingerprintCache(
+            ttl=2.0, max_size=64
+        )
+        # reception statistics incl. repeated copies, per registered device (int address)
+        self.__link_stats: dict[int, LinkStats] = {}
+
+        # flood protection: per-sender token buckets (disabled until a rate is set) and
+        # the last reported (state, time) of senders that are not in state OK
+        self.__rate_limiter: SenderRateLimiter = SenderRateLimiter()
+        # change-only reporting of scalar observations (disabled until enabled)
+        self.__report_policy: ReportPolicy = ReportPolicy()
+        self.__flood_reported: dict[int, tuple[FloodState, float]] = {}
 
         self.auto_reconnect: bool = True
         """If True (default), automatically attempt to reconnect when the connection is lost. Set to False to disable reconnection entirely."""
 
+        self.adaptive_timeout: bool = True
+        """If True (default), derive the response timeout from the measured response latency of the module (never exceeding the 500 ms of the ESP3 specification). Set to False to always wait the full 500 ms."""
+
+        self.send_retries: int = 2
+        """Maximum number of additional attempts for RADIO_ERP1 packets when the module answers ``NO_FREE_BUFFER`` or does not answer in time."""
+
+        self.transmit_diagnostics: bool = False
+        """If True, ``gateway_entities`` includes the ``send_latency``, ``send_failures`` and ``airtime`` diagnostic entities, which are updated after every sent packet."""
+
+        self.encode_cache_size: int = 256
+        """Maximum number of serialized instruction frames kept by ``send_command`` (least recently used entries are evicted). Set to 0 to disable the cache."""
+
     # ------------------------------------------------------------------
     # callback registration
     # ------------------------------------------------------------------
@@ -330,6 +496,9 @@ class Gateway:
         - the sender address of the message is known (by adding it to this gateway as known-device along with its eep), and
         - there is an EEPHandler capable of handling the eep of the sender device."""
         self.__eep_receive_callbacks.append(EEPCallbackWithFilter(cb, sender_filter))
+        for route in self.__routes.values():
+            if sender_filter is None or sender_filter == route.device.address:
+                route.eep_callbacks += (cb,)
 
     def add_ute_received_callback(self, cb: UTECallback) -> None:
         self.__ute_receive_callbacks.append(cb)
@@ -348,6 +517,8 @@ class Gateway:
         ``start()`` to receive the initial state.
         """
         self.__observation_callbacks.append(cb)
+        for route in self.__routes.values():
+            route.observe = bool(route.capabilities)
         if self.__version_info is not None:
             try:
                 loop = asyncio.get_running_loop()
@@ -371,6 +542,7 @@ class Gateway:
     # ------------------------------------------------------------------
     def __disconnect(self) -> None:
         self.__stopped = True
+        self.__abandoned_attempt = None
         if self.__transport is not None:
             self.__transport.close()
             self.__transport = None
@@ -467,6 +639,9 @@ class Gateway:
 
         if self.__send_future is not None and not self.__send_future.done():
             self.__send_future.cancel()
+        for pendings in self.__pending_confirmations.values():
+            for pending in pendings:
+                pending.future.cancel()
 
         self.__disconnect()
 
@@ -636,61 +811,306 @@ class Gateway:
     # ------------------------------------------------------------------
     # sending commands and receiving responses
     # ------------------------------------------------------------------
-    async def send_esp3_packet(self, packet: ESP3Packet) -> SendResult:
-        """Send an ESP3 packet to the EnOcean module and wait up to 500ms for a response (as per ESP3 specification).
+    async def send_esp3_packet(
+        self, packet: ESP3Packet, *, retries: int | None = None
+    ) -> SendResult:
+        """Send an ESP3 packet to the EnOcean module and wait for a response.
+
+        This method is thread-safe and can be called from multiple coroutines concurrently; the send operations will be serialized using an internal lock, and each call will wait for its corresponding response before allowing the next send operation to proceed. The method returns a SendResult object containing the received response (if any), the duration in milliseconds between sending the (last) request and receiving the response, and the number of attempts.
+
+        The response timeout is derived from the rolling latency distribution of previous responses to the same packet type (see ``response_latency``), capped at the 500 ms of the ESP3 specification. Each retry doubles the timeout (up to the cap) and waits a short, jittered back-off before writing the packet again.
 
-        This method is thread-safe and can be called from multiple coroutines concurrently; the send operations will be serialized using an internal lock, and each call will wait for its corresponding response before allowing the next send operation to proceed. The method returns a SendResult object containing the received response (if any) and the duration in milliseconds between sending the request and receiving the response.
+        Args:
+            packet: The packet to send.
+            retries: Maximum number of additional attempts if the module answers ``NO_FREE_BUFFER`` or does not answer in time. Defaults to ``send_retries`` for RADIO_ERP1 packets and to 0 for all other packet types, since common commands such as ``CO_WR_IDBASE`` are not safe to repeat.
         """
 
+        return await self.__send_frame(packet, packet.to_bytes(), retries)
+
+    async def __send_frame(
+        self,
+        packet: ESP3Packet,
+        frame: bytes,
+        retries: int | None = None,
+        low_priority: bool = False,
+        device: EURID | None = None,
+    ) -> SendResult:
+        """Send an already serialized packet; see ``send_esp3_packet``.
+
+        Low-priority sends (e.g. background polling) wait until no regular send is queued.
+        ``device`` is the registered device the packet is addressed to (for transmit metrics).
+        """
+        if low_priority:
+            await self.__regular_sends_idle.wait()
+            return await self.__send_frame_queued(packet, frame, retries, device)
+
+        self.__regular_sends += 1
+        self.__regular_sends_idle.clear()
+        try:
+            return await self.__send_frame_queued(packet, frame, retries, device)
+        finally:
+            self.__regular_sends -= 1
+            if self.__regular_sends == 0:
+                self.__regular_sends_idle.set()
+
+    async def __send_frame_queued(
+        self,
+        packet: ESP3Packet,
+        frame: bytes,
+        retries: int | None,
+        device: EURID | None,
+    ) -> SendResult:
+        """Send an already serialized packet as soon as the send lock is available."""
         if not self.__transport:
             self._logger.warning(
                 "Cannot send: gateway is not connected to an EnOcean module."
             )
             return SendResult(None, None)
 
+        if retries is None:
+            retries = (
+                self.send_retries
+                if packet.packet_type == ESP3PacketType.RADIO_ERP1
+                else 0
+            )
+
+        latency = self.__response_latency.setdefault(
+            packet.packet_type, LatencyWindow()
+        )
+
+        queued_at = time.perf_counter()
+        send = object()  # identifies the attempts of this send
         async with self.__send_lock:
-            self.__send_future = asyncio.get_running_loop().create_future()
+            queue_wait_ms = (time.perf_counter() - queued_at) * 1000
+            attempt = 0
+            transmitted = (
+                0  # attempts that reached the air: answered OK or not answered
+            )
+            while True:
+                # a late response to the previous attempt makes writing the frame again unnecessary
+                late = await self.__settle_abandoned_attempt()
+                if late is not None and late[0] is send:
+                    if late[1].return_code != ResponseCode.OK:
+                        transmitted -= 1  # the timed-out attempt was rejected after all
+                    if late[1].return_code != ResponseCode.NO_FREE_BUFFER:
+                        result = SendResult(late[1], late[2], attempt)
+                        break
+                if not self.__transport:
+                    result = SendResult(None, None, attempt)
+                    break
+
+                response, duration_ms = await self.__send_attempt(
+                    packet,
+                    frame,
+                    self.__response_timeout(latency, attempt),
+                    latency,
+                    send,
+                )
+                attempt += 1
+                if response is None or response.return_code == ResponseCode.OK:
+                    transmitted += 1
 
-            try:
+                retryable = (
+                    response is None
+                    or response.return_code == ResponseCode.NO_FREE_BUFFER
+                )
+                if not retryable or attempt > retries or not self.__transport:
+                    result = SendResult(response, duration_ms, attempt)
+                    break
+
+                delay = (
+                    random.uniform(0.5, 1.5) * _RETRY_BASE_DELAY * 2 ** (attempt - 1)
+                )
                 self._logger.debug(
-                    f"Sending ESP3 packet: {packet}. Waiting for response..."
+                    f"Retrying ESP3 packet ({attempt}/{retries}) in {delay * 1000:.0f} ms "
+                    f"({'no response' if response is None else response.return_code.name})."
                 )
-                start = time.perf_counter()
+                await asyncio.sleep(delay)
 
-                # send the frame
-                self.__transport.write(packet.to_bytes())
-                if packet.packet_type == ESP3PacketType.RADIO_ERP1:
-                    self.__cache_sent_erp1(packet.data[:-1])
-                self.__emit(self.__esp3_send_callbacks, packet)
+        self.__record_transmit(packet, result, queue_wait_ms, device, transmitted)
+        return result
 
-                try:
-                    response: ResponseTelegram | None = await asyncio.wait_for(
-                        self.__send_future, timeout=0.5
-                    )
-                except TimeoutError:
-                    end = time.perf_counter()
-                    self._logger.debug(
-                        f"No response to sent packet within 500ms. Duration: {(end - start) * 1000:.2f} ms"
-                    )
-                    return SendResult(None, (end - start) * 1000)
+    def __record_transmit(
+        self,
+        packet: ESP3Packet,
+        result: SendResult,
+        queue_wait_ms: float,
+        device: EURID | None,
+        transmitted: int,
+    ) -> None:
+        """Update transmit metrics (and diagnostic entities) with the outcome of a sent packet.
 
-                # stop the timer and calculate duration
-                end = time.perf_counter()
+        Airtime is only counted for the ``transmitted`` attempts, i.e. those the module
+        answered with ``OK`` or did not answer; rejected attempts never reached the air.
+        """
+        is_erp1 = packet.packet_type == ESP3PacketType.RADIO_ERP1
+        airtime = 0
+        if is_erp1:
+            sub_telegrams = packet.optional[0] if packet.optional else 3
+            airtime = erp1_airtime_bytes(len(packet.data), sub_telegrams) * transmitted
+        args = (
+            result.response.return_code if result.response else None,
+            result.duration_ms,
+            result.attempts,
+            queue_wait_ms,
+            airtime,
+        )
+        self.__transmit_total.record(*args)
+        if is_erp1:
+            sender = int.from_bytes(packet.data[-5:-1], "big")
+            self.__transmit_by_sender.setdefault(sender, TransmitStats()).record(*args)
+            if device is not None:
+                self.__transmit_by_device.setdefault(device, TransmitStats()).record(
+                    *args
+                )
 
+        if self.transmit_diagnostics:
+            total = self.__transmit_total
+            if result.response is not None:
+                self.__emit_gateway_observation(
+                    "send_latency", Observable.SEND_LATENCY, result.duration_ms
+                )
+            self.__emit_gateway_observation(
+                "send_failures",
+                Observable.SEND_FAILURES,
+                total.sent - total.response_codes.get(ResponseCode.OK, 0),
+            )
+            self.__emit_gateway_observation(
+                "airtime", Observable.AIRTIME, total.airtime_s
+            )
+
+    @property
+    def transmit_metrics(self) -> TransmitMetrics:
+        """Snapshot of the transmit metrics: send latency histogram, response codes, timeouts, queue wait and estimated airtime, in total, per destination device and per sender address."""
+        return TransmitMetrics(
+            total=self.__transmit_total.copy(),
+            by_device={
+                device: stats.copy()
+                for device, stats in self.__transmit_by_device.items()
+            },
+            by_sender={
+                (EURID(sender) if sender <= 0xFF7FFFFF else BaseAddress(sender)): (
+                    stats.copy()
+                )
+                for sender, stats in self.__transmit_by_sender.items()
+            },
+        )
+
+    async def __send_attempt(
+        self,
+        packet: ESP3Packet,
+        frame: bytes,
+        timeout: float,
+        latency: LatencyWindow,
+        send: object,
+    ) -> tuple[ResponseTelegram | None, float]:
+        """Write a frame once and wait up to ``timeout`` seconds for the response. Must be called with the send lock held.
+
+        If the timeout is shorter than the 500 ms of the ESP3 specification, the attempt
+        is remembered as abandoned, so that its late response is not taken for the
+        response to the next frame written (see ``__settle_abandoned_attempt``).
+        """
+        loop = asyncio.get_running_loop()
+        self.__send_future = loop.create_future()
+
+        try:
+            self._logger.debug(
+                f"Sending ESP3 packet: {packet}. Waiting up to {timeout * 1000:.0f} ms for response..."
+            )
+            start = time.perf_counter()
+
+            # send the frame
+            self.__transport.write(frame)
+            if packet.packet_type == ESP3PacketType.RADIO_ERP1:
+                self.__echo_filter.add(packet.data[:-1])
+            self.__emit(self.__esp3_send_callbacks, packet)
+
+            try:
+                response: ResponseTelegram | None = await asyncio.wait_for(
+                    self.__send_future, timeout=timeout
+                )
+            except TimeoutError:
+                duration_ms = (time.perf_counter() - start) * 1000
+                latency.add_timeout()
+                if timeout < _RESPONSE_TIMEOUT_MAX:
+                    self.__abandoned_attempt = _AbandonedAttempt(
+                        send, start, latency, loop.create_future()
+                    )
                 self._logger.debug(
-                    f"Received response to sent packet: {response}. Duration: {(end - start) * 1000:.2f} ms"
+                    f"No response to sent packet within {timeout * 1000:.0f} ms. Duration: {duration_ms:.2f} ms"
                 )
+                return None, duration_ms
+
+            # stop the timer and calculate duration
+            duration_ms = (time.perf_counter() - start) * 1000
+            latency.add(duration_ms)
+
+            self._logger.debug(
+                f"Received response to sent packet: {response}. Duration: {duration_ms:.2f} ms"
+            )
+
+            return response, duration_ms
 
-                return SendResult(response, (end - start) * 1000)
+        finally:
+            self.__send_future = None
+
+    async def __settle_abandoned_attempt(
+        self,
+    ) -> tuple[object, ResponseTelegram, float] | None:
+        """Wait until the late response to an abandoned attempt has arrived or the 500 ms of the ESP3 specification since writing it have passed. Must be called with the send lock held.
 
-            finally:
-                self.__send_future = None
+        Returns the send the attempt belongs to, its response and the duration in ms; None if there is no abandoned attempt or its response was lost.
+        """
+        attempt = self.__abandoned_attempt
+        if attempt is None:
+            return None
+        remaining = attempt.start + _RESPONSE_TIMEOUT_MAX - time.perf_counter()
+        try:
+            response, duration_ms = await asyncio.wait_for(
+                attempt.response, max(remaining, 0.0)
+            )
+        except TimeoutError:
+            return None
+        finally:
+            if self.__abandoned_attempt is attempt:
+                self.__abandoned_attempt = None
+        return attempt.send, response, duration_ms
+
+    def __response_timeout(self, latency: LatencyWindow, attempt: int) -> float:
+        """Return the response timeout in seconds for the given attempt (0 = first try)."""
+        if not self.adaptive_timeout or len(latency) < _ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+            return _RESPONSE_TIMEOUT_MAX
+        p99 = latency.percentile(99) / 1000
+        timeout = max(_RESPONSE_TIMEOUT_MIN, p99 * _ADAPTIVE_TIMEOUT_FACTOR)
+        return min(_RESPONSE_TIMEOUT_MAX, timeout * 2**attempt)
+
+    def response_timeout(self, packet_type: ESP3PacketType) -> float:
+        """Return the response timeout in seconds currently used for the first attempt of sending a packet of the given type."""
+        return self.__response_timeout(
+            self.__response_latency.get(packet_type, LatencyWindow()), 0
+        )
+
+    @property
+    def response_latency(self) -> dict[ESP3PacketType, LatencySnapshot]:
+        """Rolling response latency statistics of the EnOcean module, per sent ESP3 packet type.
+
+        Only answered requests contribute latency samples; timeouts are counted separately.
+        """
+        return {
+            packet_type: window.snapshot()
+            for packet_type, window in self.__response_latency.items()
+        }
 
     async def send_command(
         self,
         destination: EURID,
         command: Instruction,
         sender: SenderAddress | None = None,
+        *,
+        confirm: bool = False,
+        confirm_timeout: float = 5.0,
+        confirm_query: bool = True,
+        low_priority: bool = False,
     ) -> SendResult:
         """Send a typed command to a registered device.
 
@@ -700,12 +1120,21 @@ class Gateway:
             command: A typed Command instance (e.g. CoverSetPositionAndAngle, CentralDim).
             sender: Sender address to use. If None, uses the device's registered sender
                     or falls back to the gateway's base ID.
+            confirm: If True, only return once the device confirmed the command with its status
+                     telegram (e.g. D2-01 CMD 4 for the same I/O channel, D2-05 CMD 4), or after
+                     ``confirm_timeout``. Only supported for commands listed in the EEP's ``confirmations``.
+            confirm_timeout: Maximum time in seconds to wait for the confirming status telegram.
+            confirm_query: If True (default) and the EEP defines a status query for the command,
+                           send that query once if no confirmation arrived within half of ``confirm_timeout``.
+            low_priority: If True, the command is only queued once no regular send is pending
+                          (used for background polling, see ``PollScheduler``).
 
         Returns:
-            SendResult with the response and duration.
+            SendResult with the response and duration. With ``confirm=True``, also the confirming
+            EEP message and the end-to-end actuation latency (both None on timeout).
 
         Raises:
-            ValueError: If the device is unknown, or the command is not supported by its EEP.
+            ValueError: If the device is unknown, or the command is not supported (or not confirmable) by its EEP.
             ConnectionError: If not connected to the EnOcean module.
         """
         device = self.__devices.get(destination)
@@ -774,6 +1203,14 @@ class Gateway:
                 f"Command '{command.action}' is not supported for EEP {eep_id}"
             )
 
+        confirmation: EEPConfirmation | None = None
+        if confirm:
+            confirmation = spec.confirmations.get(command.action)
+            if confirmation is None:
+                raise ValueError(
+                    f"Command '{command.action}' cannot be confirmed for EEP {eep_id}"
+                )
+
         # Resolve sender: explicit > device sender > default sender
         if sender is None:
             if device.sender:
@@ -791,18 +1228,232 @@ class Gateway:
                 "Could not determine sender address; pass sender= explicitly or connect first"
             )
 
-        message: EEPMessage = spec.encoders[command.action](command, device.config)
-        message.sender = sender
-        # Only set a device-specific destination for addressed EEPs (e.g. VLD/D2).
-        if spec.uses_addressed_sending:
-            message.destination = destination
+        # Encoding only depends on the instruction, the device config and the sender,
+        # so repeated instructions are served from the cache of serialized frames.
+        key = self.__encode_cache_key(destination, command, sender)
+        cached = self.__encode_cache.get(key) if key is not None else None
+        if cached is not None:
+            self.__encode_cache.move_to_end(key)
+            self.__encode_cache_hits += 1
+            packet, frame, raw = cached
+        else:
+            self.__encode_cache_misses += 1
+            message: EEPMessage = spec.encoders[command.action](command, device.config)
+            message.sender = sender
+            # Only set a device-specific destination for addressed EEPs (e.g. VLD/D2).
+            if spec.uses_addressed_sending:
+                message.destination = destination
+
+            packet = self.__eep_handlers[eep_id].encode(message).to_esp3()
+            frame = packet.to_bytes()
+            raw = message.raw
+            if key is not None and self.encode_cache_size > 0:
+                self.__encode_cache[key] = (packet, frame, raw)
+                while len(self.__encode_cache) > self.encode_cache_size:
+                    self.__encode_cache.popitem(last=False)
 
-        erp1 = self.__eep_handlers[eep_id].encode(message)
         self.__erp1_sent += 1
         self.__emit_gateway_observation(
             "telegrams_sent", Observable.TELEGRAMS_SENT, self.__erp1_sent
         )
-        return await self.send_esp3_packet(erp1.to_esp3())
+        if confirmation is None:
+            return await self.__send_frame(
+                packet, frame, low_priority=low_priority, device=destination
+            )
+
+        channel = (
+            raw.get(confirmation.channel_field)
+            if confirmation.channel_field is not None
+            else None
+        )
+        return await self.__send_confirmed(
+            destination,
+            command,
+            packet,
+            frame,
+            _PendingConfirmation(
+                confirmation, channel, asyncio.get_running_loop().create_future()
+            ),
+            confirm_timeout,
+            confirm_query,
+        )
+
+    async def __send_confirmed(
+        self,
+        destination: EURID,
+        command: Instruction,
+        packet: ESP3Packet,
+        frame: bytes,
+        pending: _PendingConfirmation,
+        timeout: float,
+        query: bool,
+    ) -> SendResult:
+        """Send a frame and wait until the device confirms it with a status telegram (or the timeout expires)."""
+        # register before sending so that a fast reply cannot be missed
+        pendings = self.__pending_confirmations.setdefault(int(destination), [])
+        pendings.append(pending)
+        start = time.perf_counter()
+        try:
+            result = await self.__send_frame(packet, frame, device=destination)
+            if (
+                result.response is None
+                or result.response.return_code != ResponseCode.OK
+            ):
+                return result
+
+            follow_up = pending.confirmation.query if query else None
+            try:
+                if follow_up is not None:
+                    try:
+                        reply = await asyncio.wait_for(
+                            asyncio.shield(pending.future), timeout / 2
+                        )
+                    except TimeoutError:
+                        self._logger.debug(
+                            f"No confirmation from {destination} after {timeout / 2:.1f} s; querying status."
+                        )
+                        await self.send_command(
+                            destination, follow_up(entity_id=command.entity_id)
+                        )
+                        reply = await asyncio.wait_for(
+                            pending.future,
+                            max(0.0, timeout - (time.perf_counter() - start)),
+                        )
+                else:
+                    reply = await asyncio.wait_for(pending.future, timeout)
+            except TimeoutError:
+                self._logger.debug(
+                    f"No confirmation of {command.action} from {destination} within {timeout:.1f} s."
+                )
+                return result
+
+            result.confirmation = reply
+            result.actuation_ms = (time.perf_counter() - start) * 1000
+            return result
+        finally:
+            pendings.remove(pending)
+            if not pendings:
+                self.__pending_confirmations.pop(int(destination), None)
+
+    def __resolve_confirmations(self, eep_message: EEPMessage) -> None:
+        """Resolve pending confirmations of the message's sender that are satisfied by this status telegram."""
+        if eep_message.sender is None or eep_message.message_type is None:
+            return
+        pendings = self.__pending_confirmations.get(int(eep_message.sender))
+        if not pendings:
+            return
+        for pending in pendings:
+            confirmation = pending.confirmation
+            if (
+                pending.future.done()
+                or eep_message.message_type.id != confirmation.reply_cmd
+            ):
+                continue
+            if confirmation.channel_field is not None:
+                channel = eep_message.raw.get(confirmation.channel_field)
+                if channel not in (pending.channel, confirmation.all_channels) and (
+                    pending.channel != confirmation.all_channels
+                ):
+                    continue
+            pending.future.set_result(eep_message)
+
+    @staticmethod
+    def __encode_cache_key(
+        destination: EURID, command: Instruction, sender: SenderAddress
+    ) -> tuple | None:
+        """Return the encode cache key for an instruction, or None if its field values are not hashable."""
+        key = (
+            int(destination),
+            type(command),
+            tuple(vars(command).values()),
+            int(sender),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def __invalidate_encode_cache(self, address: EURID) -> None:
+        """Drop all cached frames for the given device (e.g. after a config change)."""
+        destination = int(address)
+        for key in [k for k in self.__encode_cache if k[0] == destination]:
+            del self.__encode_cache[key]
+
+    @property
+    def encode_cache_stats(self) -> CacheStats:
+        """Hit/miss counters of the ``send_command`` encode cache."""
+        return CacheStats(
+            hits=self.__encode_cache_hits,
+            misses=self.__encode_cache_misses,
+            size=len(self.__encode_cache),
+            max_size=self.encode_cache_size,
+        )
+
+    @property
+    def link_stats(self) -> dict[EURID, LinkStats]:
+        """Snapshot of the reception statistics per registered device.
+
+        Copies of a telegram relayed by repeaters within the ``repeat_filter`` window are
+        merged: the first copy is processed, later copies only update these statistics
+        (hop counts, which path delivered first, best RSSI).
+        """
+        return {
+            route.device.address: self.__link_stats[address].copy()
+            for address, route in self.__routes.items()
+            if address in self.__link_stats
+        }
+
+    @property
+    def census(self) -> SenderCensus:
+        """Table of unknown senders heard on air with traffic statistics (RORG, telegram length, rate, RSSI, first/last seen, teach-in telegrams).
+
+        Registered devices are not included. The table is bounded by ``census.max_senders``
+        (default 1024); the least recently heard sender is evicted first. A sender that was
+        evicted and is heard again triggers the new device callbacks again.
+        """
+        return self.__census
+
+    @property
+    def rate_limiter(self) -> SenderRateLimiter:
+        """Per-sender rate limiting of received telegrams (flood protection), applied before decoding.
+
+        Disabled by default; set ``rate_limiter.rate`` (telegrams per second per sender, with
+        bursts of up to ``rate_limiter.burst``) to enable it, and ``rate_limiter.quarantine_after``
+        to quarantine senders that keep flooding (their telegrams are not decoded, but still
+        update the RSSI, last seen and telegram count of the device). While enabled, registered devices expose the
+        ``telegrams_dropped`` and ``flood_state`` diagnostic entities.
+        """
+        return self.__rate_limiter
+
+    @property
+    def report_policy(self) -> ReportPolicy:
+        """Change-only reporting of scalar observations (e.g. temperature, humidity, switch state).
+
+        Disabled by default; set ``report_policy.enabled`` to emit an observation only if
+        its value changed by at least the observable's deadband (``report_policy.deadbands``,
+        e.g. 0.1 °C for temperature) since the last emitted one, or if that is at least
+        ``report_policy.max_silence`` seconds ago. While enabled, registered devices expose
+        the ``report_max_silence`` and ``<observable>_deadband`` config entities to override
+        these per device.
+        """
+        return self.__report_policy
+
+    @property
+    def echo_filter(self) -> FingerprintCache:
+        """Cache of recently sent telegrams used to drop our own telegrams echoed back by repeaters.
+
+        Adjust ``echo_filter.ttl`` / ``echo_filter.max_size`` to change the window (default 2 s, 32 telegrams); ``echo_filter.stats.hits`` counts dropped echoes.
+        """
+        return self.__echo_filter
+
+    @property
+    def repeat_filter(self) -> FingerprintCache:
+        """Cache of recently processed telegrams used to merge repeated copies relayed by repeaters (see ``link_stats``).
+
+        Adjust ``repeat_filter.ttl`` / ``repeat_filter.max_size`` to change the window (default 2 s, 64 telegrams); ``repeat_filter.stats.hits`` counts merged copies.
+        """
+        return self.__repeat_filter
 
     def connection_made(self) -> None:
         # Intentional no-op. EnOceanSerialProtocol3.connection_made() forwards here after
@@ -904,6 +1555,7 @@ class Gateway:
             sender=sender,
         )
         self.__devices[address] = device
+        self.__census.forget(address)
         self._logger.info(
             f"Added device with address {address}, EEP {eep} and sender {sender}"
         )
@@ -914,6 +1566,7 @@ class Gateway:
                 self._logger.warning(
                     f"EEP {eep} is not supported. Messages from device {address} will not be decoded."
                 )
+                self.__update_route(address)
                 return
             self.__eep_handlers[eep] = EEPHandler(EEP_SPECIFICATIONS[eep])
             self._logger.info(f"Loaded EEP handler for previously unused EEP {eep}")
@@ -941,17 +1594,48 @@ class Gateway:
             self._logger.debug(
                 f"EEP {eep} has no observers; Observation processing unavailable for device {address}."
             )
+            self.__update_route(address)
             return
 
         cb = self.__on_observation
         capabilities = [MetaDataObserver(device_address=address, on_observation=cb)]
         for factory in eep_spec.observers:
-            capabilities.append(factory(address, cb))
+            capability = factory(address, cb)
+            if isinstance(capability, ScalarObserver):
+                capability.report_policy = self.__report_policy
+                capability.device_config = device.config
+            capabilities.append(capability)
 
         device.capabilities = capabilities
         self._logger.debug(
             f"Initialized device {address} with {len(device.capabilities)} capabilities"
         )
+        self.__update_route(address)
+
+    def __update_route(self, address: EURID) -> None:
+        """(Re)build the receive route of a registered device after its registration, EEP or config changed."""
+        device = self.__devices[address]
+        spec = EEP_SPECIFICATIONS.get(device.eep)
+        fields: frozenset[str] | None = frozenset()
+        for capability in device.capabilities:
+            if capability.decoded_fields is None:
+                fields = None
+                break
+            fields |= capability.decoded_fields
+        self.__routes[int(address)] = _DeviceRoute(
+            device=device,
+            handler=self.__eep_handlers.get(device.eep),
+            config=device.config,
+            capabilities=tuple(device.capabilities),
+            eep_callbacks=tuple(
+                cb.callback
+                for cb in self.__eep_receive_callbacks
+                if cb.sender_filter is None or cb.sender_filter == address
+            ),
+            observe=bool(device.capabilities) and bool(self.__observation_callbacks),
+            fields=fields,
+            reuse_payloads=spec is not None and spec.reuse_unchanged_payloads,
+        )
 
     def set_device_config(self, address: EURID, entity_id: str, value: Any) -> None:
         """Update a single per-device config value (e.g. ``"min_brightness"``, ``"max_brightness"``).
@@ -978,6 +1662,8 @@ class Gateway:
                 f"Device {address}: sender_slot changed to {value!r} → sender={new_sender}"
             )
         device.config[entity_id] = value
+        self.__invalidate_encode_cache(address)
+        self.__update_route(address)
 
     def __resolve_sender_slot(self, value: str) -> SenderAddress | None:
         """Resolve a ``sender_slot`` string to a concrete sender address.
@@ -1044,6 +1730,8 @@ class Gateway:
     @property
     def gateway_entities(self) -> list[Entity]:
         """Entities exposed by the gateway device itself."""
+        if self.transmit_diagnostics:
+            return _GATEWAY_ENTITIES + _TRANSMIT_ENTITIES
         return _GATEWAY_ENTITIES
 
     def set_gateway_config(self, key: str, value: str) -> None:
@@ -1153,7 +1841,12 @@ class Gateway:
             for observer in self.__devices[address].capabilities:
                 observer.stop()
             del self.__devices[address]
-            self.__known_senders.discard(address)
+            self.__routes.pop(int(address), None)
+            self.__invalidate_encode_cache(address)
+            self.__transmit_by_device.pop(address, None)
+            self.__link_stats.pop(int(address), None)
+            self.__rate_limiter.forget(address)
+            self.__flood_reported.pop(int(address), None)
             self._logger.info(f"Removed device with address {address}")
         else:
             self._logger.warning(
@@ -1174,6 +1867,16 @@ class Gateway:
         if spec is None:
             return None
         extra_device = list(_METADATA_ENTITIES) + [_SENDER_SLOT_ENTITY]
+        if self.__rate_limiter.rate is not None:
+            extra_device += _FLOOD_ENTITIES
+        if self.__report_policy.enabled:
+            extra_device += self.__report_policy.config_entities(
+                {
+                    capability.observable
+                    for capability in device.capabilities
+                    if isinstance(capability, ScalarObserver)
+                }
+            )
         extra_gateway: list[Entity] = []
         if not spec.uses_addressed_sending and spec.learn_telegram_payload is None:
             extra_gateway = [_LEARNING_TOGGLE_ENTITY, _LEARNING_REMAINING_ENTITY]
@@ -1368,7 +2071,8 @@ class Gateway:
         """Process a received ESP3 packet. This includes emitting the raw packet to registered callbacks and further processing based on packet type."""
         self.__emit(self.__esp3_receive_callbacks, packet)
 
-        self._logger.debug(f"Received ESP3 packet: {packet}")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"Received ESP3 packet: {packet}")
 
         # handle packet based on type; currently we only process RESPONSE and RADIO_ERP1 packets, other types are ignored
         if packet.packet_type == ESP3PacketType.RESPONSE:
@@ -1432,98 +2136,114 @@ class Gateway:
             if cb.sender_filter is None or cb.sender_filter == sender:
                 loop.call_soon(cb.callback, obj)
 
-    def __is_sender_known(self, sender: SenderAddress) -> bool:
-        """Check if the sender address is known (i.e. if we have an EEP ID for it)."""
-        return sender in self.__devices or sender in self.__known_senders
-
     def __process_response(self, response: ResponseTelegram) -> None:
         """Process a received RESPONSE packet. If we are currently awaiting a response, try to parse it and store it for the send() method to retrieve."""
         self.__emit(self.__response_callbacks, response)
         self._logger.debug(f"Processing received RESPONSE packet: {response}")
 
+        # no frame is written while an attempt is abandoned: a response is that attempt's late response
+        attempt = self.__abandoned_attempt
+        if attempt is not None and not attempt.response.done():
+            duration_ms = (time.perf_counter() - attempt.start) * 1000
+            attempt.latency.add(duration_ms)
+            attempt.response.set_result((response, duration_ms))
+            self._logger.debug(
+                f"Late response to an abandoned send attempt after {duration_ms:.2f} ms."
+            )
+            return
+
         if self.__send_future and not self.__send_future.done():
             self.__send_future.set_result(response)
 
-    @staticmethod
-    def __erp1_fingerprint(erp1: ERP1Telegram) -> bytes:
-        """Compute the deduplication fingerprint for an ERP1 telegram (RORG + data + sender)."""
-        return bytes([erp1.rorg]) + erp1.telegram_data + bytes(erp1.sender.bytelist)
-
-    @staticmethod
-    def __cache_fingerprint(
-        cache: list[tuple[bytes, float]],
-        fingerprint: bytes,
-        ttl: float,
-        max_size: int,
-    ) -> None:
-        """Append a fingerprint to a ring-buffer cache, pruning expired and excess entries."""
+    def __report_flood(self, sender: int) -> None:
+        """Log and emit the flood diagnostics of a sender on state changes, and at most every ``_FLOOD_REPORT_INTERVAL`` seconds otherwise."""
+        state = self.__rate_limiter.state(sender)
+        previous = self.__flood_reported.get(sender)
         now = time.monotonic()
-        cutoff = now - ttl
-        cache[:] = [(fp, ts) for fp, ts in cache if ts > cutoff]
-        if len(cache) >= max_size:
-            cache.pop(0)
-        cache.append((fingerprint, now))
-
-    @staticmethod
-    def __fingerprint_in_cache(
-        cache: list[tuple[bytes, float]], fingerprint: bytes, ttl: float
-    ) -> bool:
-        """Return True if fingerprint is present in cache and not yet expired."""
-        cutoff = time.monotonic() - ttl
-        return any(fp == fingerprint and ts > cutoff for fp, ts in cache)
-
-    def __cache_sent_erp1(self, fingerprint: bytes) -> None:
-        """Add a sent ERP1 fingerprint to the echo-filter cache."""
-        self.__cache_fingerprint(
-            self.__sent_erp1_cache,
-            fingerprint,
-            self.__sent_erp1_cache_ttl,
-            self.__sent_erp1_cache_max,
-        )
+        if state is FloodState.OK:
+            self.__flood_reported.pop(sender, None)
+        elif (
+            previous is None
+            or previous[0] is not state
+            or now - previous[1] >= _FLOOD_REPORT_INTERVAL
+        ):
+            self.__flood_reported[sender] = (state, now)
+        else:
+            return
 
-    def __is_own_echo(self, erp1: ERP1Telegram) -> bool:
-        """Return True if this telegram is an echo of a packet we sent recently."""
-        return self.__fingerprint_in_cache(
-            self.__sent_erp1_cache,
-            self.__erp1_fingerprint(erp1),
-            self.__sent_erp1_cache_ttl,
-        )
+        if previous is None or previous[0] is not state:
+            self._logger.log(
+                logging.INFO if state is FloodState.OK else logging.WARNING,
+                f"Sender {sender_address(sender)} flood state changed to {state}.",
+            )
 
-    def __cache_received_erp1(self, erp1: ERP1Telegram) -> None:
-        """Cache an original received ERP1 telegram for repeat-filter tracking."""
-        self.__cache_fingerprint(
-            self.__received_erp1_cache,
-            self.__erp1_fingerprint(erp1),
-            self.__received_erp1_cache_ttl,
-            self.__received_erp1_cache_max,
+        route = self.__routes.get(sender)
+        stats = self.__rate_limiter.stats(sender)
+        if route is None or stats is None:
+            return
+        timestamp = time.time()
+        self.__on_observation(
+            Observation(
+                device=route.device.address,
+                entity="flood_state",
+                values={Observable.FLOOD_STATE: state.value},
+                timestamp=timestamp,
+                source=ObservationSource.GATEWAY,
+            )
         )
-
-    def __is_repeated_copy(self, erp1: ERP1Telegram) -> bool:
-        """Return True if this telegram is a repeated copy of one we already processed."""
-        return self.__fingerprint_in_cache(
-            self.__received_erp1_cache,
-            self.__erp1_fingerprint(erp1),
-            self.__received_erp1_cache_ttl,
+        self.__on_observation(
+            Observation(
+                device=route.device.address,
+                entity="telegrams_dropped",
+                values={Observable.TELEGRAMS_DROPPED: stats.dropped + stats.suppressed},
+                timestamp=timestamp,
+                source=ObservationSource.GATEWAY,
+            )
         )
 
     def __process_erp1_telegram(self, erp1: ERP1Telegram) -> None:
         """Process a received ERP1 telegram. This includes emitting it to registered callbacks and further processing based on RORG and learning bit."""
-        if self.__is_own_echo(erp1):
+        fingerprint = erp1.fingerprint
+        if fingerprint in self.__echo_filter:
             self._logger.debug(
                 f"Received own packet echoed back by repeater; dropping: {erp1}"
             )
             return
 
-        if erp1.repeater_count in (
-            RepeaterCount.Original,
-            RepeaterCount.ShallNotBeRepeated,
-        ):
-            self.__cache_received_erp1(erp1)
-        elif self.__is_repeated_copy(erp1):
-            self._logger.debug(
-                f"Received repeated copy of already-processed telegram; dropping: {erp1}"
-            )
-            return
+        repeater_count = erp1.repeater_count
+        hops = (
+            0
+            if repeater_count == RepeaterCount.ShallNotBeRepeated
+            else int(repeater_count)
+        )
+        if hops:
+            copies = self.__repeat_filter.get(fingerprint)
+            if copies is not None:
+                # repeated copy of an already-processed telegram: only update link statistics
+                if copies.link is not None:
+                    copies.link.record(hops, erp1.rssi, first=False)
+                self._logger.debug(
+                    f"Received repeated copy of already-processed telegram; dropping: {erp1}"
+                )
+                return
+
+        # first copy of a telegram (originals are always processed, even if identical to a recent one)
+        link = self.__link_stats.get(erp1.sender_int)
+        if link is None and erp1.sender_int in self.__routes:
+            link = self.__link_stats[erp1.sender_int] = LinkStats()
+        if link is not None:
+            link.record(hops, erp1.rssi, first=True)
+        self.__repeat_filter.add(fingerprint, _TelegramCopies(link))
+
+        if self.__rate_limiter.rate is not None:
+            sender = erp1.sender_int
+            allowed = self.__rate_limiter.allow(sender)
+            if not allowed or sender in self.__flood_reported:
+                self.__report_flood(sender)
+            if not allowed:
+                if self.__rate_limiter.state(sender) is FloodState.QUARANTINED:
+                    self.__observe_metadata(erp1)
+                return
 
         self.__erp1_received += 1
         self.__emit_gateway_observation(
@@ -1531,11 +2251,13 @@ class Gateway:
         )
         # emit the raw telegram
         self.__emit_with_sender_filter(self.__erp1_receive_callbacks, erp1.sender, erp1)
-        self._logger.debug(f"ESP3 packet successfully decoded to ERP1 telegram: {erp1}")
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                f"ESP3 packet successfully decoded to ERP1 telegram: {erp1}"
+            )
 
-        # check if sender is known; if not, track it and notify callbacks (EURIDs only)
-        if not self.__is_sender_known(erp1.sender):
-            self.__known_senders.add(erp1.sender)
+        # track unknown senders in the census; notify callbacks on first sight (EURIDs only)
+        if erp1.sender_int not in self.__routes and self.__census.record(erp1):
             if isinstance(erp1.sender, EURID):
                 self.__emit(self.__new_device_callbacks, erp1.sender)
                 self._logger.info(
@@ -1575,13 +2297,11 @@ class Gateway:
         # There are two options for determining the EEP ID of an incoming ERP1 telegram: either we look it up by the sender address, or by the destination address (if the destination is not a broadcast address).
         # We first check if we have a known device with the sender address, and if not, we check if we have a known device with the destination address.
         # If we cannot find a known device for either the sender or the destination, we cannot determine the EEP ID for this telegram, so we emit a parsing failed message and return.
-        # If we can find a known device for either the sender or the destination, we use that device's EEP ID for further processing.
-        eep_id: EEP
-        device_config: dict
-        sender_device = self.__devices.get(erp1.sender)
-        if sender_device is not None:
-            eep_id = sender_device.eep
-            device_config = sender_device.config
+        # If we can find a known device for either the sender or the destination, we use that device's route (EEP handler, config) for further processing.
+        sender_route = self.__routes.get(erp1.sender_int)
+        route: _DeviceRoute
+        if sender_route is not None:
+            route = sender_route
         else:
             if erp1.destination is None or erp1.destination.is_broadcast:
                 msg = (
@@ -1592,8 +2312,8 @@ class Gateway:
                 self.__emit(self.__parsing_failed_callbacks, msg)
                 return
 
-            destination_device = self.__devices.get(erp1.destination)
-            if destination_device is None:
+            destination_route = self.__routes.get(int(erp1.destination))
+            if destination_route is None:
                 msg = (
                     f"Failed to decode ERP1 telegram to EEP message: sender {erp1.sender} "
                     f"is unknown and destination {erp1.destination} is also unknown."
@@ -1606,22 +2326,30 @@ class Gateway:
                 f"Sender {erp1.sender} is unknown, but destination {erp1.destination} "
                 "is known, using EEP ID of destination for EEP decoding."
             )
-            eep_id = destination_device.eep
-            device_config = destination_device.config
+            route = destination_route
 
-        if eep_id not in self.__eep_handlers:
-            self._logger.debug(
-                f"Failed to decode ERP1 telegram to EEP message: No EEP handler for {eep_id}."
-            )
-            self.__emit(
-                self.__parsing_failed_callbacks,
-                f"Failed to decode ERP1 telegram to EEP message: No EEP handler for {eep_id}.",
-            )
+        if route.handler is None:
+            msg = f"Failed to decode ERP1 telegram to EEP message: No EEP handler for {route.device.eep}."
+            self._logger.debug(msg)
+            self.__emit(self.__parsing_failed_callbacks, msg)
             return
 
+        # decode only as far as somebody consumes the result: nothing if no callback
+        # or capability of a registered sender would see the message, only the
+        # fields its capabilities read if no EEP callback or confirmation needs all
+        fields = None
+        if sender_route is not None and not self.__pending_confirmations:
+            if not sender_route.eep_callbacks:
+                if not sender_route.observe:
+                    return
+                fields = sender_route.fields
+
         try:
-            eep_message = self.__eep_handlers[eep_id](erp1, device_config)
-            self.__process_eep_message(eep_message)
+            if sender_route is not None and sender_route.reuse_payloads:
+                eep_message = self.__decode_memoized(erp1, sender_route, fields)
+            else:
+                eep_message = route.handler(erp1, route.config, fields)
+            self.__process_eep_message(eep_message, sender_route)
         except Exception as e:
             self._logger.debug(f"Failed to decode ERP1 telegram to EEP message: {e}")
             self.__emit(
@@ -1630,18 +2358,58 @@ class Gateway:
             )
             return
 
-    def __process_eep_message(self, eep_message: EEPMessage) -> None:
-        """Emit callbacks for a decoded EEP message."""
-        self.__emit_with_sender_filter(
-            self.__eep_receive_callbacks, eep_message.sender, eep_message
-        )
-        self._logger.debug(
-            f"ERP1 telegram successfully decoded to EEP message: {eep_message}"
-        )
-        self.__process_capability_message(eep_message)
+    @staticmethod
+    def __decode_memoized(
+        erp1: ERP1Telegram, route: _DeviceRoute, fields: frozenset[str] | None
+    ) -> EEPMessage:
+        """Decode a telegram of a registered device, reusing the previous decode result if the telegram data is unchanged."""
+        data = erp1.telegram_data
+        last = route.last_message
+        if (
+            last is not None
+            and data == route.last_payload
+            and (route.last_fields is None or route.last_fields == fields)
+        ):
+            return route.handler.reuse(last, erp1)
 
-    def __process_capability_message(self, eep_message: EEPMessage) -> None:
-        """Decode EEP message using device capabilities."""
+        eep_message = route.handler(erp1, route.config, fields)
+        route.last_payload = data
+        route.last_fields = fields
+        route.last_message = eep_message
+        return eep_message
+
+    def __process_eep_message(
+        self, eep_message: EEPMessage, route: _DeviceRoute | None
+    ) -> None:
+        """Emit callbacks for a decoded EEP message. ``route`` is the route of the sending device, if registered."""
+        if self.__pending_confirmations:
+            self.__resolve_confirmations(eep_message)
+        if route is not None:
+            self.__emit(route.eep_callbacks, eep_message)
+        else:
+            self.__emit_with_sender_filter(
+                self.__eep_receive_callbacks, eep_message.sender, eep_message
+            )
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                f"ERP1 telegram successfully decoded to EEP message: {eep_message}"
+            )
+        self.__process_capability_message(eep_message, route)
+
+    def __observe_metadata(self, erp1: ERP1Telegram) -> None:
+        """Feed a telegram that is not decoded (quarantined sender) to the metadata observer of its device, so RSSI, last seen and telegram count stay current."""
+        route = self.__routes.get(erp1.sender_int)
+        if route is None or not route.observe:
+            return
+        message = EEPMessage(sender=erp1.sender, eep=route.device.eep, rssi=erp1.rssi)
+        for capability in route.capabilities:
+            if isinstance(capability, MetaDataObserver):
+                capability.decode(message)
+
+    def __process_capability_message(
+        self, eep_message: EEPMessage, route: _DeviceRoute | None
+    ) -> None:
+        """Decode EEP message using the capabilities of the sending device."""
         if eep_message.sender is None:
             self.__emit(
                 self.__parsing_failed_callbacks,
@@ -1649,15 +2417,17 @@ class Gateway:
             )
             return
 
-        device = self.__devices.get(eep_message.sender)
-        if device is None:
+        if route is None:
             self.__emit(
                 self.__parsing_failed_callbacks,
                 "Failed to decode capability: no device.",
             )
             return
 
-        for capability in device.capabilities:
+        if not route.observe:
+            return
+
+        for capability in route.capabilities:
             try:
                 capability.decode(eep_message)
             except Exception as e:
@@ -1992,6 +2762,7 @@ class Gateway:
                 self._logger.info(
                     f"Loaded EEP handler for previously unused EEP {eep} due to re-teach-in."
                 )
+            self.__update_route(existing.address)
             self._logger.info(
                 f"4BS re-teach-in from {erp1.sender}: updated EEP of existing device registration to {eep}."
             )
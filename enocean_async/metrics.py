@@ -0,0 +1,286 @@
+"""Rolling statistics for the gateway's send and receive paths."""
+
+from collections import deque
+from dataclasses import dataclass, field
+import math
+
+from .address import EURID, SenderAddress
+from .protocol.esp3.response import ResponseCode
+
+LATENCY_BUCKETS_MS: tuple[float, ...] = (5, 10, 20, 50, 100, 200, 500)
+"""Upper bounds (inclusive) of the send latency histogram buckets; a final bucket counts everything above."""
+
+# ERP1 radio: 125 kbit/s, each sub-telegram is preceded by an 8 bit preamble/sync and followed by a hash byte
+_ERP1_BITRATE: int = 125_000
+_ERP1_SUBTELEGRAM_OVERHEAD_BYTES: int = 2
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters of a bounded cache."""
+
+    hits: int
+    misses: int
+    size: int
+    """Number of entries currently held."""
+    max_size: int
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Fraction of lookups that were hits, or ``None`` before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+@dataclass(frozen=True)
+class LatencySnapshot:
+    """Point-in-time summary of a :class:`LatencyWindow`. All durations are in milliseconds.
+
+    Percentiles are ``None`` while the window holds no samples.
+    """
+
+    count: int
+    """Number of samples currently held in the window."""
+
+    timeouts: int
+    """Total number of timeouts recorded since the window was created (not windowed)."""
+
+    min_ms: float | None
+    mean_ms: float | None
+    p50_ms: float | None
+    p90_ms: float | None
+    p99_ms: float | None
+    max_ms: float | None
+
+
+class LatencyWindow:
+    """Rolling window of the most recent latency samples (in milliseconds).
+
+    Only completed round trips are recorded as samples; timeouts are counted
+    separately so that they do not distort the distribution.
+    """
+
+    def __init__(self, size: int = 256) -> None:
+        self.__samples: deque[float] = deque(maxlen=size)
+        self.__sorted: list[float] | None = None
+        self.__timeouts: int = 0
+
+    def __len__(self) -> int:
+        return len(self.__samples)
+
+    @property
+    def timeouts(self) -> int:
+        """Total number of timeouts recorded."""
+        return self.__timeouts
+
+    def add(self, duration_ms: float) -> None:
+        """Record a completed round trip."""
+        self.__samples.append(duration_ms)
+        self.__sorted = None
+
+    def add_timeout(self) -> None:
+        """Record a round trip that did not complete in time."""
+        self.__timeouts += 1
+
+    def percentile(self, q: float) -> float | None:
+        """Return the ``q``-th percentile (0–100, nearest-rank) or ``None`` if there are no samples."""
+        if not self.__samples:
+            return None
+        if self.__sorted is None:
+            self.__sorted = sorted(self.__samples)
+        rank = max(1, math.ceil(q / 100 * len(self.__sorted)))
+        return self.__sorted[rank - 1]
+
+    def snapshot(self) -> LatencySnapshot:
+        """Return an immutable summary of the current window."""
+        if not self.__samples:
+            return LatencySnapshot(
+                0, self.__timeouts, None, None, None, None, None, None
+            )
+        return LatencySnapshot(
+            count=len(self.__samples),
+            timeouts=self.__timeouts,
+            min_ms=self.percentile(0),
+            mean_ms=sum(self.__samples) / len(self.__samples),
+            p50_ms=self.percentile(50),
+            p90_ms=self.percentile(90),
+            p99_ms=self.percentile(99),
+            max_ms=self.percentile(100),
+        )
+
+
+@dataclass
+class TransmitStats:
+    """Counters and histograms of the send path for one device, one sender address, or the gateway as a whole."""
+
+    sent: int = 0
+    """Number of packets sent (a packet that needed retries counts once)."""
+
+    attempts: int = 0
+    """Number of writes to the module including retries."""
+
+    timeouts: int = 0
+    """Number of packets for which the module did not respond in time (after all retries)."""
+
+    response_codes: dict[ResponseCode, int] = field(default_factory=dict)
+    """Number of final responses per ResponseCode."""
+
+    latency_buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+    """Histogram of response latencies, see ``LATENCY_BUCKETS_MS``."""
+
+    latency_total_ms: float = 0.0
+    latency_max_ms: float = 0.0
+
+    queue_wait_total_ms: float = 0.0
+    """Total time packets waited for the send lock (i.e. behind other packets)."""
+
+    queue_wait_max_ms: float = 0.0
+
+    airtime_bytes: int = 0
+    """Estimated number of bytes put on air, including sub-telegram repetitions and framing."""
+
+    @property
+    def answered(self) -> int:
+        """Number of packets the module responded to."""
+        return sum(self.response_codes.values())
+
+    @property
+    def mean_latency_ms(self) -> float | None:
+        return self.latency_total_ms / self.answered if self.answered else None
+
+    @property
+    def mean_queue_wait_ms(self) -> float | None:
+        return self.queue_wait_total_ms / self.sent if self.sent else None
+
+    @property
+    def airtime_s(self) -> float:
+        """Estimated airtime in seconds at the ERP1 bit rate of 125 kbit/s."""
+        return self.airtime_bytes * 8 / _ERP1_BITRATE
+
+    def record(
+        self,
+        response_code: ResponseCode | None,
+        duration_ms: float | None,
+        attempts: int,
+        queue_wait_ms: float,
+        airtime_bytes: int,
+    ) -> None:
+        """Record the outcome of one sent packet."""
+        self.sent += 1
+        self.attempts += attempts
+        self.queue_wait_total_ms += queue_wait_ms
+        self.queue_wait_max_ms = max(self.queue_wait_max_ms, queue_wait_ms)
+        self.airtime_bytes += airtime_bytes
+        if response_code is None or duration_ms is None:
+            self.timeouts += 1
+            return
+        self.response_codes[response_code] = (
+            self.response_codes.get(response_code, 0) + 1
+        )
+        self.latency_total_ms += duration_ms
+        self.latency_max_ms = max(self.latency_max_ms, duration_ms)
+        for i, bound in enumerate(LATENCY_BUCKETS_MS):
+            if duration_ms <= bound:
+                self.latency_buckets[i] += 1
+                break
+        else:
+            self.latency_buckets[-1] += 1
+
+    def copy(self) -> "TransmitStats":
+        """Return an independent copy."""
+        return TransmitStats(
+            sent=self.sent,
+            attempts=self.attempts,
+            timeouts=self.timeouts,
+            response_codes=dict(self.response_codes),
+            latency_buckets=list(self.latency_buckets),
+            latency_total_ms=self.latency_total_ms,
+            latency_max_ms=self.latency_max_ms,
+            queue_wait_total_ms=self.queue_wait_total_ms,
+            queue_wait_max_ms=self.queue_wait_max_ms,
+            airtime_bytes=self.airtime_bytes,
+        )
+
+
+@dataclass
+class LinkStats:
+    """Reception statistics of one device, including the copies of its telegrams relayed by repeaters.
+
+    Hop counts are taken from the telegram's repeater count (0 = received directly).
+    RSSI values are as reported by the module, i.e. -dBm: lower values are stronger signals.
+    """
+
+    telegrams: int = 0
+    """Number of distinct telegrams received (copies of a telegram are counted once)."""
+
+    receptions_by_hops: dict[int, int] = field(default_factory=dict)
+    """Number of received copies per hop count, including the first."""
+
+    first_by_hops: dict[int, int] = field(default_factory=dict)
+    """Number of telegrams per hop count of the copy that arrived first, i.e. which path delivered."""
+
+    rssi_total_by_hops: dict[int, int] = field(default_factory=dict)
+    rssi_samples_by_hops: dict[int, int] = field(default_factory=dict)
+
+    best_rssi: int | None = None
+    """Best RSSI over all copies of the most recent telegram."""
+
+    last_hops: int | None = None
+    """Hop count of the copy that delivered the most recent telegram first."""
+
+    @property
+    def duplicates(self) -> int:
+        """Number of copies received in addition to the first one."""
+        return sum(self.receptions_by_hops.values()) - self.telegrams
+
+    def mean_rssi(self, hops: int) -> float | None:
+        """Mean RSSI of the copies received over ``hops`` hops, or None if there are none."""
+        samples = self.rssi_samples_by_hops.get(hops, 0)
+        return self.rssi_total_by_hops[hops] / samples if samples else None
+
+    def record(self, hops: int, rssi: int | None, first: bool) -> None:
+        """Record a received copy of a telegram; ``first`` is True for the copy that is processed."""
+        self.receptions_by_hops[hops] = self.receptions_by_hops.get(hops, 0) + 1
+        if first:
+            self.telegrams += 1
+            self.first_by_hops[hops] = self.first_by_hops.get(hops, 0) + 1
+            self.last_hops = hops
+            self.best_rssi = rssi
+        if rssi is not None:
+            self.rssi_total_by_hops[hops] = self.rssi_total_by_hops.get(hops, 0) + rssi
+            self.rssi_samples_by_hops[hops] = self.rssi_samples_by_hops.get(hops, 0) + 1
+            if not first and (self.best_rssi is None or rssi < self.best_rssi):
+                self.best_rssi = rssi
+
+    def copy(self) -> "LinkStats":
+        """Return an independent copy."""
+        return LinkStats(
+            telegrams=self.telegrams,
+            receptions_by_hops=dict(self.receptions_by_hops),
+            first_by_hops=dict(self.first_by_hops),
+            rssi_total_by_hops=dict(self.rssi_total_by_hops),
+            rssi_samples_by_hops=dict(self.rssi_samples_by_hops),
+            best_rssi=self.best_rssi,
+            last_hops=self.last_hops,
+        )
+
+
+def erp1_airtime_bytes(data_length: int, sub_telegrams: int = 3) -> int:
+    """Estimate the bytes on air for an ERP1 telegram with ``data_length`` bytes of ESP3 data (RORG to status)."""
+    return (data_length + _ERP1_SUBTELEGRAM_OVERHEAD_BYTES) * max(1, sub_telegrams)
+
+
+@dataclass(frozen=True)
+class TransmitMetrics:
+    """Snapshot of the gateway's transmit metrics."""
+
+    total: TransmitStats
+    """All packets sent to the module (any packet type)."""
+
+    by_device: dict[EURID, TransmitStats]
+    """RADIO_ERP1 packets per registered destination device."""
+
+    by_sender: dict[SenderAddress, TransmitStats]
+    """RADIO_ERP1 packets per sender address (gateway EURID or BaseID+n)."""
@@ -0,0 +1,241 @@
+"""Fleet polling of actuator status and measurement queries."""
+
+import asyncio
+from dataclasses import dataclass
+import heapq
+import itertools
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+from .address import EURID
+from .eep.message import EEPMessage
+from .protocol.esp3.response import ResponseCode
+from .semantics.instructable import Instructable
+from .semantics.instruction import Instruction
+
+if TYPE_CHECKING:
+    from .gateway import Gateway
+
+_logger = logging.getLogger(__name__)
+
+# telegrams arriving within this time after a poll are treated as its reply, not as spontaneous reports
+_REPLY_WINDOW: float = 2.0
+
+
+@dataclass
+class PollJob:
+    """A query instruction that is sent to a device periodically."""
+
+    device: EURID
+    instruction: Instruction
+    interval: float
+    """Nominal polling interval in seconds."""
+
+    jitter: float = 0.1
+    """Random deviation of each interval, as a fraction of ``interval`` (0.1 = ±10%)."""
+
+    backoff: int = 0
+    """Number of consecutive failed polls; the interval is doubled per failure (bounded)."""
+
+    polls: int = 0
+    """Number of queries sent."""
+
+    skipped: int = 0
+    """Number of polls skipped because the device had reported recently."""
+
+
+class PollScheduler:
+    """Periodically sends query instructions (e.g. ``QueryActuatorStatus``) to many devices.
+
+    Due polls are kept in a heap, so the scheduler sleeps until the next poll is due
+    regardless of the number of jobs. Polling load is spread out by
+
+    - a random initial phase and a per-job jitter on every interval,
+    - skipping polls while the device's state is fresh: a telegram the device
+      sent spontaneously (not as reply to a poll) postpones its next poll by a
+      full interval,
+    - a global rate cap (``max_rate`` polls per second), and
+    - sending polls at low priority, i.e. only when no regular send is queued.
+
+    Failed polls (no or error response from the module) back off exponentially
+    up to ``2**max_backoff`` times the interval.
+    """
+
+    def __init__(
+        self, gateway: "Gateway", *, max_rate: float = 2.0, max_backoff: int = 4
+    ) -> None:
+        """Create a scheduler that polls through ``gateway``.
+
+        Args:
+            gateway: The gateway used to send queries; devices must be registered there.
+            max_rate: Maximum number of polls per second across all jobs.
+            max_backoff: Maximum exponent of the failure back-off.
+        """
+        self.__gateway = gateway
+        self.max_rate: float = max_rate
+        self.max_backoff: int = max_backoff
+
+        self.__jobs: dict[tuple[int, Instructable, str], PollJob] = {}
+        self.__generation: dict[tuple[int, Instructable, str], int] = {}
+        self.__heap: list[tuple[float, int, tuple[int, Instructable, str]]] = []
+        self.__counter = itertools.count()
+        self.__next_slot: float = 0.0
+        self.__wakeup: asyncio.Event = asyncio.Event()
+        self.__task: asyncio.Task | None = None
+        # monotonic time of the last spontaneous telegram / the last poll, per polled device
+        self.__last_report: dict[int, float] = {}
+        self.__last_poll: dict[int, float] = {}
+
+        gateway.add_eep_message_received_callback(self.__on_eep_message)
+
+    @staticmethod
+    def __key(device: EURID, instruction: Instruction) -> tuple[int, Instructable, str]:
+        return (int(device), instruction.action, instruction.entity_id)
+
+    @property
+    def jobs(self) -> list[PollJob]:
+        """All registered poll jobs."""
+        return list(self.__jobs.values())
+
+    @property
+    def is_running(self) -> bool:
+        """True while the scheduler task is running."""
+        return self.__task is not None and not self.__task.done()
+
+    def add(
+        self,
+        device: EURID,
+        instruction: Instruction,
+        interval: float,
+        *,
+        jitter: float = 0.1,
+    ) -> PollJob:
+        """Poll ``device`` with ``instruction`` every ``interval`` seconds.
+
+        Re-adding the same instruction (same action and entity_id) for a device replaces the previous job.
+        The first poll happens at a random time within the first interval.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        key = self.__key(device, instruction)
+        job = PollJob(
+            device=device,
+            instruction=instruction,
+            interval=interval,
+            jitter=jitter,
+        )
+        self.__jobs[key] = job
+        self.__last_report.setdefault(key[0], 0.0)
+        self.__schedule(key, time.monotonic() + random.uniform(0, interval))
+        return job
+
+    def remove(self, device: EURID, instruction: Instruction | None = None) -> None:
+        """Stop polling ``device`` with ``instruction``, or entirely if ``instruction`` is None."""
+        if instruction is not None:
+            keys = [self.__key(device, instruction)]
+        else:
+            keys = [k for k in self.__jobs if k[0] == int(device)]
+        for key in keys:
+            self.__jobs.pop(key, None)
+            self.__generation.pop(key, None)
+        if not any(k[0] == int(device) for k in self.__jobs):
+            self.__last_report.pop(int(device), None)
+            self.__last_poll.pop(int(device), None)
+
+    def start(self) -> None:
+        """Start the scheduler task (no-op if already running)."""
+        if not self.is_running:
+            self.__task = asyncio.create_task(self.__run())
+
+    async def stop(self) -> None:
+        """Stop the scheduler task and wait for it to finish."""
+        if self.__task is None:
+            return
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+    def __schedule(self, key: tuple[int, Instructable, str], due: float) -> None:
+        """(Re)schedule a job; older heap entries of the job become stale."""
+        seq = next(self.__counter)
+        self.__generation[key] = seq
+        heapq.heappush(self.__heap, (due, seq, key))
+        self.__wakeup.set()
+
+    def __jittered(self, job: PollJob) -> float:
+        interval = job.interval * 2 ** min(job.backoff, self.max_backoff)
+        return interval * (1 + random.uniform(-job.jitter, job.jitter))
+
+    def __on_eep_message(self, message: EEPMessage) -> None:
+        """Record the time of spontaneous telegrams received from polled devices."""
+        if message.sender is None:
+            return
+        sender = int(message.sender)
+        if sender in self.__last_report:
+            now = time.monotonic()
+            if now - self.__last_poll.get(sender, 0.0) > _REPLY_WINDOW:
+                self.__last_report[sender] = now
+
+    async def __run(self) -> None:
+        while True:
+            if not self.__heap:
+                self.__wakeup.clear()
+                await self.__wakeup.wait()
+                continue
+
+            due, seq, key = self.__heap[0]
+            now = time.monotonic()
+            if due > now:
+                self.__wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.__wakeup.wait(), due - now)
+                except TimeoutError:
+                    pass
+                continue
+
+            heapq.heappop(self.__heap)
+            job = self.__jobs.get(key)
+            if job is None or self.__generation.get(key) != seq:
+                continue  # removed or rescheduled
+
+            # fresh state: the device reported within the last interval
+            last_report = self.__last_report.get(key[0], 0.0)
+            if last_report and now - last_report < job.interval:
+                job.skipped += 1
+                self.__schedule(
+                    key,
+                    last_report + job.interval * (1 + random.uniform(0, job.jitter)),
+                )
+                continue
+
+            # global rate cap
+            if self.max_rate > 0:
+                if self.__next_slot > now:
+                    await asyncio.sleep(self.__next_slot - now)
+                self.__next_slot = max(now, self.__next_slot) + 1 / self.max_rate
+
+            await self.__poll(key, job)
+
+    async def __poll(self, key: tuple[int, Instructable, str], job: PollJob) -> None:
+        job.polls += 1
+        self.__last_poll[key[0]] = time.monotonic()
+        try:
+            result = await self.__gateway.send_command(
+                job.device, job.instruction, low_priority=True
+            )
+            ok = (
+                result.response is not None
+                and result.response.return_code == ResponseCode.OK
+            )
+        except ValueError as e:
+            _logger.warning(f"Polling {job.device} failed: {e}")
+            ok = False
+
+        job.backoff = 0 if ok else job.backoff + 1
+        if self.__jobs.get(key) is job:
+            self.__schedule(key, time.monotonic() + self.__jittered(job))
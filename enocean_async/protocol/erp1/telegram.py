@@ -1,7 +1,6 @@
-from dataclasses import dataclass
 from enum import IntEnum
 
-from ...address import EURID, Address, BaseAddress, BroadcastAddress
+from ...address import BROADCAST, EURID, BaseAddress, BroadcastAddress, sender_address
 from ..esp3.packet import ESP3Packet, ESP3PacketType
 from .errors import ERP1ParseError
 from .rorg import RORG
@@ -31,17 +30,190 @@ class RepeaterCount(IntEnum):
     ShallNotBeRepeated = 0xF
 
 
-@dataclass
+# Valid telegram data lengths (RORG byte, sender and status excluded) per RORG; RORGs not listed are not checked.
+_DATA_LENGTH: dict[RORG, tuple[int, int]] = {
+    RORG.RORG_RPS: (1, 1),
+    RORG.RORG_1BS: (1, 1),
+    RORG.RORG_4BS: (4, 4),
+    RORG.RORG_VLD: (1, 14),
+    RORG.RORG_MSC: (1, 14),
+    RORG.RORG_UTE: (7, 7),
+}
+
+_RORG_BY_VALUE: dict[int, RORG] = {r.value: r for r in RORG}
+
+_UNPARSED = object()
+"""Sentinel for lazily parsed attributes of telegrams created by ``ERP1Telegram.from_esp3``."""
+
+
 class ERP1Telegram:
-    rorg: RORG
-    telegram_data: bytes
-    sender: EURID | BaseAddress
-    status: int = 0x00
+    """An ERP1 radio telegram.
+
+    Telegrams created by :meth:`from_esp3` keep the raw ESP3 data and parse the
+    sender, destination, RSSI and security level on first access, so telegrams
+    that are discarded after a look at the sender (e.g. from unknown devices)
+    do not pay for the rest. Assigning ``rorg``, ``telegram_data``, ``sender`` or
+    ``status`` detaches a received telegram from its raw ESP3 data, so that
+    ``fingerprint`` always describes the current frame.
+    """
+
+    __slots__ = (
+        "_rorg",
+        "_telegram_data",
+        "_status",
+        "sub_tel_num",
+        "_sender",
+        "_destination",
+        "_rssi",
+        "_sec_level",
+        "_data",
+        "_optional",
+    )
+
+    def __init__(
+        self,
+        rorg: RORG,
+        telegram_data: bytes,
+        sender: EURID | BaseAddress,
+        status: int = 0x00,
+        sub_tel_num: int | None = 0x03,
+        rssi: int | None = 0xFF,
+        sec_level: int | None = None,
+        destination: EURID | BroadcastAddress | None = None,
+    ) -> None:
+        self._rorg: RORG = rorg
+        self._telegram_data: bytes = telegram_data
+        self._status: int = status
+        self.sub_tel_num: int | None = sub_tel_num
+        self._sender = sender
+        self._destination = destination
+        self._rssi = rssi
+        self._sec_level = sec_level
+        self._data: bytes = b""
+        self._optional: bytes = b""
+
+    def _detach(self) -> None:
+        """Drop the raw ESP3 data of a received telegram before its frame is modified (parsing the sender first)."""
+        if self._data:
+            self._sender = self.sender
+            self._data = b""
+
+    @property
+    def rorg(self) -> RORG:
+        return self._rorg
+
+    @rorg.setter
+    def rorg(self, value: RORG) -> None:
+        self._detach()
+        self._rorg = value
+
+    @property
+    def telegram_data(self) -> bytes:
+        return self._telegram_data
 
-    sub_tel_num: int | None = 0x03
-    rssi: int | None = 0xFF
-    sec_level: int | None = None
-    destination: EURID | BroadcastAddress | None = None
+    @telegram_data.setter
+    def telegram_data(self, value: bytes) -> None:
+        self._detach()
+        self._telegram_data = value
+
+    @property
+    def status(self) -> int:
+        return self._status
+
+    @status.setter
+    def status(self, value: int) -> None:
+        self._detach()
+        self._status = value
+
+    @property
+    def sender(self) -> EURID | BaseAddress:
+        if self._sender is _UNPARSED:
+            self._sender = sender_address(int.from_bytes(self._data[-5:-1], "big"))
+        return self._sender
+
+    @sender.setter
+    def sender(self, value: EURID | BaseAddress) -> None:
+        self._sender = value
+        self._data = b""
+
+    @property
+    def sender_int(self) -> int:
+        """The sender address as 32-bit integer (without constructing an address object for received telegrams)."""
+        if self._sender is _UNPARSED:
+            return int.from_bytes(self._data[-5:-1], "big")
+        return int(self._sender)
+
+    @property
+    def fingerprint(self) -> bytes:
+        """RORG, telegram data and sender as bytes, i.e. the ESP3 data without the status byte; identifies repeated copies of a telegram.
+
+        For received telegrams this is a slice of the raw ESP3 data, which is dropped once the frame is modified.
+        """
+        if self._data:
+            return self._data[:-1]
+        return bytes([self.rorg]) + self.telegram_data + bytes(self.sender.bytelist)
+
+    @property
+    def destination(self) -> EURID | BroadcastAddress | None:
+        if self._destination is _UNPARSED:
+            destination = None
+            if len(self._optional) > 4:
+                value = int.from_bytes(self._optional[1:5], "big")
+                if value == 0xFFFFFFFF:
+                    destination = BROADCAST
+                elif value <= 0xFF7FFFFF:
+                    destination = sender_address(value)
+            self._destination = destination
+        return self._destination
+
+    @destination.setter
+    def destination(self, value: EURID | BroadcastAddress | None) -> None:
+        self._destination = value
+
+    @property
+    def rssi(self) -> int | None:
+        if self._rssi is _UNPARSED:
+            self._rssi = self._optional[5] if len(self._optional) > 5 else None
+        return self._rssi
+
+    @rssi.setter
+    def rssi(self, value: int | None) -> None:
+        self._rssi = value
+
+    @property
+    def sec_level(self) -> int | None:
+        if self._sec_level is _UNPARSED:
+            self._sec_level = self._optional[6] if len(self._optional) > 6 else None
+        return self._sec_level
+
+    @sec_level.setter
+    def sec_level(self, value: int | None) -> None:
+        self._sec_level = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ERP1Telegram):
+            return NotImplemented
+        return (
+            self.rorg,
+            self.telegram_data,
+            self.sender,
+            self.status,
+            self.sub_tel_num,
+            self.rssi,
+            self.sec_level,
+            self.destination,
+        ) == (
+            other.rorg,
+            other.telegram_data,
+            other.sender,
+            other.status,
+            other.sub_tel_num,
+            other.rssi,
+            other.sec_level,
+            other.destination,
+        )
+
+    __hash__ = None  # mutable, like the dataclass it replaces
 
     def data_byte(self, index: int) -> int:
         """Get the byte in the telegram data at the given index, counting from the end of the telegram data (as in the EEP specification).
@@ -98,7 +270,7 @@ class ERP1Telegram:
         # clear the bits at the desired position and set them to the new value
         data_bits = (data_bits & ~mask) | ((value << shift) & mask)
 
-        # convert back to bytes and update telegram_data
+        # convert back to bytes and update telegram_data (which drops the raw ESP3 data that no longer matches)
         self.telegram_data = data_bits.to_bytes(len(self.telegram_data), "big")
 
     def bitstring_scaled_value(
@@ -166,111 +338,48 @@ class ERP1Telegram:
             raise ERP1ParseError("Not an ERP1 telegram")
 
         data = pkt.data
-        opt = pkt.optional
 
         # ERP1 telegrams must have at least 6 bytes of data (RORG + payload + sender + status)
         if len(data) < 6:
             raise ERP1ParseError(f"ERP1 telegram too short: {len(data)} bytes")
 
         # determine RORG
-        rorg: RORG | None = None
-        try:
-            rorg = RORG(data[0])
-        except ValueError:
+        rorg = _RORG_BY_VALUE.get(data[0])
+        if rorg is None:
             raise ERP1ParseError(f"Unknown RORG: 0x{data[0]:02X}")
 
-        # determine telegram data
+        # determine telegram data and check its length against the RORG
         telegram_data = data[1:-5]
-
-        # match RORG and telegram data length
-        match rorg:
-            case RORG.RORG_RPS:
-                if len(telegram_data) != 1:
-                    raise ERP1ParseError(
-                        f"RPS telegram data must be 1 byte, got {len(telegram_data)} bytes"
-                    )
-
-            case RORG.RORG_1BS:
-                if len(telegram_data) != 1:
-                    raise ERP1ParseError(
-                        f"1BS telegram data must be 1 byte, got {len(telegram_data)} bytes"
-                    )
-
-            case RORG.RORG_4BS:
-                if len(telegram_data) != 4:
-                    raise ERP1ParseError(
-                        f"4BS telegram data must be 4 bytes, got {len(telegram_data)} bytes"
-                    )
-
-            case RORG.RORG_VLD:
-                if len(telegram_data) < 1:
-                    raise ERP1ParseError(
-                        f"VLD telegram data must be at least 1 byte, got {len(telegram_data)} bytes"
-                    )
-                if len(telegram_data) > 14:
-                    raise ERP1ParseError(
-                        f"VLD telegram data must be at most 14 bytes, got {len(telegram_data)} bytes"
-                    )
-
-            case RORG.RORG_MSC:
-                if len(telegram_data) < 1:
-                    raise ERP1ParseError(
-                        f"MSC telegram data must be at least 1 byte, got {len(telegram_data)} bytes"
-                    )
-                if len(telegram_data) > 14:
-                    raise ERP1ParseError(
-                        f"MSC telegram data must be at most 14 bytes, got {len(telegram_data)} bytes"
-                    )
-
-            case RORG.RORG_UTE:
-                if len(telegram_data) != 7:
-                    raise ERP1ParseError(
-                        f"UTE telegram data must be exactly 7 bytes, got {len(telegram_data)} bytes"
-                    )
-
-        # determine sender address
-        try:
-            s = Address(data[-5:-1])
-        except ValueError:
+        limits = _DATA_LENGTH.get(rorg)
+        if limits is not None and not (limits[0] <= len(telegram_data) <= limits[1]):
+            low, high = limits
+            expected = (
+                f"{low} byte{'s' if low > 1 else ''}"
+                if low == high
+                else f"between {low} and {high} bytes"
+            )
             raise ERP1ParseError(
-                f"Invalid sender address in ERP1 telegram: {data[-5:-1].hex().upper()}"
+                f"{rorg.simple_name} telegram data must be {expected}, got {len(telegram_data)} bytes"
             )
 
-        # determine if sender is EURID or Base ID
-        if s.is_eurid:
-            sender = EURID(int(s))
-        elif s.is_base_address:
-            sender = BaseAddress(int(s))
-        else:
-            raise ERP1ParseError(f"Invalid sender address: {s}")
-
-        status = data[-1]
-
-        # parse optional
-        sub_tel_num = opt[0] if opt else None
-
-        destination_bytes = opt[1:5] if len(opt) > 4 else None
-        d = Address(destination_bytes) if destination_bytes else None
-
-        destination = None
-        if d is not None and d.is_broadcast:
-            destination = BroadcastAddress()
-        elif d is not None and d.is_eurid():
-            destination = EURID(int(d))
-
-        rssi = opt[5] if len(opt) > 5 else None
-        sec_level = opt[6] if len(opt) > 6 else None
-
-        return cls(
-            rorg=rorg,
-            telegram_data=telegram_data,
-            sender=sender,
-            status=status,
-            sub_tel_num=sub_tel_num,
-            rssi=rssi,
-            sec_level=sec_level,
-            destination=destination,
-        )
+        # the sender must be a EURID or a base address, i.e. anything but the broadcast address
+        if data[-5:-1] == b"\xff\xff\xff\xff":
+            raise ERP1ParseError("Invalid sender address: FF:FF:FF:FF")
+
+        # sender, destination, RSSI and security level are parsed on first access
+        opt = pkt.optional
+        telegram = cls.__new__(cls)
+        telegram._rorg = rorg
+        telegram._telegram_data = telegram_data
+        telegram._status = data[-1]
+        telegram.sub_tel_num = opt[0] if opt else None
+        telegram._sender = _UNPARSED
+        telegram._destination = _UNPARSED
+        telegram._rssi = _UNPARSED
+        telegram._sec_level = _UNPARSED
+        telegram._data = data
+        telegram._optional = opt
+        return telegram
 
     def to_esp3(self) -> ESP3Packet:
         data = (
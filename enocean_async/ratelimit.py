@@ -0,0 +1,163 @@
+"""Per-sender rate limiting of received telegrams (flood protection)."""
+
+from dataclasses import dataclass
+from enum import StrEnum
+import time
+
+from .address import Address
+
+
+class FloodState(StrEnum):
+    """Rate limiting state of a sender."""
+
+    OK = "ok"
+    """Within its rate limit."""
+
+    LIMITED = "limited"
+    """Telegrams above the rate limit are dropped; ends once the sender has been quiet long enough to refill its bucket."""
+
+    QUARANTINED = "quarantined"
+    """All telegrams are dropped (only counted; the gateway still updates the device's RSSI, last seen and telegram count) until the sender has been quiet long enough to refill its bucket."""
+
+
+@dataclass
+class FloodStats:
+    """Rate limiting counters of one sender."""
+
+    passed: int = 0
+    """Telegrams within the rate limit."""
+
+    dropped: int = 0
+    """Telegrams dropped because the sender exceeded its rate limit."""
+
+    suppressed: int = 0
+    """Telegrams dropped while the sender was quarantined."""
+
+    quarantines: int = 0
+    """Number of times the sender was quarantined."""
+
+    state: FloodState = FloodState.OK
+
+
+class _Bucket:
+    __slots__ = ("tokens", "last", "episode_drops", "stats")
+
+    def __init__(self, tokens: float, now: float) -> None:
+        self.tokens = tokens
+        self.last = now
+        self.episode_drops = 0
+        self.stats = FloodStats()
+
+
+class SenderRateLimiter:
+    """Token bucket per sender address.
+
+    Each sender may send ``burst`` telegrams at once and ``rate`` telegrams per second
+    on average; telegrams beyond that are dropped. With ``quarantine_after`` set, a
+    sender that has ``quarantine_after`` telegrams dropped without becoming quiet in
+    between is quarantined: all its telegrams are dropped until it has been quiet
+    long enough to refill its bucket (``burst / rate`` seconds).
+
+    Rate limiting is disabled while ``rate`` is None (the default).
+    """
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        burst: int = 20,
+        quarantine_after: int | None = None,
+        max_senders: int = 1024,
+    ) -> None:
+        self.rate: float | None = rate
+        """Average number of telegrams per second allowed per sender; None disables rate limiting."""
+
+        self.burst: int = burst
+        """Number of telegrams a sender may send at once (bucket size)."""
+
+        self.quarantine_after: int | None = quarantine_after
+        """Number of dropped telegrams within one flooding episode after which a sender is quarantined; None disables quarantine."""
+
+        self.max_senders: int = max_senders
+        """Maximum number of senders tracked; idle senders are forgotten first."""
+
+        self.__buckets: dict[int, _Bucket] = {}
+
+    def allow(self, sender: int) -> bool:
+        """Account a telegram of ``sender`` (32-bit address) and return whether it may be processed."""
+        rate = self.rate
+        if rate is None:
+            return True
+        now = time.monotonic()
+        bucket = self.__buckets.get(sender)
+        if bucket is None:
+            if len(self.__buckets) >= self.max_senders:
+                self.__prune(now)
+            bucket = self.__buckets[sender] = _Bucket(self.burst, now)
+        else:
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.last) * rate)
+            bucket.last = now
+
+        stats = bucket.stats
+        if stats.state is not FloodState.OK and bucket.tokens >= self.burst:
+            # quiet long enough to refill: the flooding episode is over
+            stats.state = FloodState.OK
+            bucket.episode_drops = 0
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            if stats.state is FloodState.QUARANTINED:
+                stats.suppressed += 1
+                return False
+            stats.passed += 1
+            return True
+
+        if stats.state is FloodState.QUARANTINED:
+            stats.suppressed += 1
+            return False
+        stats.dropped += 1
+        bucket.episode_drops += 1
+        stats.state = FloodState.LIMITED
+        if (
+            self.quarantine_after is not None
+            and bucket.episode_drops >= self.quarantine_after
+        ):
+            stats.state = FloodState.QUARANTINED
+            stats.quarantines += 1
+        return False
+
+    def state(self, sender: int | Address) -> FloodState:
+        """Current state of a sender (``OK`` for senders that are not tracked)."""
+        bucket = self.__buckets.get(int(sender))
+        return FloodState.OK if bucket is None else bucket.stats.state
+
+    def stats(self, sender: int | Address) -> FloodStats | None:
+        """Copy of the counters of a sender, or None if it is not tracked."""
+        bucket = self.__buckets.get(int(sender))
+        if bucket is None:
+            return None
+        s = bucket.stats
+        return FloodStats(s.passed, s.dropped, s.suppressed, s.quarantines, s.state)
+
+    def release(self, sender: int | Address) -> None:
+        """End a quarantine or limitation of a sender immediately and refill its bucket."""
+        bucket = self.__buckets.get(int(sender))
+        if bucket is not None:
+            bucket.stats.state = FloodState.OK
+            bucket.episode_drops = 0
+            bucket.tokens = self.burst
+
+    def forget(self, sender: int | Address) -> None:
+        """Drop the bucket and counters of a sender."""
+        self.__buckets.pop(int(sender), None)
+
+    def __prune(self, now: float) -> None:
+        """Forget senders whose bucket has refilled (they behave); if that is not enough, the least recently added."""
+        refill = self.burst / self.rate if self.rate else 0.0
+        for sender in [
+            sender
+            for sender, bucket in self.__buckets.items()
+            if bucket.stats.state is FloodState.OK and now - bucket.last >= refill
+        ]:
+            del self.__buckets[sender]
+        while len(self.__buckets) >= self.max_senders:
+            del self.__buckets[next(iter(self.__buckets))]
@@ -123,3 +123,10 @@ class Observable(str, Enum):
     )
     LEARNING_ACTIVE = ("learning_active", None, _B)
     LEARNING_REMAINING = ("learning_remaining", "s", _S)
+    SEND_LATENCY = ("send_latency", "ms", _S)
+    SEND_FAILURES = ("send_failures", None, _S)
+    AIRTIME = ("airtime", "s", _S)
+
+    # Flood protection (device diagnostics)
+    TELEGRAMS_DROPPED = ("telegrams_dropped", None, _S)
+    FLOOD_STATE = ("flood_state", None, _E, ["ok", "limited", "quarantined"])
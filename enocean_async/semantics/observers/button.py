@@ -4,7 +4,7 @@ import asyncio
 from dataclasses import dataclass, field
 import logging
 from time import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 _logger = logging.getLogger(__name__)
 
@@ -208,6 +208,10 @@ class F6_02_01_02_ButtonObserver(ButtonObserver):
     Handles R1/EB/R2/SA fields from F6-02-01 and F6-02-02 telegrams.
     """
 
+    decoded_fields: ClassVar[frozenset[str] | None] = frozenset(
+        {"R1", "EB", "R2", "SA"}
+    )
+
     def _decode_impl(self, message: EEPMessage) -> None:
         if not {"R1", "EB", "R2", "SA"}.issubset(message.decoded):
             return
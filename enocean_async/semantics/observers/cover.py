@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass, field
 from time import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from ..observable import Observable
 from ..observation import Observation, ObservationSource
@@ -21,6 +21,8 @@ COVER_WATCHDOG_TIMEOUT = 1.5
 class CoverObserver(Observer):
     """Observer that emits position and angle updates for blinds/cover devices."""
 
+    decoded_fields: ClassVar[frozenset[str] | None] = frozenset()
+
     message_type_id: int = 4
     """Message type ID to listen to (4 for D2-05 'Reply position and angle',
     7 for A5-38-08 CMD=7 incoming status)."""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from time import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from ...address import Address
 from .observer import Observer
@@ -23,6 +23,8 @@ class MetaDataObserver(Observer):
     - Telegram count (number of messages received)
     """
 
+    decoded_fields: ClassVar[frozenset[str] | None] = frozenset()
+
     def __init__(
         self, device_address: Address, on_observation: ObservationCallback | None
     ) -> None:
@@ -4,7 +4,7 @@ from abc import ABC
 import asyncio
 from dataclasses import dataclass
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from ...address import Address
 from ..observation import Observation, ObservationCallback
@@ -23,6 +23,9 @@ class Observer(ABC):
     device_address: Address
     on_observation: ObservationCallback | None = None
 
+    decoded_fields: ClassVar[frozenset[str] | None] = None
+    """Data fields this observer reads from ``message.decoded``, so the gateway can skip decoding the others; None if it may read any field."""
+
     def decode(self, message: EEPMessage) -> None:
         """Decode the given EEPMessage according to this observer's logic.
 
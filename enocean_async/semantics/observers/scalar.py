@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from time import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from ..observable import Observable
 from ..observation import Observation, ObservationSource
 from ..observer_factory import ObserverFactory
+from ..reporting import ReportPolicy
 from .observer import Observer
 
 if TYPE_CHECKING:
@@ -23,6 +24,8 @@ class ScalarObserver(Observer):
     This makes it fully EEP-agnostic.
     """
 
+    decoded_fields: ClassVar[frozenset[str] | None] = frozenset()
+
     observable: Observable = field(kw_only=True)
     """The observable type to read from EEPMessage.entities and emit as an Observation."""
 
@@ -44,6 +47,17 @@ class ScalarObserver(Observer):
     entity_id_suffix: str = field(default="", kw_only=True)
     """Suffix appended when building entity_id from entity_id_field (e.g. ``"_switch_state"`` → ``"ch1_switch_state"``)."""
 
+    report_policy: ReportPolicy | None = field(default=None, kw_only=True)
+    """Change-only reporting policy (set by the gateway); None emits an Observation for every telegram."""
+
+    device_config: dict[str, Any] = field(default_factory=dict, kw_only=True)
+    """Config of the device (set by the gateway), read for per-device overrides of the report policy."""
+
+    _reported: dict[str, tuple[Any, float]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    """Last emitted value and its time per entity_id (change-only reporting only)."""
+
     def _resolve_entity_id(self, message: EEPMessage) -> str:
         """Determine the entity_id for this state change."""
         if self.entity_id_field is not None:
@@ -57,12 +71,28 @@ class ScalarObserver(Observer):
         if v is None or v.value is None:
             return
 
+        entity = self._resolve_entity_id(message)
+        now = time()
+        policy = self.report_policy
+        if policy is not None and policy.enabled:
+            reported = self._reported.get(entity)
+            if reported is not None:
+                value, reported_at = reported
+                max_silence = policy.max_silence_for(self.device_config)
+                if (
+                    max_silence is None or now - reported_at < max_silence
+                ) and policy.deadband(self.observable, self.device_config).suppresses(
+                    value, v.value
+                ):
+                    return
+            self._reported[entity] = (v.value, now)
+
         self._emit(
             Observation(
                 device=self.device_address,
-                entity=self._resolve_entity_id(message),
+                entity=entity,
                 values={self.observable: v.value},
-                timestamp=time(),
+                timestamp=now,
                 source=ObservationSource.TELEGRAM,
             )
         )
@@ -0,0 +1,137 @@
+"""Change-only reporting of scalar observations with per-observable deadbands."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from .entity import Entity, EntityCategory, NumberRange
+from .observable import Observable
+from .value_kind import ValueKind
+
+
+@dataclass(frozen=True)
+class Deadband:
+    """Minimum change of a numeric value, relative to the last reported value, that is reported.
+
+    Non-numeric values (and numeric values without a deadband) are reported whenever they change.
+    """
+
+    absolute: float = 0.0
+    """Changes smaller than this (in the observable's unit) are not reported."""
+
+    relative: float = 0.0
+    """Changes smaller than this fraction of the last reported value (e.g. ``0.01`` for 1 %) are not reported."""
+
+    def suppresses(self, reported: Any, value: Any) -> bool:
+        """Whether ``value`` is too close to the last ``reported`` value to be reported."""
+        if value == reported:
+            return True
+        if not (_is_number(value) and _is_number(reported)):
+            return False
+        return abs(value - reported) < max(self.absolute, self.relative * abs(reported))
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, int | float) and not isinstance(value, bool)
+
+
+DEFAULT_DEADBANDS: dict[Observable, Deadband] = {
+    Observable.TEMPERATURE: Deadband(absolute=0.1),
+    Observable.HUMIDITY: Deadband(absolute=1.0),
+    Observable.ILLUMINATION: Deadband(relative=0.01),
+    Observable.POWER: Deadband(relative=0.01),
+}
+"""Deadbands of ``ReportPolicy`` by default; other observables are reported on any change."""
+
+MAX_SILENCE_CONFIG = "report_max_silence"
+"""Device config entity overriding ``ReportPolicy.max_silence`` (seconds, 0 = never)."""
+
+
+def deadband_config(observable: Observable) -> str:
+    """Device config entity overriding the deadband of an observable (e.g. ``"temperature_deadband"``)."""
+    return f"{observable.value}_deadband"
+
+
+class ReportPolicy:
+    """Change-only reporting of the observations of scalar observers (see ``Gateway.report_policy``).
+
+    While enabled, a scalar observation of an entity is only emitted if its value
+    differs from the last emitted value of that entity by at least the observable's
+    deadband, or if the last emission is at least ``max_silence`` seconds ago
+    (checked when a telegram arrives; there is no timer). Devices can override both
+    via config entities (``report_max_silence`` and ``<observable>_deadband``).
+
+    Disabled by default: every telegram is reported.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        deadbands: dict[Observable, Deadband] | None = None,
+        max_silence: float | None = 3600.0,
+    ) -> None:
+        self.enabled: bool = enabled
+        """Whether unchanged values are suppressed."""
+
+        self.deadbands: dict[Observable, Deadband] = (
+            dict(DEFAULT_DEADBANDS) if deadbands is None else deadbands
+        )
+        """Deadband per observable; observables without an entry are reported on any change."""
+
+        self.max_silence: float | None = max_silence
+        """Seconds after which an unchanged value is reported again; None never reports unchanged values."""
+
+    def deadband(self, observable: Observable, config: dict[str, Any]) -> Deadband:
+        """Deadband of an observable for a device, taking its config override into account.
+
+        The override is absolute, or a percentage if the default deadband is relative.
+        """
+        default = self.deadbands.get(observable, Deadband())
+        override = config.get(deadband_config(observable))
+        if override is None:
+            return default
+        if default.relative and not default.absolute:
+            return Deadband(relative=float(override) / 100)
+        return Deadband(absolute=float(override))
+
+    def max_silence_for(self, config: dict[str, Any]) -> float | None:
+        """Maximum silence for a device, taking its config override (0 = never) into account."""
+        override = config.get(MAX_SILENCE_CONFIG)
+        if override is None:
+            return self.max_silence
+        return float(override) or None
+
+    def config_entities(self, observables: set[Observable]) -> list[Entity]:
+        """Config entities of a device that reports ``observables`` with scalar observers."""
+        entities = [
+            Entity(
+                id=MAX_SILENCE_CONFIG,
+                config_spec=NumberRange(
+                    min_value=0.0,
+                    max_value=86400.0,
+                    step=60.0,
+                    unit="s",
+                    default=self.max_silence or 0.0,
+                ),
+                category=EntityCategory.CONFIG,
+            )
+        ]
+        for observable in sorted(observables, key=lambda o: o.value):
+            if observable.kind is not ValueKind.SCALAR:
+                continue
+            default = self.deadbands.get(observable, Deadband())
+            relative = bool(default.relative and not default.absolute)
+            value = default.relative * 100 if relative else default.absolute
+            entities.append(
+                Entity(
+                    id=deadband_config(observable),
+                    config_spec=NumberRange(
+                        min_value=0.0,
+                        max_value=100.0 if relative else 1000.0,
+                        step=0.01,
+                        unit="%" if relative else observable.unit,
+                        default=value,
+                    ),
+                    category=EntityCategory.CONFIG,
+                )
+            )
+        return entities
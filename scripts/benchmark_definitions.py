@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Measure loading EEP definition files with and without the cached compiled form.
+
+Run from the repository root:
+    python scripts/benchmark_definitions.py [--profiles N] [--runs N]
+
+Generates a definition file with N synthetic 4BS profiles (temperature, humidity
+and an enumerated field each) and reports the median time of loading it by
+parsing the JSON, by reading the compiled form from the cache, and of registering
+it (compiled form, specifications built on first lookup).
+"""
+
+import argparse
+import json
+from pathlib import Path
+import statistics
+import tempfile
+import time
+
+import enocean_async.eep as eep_package
+from enocean_async.eep import EEPRegistry
+from enocean_async.eep.definition import load_definitions
+
+
+def profile(i: int) -> dict:
+    return {
+        "eep": f"A5-3F-{i:02X}",
+        "name": f"Synthetic sensor {i}",
+        "fields": [
+            {
+                "id": "HUM",
+                "name": "Humidity",
+                "offset": 8,
+                "size": 8,
+                "range": [0, 250],
+                "scale": [0, 100],
+                "unit": "%",
+                "observable": "humidity",
+            },
+            {
+                "id": "TMP",
+                "name": "Temperature",
+                "offset": 16,
+                "size": 8,
+                "range": [0, 250],
+                "scale": [-20 - i, 60 + i],
+                "unit": "°C",
+                "observable": "temperature",
+            },
+            {
+                "id": "ST",
+                "name": "Status",
+                "offset": 24,
+                "size": 4,
+                "enum": {"0": "OK", "1-14": "Error {}", "15": "Unknown"},
+            },
+        ],
+        "observers": ["humidity", "temperature"],
+    }
+
+
+def measure(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        t = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=200)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "definitions.json"
+        document = {"format": 1, "profiles": [profile(i) for i in range(args.profiles)]}
+        path.write_text(json.dumps(document), encoding="utf-8")
+        cache_dir = Path(tmp) / "cache"
+        load_definitions(path, cache_dir=cache_dir)  # compile once
+
+        parsed = measure(lambda: load_definitions(path, cache=False), args.runs)
+        cached = measure(lambda: load_definitions(path, cache_dir=cache_dir), args.runs)
+
+        def register() -> None:
+            # a fresh registry per run; specifications are built on first lookup
+            eep_package.EEP_SPECIFICATIONS = EEPRegistry({})
+            eep_package.register_definitions(path, cache_dir=cache_dir)
+
+        registered = measure(register, args.runs)
+
+    print(f"{args.profiles} profiles, {path.name}:")
+    print(f"  parse JSON     {parsed * 1000:8.1f} ms")
+    print(f"  compiled form  {cached * 1000:8.1f} ms")
+    print(f"  register only  {registered * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Measure the import time of enocean_async in fresh interpreters.
+
+Run from the repository root:
+    python scripts/benchmark_import.py [--runs N]
+
+Reports the median of N runs for importing the package, for the first lookup of
+one EEP specification and for loading all specifications.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+CASES = {
+    "import enocean_async": "import enocean_async",
+    "+ first EEP lookup": (
+        "import enocean_async\n"
+        "enocean_async.EEP_SPECIFICATIONS[enocean_async.EEP('A5-02-05')]"
+    ),
+    "+ all EEP specifications": (
+        "import enocean_async\nenocean_async.EEP_SPECIFICATIONS.load_all()"
+    ),
+}
+
+TIMER = (
+    "import time\n"
+    "t = time.perf_counter()\n"
+    "{code}\n"
+    "print(time.perf_counter() - t)\n"
+)
+
+
+def measure(code: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(float(out))
+    return statistics.median(samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    for label, code in CASES.items():
+        print(f"{label:<28} {measure(code, args.runs) * 1000:8.1f} ms")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Generate enocean_async/eep/_compiled.py, the ahead-of-time compiled decode and encode
+functions of every EEP telegram type in EEP_SPECIFICATIONS.
+
+Run from the repository root after changing an EEP specification:
+    python scripts/generate_decoders.py
+
+EEPHandler only uses an entry whose digest matches the code generated from the
+current specification, so an outdated module is never wrong, just slower (the
+handler then generates the function at runtime or uses the interpreter).
+"""
+
+from pathlib import Path
+
+from enocean_async.eep import EEP_SPECIFICATIONS
+from enocean_async.eep.codegen import decoder_source, source_digest
+from enocean_async.eep.packer import TelegramPacker
+
+OUT = Path(__file__).parent.parent / "enocean_async" / "eep" / "_compiled.py"
+
+HEADER = '''\
+"""Ahead-of-time compiled decode and encode functions of all EEP telegram types.
+
+Generated by scripts/generate_decoders.py — do not edit manually.
+
+DECODERS and ENCODERS map (EEP, telegram type) to (source digest, function);
+EEPHandler uses an entry only if its digest matches the code generated from the
+current specification (see enocean_async.eep.codegen).
+"""
+
+import logging
+
+from .message import ValueWithContext as VWC
+
+_logger = logging.getLogger("enocean_async.eep.packer")
+from_bytes = int.from_bytes
+'''
+
+
+def render() -> str:
+    functions: list[str] = []
+    names: dict[str, str] = {}  # canonical source -> function name (identical telegram types share code)
+    decoders: list[str] = []
+    encoders: list[str] = []
+
+    def define(canonical: str, prefix: str, generate) -> str:
+        name = names.get(canonical)
+        if name is None:
+            name = names[canonical] = f"_{prefix}_{len(names)}"
+            functions.append(generate(name))
+        return name
+
+    for eep, spec in EEP_SPECIFICATIONS.items():
+        resolver_count = len(spec.semantic_resolvers)
+        for cmd_value, telegram in spec.telegrams.items():
+            key = f"({str(eep)!r}, {cmd_value})"
+
+            source = decoder_source(telegram, resolver_count)
+            name = define(
+                source,
+                "decoder",
+                lambda n: decoder_source(telegram, resolver_count, name=n),
+            )
+            decoders.append(f"    {key}: ({source_digest(source)!r}, {name}),")
+
+            cmd, ecid = spec.selector_values(cmd_value)
+            packer = TelegramPacker(
+                telegram,
+                cmd_value=cmd,
+                cmd_size=spec.cmd_size,
+                cmd_offset=spec.cmd_offset,
+                ecid_value=ecid,
+                ecid_size=spec.ecid_size,
+                ecid_offset=spec.ecid_offset,
+            )
+            source = packer.source()
+            name = define(source, "encoder", lambda n: packer.source(name=n))
+            encoders.append(f"    {key}: ({source_digest(source)!r}, {name}),")
+
+    return "\n\n".join(
+        [
+            HEADER,
+            *functions,
+            "DECODERS = {\n" + "\n".join(decoders) + "\n}\n",
+            "ENCODERS = {\n" + "\n".join(encoders) + "\n}\n",
+        ]
+    )
+
+
+if __name__ == "__main__":
+    OUT.write_text(render(), encoding="utf-8")
+    print(f"Written {OUT}")
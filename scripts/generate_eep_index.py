@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Generate enocean_async/eep/_index.py, the precomputed index of EEP_SPECIFICATIONS.
+
+Run from the repository root after adding, renaming or removing an EEP specification:
+    python scripts/generate_eep_index.py
+"""
+
+import json
+from pathlib import Path
+
+from enocean_async.eep.registry import discover_specifications
+
+OUT = Path(__file__).parent.parent / "enocean_async" / "eep" / "_index.py"
+
+
+def render() -> str:
+    lines = [
+        '"""Precomputed index of all supported EEPs: (eep, name, module, attribute).',
+        "",
+        "Generated by scripts/generate_eep_index.py — do not edit manually.",
+        '"""',
+        "",
+        "INDEX: tuple[tuple[str, str, str, str], ...] = (",
+    ]
+    for entry in discover_specifications():
+        lines.append("    (")
+        for value in (str(entry.eep), entry.name, entry.module, entry.attribute):
+            lines.append(f"        {json.dumps(value, ensure_ascii=False)},")
+        lines.append("    ),")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    OUT.write_text(render(), encoding="utf-8")
+    print(f"Written {OUT}")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Report the memory used by the EEP specifications of the registry.
+
+Run from the repository root:
+    python scripts/memory_report.py
+
+Imports enocean_async in a fresh interpreter, loads all EEP specifications and
+reports the memory allocated by loading them (via tracemalloc), the peak
+resident set size, and how many data fields and enumerations the
+specifications reference in total and as distinct objects, with the size of
+the distinct enumerations.
+"""
+
+import argparse
+import subprocess
+import sys
+
+REPORT = r"""
+import gc
+import resource
+import sys
+import time
+import tracemalloc
+
+tracemalloc.start()
+import enocean_async
+from enocean_async.eep import EEP_SPECIFICATIONS
+
+before = tracemalloc.get_traced_memory()[0]
+t = time.perf_counter()
+EEP_SPECIFICATIONS.load_all()
+load_time = time.perf_counter() - t
+loaded = tracemalloc.get_traced_memory()[0] - before
+tracemalloc.stop()
+
+fields = [
+    f
+    for spec in EEP_SPECIFICATIONS.values()
+    for telegram in spec.telegrams.values()
+    for f in telegram.datafields
+]
+enums = [f.range_enum for f in fields if f.range_enum is not None]
+
+
+def deep_size(obj, seen: set[int]) -> int:
+    # obj and the containers, strings and numbers it references, each counted once
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if not isinstance(obj, (str, int, float)):
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, (tuple, list, dict, str, int, float)):
+                size += deep_size(ref, seen)
+    return size
+
+
+distinct_enums = {id(e): e for e in enums}.values()
+print(f"EEP specifications        {len(EEP_SPECIFICATIONS):>10}")
+print(f"data fields (referenced)  {len(fields):>10}")
+print(f"data fields (distinct)    {len({id(f) for f in fields}):>10}")
+print(f"enumerations (referenced) {len(enums):>10}")
+print(f"enumerations (distinct)   {len(distinct_enums):>10}")
+seen = set()
+enum_bytes = sum(deep_size(e, seen) for e in distinct_enums)
+print(f"enumerations (size)       {enum_bytes / 1024:>10.1f} KiB")
+print(f"load_all() allocated      {loaded / 1024:>10.1f} KiB")
+print(f"load_all() time           {load_time * 1000:>10.1f} ms (traced)")
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(f"peak RSS                  {rss / 1024:>10.1f} MiB")
+"""
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.parse_args()
+    subprocess.run([sys.executable, "-c", REPORT], check=True)
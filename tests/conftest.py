@@ -4,12 +4,21 @@ All fixtures are session- or function-scoped and kept deliberately small so
 that individual test modules can compose them freely.
 """
 
+import asyncio
+
 import pytest
 
 from enocean_async.address import EURID, BaseAddress
+from enocean_async.gateway import Gateway
 from enocean_async.protocol.erp1.rorg import RORG
 from enocean_async.protocol.erp1.telegram import ERP1Telegram
-from enocean_async.protocol.esp3.packet import SYNC_BYTE, crc8
+from enocean_async.protocol.esp3.packet import (
+    SYNC_BYTE,
+    ESP3Packet,
+    ESP3PacketType,
+    crc8,
+)
+from enocean_async.protocol.esp3.response import ResponseCode
 from enocean_async.semantics.observation import Observation
 
 # ---------------------------------------------------------------------------
@@ -111,3 +120,46 @@ def build_esp3_frame(
         + optional
         + bytes([crc8(data + optional)])
     )
+
+
+# ---------------------------------------------------------------------------
+# Gateway with a fake serial transport
+# ---------------------------------------------------------------------------
+
+
+class FakeTransport:
+    """Stand-in for ``serialx.SerialTransport`` that records written frames.
+
+    Every write is answered with a RESPONSE packet. Queue return codes in
+    *responses* to control the answers; ``None`` simulates a lost response.
+    Once the queue is empty, writes are answered with ``ResponseCode.OK``.
+    Queue seconds in *delays* to let the answers to the next writes arrive late.
+    """
+
+    def __init__(self, gateway) -> None:
+        self.gateway = gateway
+        self.written: list[bytes] = []
+        self.responses: list[int | None] = []
+        self.delays: list[float] = []
+
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
+        code = self.responses.pop(0) if self.responses else ResponseCode.OK
+        delay = self.delays.pop(0) if self.delays else 0.0
+        if code is not None:
+            asyncio.get_running_loop().call_later(
+                delay,
+                self.gateway.process_esp3_packet,
+                ESP3Packet(ESP3PacketType.RESPONSE, bytes([code]), b""),
+            )
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def gateway() -> Gateway:
+    """A Gateway whose serial transport is replaced by a :class:`FakeTransport`."""
+    gw = Gateway("/dev/null")
+    gw._Gateway__transport = FakeTransport(gw)
+    return gw
@@ -1,4 +1,13 @@
-from enocean_async.address import Address, BroadcastAddress
+import pytest
+
+from enocean_async.address import (
+    BROADCAST,
+    EURID,
+    Address,
+    BaseAddress,
+    BroadcastAddress,
+    sender_address,
+)
 
 
 def test_conversion():
@@ -28,4 +37,33 @@ def test_is_base_address():
     assert Address("FF:FF:FF:FE").is_base_address
     assert Address("FF:7F:FF:FF").is_base_address == False
     assert Address("00:00:00:00").is_base_address == False
-    assert BroadcastAddress().is_base_address == False
\ No newline at end of file
+    assert BroadcastAddress().is_base_address == False
+
+
+def test_sender_address_is_interned():
+    assert sender_address(0x01020304) is sender_address(0x01020304)
+    assert type(sender_address(0x01020304)) is EURID
+    assert type(sender_address(0xFF800001)) is BaseAddress
+    assert sender_address(0xFF800001) == BaseAddress("FF:80:00:01")
+    with pytest.raises(ValueError):
+        sender_address(0xFFFFFFFF)
+    with pytest.raises(ValueError):
+        sender_address(-1)
+
+
+def test_broadcast_constant():
+    assert BROADCAST == BroadcastAddress()
+    assert BROADCAST.is_broadcast
+
+
+def test_no_equality_with_int():
+    assert EURID(0x01020304) != 0x01020304
+    assert EURID(0x01020304) != "01:02:03:04"
+    assert EURID(1) != True  # noqa: E712
+    assert 0x01020304 not in {EURID(0x01020304)}
+    assert int(EURID(0x01020304)) == 0x01020304
+
+
+def test_slots():
+    with pytest.raises(AttributeError):
+        EURID(1).foo = 1
@@ -0,0 +1,130 @@
+"""Tests for columnar batch decoding (BatchDecoder) against EEPHandler.decode."""
+
+import math
+import random
+
+import pytest
+
+from enocean_async.address import EURID
+from enocean_async.eep import EEP_SPECIFICATIONS
+from enocean_async.eep.batch import NUMPY_AVAILABLE, BatchDecoder
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+
+_MODES = [
+    pytest.param(
+        True,
+        id="numpy",
+        marks=pytest.mark.skipif(not NUMPY_AVAILABLE, reason="NumPy not installed"),
+    ),
+    pytest.param(False, id="python"),
+]
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, float) and isinstance(b, float):
+        return a == b or (math.isnan(a) and math.isnan(b))
+    return a == b
+
+
+def _payloads(spec, cmd_value: int, count: int, seed: str) -> list[bytes]:
+    rng = random.Random(seed)
+    packer = EEPHandler(spec).packer(cmd_value)
+    telegram = spec.telegrams[cmd_value]
+    return [
+        packer.pack({f.id: rng.randrange(1 << f.size) for f in telegram.datafields})
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("use_numpy", _MODES)
+@pytest.mark.parametrize("eep", list(EEP_SPECIFICATIONS), ids=str)
+def test_batch_matches_handler(eep, use_numpy):
+    spec = EEP_SPECIFICATIONS[eep]
+    handler = EEPHandler(spec, specialized=False)
+
+    for cmd_value in spec.telegrams:
+        payloads = _payloads(spec, cmd_value, 20, str(eep))
+        columns = BatchDecoder(spec, cmd_value, use_numpy=use_numpy).decode(payloads)
+
+        for i, data in enumerate(payloads):
+            erp1 = ERP1Telegram(
+                rorg=RORG(spec.eep.rorg),
+                telegram_data=data,
+                sender=EURID("01:23:45:67"),
+            )
+            try:
+                msg = handler.decode(erp1)
+            except ValueError:
+                continue  # invalid dynamic scaling; NaN in the batch
+            if msg.message_type is None or msg.message_type.id != cmd_value:
+                continue  # CMD field of another telegram type
+            for field_id, decoded in msg.decoded.items():
+                column = columns[field_id]
+                assert int(column.raw[i]) == msg.raw[field_id]
+                if column.values is None:
+                    assert column.labels()[i] == decoded.value
+                else:
+                    assert _same(float(column.values[i]), decoded.value)
+                unit = column.unit
+                if not isinstance(unit, str | None):
+                    unit = unit[i]  # depends on other fields
+                assert unit == decoded.unit
+
+
+@pytest.mark.parametrize("use_numpy", _MODES)
+def test_dynamic_scaling(use_numpy):
+    # A5-12-01: the scale of MR depends on the divisor DIV
+    spec = EEP_SPECIFICATIONS[EEP("A5-12-01")]
+    payloads = [bytes([0, 0, 100, div]) for div in range(4)]
+    columns = BatchDecoder(spec, use_numpy=use_numpy).decode(payloads)
+    assert list(columns["MR"].raw) == [100] * 4
+    assert [float(v) for v in columns["MR"].values] == [100.0, 10.0, 1.0, 0.1]
+    assert list(columns["DIV"].raw) == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("use_numpy", _MODES)
+def test_longer_and_shorter_data(use_numpy):
+    spec = EEP_SPECIFICATIONS[EEP("F6-02-01")]
+    decoder = BatchDecoder(spec, use_numpy=use_numpy)
+    # fields end in the first byte
+    columns = decoder.decode([b"\x30\xff", b"\x50\x00"])
+    assert list(columns["R1"].raw) == [1, 2]
+
+    decoder = BatchDecoder(EEP_SPECIFICATIONS[EEP("A5-02-05")], use_numpy=use_numpy)
+    with pytest.raises(ValueError, match="too short"):
+        decoder.decode([b"\x00\x00"])
+
+
+def test_empty_batch():
+    columns = BatchDecoder(EEP_SPECIFICATIONS[EEP("A5-12-01")]).decode([])
+    assert len(columns["MR"].raw) == 0
+    assert len(columns["MR"].values) == 0
+
+
+def test_python_columns_are_lists():
+    decoder = BatchDecoder(EEP_SPECIFICATIONS[EEP("A5-02-05")], use_numpy=False)
+    assert not decoder.uses_numpy
+    columns = decoder.decode([bytes([0, 0, 0, 0x08])])
+    assert columns["TMP"].raw == [0]
+    assert columns["TMP"].values == [40.0]
+    assert columns["TMP"].unit == "°C"
+
+
+def test_numpy_array_input():
+    np = pytest.importorskip("numpy")
+    spec = EEP_SPECIFICATIONS[EEP("A5-02-05")]
+    decoder = BatchDecoder(spec)
+    assert decoder.uses_numpy
+
+    data = np.array([[0, 0, 0, 8], [0, 0, 255, 8]], dtype=np.uint8)
+    columns = decoder.decode(data)
+    assert columns["TMP"].values.dtype == np.float64
+    assert columns["TMP"].values.tolist() == [40.0, 0.0]
+
+    with pytest.raises(ValueError, match="same length"):
+        decoder.decode([bytes(4), bytes(5)])
+    with pytest.raises(ValueError, match="uint8"):
+        decoder.decode(data.astype(np.int32))
@@ -0,0 +1,85 @@
+"""Tests for the RF census of unknown senders."""
+
+import asyncio
+
+from enocean_async.address import EURID, BaseAddress
+from enocean_async.census import SenderCensus
+from enocean_async.eep import device_type_for_eep
+from enocean_async.eep.id import EEP
+from enocean_async.gateway import Gateway
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+
+
+def _telegram(
+    sender: EURID | BaseAddress, learn: bool = False, rssi: int = 0x50
+) -> ERP1Telegram:
+    return ERP1Telegram(
+        rorg=RORG.RORG_4BS,
+        telegram_data=b"\x00\x00\x80" + (b"\x00" if learn else b"\x08"),
+        sender=sender,
+        rssi=rssi,
+    )
+
+
+def test_statistics():
+    census = SenderCensus()
+    sender = EURID("01:00:00:01")
+    assert census.record(_telegram(sender, learn=True, rssi=0x40))
+    assert not census.record(_telegram(sender, rssi=0x60))
+
+    entry = census.get(sender)
+    assert entry.address == sender
+    assert entry.rorg == RORG.RORG_4BS
+    assert entry.data_length == 4
+    assert entry.telegrams == 2
+    assert entry.learn_telegrams == 1
+    assert (entry.rssi_min, entry.rssi_max, entry.rssi_mean) == (0x40, 0x60, 0x50)
+    assert entry.first_seen <= entry.last_seen
+    assert sender in census
+
+
+def test_least_recently_heard_sender_is_evicted():
+    census = SenderCensus(max_senders=2)
+    a, b, c = (EURID(i) for i in (1, 2, 3))
+    census.record(_telegram(a))
+    census.record(_telegram(b))
+    census.record(_telegram(a))  # a is now the most recently heard
+    census.record(_telegram(c))
+
+    assert len(census) == 2
+    assert census.get(b) is None
+    assert census.evictions == 1
+    assert [e.address for e in census.entries()] == [c, a]
+
+
+def test_query_filters():
+    census = SenderCensus()
+    census.record(_telegram(EURID(1), learn=True, rssi=0x30))
+    census.record(_telegram(EURID(2), rssi=0x70))
+    census.record(_telegram(EURID(2), rssi=0x70))
+    census.record(_telegram(BaseAddress("FF:80:00:01"), rssi=0x70))
+
+    assert [e.address for e in census.entries(learning=True)] == [EURID(1)]
+    assert [e.address for e in census.entries(min_telegrams=2)] == [EURID(2)]
+    assert [e.address for e in census.entries(max_rssi=0x40)] == [EURID(1)]
+    assert census.entries(rorg=RORG.RORG_VLD) == []
+
+
+async def test_gateway_tracks_only_unknown_senders(gateway: Gateway):
+    new_devices = []
+    gateway.add_new_device_callback(new_devices.append)
+    known, unknown = EURID("01:00:00:01"), EURID("01:00:00:02")
+    gateway.add_device(known, device_type_for_eep(EEP("A5-02-05")))
+
+    for sender in (known, unknown, unknown):
+        gateway.process_esp3_packet(_telegram(sender).to_esp3())
+    await asyncio.sleep(0)
+
+    assert new_devices == [unknown]
+    assert known not in gateway.census
+    assert gateway.census.get(unknown).telegrams == 2
+
+    # registering a device removes it from the census
+    gateway.add_device(unknown, device_type_for_eep(EEP("A5-02-05")))
+    assert unknown not in gateway.census
@@ -0,0 +1,226 @@
+"""Differential tests: generated decode functions against the generic interpreter of EEPHandler."""
+
+import random
+
+import pytest
+
+from enocean_async.address import EURID
+from enocean_async.eep import EEP_SPECIFICATIONS, codegen
+from enocean_async.eep._compiled import DECODERS, ENCODERS
+from enocean_async.eep.codegen import (
+    compile_decoder,
+    decoder_source,
+    source_digest,
+    specialized_decoder,
+)
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.eep.message import EEPMessage, EEPMessageType, RawEEPMessage
+from enocean_async.eep.packer import TelegramPacker
+from enocean_async.eep.profile import EEPDataField, EEPTelegram
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+
+
+def _decode(handler: EEPHandler, erp1: ERP1Telegram, config: dict):
+    try:
+        msg = handler.decode(erp1, config)
+    except ValueError as e:
+        return ("ValueError", str(e))
+    return (msg.message_type, msg.raw, msg.decoded, msg.values)
+
+
+@pytest.mark.parametrize("eep", list(EEP_SPECIFICATIONS), ids=str)
+def test_specialized_decode_matches_interpreter(eep):
+    spec = EEP_SPECIFICATIONS[eep]
+    specialized = EEPHandler(spec)
+    interpreter = EEPHandler(spec, specialized=False)
+    rng = random.Random(str(eep))
+
+    for cmd_value, telegram_def in spec.telegrams.items():
+        packer = specialized.packer(cmd_value)
+        for _ in range(10):
+            raw = {f.id: rng.randrange(1 << f.size) for f in telegram_def.datafields}
+            erp1 = ERP1Telegram(
+                rorg=RORG(spec.eep.rorg),
+                telegram_data=packer.pack(raw),
+                sender=EURID("01:23:45:67"),
+            )
+            for config in ({}, {"inverted": True}):
+                assert _decode(specialized, erp1, config) == _decode(
+                    interpreter, erp1, config
+                )
+
+
+def _telegram() -> EEPTelegram:
+    return EEPTelegram(
+        name=None,
+        datafields=[
+            EEPDataField(
+                id="A", name="Enum", offset=0, size=2, range_enum={0: "off", 1: "on"}
+            ),
+            EEPDataField(
+                id="B",
+                name="Temperature",
+                offset=4,
+                size=12,
+                range_min=4095,
+                range_max=0,
+                scale_min_fn=lambda _: -40.0,
+                scale_max_fn=lambda _: 0.0,
+                unit_fn=lambda _: "°C",
+            ),
+            EEPDataField(
+                id="C",
+                name="",
+                offset=16,
+                size=8,
+                scale_min_fn=lambda _: 0.0,
+                scale_max_fn=lambda raw: 100.0 if raw["A"] else 10.0,
+                unit_fn=lambda raw: "%" if raw["A"] else "",
+            ),
+        ],
+    )
+
+
+def _message() -> EEPMessage:
+    return EEPMessage(sender=EURID("01:23:45:67"), eep=EEP("A5-02-05"))
+
+
+def test_constant_scale_and_unit_are_folded():
+    decoder = compile_decoder(_telegram(), {}, fallback=None, label="test")
+    assert "d0 = T0[f0]" in decoder.source  # narrow enum: table lookup
+    assert "scaled_value" not in decoder.source.split("d1 =")[1].splitlines()[0]
+    assert "'°C'" in decoder.source
+    assert "F2.scaled_value" in decoder.source  # scale depends on A
+    assert "values" not in decoder.source  # no observables, no resolvers
+
+    msg = _message()
+    decoder(bytes([0x4F, 0xFF, 50]), msg, {})
+    assert msg.raw == {"A": 1, "B": 4095, "C": 50}
+    assert msg.decoded["A"].value == "on"
+    assert msg.decoded["B"] == (-40.0, "°C", "Temperature")
+    assert msg.decoded["C"] == (50 * 100.0 / 255, "%", "C")
+
+    msg = _message()
+    decoder(bytes([0xC0, 0, 0]), msg, {})
+    assert msg.decoded["A"].value == "Unknown(3)"
+
+    msg = _message()
+    decoder(bytes([0x00, 0, 255]), msg, {})
+    assert msg.decoded["C"] == (10.0, None, "C")
+
+
+def test_longer_data_is_decoded_and_shorter_uses_fallback():
+    calls = []
+    decoder = compile_decoder(
+        _telegram(), {}, fallback=lambda *args: calls.append(args), label="test"
+    )
+    msg = _message()
+    decoder(b"\x00\x00", msg, {})
+    assert [len(data) for data, _, _ in calls] == [2]
+    assert msg.raw == {}
+
+    decoder(bytes([0x4F, 0xFF, 50, 0xAA]), msg, {})  # e.g. 4BS data, fields end in byte 3
+    assert msg.raw == {"A": 1, "B": 4095, "C": 50}
+    assert len(calls) == 1
+
+
+def test_invalid_constant_scaling_raises():
+    telegram = EEPTelegram(
+        name=None,
+        datafields=[
+            EEPDataField(id="A", name="", offset=0, size=8),
+            EEPDataField(id="B", name="", offset=8, size=8, range_min=5, range_max=5),
+        ],
+    )
+    decoder = compile_decoder(telegram, {}, fallback=None)
+    msg = _message()
+    with pytest.raises(ValueError, match="range_max must differ"):
+        decoder(b"\x01\x02", msg, {})
+    assert list(msg.decoded) == ["A"]
+
+
+def _encode(handler: EEPHandler, cmd_value: int, raw: dict):
+    try:
+        return handler.encode(
+            RawEEPMessage(
+                sender=EURID("01:23:45:67"),
+                message_type=EEPMessageType(id=cmd_value, description=""),
+                raw=raw,
+            )
+        ).telegram_data
+    except ValueError as e:
+        return ("ValueError", str(e))
+
+
+@pytest.mark.parametrize("eep", list(EEP_SPECIFICATIONS), ids=str)
+def test_compiled_encode_matches_packer(eep):
+    spec = EEP_SPECIFICATIONS[eep]
+    specialized = EEPHandler(spec)
+    interpreter = EEPHandler(spec, specialized=False)
+    rng = random.Random(str(eep))
+
+    for cmd_value, telegram_def in spec.telegrams.items():
+        for _ in range(5):
+            raw = {
+                f.id: rng.randrange(1 << (f.size + 1))  # also out of range
+                for f in telegram_def.datafields
+                if rng.random() < 0.8  # also missing fields
+            }
+            assert _encode(specialized, cmd_value, raw) == _encode(
+                interpreter, cmd_value, raw
+            )
+
+
+def test_compiled_module_is_up_to_date():
+    """Fails if an EEP specification changed without running scripts/generate_decoders.py."""
+    decoders = set()
+    encoders = set()
+    for eep, spec in EEP_SPECIFICATIONS.items():
+        for cmd_value, telegram_def in spec.telegrams.items():
+            key = (str(eep), cmd_value)
+            decoders.add(key)
+            source = decoder_source(telegram_def, len(spec.semantic_resolvers))
+            assert DECODERS[key][0] == source_digest(source), key
+
+            encoders.add(key)
+            cmd, ecid = spec.selector_values(cmd_value)
+            packer = TelegramPacker(
+                telegram_def,
+                cmd_value=cmd,
+                cmd_size=spec.cmd_size,
+                cmd_offset=spec.cmd_offset,
+                ecid_value=ecid,
+                ecid_size=spec.ecid_size,
+                ecid_offset=spec.ecid_offset,
+            )
+            assert ENCODERS[key][0] == source_digest(packer.source()), key
+    assert set(DECODERS) == decoders
+    assert set(ENCODERS) == encoders
+
+
+def test_compiled_decoder_is_preferred(monkeypatch):
+    def no_codegen(*args, **kwargs):
+        raise AssertionError("runtime code generation")
+
+    monkeypatch.setattr(codegen, "compile_decoder", no_codegen)
+    spec = EEP_SPECIFICATIONS[EEP("D2-01-12")]
+    for cmd_value, telegram_def in spec.telegrams.items():
+        decoder = specialized_decoder(
+            ("D2-01-12", cmd_value), telegram_def, spec.semantic_resolvers, None
+        )
+        assert decoder is not None
+        assert not hasattr(decoder, "source")
+
+
+def test_runtime_codegen_can_be_disabled(monkeypatch):
+    key = ("A5-02-05", 99)  # not in the compiled module
+    assert specialized_decoder(key, _telegram(), {}, None).source
+
+    monkeypatch.setattr(codegen, "ALLOW_RUNTIME_CODEGEN", False)
+    assert specialized_decoder(key, _telegram(), {}, None) is None
+
+    # an outdated compiled entry is not used either
+    stale = ("A5-02-05", 0)
+    assert specialized_decoder(stale, _telegram(), {}, None) is None
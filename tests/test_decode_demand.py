@@ -0,0 +1,102 @@
+"""Tests for demand-driven decoding: only the pipeline stages and fields somebody consumes are computed."""
+
+import asyncio
+
+import pytest
+
+from enocean_async.address import EURID
+from enocean_async.eep import EEP_SPECIFICATIONS, device_type_for_eep
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.gateway import Gateway
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+from enocean_async.semantics.observers.button import F6_02_01_02_ButtonObserver
+from enocean_async.semantics.observers.scalar import ScalarObserver
+
+_SENSOR = EURID("01:23:45:67")
+_A5_04_01 = EEP("A5-04-01")  # HUM and TMP are observable, TSN is not
+
+
+def _erp1(data: bytes = bytes([0x00, 0x80, 0x40, 0x0A])) -> ERP1Telegram:
+    return ERP1Telegram(rorg=RORG.RORG_4BS, telegram_data=data, sender=_SENSOR)
+
+
+@pytest.mark.parametrize("specialized", [True, False])
+def test_handler_decodes_only_demanded_fields(specialized):
+    handler = EEPHandler(EEP_SPECIFICATIONS[_A5_04_01], specialized=specialized)
+    full = handler.decode(_erp1())
+    assert set(full.decoded) == {"HUM", "TMP", "TSN"}
+
+    msg = handler.decode(_erp1(), fields=frozenset())
+    assert set(msg.decoded) == {"HUM", "TMP"}
+    assert msg.raw == full.raw
+    assert msg.values == full.values
+    assert msg.decoded["TMP"] == full.decoded["TMP"]
+
+    msg = handler.decode(_erp1(), fields=frozenset({"TSN"}))
+    assert msg.decoded == full.decoded
+
+
+def test_handler_decodes_all_fields_for_semantic_resolvers():
+    spec = EEP_SPECIFICATIONS[EEP("A5-06-01")]  # resolvers may read any field
+    assert spec.semantic_resolvers
+    handler = EEPHandler(spec)
+    erp1 = ERP1Telegram(
+        rorg=RORG.RORG_4BS, telegram_data=handler.packer().pack({}), sender=_SENSOR
+    )
+    assert handler.decode(erp1, fields=frozenset()).decoded == (
+        handler.decode(erp1).decoded
+    )
+
+
+def test_observers_declare_decoded_fields():
+    assert ScalarObserver.decoded_fields == frozenset()
+    assert F6_02_01_02_ButtonObserver.decoded_fields == {"R1", "EB", "R2", "SA"}
+
+
+@pytest.fixture
+def sensor_gateway(gateway: Gateway, monkeypatch) -> tuple[Gateway, list]:
+    """Gateway with an A5-04-01 sensor; records the ``fields`` argument of every decode."""
+    gateway.add_device(_SENSOR, device_type_for_eep(_A5_04_01))
+    calls = []
+    decode = EEPHandler.decode
+
+    def spy(self, telegram, config=None, fields=None):
+        calls.append(fields)
+        return decode(self, telegram, config, fields)
+
+    monkeypatch.setattr(EEPHandler, "decode", spy)
+    return gateway, calls
+
+
+async def test_nothing_is_decoded_without_consumers(sensor_gateway):
+    gateway, calls = sensor_gateway
+    gateway.process_esp3_packet(_erp1().to_esp3())
+    await asyncio.sleep(0.01)
+    assert calls == []
+
+
+async def test_observation_callbacks_only_need_observable_fields(sensor_gateway):
+    gateway, calls = sensor_gateway
+    observations = []
+    gateway.add_observation_callback(observations.append)
+
+    gateway.process_esp3_packet(_erp1().to_esp3())
+    await asyncio.sleep(0.01)
+
+    assert calls == [frozenset()]
+    assert {o.entity for o in observations} >= {"temperature", "humidity"}
+
+
+async def test_eep_callbacks_get_fully_decoded_messages(sensor_gateway):
+    gateway, calls = sensor_gateway
+    messages = []
+    gateway.add_observation_callback(lambda _: None)
+    gateway.add_eep_message_received_callback(messages.append)
+
+    gateway.process_esp3_packet(_erp1().to_esp3())
+    await asyncio.sleep(0.01)
+
+    assert calls == [None]
+    assert set(messages[0].decoded) == {"HUM", "TMP", "TSN"}
@@ -0,0 +1,188 @@
+"""Tests for the fingerprint caches of the echo and repeat filters and the merging of repeated copies."""
+
+import asyncio
+
+import pytest
+
+from enocean_async import dedupe
+from enocean_async.address import EURID
+from enocean_async.dedupe import FingerprintCache
+from enocean_async.eep import EEP_SPECIFICATIONS, device_type_for_eep
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.eep.message import EEPMessageType, RawEEPMessage
+from enocean_async.gateway import Gateway
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram, RepeaterCount
+
+_SWITCH = EURID("01:23:45:67")
+_D2_01_12 = EEP("D2-01-12")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for ``time.monotonic`` in the dedupe module."""
+    now = [1000.0]
+    monkeypatch.setattr(dedupe.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = FingerprintCache(ttl=2.0, max_size=8)
+    cache.add(b"a")
+    clock[0] += 1.0
+    assert b"a" in cache
+    clock[0] += 1.5
+    assert b"a" not in cache
+
+    # expired entries are dropped on the next add
+    cache.add(b"b")
+    assert len(cache) == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_oldest_entries_are_evicted(clock):
+    cache = FingerprintCache(ttl=2.0, max_size=3)
+    for fp in (b"a", b"b", b"c", b"d"):
+        cache.add(fp)
+    assert b"a" not in cache
+    assert all(fp in cache for fp in (b"b", b"c", b"d"))
+    assert cache.stats.size == 3
+    assert cache.stats.max_size == 3
+
+
+def test_re_adding_refreshes(clock):
+    cache = FingerprintCache(ttl=2.0, max_size=8)
+    cache.add(b"a")
+    clock[0] += 1.5
+    cache.add(b"a")
+    clock[0] += 1.5
+    cache.add(b"b")  # evicts the first entry of "a" but not the refreshed one
+    assert b"a" in cache
+    assert len(cache) == 2
+
+
+def test_refreshes_do_not_count_towards_max_size(clock):
+    cache = FingerprintCache(ttl=2.0, max_size=3)
+    cache.add(b"a")
+    for _ in range(10):
+        clock[0] += 0.01
+        cache.add(b"b")
+    assert b"a" in cache and b"b" in cache
+    cache.add(b"c")
+    assert len(cache) == 3
+    cache.add(b"d")  # the fourth distinct fingerprint evicts the oldest
+    assert b"a" not in cache
+    assert all(fp in cache for fp in (b"b", b"c", b"d"))
+
+
+def _esp3(repeater_count: RepeaterCount):
+    return ERP1Telegram(
+        rorg=RORG.RORG_RPS,
+        telegram_data=b"\x30",
+        sender=EURID("01:23:45:67"),
+        status=repeater_count,
+    ).to_esp3()
+
+
+async def test_gateway_drops_repeated_copies(gateway: Gateway):
+    received = []
+    gateway.add_erp1_received_callback(received.append)
+
+    gateway.process_esp3_packet(_esp3(RepeaterCount.Original))
+    gateway.process_esp3_packet(_esp3(RepeaterCount.OnceRepeated))
+    await asyncio.sleep(0)
+
+    assert len(received) == 1
+    assert gateway.repeat_filter.stats.hits == 1
+
+
+async def test_gateway_repeat_filter_can_be_disabled_by_ttl(gateway: Gateway):
+    received = []
+    gateway.add_erp1_received_callback(received.append)
+    gateway.repeat_filter.ttl = 0
+
+    gateway.process_esp3_packet(_esp3(RepeaterCount.Original))
+    gateway.process_esp3_packet(_esp3(RepeaterCount.OnceRepeated))
+    await asyncio.sleep(0)
+
+    assert len(received) == 2
+
+
+def _switch_status(repeater_count: RepeaterCount, rssi: int):
+    """ESP3 packet of a D2-01 'Actuator status response' (CMD 4) from _SWITCH."""
+    telegram = EEPHandler(EEP_SPECIFICATIONS[_D2_01_12]).encode(
+        RawEEPMessage(
+            sender=_SWITCH,
+            message_type=EEPMessageType(id=0x4, description=""),
+            raw={"I/O": 0, "OV": 100},
+        )
+    )
+    telegram.status = repeater_count
+    telegram.rssi = rssi
+    return telegram.to_esp3()
+
+
+@pytest.fixture
+def switch_gateway(gateway: Gateway) -> Gateway:
+    gateway.add_device(_SWITCH, device_type_for_eep(_D2_01_12))
+    return gateway
+
+
+async def test_repeated_copies_are_merged_into_link_stats(switch_gateway: Gateway):
+    messages = []
+    switch_gateway.add_eep_message_received_callback(messages.append)
+
+    switch_gateway.process_esp3_packet(_switch_status(RepeaterCount.Original, 0x50))
+    switch_gateway.process_esp3_packet(
+        _switch_status(RepeaterCount.OnceRepeated, 0x40)
+    )
+    switch_gateway.process_esp3_packet(
+        _switch_status(RepeaterCount.TwiceRepeated, 0x60)
+    )
+    await asyncio.sleep(0)
+
+    assert len(messages) == 1
+    assert messages[0].rssi == 0x50
+    link = switch_gateway.link_stats[_SWITCH]
+    assert link.telegrams == 1
+    assert link.duplicates == 2
+    assert link.receptions_by_hops == {0: 1, 1: 1, 2: 1}
+    assert link.first_by_hops == {0: 1}
+    assert link.best_rssi == 0x40
+    assert link.last_hops == 0
+    assert link.mean_rssi(1) == 0x40
+    assert link.mean_rssi(3) is None
+
+
+async def test_first_copy_via_repeater_is_processed_once(switch_gateway: Gateway):
+    messages = []
+    switch_gateway.add_eep_message_received_callback(messages.append)
+
+    switch_gateway.process_esp3_packet(
+        _switch_status(RepeaterCount.OnceRepeated, 0x50)
+    )
+    switch_gateway.process_esp3_packet(
+        _switch_status(RepeaterCount.TwiceRepeated, 0x55)
+    )
+    await asyncio.sleep(0)
+
+    assert len(messages) == 1
+    link = switch_gateway.link_stats[_SWITCH]
+    assert link.first_by_hops == {1: 1}
+    assert link.best_rssi == 0x50
+
+
+async def test_identical_originals_are_not_merged(switch_gateway: Gateway):
+    messages = []
+    switch_gateway.add_eep_message_received_callback(messages.append)
+
+    switch_gateway.process_esp3_packet(_switch_status(RepeaterCount.Original, 0x50))
+    switch_gateway.process_esp3_packet(_switch_status(RepeaterCount.Original, 0x50))
+    await asyncio.sleep(0)
+
+    assert len(messages) == 2
+    assert switch_gateway.link_stats[_SWITCH].telegrams == 2
+    switch_gateway.remove_device(_SWITCH)
+    assert switch_gateway.link_stats == {}
@@ -0,0 +1,235 @@
+"""Tests for EEP definition files (JSON) and their cached compiled form."""
+
+import asyncio
+import json
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from enocean_async.address import EURID
+import enocean_async.eep as eep_package
+from enocean_async.eep import EEP_SPECIFICATIONS, definition
+from enocean_async.eep.definition import load_definitions
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.eep.registry import EEPRegistry
+import enocean_async.gateway as gateway_module
+from enocean_async.gateway import Gateway
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+from enocean_async.semantics.observable import Observable
+
+_ROOT = Path(__file__).parent.parent
+
+_DEVICE = EURID("01:23:45:67")
+
+_TEMPERATURE = {
+    "eep": "A5-02-05",
+    "name": "Temperature sensor, range 0.0°C to 40.0°C",
+    "fields": [
+        {
+            "id": "TMP",
+            "name": "Temperature",
+            "offset": 16,
+            "size": 8,
+            "range": [255, 0],
+            "scale": [0, 40],
+            "unit": "°C",
+            "observable": "temperature",
+        }
+    ],
+    "observers": ["temperature"],
+}
+
+_FAN = {
+    "eep": "D2-3F-01",
+    "name": "Test fan with extended commands",
+    "cmd": {"offset": 4, "size": 4},
+    "ecid": {"offset": 8, "size": 8},
+    "telegrams": {
+        "0x1": {
+            "name": "Fan status",
+            "fields": [
+                {"id": "CMD", "offset": 4, "size": 4},
+                {
+                    "id": "FS",
+                    "name": "Fan speed",
+                    "offset": 8,
+                    "size": 8,
+                    "enum": {"0": "Off", "1-100": "{}%", "0xFF": "Auto"},
+                },
+            ],
+        },
+        "0xF/0x02": {
+            "name": "Limits",
+            "fields": [
+                {"id": "CMD", "offset": 4, "size": 4},
+                {"id": "ECID", "offset": 8, "size": 8},
+                {"id": "MAX", "offset": 16, "size": 8, "unit": "%"},
+            ],
+        },
+    },
+    "addressed_sending": False,
+}
+
+
+def _write(path, *profiles):
+    path.write_text(
+        json.dumps({"format": 1, "profiles": list(profiles)}), encoding="utf-8"
+    )
+    return path
+
+
+def _erp1(rorg: RORG, data: bytes) -> ERP1Telegram:
+    return ERP1Telegram(rorg=rorg, telegram_data=data, sender=_DEVICE)
+
+
+def test_decodes_like_the_python_profile(tmp_path):
+    (spec,) = load_definitions(_write(tmp_path / "a.json", _TEMPERATURE), cache=False)
+    assert spec.eep == EEP("A5-02-05")
+    assert [e.id for e in spec.entities] == ["temperature"]
+    builtin = EEP_SPECIFICATIONS[EEP("A5-02-05")]
+    # identical field definitions are shared with the Python profile
+    assert spec.telegrams[0].datafields[0] is builtin.telegrams[0].datafields[0]
+
+    loaded, reference = EEPHandler(spec), EEPHandler(builtin)
+    for raw in range(256):
+        telegram = _erp1(RORG.RORG_4BS, bytes([0, 0, raw, 0x08]))
+        message = loaded.decode(telegram)
+        assert message.decoded == reference.decode(telegram).decoded
+    assert message.values[Observable.TEMPERATURE].unit == "°C"
+
+
+def test_commands_and_enumerations(tmp_path):
+    (spec,) = load_definitions(_write(tmp_path / "fan.json", _FAN), cache=False)
+    assert not spec.uses_addressed_sending
+    assert set(spec.telegrams) == {0x1, spec.telegram_key(0xF, 0x02)}
+    handler = EEPHandler(spec)
+
+    status = handler.decode(_erp1(RORG.RORG_VLD, bytes([0x01, 42])))
+    assert status.message_type.description == "Fan status"
+    assert status.decoded["FS"].value == "42%"
+    auto = handler.decode(_erp1(RORG.RORG_VLD, bytes([0x01, 0xFF])))
+    assert auto.decoded["FS"].value == "Auto"
+
+    limits = handler.decode(_erp1(RORG.RORG_VLD, bytes([0x0F, 0x02, 80])))
+    assert limits.raw == {"CMD": 0xF, "ECID": 0x02, "MAX": 80}
+    assert limits.decoded["MAX"].unit == "%"
+
+
+def test_compiled_form_is_cached_by_content(tmp_path, monkeypatch):
+    path = _write(tmp_path / "defs.json", _TEMPERATURE, _FAN)
+    cache_dir = tmp_path / "cache"
+    first = load_definitions(path, cache_dir=cache_dir)
+    (cache_file,) = cache_dir.iterdir()
+
+    def no_parsing(_):
+        raise AssertionError("definition file parsed again")
+
+    monkeypatch.setattr(definition.json, "loads", no_parsing)
+    second = load_definitions(path, cache_dir=cache_dir)
+    assert [s.eep for s in second] == [s.eep for s in first]
+    assert second[1].telegrams.keys() == first[1].telegrams.keys()
+    monkeypatch.undo()
+
+    # an edited file is compiled again
+    _write(path, _FAN)
+    assert [s.eep for s in load_definitions(path, cache_dir=cache_dir)] == [
+        EEP("D2-3F-01")
+    ]
+    assert len(list(cache_dir.iterdir())) == 2
+
+    # unreadable compiled files are ignored
+    cache_file.write_bytes(b"garbage")
+    _write(path, _TEMPERATURE, _FAN)
+    assert len(load_definitions(path, cache_dir=cache_dir)) == 2
+
+
+def test_cache_can_be_disabled(tmp_path):
+    path = _write(tmp_path / "a.json", _TEMPERATURE)
+    load_definitions(path, cache=False, cache_dir=tmp_path / "cache")
+    assert not (tmp_path / "cache").exists()
+
+
+@pytest.mark.parametrize(
+    ("change", "message"),
+    [
+        ({"colour": "blue"}, "unknown keys"),
+        ({"observers": ["warmth"]}, "unknown observable"),
+        ({"eep": "A5-02"}, "Invalid EEP"),
+        ({"fields": [{"id": "X", "offset": 0, "size": 2, "enum": {"4": "a"}}]}, "fit"),
+        ({"fields": [{"id": "X", "offset": 0, "size": True}]}, "size: expected int"),
+        ({"telegrams": {}}, "either 'fields' or 'telegrams'"),
+    ],
+)
+def test_invalid_definitions(tmp_path, change, message):
+    path = _write(tmp_path / "bad.json", _TEMPERATURE | change)
+    with pytest.raises(ValueError, match=message):
+        load_definitions(path, cache=False)
+
+
+def test_invalid_format(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text('{"format": 2, "profiles": []}')
+    with pytest.raises(ValueError, match="unsupported format"):
+        load_definitions(path, cache=False)
+    path.write_text("{")
+    with pytest.raises(ValueError, match="invalid JSON"):
+        load_definitions(path, cache=False)
+
+
+@pytest.fixture
+def registry(monkeypatch) -> EEPRegistry:
+    """A copy of the EEP registry and device type catalog, so registered EEPs do not leak into other tests."""
+    registry = EEPRegistry(EEP_SPECIFICATIONS.index)
+    monkeypatch.setattr(eep_package, "EEP_SPECIFICATIONS", registry)
+    monkeypatch.setattr(gateway_module, "EEP_SPECIFICATIONS", registry)
+    monkeypatch.setattr(eep_package, "DEVICE_TYPES", dict(eep_package.DEVICE_TYPES))
+    return registry
+
+
+async def test_register_definitions(tmp_path, registry, gateway: Gateway):
+    temperature = _TEMPERATURE | {"eep": "A5-02-05.ELTAKO"}
+    path = _write(tmp_path / "defs.json", temperature)
+    (eep,) = eep_package.register_definitions(path, cache=False)
+    assert eep == EEP("A5-02-05.ELTAKO") and eep in registry
+    assert registry.index[eep].module == str(path)
+    assert not registry.is_loaded(eep)  # built on first lookup
+    assert registry[eep] is registry[eep]
+    with pytest.raises(ValueError, match="already registered"):
+        eep_package.register_definitions(path, cache=False)
+
+    # duplicates within a file: nothing of the file is registered
+    humidity = _TEMPERATURE | {"eep": "A5-04-01.ELTAKO"}
+    twice = _write(tmp_path / "twice.json", humidity, _FAN, humidity)
+    with pytest.raises(ValueError, match="more than once"):
+        eep_package.register_definitions(twice, cache=False)
+    assert EEP("A5-04-01.ELTAKO") not in registry
+    assert EEP("D2-3F-01") not in registry
+
+    observations = []
+    gateway.add_observation_callback(observations.append)
+    gateway.add_device(_DEVICE, eep_package.device_type_for_eep(eep))
+    gateway.process_esp3_packet(
+        _erp1(RORG.RORG_4BS, bytes([0, 0, 0x80, 0x08])).to_esp3()
+    )
+    await asyncio.sleep(0.01)
+    assert round(observations[-1].values[Observable.TEMPERATURE], 2) == 19.92
+
+
+def test_import_does_not_load_the_definition_module():
+    code = """
+import sys
+import enocean_async
+from enocean_async.eep import register_definitions
+
+assert "enocean_async.eep.definition" not in sys.modules
+from enocean_async.eep import load_definitions
+assert load_definitions.__module__ == "enocean_async.eep.definition"
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=_ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
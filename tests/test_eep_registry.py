@@ -0,0 +1,75 @@
+"""Tests for the lazily loaded EEP registry (EEP_SPECIFICATIONS)."""
+
+from pathlib import Path
+import subprocess
+import sys
+
+import pytest
+
+from enocean_async.eep import DEVICE_TYPES, EEP_SPECIFICATIONS, device_type_for_eep
+from enocean_async.eep.id import EEP
+from enocean_async.eep.registry import discover_specifications
+
+_ROOT = Path(__file__).parent.parent
+
+
+def test_index_is_up_to_date():
+    """Fails if a specification was added, renamed or removed without running scripts/generate_eep_index.py."""
+    assert list(EEP_SPECIFICATIONS.index.values()) == discover_specifications()
+
+
+def test_lookup_returns_specification_of_eep():
+    for eep in EEP_SPECIFICATIONS:
+        spec = EEP_SPECIFICATIONS[eep]
+        assert spec.eep == eep
+        assert spec.name == EEP_SPECIFICATIONS.index[eep].name
+        assert EEP_SPECIFICATIONS.is_loaded(eep)
+        assert device_type_for_eep(eep).model == spec.name
+
+
+def test_mapping_behaviour():
+    assert EEP("A5-02-05") in EEP_SPECIFICATIONS
+    assert EEP("A5-08-01.ELTAKO") in EEP_SPECIFICATIONS
+    assert EEP("A5-FF-FF") not in EEP_SPECIFICATIONS
+    assert "A5-02-05" not in EEP_SPECIFICATIONS
+    assert EEP_SPECIFICATIONS.get(EEP("A5-FF-FF")) is None
+    with pytest.raises(KeyError):
+        EEP_SPECIFICATIONS[EEP("A5-FF-FF")]
+    assert len(EEP_SPECIFICATIONS) == len(list(EEP_SPECIFICATIONS))
+    assert len([dt for dt in DEVICE_TYPES.values() if dt.manufacturer is None]) == len(
+        EEP_SPECIFICATIONS
+    )
+
+
+def test_package_attributes_are_resolved_lazily():
+    from enocean_async.eep import EEP_D2_01_12
+    from enocean_async.eep.a5 import EEP_A5_02_05
+
+    assert EEP_A5_02_05 is EEP_SPECIFICATIONS[EEP("A5-02-05")]
+    assert EEP_D2_01_12 is EEP_SPECIFICATIONS[EEP("D2-01-12")]
+    with pytest.raises(ImportError):
+        from enocean_async.eep.f6 import EEP_A5_02_05  # noqa: F401
+    with pytest.raises(AttributeError):
+        import enocean_async.eep.a5
+
+        enocean_async.eep.a5.EEP_A5_FF_FF
+
+
+def test_import_does_not_load_profile_modules():
+    code = """
+import sys
+import enocean_async
+from enocean_async import EEP, EEP_SPECIFICATIONS, DEVICE_TYPES
+
+profiles = lambda: sorted(m for m in sys.modules if m.startswith(("enocean_async.eep.a5.", "enocean_async.eep.d2.", "enocean_async.eep.f6.")))
+assert profiles() == [], profiles()
+assert EEP("D2-01-12") in EEP_SPECIFICATIONS and len(DEVICE_TYPES) > len(EEP_SPECIFICATIONS)
+assert profiles() == [], profiles()
+EEP_SPECIFICATIONS[EEP("D2-01-12")]
+assert "enocean_async.eep.d2.d2_01" in profiles(), profiles()
+assert not any(".a5." in m or ".f6." in m for m in profiles()), profiles()
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=_ROOT, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
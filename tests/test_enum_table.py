@@ -0,0 +1,117 @@
+"""Tests for shared enumeration tables (EnumTable) and shared data field definitions."""
+
+import pytest
+
+from enocean_async.eep import EEP_SPECIFICATIONS
+from enocean_async.eep.enum_table import EnumTable, enum_table
+from enocean_async.eep.id import EEP
+from enocean_async.eep.profile import EEPDataField, EEPTelegram
+
+
+def test_behaves_like_the_dict():
+    labels = {
+        0: "Off",
+        **{i: "Stage 1" for i in range(1, 10)},
+        **{i: f"{i}%" for i in range(10, 13)},
+        20: "Reserved",
+        22: "Auto",
+    }
+    table = enum_table(labels)
+    assert table == labels
+    assert dict(table) == labels
+    assert len(table) == len(labels)
+    assert list(table) == sorted(labels)
+    assert table[11] == "11%"
+    assert table.get(21) is None
+    assert table.get(21, "x") == "x"
+    assert 22 in table and 21 not in table and "22" not in table
+    assert table.get(-1) is None and table.get(23) is None
+    with pytest.raises(KeyError):
+        table[21]
+    assert (table.min_value, table.max_value) == (0, 22)
+
+
+def test_ranges_and_label_functions():
+    table = enum_table(
+        {0: "Timer deactivated", range(1, 0xFFFF): lambda i: f"{i * 0.1:.1f} s"}
+    )
+    assert len(table) == 0xFFFF
+    assert table[1] == "0.1 s"
+    assert table[0xFFFE] == "6553.4 s"
+    assert 0xFFFF not in table
+
+    with pytest.raises(ValueError, match="overlap"):
+        enum_table({5: "a", range(0, 10): "b"})
+    with pytest.raises(ValueError, match="step 1"):
+        enum_table({range(0, 10, 2): "b"})
+
+
+def test_equal_enumerations_are_shared():
+    a = enum_table({i: "Reserved" if i > 3 else str(i) for i in range(8)})
+    b = enum_table(dict(reversed(list(a.items()))))
+    assert a is b
+    assert enum_table(a) is a
+    assert hash(a) == hash(b)
+    assert enum_table({0: "x"}) != a
+
+
+def test_fields_store_shared_enumerations():
+    field = EEPDataField(
+        id="A", name="", offset=0, size=2, range_enum={0: "a", 1: "b"}
+    )
+    assert isinstance(field.range_enum, EnumTable)
+    assert field.range_enum is enum_table({1: "b", 0: "a"})
+    assert (field.range_min, field.range_max) == (0, 1)
+
+
+def test_identical_fields_are_shared():
+    def make() -> EEPDataField:
+        return EEPDataField(
+            id="TMP",
+            name="Temperature",
+            offset=16,
+            size=8,
+            range_min=255,
+            range_max=0,
+            scale_min_fn=lambda _: 0.0,
+            scale_max_fn=lambda _: 40.0,
+            unit_fn=lambda _: "°C",
+        )
+
+    first = EEPTelegram(name=None, datafields=[make()])
+    second = EEPTelegram(name=None, datafields=[make()])
+    assert first.datafields[0] is second.datafields[0]
+
+    dynamic = EEPTelegram(
+        name=None,
+        datafields=[
+            EEPDataField(
+                id="TMP", name="", offset=0, size=8, unit_fn=lambda raw: str(raw["X"])
+            )
+        ],
+    )
+    assert dynamic.datafields[0] is not first.datafields[0]
+
+
+def test_fields_are_immutable():
+    field = EEP_SPECIFICATIONS[EEP("A5-02-05")].telegrams[0].datafields[0]
+    with pytest.raises(AttributeError):
+        field.offset = 0
+
+
+def test_profiles_share_fields_and_enumerations():
+    specs = [EEP_SPECIFICATIONS[EEP(f"A5-02-{t:02X}")] for t in (0x01, 0x05)]
+    lrn = [
+        [f for f in spec.telegrams[0].datafields if f.id != "TMP"] for spec in specs
+    ]
+    assert [id(f) for f in lrn[0]] == [id(f) for f in lrn[1]]
+
+    d2_01 = [EEP_SPECIFICATIONS[EEP(f"D2-01-{t:02X}")] for t in (0x00, 0x12)]
+    io = {
+        id(f.range_enum)
+        for spec in d2_01
+        for telegram in spec.telegrams.values()
+        for f in telegram.datafields
+        if f.id == "I/O"
+    }
+    assert len(io) <= 3  # command, response and dimming-limits variants
@@ -0,0 +1,115 @@
+"""Tests for ERP1Telegram parsing from ESP3 packets."""
+
+import pytest
+
+from enocean_async.address import EURID, BaseAddress, BroadcastAddress
+from enocean_async.protocol.erp1.errors import ERP1ParseError
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+from enocean_async.protocol.esp3.packet import ESP3Packet, ESP3PacketType
+
+
+def _packet(data: bytes, optional: bytes = b"") -> ESP3Packet:
+    return ESP3Packet(ESP3PacketType.RADIO_ERP1, data, optional)
+
+
+_SENDER_BYTES = bytes.fromhex("01234567")
+
+
+def test_roundtrip():
+    telegram = ERP1Telegram(
+        rorg=RORG.RORG_VLD,
+        telegram_data=b"\x04\x60\xe4",
+        sender=EURID("01:23:45:67"),
+        status=0x01,
+        rssi=0x4A,
+        sec_level=0,
+        destination=EURID("FF:00:00:01"),
+    )
+    parsed = ERP1Telegram.from_esp3(telegram.to_esp3())
+    assert parsed == telegram
+    assert isinstance(parsed.sender, EURID)
+    assert parsed.sender_int == 0x01234567
+
+
+def test_fingerprint():
+    telegram = ERP1Telegram(
+        rorg=RORG.RORG_RPS,
+        telegram_data=b"\x30",
+        sender=EURID("01:23:45:67"),
+        status=0x30,
+    )
+    parsed = ERP1Telegram.from_esp3(telegram.to_esp3())
+    assert telegram.fingerprint == b"\xf6\x30" + _SENDER_BYTES
+    assert parsed.fingerprint == telegram.fingerprint
+
+    # modifications of a received telegram are reflected
+    parsed.set_bitstring_raw_value(offset=0, size=8, value=0x10)
+    assert parsed.fingerprint == b"\xf6\x10" + _SENDER_BYTES
+    assert parsed.sender == EURID("01:23:45:67")
+    parsed.sender = EURID("01:23:45:68")
+    assert parsed.fingerprint == b"\xf6\x10" + bytes.fromhex("01234568")
+
+
+@pytest.mark.parametrize(
+    ("attribute", "value", "fingerprint"),
+    [
+        ("telegram_data", b"\x10", b"\xf6\x10" + _SENDER_BYTES),
+        ("rorg", RORG.RORG_1BS, b"\xd5\x30" + _SENDER_BYTES),
+        ("status", 0x20, b"\xf6\x30" + _SENDER_BYTES),
+    ],
+)
+def test_assigning_attributes_updates_fingerprint(attribute, value, fingerprint):
+    parsed = ERP1Telegram.from_esp3(
+        _packet(b"\xf6\x30" + _SENDER_BYTES + b"\x30", b"\x01")
+    )
+    setattr(parsed, attribute, value)
+    assert getattr(parsed, attribute) == value
+    assert parsed.fingerprint == fingerprint
+    assert parsed.sender == EURID("01:23:45:67")
+    assert parsed.to_esp3().data[:-1] == fingerprint
+
+
+def test_optional_fields_are_parsed_lazily():
+    telegram = ERP1Telegram.from_esp3(
+        _packet(
+            b"\xf6\x30" + _SENDER_BYTES + b"\x30",
+            b"\x01" + b"\xff\xff\xff\xff" + b"\x2d\x00",
+        )
+    )
+    assert telegram.sender == EURID("01:23:45:67")
+    assert isinstance(telegram.destination, BroadcastAddress)
+    assert telegram.rssi == 0x2D
+    assert telegram.sec_level == 0
+    assert telegram.sub_tel_num == 1
+
+
+def test_base_address_sender_and_missing_optional_data():
+    telegram = ERP1Telegram.from_esp3(_packet(b"\xf6\x30\xff\x80\x00\x01\x30"))
+    assert telegram.sender == BaseAddress("FF:80:00:01")
+    assert isinstance(telegram.sender, BaseAddress)
+    assert telegram.destination is None
+    assert telegram.rssi is None
+    assert telegram.sub_tel_num is None
+
+
+def test_eurid_destination():
+    telegram = ERP1Telegram.from_esp3(
+        _packet(b"\xd2\x04" + _SENDER_BYTES + b"\x00", b"\x01\x00\x00\x00\x02\x40\x00")
+    )
+    assert telegram.destination == EURID("00:00:00:02")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"\xa5\x00\x00\x00" + _SENDER_BYTES + b"\x00",  # 4BS with 3 data bytes
+        b"\xf6\x00\x00" + _SENDER_BYTES + b"\x00",  # RPS with 2 data bytes
+        b"\x00\x00" + _SENDER_BYTES + b"\x00",  # unknown RORG
+        b"\xf6\x30\xff\xff\xff\xff\x30",  # broadcast sender
+        b"\xf6\x30\x00",  # too short
+    ],
+)
+def test_invalid_telegrams_are_rejected(data):
+    with pytest.raises(ERP1ParseError):
+        ERP1Telegram.from_esp3(_packet(data))
@@ -0,0 +1,109 @@
+"""Tests for two-level CMD/ECID dispatch of extended commands (D2-01 dimming limits)."""
+
+import logging
+
+import pytest
+
+from enocean_async.address import EURID, BaseAddress
+from enocean_async.eep import EEP_SPECIFICATIONS
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.eep.message import EEPMessageType, RawEEPMessage
+from enocean_async.eep.profile import EEPDataField, EEPSpecification, EEPTelegram
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+
+_SPEC = EEP_SPECIFICATIONS[EEP("D2-01-00")]
+
+
+def _erp1(data: bytes) -> ERP1Telegram:
+    return ERP1Telegram(
+        rorg=RORG.RORG_VLD, telegram_data=data, sender=EURID("01:23:45:67")
+    )
+
+
+def test_telegram_keys():
+    assert _SPEC.telegram_key(0x4) == 0x4
+    assert _SPEC.telegram_key(0xF, 0x02) == (0xF, 0x02)
+    assert _SPEC.selector_values((0xF, 0x02)) == (0xF, 0x02)
+    assert _SPEC.selector_values(0x4) == (0x4, None)
+    assert {(0xF, 0x00), (0xF, 0x01), (0xF, 0x02)} <= set(_SPEC.telegrams)
+
+
+@pytest.mark.parametrize("specialized", [True, False])
+def test_decode_dispatches_on_cmd_and_ecid(specialized):
+    handler = EEPHandler(_SPEC, specialized=specialized)
+    # dimming limits response: I/O 0, MAXV 100 %, MINV 10 %
+    msg = handler.decode(_erp1(bytes([0x0F, 0x02, 0x00, 0x64, 0x0A])))
+    assert msg.message_type.id == (0xF, 0x02)
+    assert "response" in msg.message_type.description
+    assert msg.raw == {"CMD": 0xF, "ECID": 0x02, "I/O": 0, "MAXV": 100, "MINV": 10}
+
+    msg = handler.decode(_erp1(bytes([0x0F, 0x01, 0x00])))
+    assert msg.message_type.id == (0xF, 0x01)
+    assert set(msg.raw) == {"CMD", "ECID", "I/O"}
+
+    # plain commands are unaffected
+    msg = handler.decode(_erp1(bytes([0x03, 0x1E])))
+    assert msg.message_type.id == 0x3
+
+
+def test_extended_keys_do_not_collide_with_plain_commands():
+    # CMD 0 / ECID 1 used to share its key with the plain CMD 1
+    cmd = EEPDataField(id="CMD", name="Command", offset=4, size=4)
+    ecid = EEPDataField(id="ECID", name="Extended command", offset=8, size=8)
+    plain_value = EEPDataField(id="V", name="Value", offset=8, size=8)
+    value = EEPDataField(id="V", name="Value", offset=16, size=8)
+    spec = EEPSpecification(
+        eep=EEP("D2-3F-7F"),
+        name="Test",
+        cmd_size=4,
+        cmd_offset=4,
+        ecid_size=8,
+        ecid_offset=8,
+        telegrams={
+            0x1: EEPTelegram("Plain", [cmd, plain_value]),
+            (0x0, 0x01): EEPTelegram("Extended", [cmd, ecid, value]),
+        },
+    )
+    handler = EEPHandler(spec)
+
+    msg = handler.decode(_erp1(bytes([0x00, 0x01, 42])))
+    assert msg.message_type.id == (0x0, 0x01)
+    assert msg.raw == {"CMD": 0, "ECID": 1, "V": 42}
+
+    msg = handler.decode(_erp1(bytes([0x01, 42])))
+    assert msg.message_type.id == 0x1
+    assert msg.raw == {"CMD": 1, "V": 42}
+
+
+def test_unknown_extended_command_is_rejected(caplog):
+    handler = EEPHandler(_SPEC)
+    with caplog.at_level(logging.DEBUG, logger="enocean_async.eep.handler"):
+        msg = handler.decode(_erp1(bytes([0x0F, 0x07, 0x00, 0x00, 0x00])))
+        # rejected before any field is decoded
+        assert msg.message_type is None
+        assert msg.raw == {} and msg.decoded == {} and msg.values == {}
+        assert "Unknown telegram command 0x0F/0x07" in caplog.text
+
+        msg = handler.decode(_erp1(bytes([0x0F])))  # no ECID
+        assert msg.message_type is None and msg.raw == {}
+        assert "too short" in caplog.text
+
+
+def test_encode_writes_cmd_and_ecid():
+    handler = EEPHandler(_SPEC)
+    message = RawEEPMessage(
+        message_type=EEPMessageType(id=(0xF, 0x00), description=""),
+        raw={"I/O": 0x1E, "MAXV": 90, "MINV": 5},
+        sender=BaseAddress("FF:80:00:01"),
+    )
+    erp1 = handler.encode(message)
+    assert erp1.telegram_data == bytes([0x0F, 0x00, 0xF0, 90, 5])
+    assert handler.decode(erp1).raw == {
+        "CMD": 0xF,
+        "ECID": 0x00,
+        "I/O": 0x1E,
+        "MAXV": 90,
+        "MINV": 5,
+    }
@@ -0,0 +1,80 @@
+"""Tests for send_command(..., confirm=True): correlation of actuator status replies."""
+
+import asyncio
+
+import pytest
+
+from enocean_async.address import EURID, BaseAddress
+from enocean_async.eep import EEP_SPECIFICATIONS, device_type_for_eep
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.eep.message import EEPMessageType, RawEEPMessage
+from enocean_async.gateway import Gateway
+from enocean_async.semantics.instructions.switch import SetSwitchOutput
+
+_SWITCH = EURID("01:23:45:67")
+_SENDER = BaseAddress("FF:80:00:01")
+_D2_01_12 = EEP("D2-01-12")
+
+
+def _status_reply(io: int, ov: int):
+    """ESP3 packet of a D2-01 'Actuator status response' (CMD 4) sent by the switch."""
+    message = RawEEPMessage(
+        sender=_SWITCH,
+        message_type=EEPMessageType(id=0x4, description=""),
+        raw={"I/O": io, "OV": ov},
+    )
+    return EEPHandler(EEP_SPECIFICATIONS[_D2_01_12]).encode(message).to_esp3()
+
+
+def _reply_later(gateway: Gateway, packet, delay: float = 0.01) -> None:
+    asyncio.get_running_loop().call_later(delay, gateway.process_esp3_packet, packet)
+
+
+@pytest.fixture
+def switch_gateway(gateway: Gateway) -> Gateway:
+    gateway.add_device(_SWITCH, device_type_for_eep(_D2_01_12), sender=_SENDER)
+    return gateway
+
+
+async def test_confirmed_by_status_of_same_channel(switch_gateway: Gateway):
+    _reply_later(switch_gateway, _status_reply(io=0, ov=100), delay=0.01)
+    _reply_later(switch_gateway, _status_reply(io=1, ov=100), delay=0.02)
+
+    result = await switch_gateway.send_command(
+        _SWITCH,
+        SetSwitchOutput(100, entity_id="ch2_switch_state"),
+        confirm=True,
+        confirm_timeout=1.0,
+    )
+
+    assert result.confirmation is not None
+    assert result.confirmation.raw["I/O"] == 1
+    assert result.actuation_ms >= 20
+
+
+async def test_all_channels_confirmed_by_any_channel(switch_gateway: Gateway):
+    _reply_later(switch_gateway, _status_reply(io=1, ov=0))
+
+    result = await switch_gateway.send_command(
+        _SWITCH, SetSwitchOutput(0), confirm=True, confirm_timeout=1.0
+    )
+
+    assert result.confirmation is not None
+
+
+async def test_timeout_sends_follow_up_status_query(switch_gateway: Gateway):
+    transport = switch_gateway._Gateway__transport
+
+    result = await switch_gateway.send_command(
+        _SWITCH,
+        SetSwitchOutput(100, entity_id="ch1_switch_state"),
+        confirm=True,
+        confirm_timeout=0.1,
+    )
+
+    assert result.confirmation is None
+    assert result.actuation_ms is None
+    assert len(transport.written) == 2  # command + QueryActuatorStatus
+    assert switch_gateway._Gateway__pending_confirmations == {}
+
@@ -0,0 +1,86 @@
+"""Tests for the gateway's receive path: routing of decoded telegrams to callbacks and observers."""
+
+import asyncio
+
+import pytest
+
+from enocean_async.address import EURID, BaseAddress
+from enocean_async.eep import EEP_SPECIFICATIONS, device_type_for_eep
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.eep.message import EEPMessageType, RawEEPMessage
+from enocean_async.gateway import Gateway
+
+_SWITCH = EURID("01:23:45:67")
+_OTHER = EURID("01:23:45:68")
+_SENDER = BaseAddress("FF:80:00:01")
+_D2_01_12 = EEP("D2-01-12")
+
+
+def _status(sender: EURID, destination: EURID | None = None):
+    """ESP3 packet of a D2-01 'Actuator status response' (CMD 4)."""
+    message = RawEEPMessage(
+        sender=sender,
+        destination=destination,
+        message_type=EEPMessageType(id=0x4, description=""),
+        raw={"I/O": 0, "OV": 100},
+    )
+    return EEPHandler(EEP_SPECIFICATIONS[_D2_01_12]).encode(message).to_esp3()
+
+
+@pytest.fixture
+def switch_gateway(gateway: Gateway) -> Gateway:
+    gateway.add_device(_SWITCH, device_type_for_eep(_D2_01_12), sender=_SENDER)
+    return gateway
+
+
+async def test_filtered_callbacks_added_after_device(switch_gateway: Gateway):
+    matching, unfiltered, other = [], [], []
+    switch_gateway.add_eep_message_received_callback(matching.append, _SWITCH)
+    switch_gateway.add_eep_message_received_callback(unfiltered.append)
+    switch_gateway.add_eep_message_received_callback(other.append, _OTHER)
+
+    switch_gateway.process_esp3_packet(_status(_SWITCH))
+    await asyncio.sleep(0)
+
+    assert len(matching) == 1
+    assert len(unfiltered) == 1
+    assert other == []
+    assert matching[0].sender == _SWITCH
+
+
+async def test_observers_receive_decoded_message(switch_gateway: Gateway):
+    observations = []
+    switch_gateway.add_observation_callback(observations.append)
+
+    switch_gateway.process_esp3_packet(_status(_SWITCH))
+    await asyncio.sleep(0.01)
+
+    assert any(o.entity == "ch1_switch_state" for o in observations)
+
+
+async def test_removed_device_is_not_decoded(switch_gateway: Gateway):
+    messages, failures = [], []
+    switch_gateway.add_eep_message_received_callback(messages.append)
+    switch_gateway.add_parsing_failed_callback(failures.append)
+    switch_gateway.remove_device(_SWITCH)
+
+    switch_gateway.process_esp3_packet(_status(_SWITCH))
+    await asyncio.sleep(0)
+
+    assert messages == []
+    assert len(failures) == 1
+
+
+async def test_unknown_sender_decoded_via_destination(switch_gateway: Gateway):
+    messages, failures = [], []
+    switch_gateway.add_eep_message_received_callback(messages.append)
+    switch_gateway.add_parsing_failed_callback(failures.append)
+
+    switch_gateway.process_esp3_packet(_status(_OTHER, destination=_SWITCH))
+    await asyncio.sleep(0)
+
+    assert len(messages) == 1
+    assert messages[0].sender == _OTHER
+    # the sender itself is not registered, so there are no observers for it
+    assert failures == ["Failed to decode capability: no device."]
@@ -0,0 +1,260 @@
+"""Tests for the gateway send path: adaptive response timeout, retries, encode cache and transmit metrics."""
+
+from enocean_async.address import EURID, BaseAddress
+from enocean_async.eep import device_type_for_eep
+from enocean_async.eep.id import EEP
+import enocean_async.gateway as gateway_module
+from enocean_async.gateway import Gateway
+from enocean_async.metrics import LatencyWindow, erp1_airtime_bytes
+from enocean_async.protocol.esp3.packet import ESP3Packet, ESP3PacketType
+from enocean_async.protocol.esp3.response import ResponseCode
+from enocean_async.semantics.instructions.switch import (
+    QueryActuatorStatus,
+    SetSwitchOutput,
+)
+
+_ERP1 = ESP3Packet(
+    ESP3PacketType.RADIO_ERP1,
+    bytes([0xF6, 0x30, 0xFF, 0x80, 0x00, 0x01, 0x30]),
+    bytes([0x01, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0x00]),
+)
+_COMMON_COMMAND = ESP3Packet(ESP3PacketType.COMMON_COMMAND, bytes([0x08]), b"")
+
+
+def test_latency_window_percentiles():
+    window = LatencyWindow(size=4)
+    assert window.percentile(50) is None
+    for ms in (10.0, 1.0, 4.0, 3.0, 2.0):  # 10.0 falls out of the window
+        window.add(ms)
+    window.add_timeout()
+
+    snapshot = window.snapshot()
+    assert snapshot.count == 4
+    assert snapshot.timeouts == 1
+    assert snapshot.min_ms == 1.0
+    assert snapshot.p50_ms == 2.0
+    assert snapshot.max_ms == 4.0
+    assert snapshot.mean_ms == 2.5
+
+
+async def test_timeout_is_spec_maximum_without_samples(gateway: Gateway):
+    assert gateway.response_timeout(ESP3PacketType.RADIO_ERP1) == 0.5
+
+
+async def test_timeout_adapts_to_measured_latency(gateway: Gateway):
+    for _ in range(20):
+        result = await gateway.send_esp3_packet(_ERP1)
+        assert result.response.return_code == ResponseCode.OK
+        assert result.attempts == 1
+
+    assert gateway.response_latency[ESP3PacketType.RADIO_ERP1].count == 20
+    assert gateway.response_timeout(ESP3PacketType.RADIO_ERP1) < 0.5
+
+
+async def test_timeout_is_fixed_when_adaptive_timeout_disabled(gateway: Gateway):
+    gateway.adaptive_timeout = False
+    for _ in range(20):
+        await gateway.send_esp3_packet(_ERP1)
+    assert gateway.response_timeout(ESP3PacketType.RADIO_ERP1) == 0.5
+
+
+async def test_retry_on_no_free_buffer(gateway: Gateway):
+    transport = gateway._Gateway__transport
+    transport.responses = [ResponseCode.NO_FREE_BUFFER, ResponseCode.OK]
+
+    result = await gateway.send_esp3_packet(_ERP1)
+
+    assert result.response.return_code == ResponseCode.OK
+    assert result.attempts == 2
+    assert len(transport.written) == 2
+
+
+async def test_retries_are_bounded(gateway: Gateway):
+    transport = gateway._Gateway__transport
+    transport.responses = [ResponseCode.NO_FREE_BUFFER] * 5
+    gateway.send_retries = 2
+
+    result = await gateway.send_esp3_packet(_ERP1)
+
+    assert result.response.return_code == ResponseCode.NO_FREE_BUFFER
+    assert result.attempts == 3
+    assert len(transport.written) == 3
+
+
+async def test_retry_on_lost_response(gateway: Gateway):
+    transport = gateway._Gateway__transport
+    transport.responses = [None, ResponseCode.OK]
+
+    result = await gateway.send_esp3_packet(_ERP1)
+
+    assert result.response.return_code == ResponseCode.OK
+    assert result.attempts == 2
+    assert gateway.response_latency[ESP3PacketType.RADIO_ERP1].timeouts == 1
+
+
+async def _train_timeout(gateway: Gateway, packet: ESP3Packet) -> None:
+    """Send fast-answered packets until the adaptive timeout drops to its 50 ms minimum."""
+    for _ in range(20):
+        await gateway.send_esp3_packet(packet)
+    assert gateway.response_timeout(packet.packet_type) == 0.05
+
+
+async def test_late_response_during_back_off_is_used(gateway: Gateway, monkeypatch):
+    await _train_timeout(gateway, _ERP1)
+    transport = gateway._Gateway__transport
+    transport.written.clear()
+    monkeypatch.setattr(gateway_module.random, "uniform", lambda a, b: b)  # 30 ms
+    transport.delays = [0.065]  # after the 50 ms timeout, during the back-off
+
+    result = await gateway.send_esp3_packet(_ERP1)
+
+    assert result.response.return_code == ResponseCode.OK
+    assert result.duration_ms >= 60
+    assert len(transport.written) == 1  # not transmitted again
+
+
+async def test_late_response_is_not_taken_for_the_next_frame(gateway: Gateway):
+    await _train_timeout(gateway, _COMMON_COMMAND)
+    transport = gateway._Gateway__transport
+    # the module answers in order: the first (late) response arrives before the second
+    transport.responses = [ResponseCode.NO_FREE_BUFFER, ResponseCode.OK]
+    transport.delays = [0.07, 0.04]
+
+    first = await gateway.send_esp3_packet(_COMMON_COMMAND)
+    assert first.response is None
+    second = await gateway.send_esp3_packet(_COMMON_COMMAND)
+
+    assert second.response.return_code == ResponseCode.OK
+    assert second.duration_ms >= 35
+    # the late response is a latency sample of its own attempt
+    assert gateway.response_latency[ESP3PacketType.COMMON_COMMAND].max_ms >= 65
+
+
+async def test_lost_response_is_not_taken_from_the_next_frame(gateway: Gateway):
+    await _train_timeout(gateway, _COMMON_COMMAND)
+    transport = gateway._Gateway__transport
+    transport.responses = [None]  # lost
+
+    first = await gateway.send_esp3_packet(_COMMON_COMMAND)
+    assert first.response is None
+    second = await gateway.send_esp3_packet(_COMMON_COMMAND)
+
+    assert second.response.return_code == ResponseCode.OK
+    assert second.attempts == 1
+
+
+async def test_retry_after_lost_response_with_adaptive_timeout(gateway: Gateway):
+    await _train_timeout(gateway, _ERP1)
+    transport = gateway._Gateway__transport
+    transport.written.clear()
+    transport.responses = [None, ResponseCode.OK]
+
+    result = await gateway.send_esp3_packet(_ERP1, retries=1)
+
+    assert result.response.return_code == ResponseCode.OK
+    assert result.attempts == 2
+    assert len(transport.written) == 2
+
+
+async def test_common_commands_are_not_retried_by_default(gateway: Gateway):
+    transport = gateway._Gateway__transport
+    transport.responses = [ResponseCode.NO_FREE_BUFFER]
+
+    result = await gateway.send_esp3_packet(_COMMON_COMMAND)
+
+    assert result.response.return_code == ResponseCode.NO_FREE_BUFFER
+    assert result.attempts == 1
+
+
+# ---------------------------------------------------------------------------
+# encode cache
+# ---------------------------------------------------------------------------
+
+_SWITCH = EURID("01:23:45:67")
+_SENDER = BaseAddress("FF:80:00:01")
+
+
+def _add_switch(gateway: Gateway) -> None:
+    gateway.add_device(_SWITCH, device_type_for_eep(EEP("D2-01-12")), sender=_SENDER)
+
+
+async def test_repeated_instruction_is_served_from_encode_cache(gateway: Gateway):
+    _add_switch(gateway)
+    transport = gateway._Gateway__transport
+
+    await gateway.send_command(_SWITCH, SetSwitchOutput(100, entity_id="ch1_switch_state"))
+    await gateway.send_command(_SWITCH, SetSwitchOutput(100, entity_id="ch1_switch_state"))
+    await gateway.send_command(_SWITCH, SetSwitchOutput(0, entity_id="ch1_switch_state"))
+
+    stats = gateway.encode_cache_stats
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+    assert transport.written[0] == transport.written[1]
+    assert transport.written[0] != transport.written[2]
+
+
+async def test_encode_cache_is_invalidated_on_config_change(gateway: Gateway):
+    _add_switch(gateway)
+
+    await gateway.send_command(_SWITCH, QueryActuatorStatus())
+    gateway.set_device_config(_SWITCH, "local_control", True)
+    await gateway.send_command(_SWITCH, QueryActuatorStatus())
+
+    stats = gateway.encode_cache_stats
+    assert (stats.hits, stats.misses) == (0, 2)
+
+
+async def test_encode_cache_is_bounded(gateway: Gateway):
+    _add_switch(gateway)
+    gateway.encode_cache_size = 2
+
+    for value in (10, 20, 30):
+        await gateway.send_command(_SWITCH, SetSwitchOutput(value))
+
+    assert gateway.encode_cache_stats.size == 2
+
+
+# ---------------------------------------------------------------------------
+# transmit metrics
+# ---------------------------------------------------------------------------
+
+
+async def test_transmit_metrics_per_device_and_sender(gateway: Gateway):
+    _add_switch(gateway)
+    transport = gateway._Gateway__transport
+    transport.responses = [ResponseCode.OK, None, None, None, ResponseCode.OK]
+    gateway.send_retries = 2
+
+    await gateway.send_command(_SWITCH, QueryActuatorStatus())  # OK
+    await gateway.send_command(_SWITCH, QueryActuatorStatus())  # 3 timeouts
+    await gateway.send_esp3_packet(_COMMON_COMMAND)  # OK, not ERP1
+
+    metrics = gateway.transmit_metrics
+    assert metrics.total.sent == 3
+    assert metrics.total.timeouts == 1
+    assert metrics.total.response_codes == {ResponseCode.OK: 2}
+    assert sum(metrics.total.latency_buckets) == 2
+
+    device_stats = metrics.by_device[_SWITCH]
+    assert (device_stats.sent, device_stats.attempts, device_stats.timeouts) == (2, 4, 1)
+    assert device_stats.airtime_bytes > 0
+    assert metrics.by_sender[_SENDER].sent == 2
+
+
+async def test_airtime_counts_only_transmitted_attempts(gateway: Gateway):
+    transport = gateway._Gateway__transport
+    # rejected attempts never reach the air; lost responses may have been transmitted
+    transport.responses = [ResponseCode.NO_FREE_BUFFER, None, ResponseCode.OK]
+
+    result = await gateway.send_esp3_packet(_ERP1, retries=2)
+
+    assert result.attempts == 3
+    single = erp1_airtime_bytes(len(_ERP1.data), _ERP1.optional[0])
+    assert gateway.transmit_metrics.total.airtime_bytes == 2 * single
+
+
+async def test_transmit_diagnostic_entities_are_optional(gateway: Gateway):
+    ids = {e.id for e in gateway.gateway_entities}
+    assert "send_latency" not in ids
+    gateway.transmit_diagnostics = True
+    ids = {e.id for e in gateway.gateway_entities}
+    assert {"send_latency", "send_failures", "airtime"} <= ids
@@ -0,0 +1,88 @@
+"""Tests for the precompiled telegram packers used by EEPHandler.encode."""
+
+import random
+
+import pytest
+
+from enocean_async.address import BaseAddress
+from enocean_async.eep import EEP_SPECIFICATIONS
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.message import EEPMessageType, RawEEPMessage
+from enocean_async.eep.packer import TelegramPacker
+from enocean_async.eep.profile import EEPDataField, EEPTelegram
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+
+
+def _reference_pack(spec, cmd_value: int, raw: dict[str, int]) -> bytes:
+    """Field-by-field encoding via ERP1Telegram.set_bitstring_raw_value."""
+    telegram_def = spec.telegrams[cmd_value]
+    erp1 = ERP1Telegram(
+        rorg=RORG(spec.eep.rorg),
+        telegram_data=bytes(telegram_def.byte_size),
+        sender=BaseAddress("FF:80:00:01"),
+    )
+    for f in telegram_def.datafields:
+        erp1.set_bitstring_raw_value(f.offset, f.size, raw.get(f.id, 0))
+    cmd, ecid = spec.selector_values(cmd_value)
+    if spec.cmd_size > 0 and spec.cmd_offset is not None:
+        offset = (
+            spec.cmd_offset
+            if spec.cmd_offset >= 0
+            else telegram_def.byte_size * 8 + spec.cmd_offset
+        )
+        erp1.set_bitstring_raw_value(offset, spec.cmd_size, cmd)
+    if ecid is not None:
+        erp1.set_bitstring_raw_value(spec.ecid_offset, spec.ecid_size, ecid)
+    return erp1.telegram_data
+
+
+@pytest.mark.parametrize("eep", list(EEP_SPECIFICATIONS), ids=str)
+def test_packer_matches_field_by_field_encoding(eep):
+    spec = EEP_SPECIFICATIONS[eep]
+    handler = EEPHandler(spec)
+    rng = random.Random(str(eep))
+
+    for cmd_value, telegram_def in spec.telegrams.items():
+        for _ in range(5):
+            raw = {
+                f.id: rng.randrange(1 << f.size)
+                for f in telegram_def.datafields
+                if rng.random() < 0.9
+            }
+            message = RawEEPMessage(
+                message_type=EEPMessageType(id=cmd_value, description=""),
+                raw=raw,
+                sender=BaseAddress("FF:80:00:01"),
+            )
+            assert handler.encode(message).telegram_data == _reference_pack(
+                spec, cmd_value, raw
+            )
+
+
+def test_pack_rejects_out_of_range_value():
+    packer = TelegramPacker(
+        EEPTelegram("t", [EEPDataField(id="A", name="A", offset=0, size=4)])
+    )
+    with pytest.raises(ValueError):
+        packer.pack({"A": 16})
+
+
+def test_field_not_fitting_into_telegram_is_rejected_at_compile_time():
+    telegram = EEPTelegram("t", [EEPDataField(id="A", name="A", offset=4, size=8)])
+    with pytest.raises(ValueError):
+        TelegramPacker(telegram, cmd_size=4, cmd_offset=16)
+
+
+def test_pack_many():
+    packer = TelegramPacker(
+        EEPTelegram(
+            "t",
+            [
+                EEPDataField(id="A", name="A", offset=0, size=4),
+                EEPDataField(id="B", name="B", offset=4, size=12),
+            ],
+        )
+    )
+    assert packer.byte_size == 2
+    assert packer.pack_many([{"A": 1, "B": 2}, {"B": 0xFFF}]) == [b"\x10\x02", b"\x0f\xff"]
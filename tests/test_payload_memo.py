@@ -0,0 +1,110 @@
+"""Tests for the per-device memo that reuses the decode result of unchanged telegram data."""
+
+import asyncio
+
+import pytest
+
+from enocean_async.address import EURID
+from enocean_async.eep import EEP_SPECIFICATIONS, device_type_for_eep
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.gateway import Gateway
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+
+_SENSOR = EURID("01:23:45:67")
+_A5_02_05 = EEP("A5-02-05")
+
+
+def _esp3(temperature: int = 0x80, rssi: int = 0x40):
+    return ERP1Telegram(
+        rorg=RORG.RORG_4BS,
+        telegram_data=bytes([0x00, 0x00, temperature, 0x08]),
+        sender=_SENSOR,
+        rssi=rssi,
+    ).to_esp3()
+
+
+@pytest.fixture
+def sensor_gateway(gateway: Gateway, monkeypatch) -> tuple[Gateway, list]:
+    """Gateway that records the telegram data of every decode."""
+    gateway.repeat_filter.ttl = 0  # identical telegrams are not repeated copies here
+    decodes = []
+    decode = EEPHandler.decode
+
+    def spy(self, telegram, config=None, fields=None):
+        decodes.append(telegram.telegram_data)
+        return decode(self, telegram, config, fields)
+
+    monkeypatch.setattr(EEPHandler, "decode", spy)
+    return gateway, decodes
+
+
+async def _receive(gateway: Gateway, *packets) -> None:
+    for packet in packets:
+        gateway.process_esp3_packet(packet)
+    await asyncio.sleep(0.01)
+
+
+async def test_unchanged_payload_is_decoded_once(sensor_gateway):
+    gateway, decodes = sensor_gateway
+    messages = []
+    gateway.add_eep_message_received_callback(messages.append)
+    gateway.add_device(_SENSOR, device_type_for_eep(_A5_02_05))
+
+    await _receive(gateway, _esp3(rssi=0x40), _esp3(rssi=0x50), _esp3(rssi=0x60))
+
+    assert len(decodes) == 1
+    assert [m.rssi for m in messages] == [0x40, 0x50, 0x60]
+    first, second, _ = messages
+    assert second is not first
+    assert second.decoded == first.decoded and second.values == first.values
+    assert second.decoded is not first.decoded
+    assert second.message_type == first.message_type
+
+
+async def test_changed_payload_or_config_is_decoded_again(sensor_gateway):
+    gateway, decodes = sensor_gateway
+    messages = []
+    gateway.add_eep_message_received_callback(messages.append)
+    gateway.add_device(_SENSOR, device_type_for_eep(_A5_02_05))
+
+    await _receive(gateway, _esp3(0x80), _esp3(0x81), _esp3(0x81))
+    assert len(decodes) == 2
+    assert messages[1].decoded["TMP"].value != messages[0].decoded["TMP"].value
+
+    gateway.set_device_config(_SENSOR, "sender_slot", "auto")
+    await _receive(gateway, _esp3(0x81))
+    assert len(decodes) == 3
+
+
+async def test_reuse_can_be_disabled_per_eep(sensor_gateway, monkeypatch):
+    gateway, decodes = sensor_gateway
+    gateway.add_eep_message_received_callback(lambda _: None)
+    spec = EEP_SPECIFICATIONS[_A5_02_05]
+    monkeypatch.setattr(spec, "reuse_unchanged_payloads", False)
+    gateway.add_device(_SENSOR, device_type_for_eep(_A5_02_05))
+
+    await _receive(gateway, _esp3(), _esp3())
+    assert len(decodes) == 2
+
+
+async def test_partial_decode_is_not_reused_for_full_decode(sensor_gateway):
+    gateway, decodes = sensor_gateway
+    gateway.add_device(_SENSOR, device_type_for_eep(EEP("A5-04-01")))
+    gateway.add_observation_callback(lambda _: None)
+    data = bytes([0x00, 0x80, 0x40, 0x0A])
+
+    def esp3():
+        return ERP1Telegram(
+            rorg=RORG.RORG_4BS, telegram_data=data, sender=_SENSOR
+        ).to_esp3()
+
+    await _receive(gateway, esp3(), esp3())
+    assert len(decodes) == 1  # observable fields only
+
+    full = []
+    gateway.add_eep_message_received_callback(full.append, sender_filter=_SENSOR)
+    await _receive(gateway, esp3(), esp3())
+    assert len(decodes) == 2
+    assert set(full[0].decoded) == set(full[1].decoded) == {"HUM", "TMP", "TSN"}
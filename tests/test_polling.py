@@ -0,0 +1,67 @@
+"""Tests for the PollScheduler."""
+
+import asyncio
+
+from enocean_async.address import EURID, BaseAddress
+from enocean_async.eep import device_type_for_eep
+from enocean_async.eep.id import EEP
+from enocean_async.eep.message import EEPMessage
+from enocean_async.gateway import Gateway
+from enocean_async.polling import PollScheduler
+from enocean_async.semantics.instructions.switch import QueryActuatorStatus
+
+_SENDER = BaseAddress("FF:80:00:01")
+_EEP = EEP("D2-01-12")
+
+
+def _add_switches(gateway: Gateway, n: int) -> list[EURID]:
+    addresses = [EURID(0x01000000 + i) for i in range(n)]
+    for address in addresses:
+        gateway.add_device(address, device_type_for_eep(_EEP), sender=_SENDER)
+    return addresses
+
+
+async def test_polls_are_spread_and_rate_capped(gateway: Gateway):
+    devices = _add_switches(gateway, 5)
+    scheduler = PollScheduler(gateway, max_rate=50.0)
+    for device in devices:
+        scheduler.add(device, QueryActuatorStatus(), interval=0.1)
+
+    scheduler.start()
+    await asyncio.sleep(0.25)
+    await scheduler.stop()
+
+    polls = sum(job.polls for job in scheduler.jobs)
+    assert all(job.polls >= 1 for job in scheduler.jobs)
+    assert polls <= 0.25 * 50 + 1
+    assert len(gateway._Gateway__transport.written) == polls
+
+
+async def test_spontaneous_report_postpones_poll(gateway: Gateway):
+    (device,) = _add_switches(gateway, 1)
+    scheduler = PollScheduler(gateway)
+    job = scheduler.add(device, QueryActuatorStatus(), interval=0.2)
+
+    # the gateway forwards decoded messages to the scheduler's callback
+    for cb in gateway._Gateway__eep_receive_callbacks:
+        cb.callback(EEPMessage(sender=device, eep=_EEP))
+
+    scheduler.start()
+    await asyncio.sleep(0.15)
+    await scheduler.stop()
+
+    assert job.polls == 0
+
+
+async def test_removed_job_is_not_polled(gateway: Gateway):
+    (device,) = _add_switches(gateway, 1)
+    scheduler = PollScheduler(gateway)
+    scheduler.add(device, QueryActuatorStatus(), interval=0.05)
+    scheduler.remove(device)
+
+    scheduler.start()
+    await asyncio.sleep(0.1)
+    await scheduler.stop()
+
+    assert scheduler.jobs == []
+    assert gateway._Gateway__transport.written == []
@@ -0,0 +1,140 @@
+"""Tests for the per-sender rate limiting of received telegrams."""
+
+import asyncio
+
+import pytest
+
+from enocean_async import ratelimit
+from enocean_async.address import EURID
+from enocean_async.eep import device_type_for_eep
+from enocean_async.eep.id import EEP
+from enocean_async.gateway import Gateway
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+from enocean_async.ratelimit import FloodState, SenderRateLimiter
+from enocean_async.semantics.observable import Observable
+
+_SENSOR = EURID("01:23:45:67")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for ``time.monotonic`` in the ratelimit module."""
+    now = [1000.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_disabled_by_default():
+    limiter = SenderRateLimiter()
+    assert all(limiter.allow(1) for _ in range(1000))
+    assert limiter.stats(1) is None
+
+
+def test_burst_then_rate(clock):
+    limiter = SenderRateLimiter(rate=2.0, burst=3)
+    assert [limiter.allow(1) for _ in range(4)] == [True, True, True, False]
+    assert limiter.state(1) is FloodState.LIMITED
+    assert limiter.allow(2)  # other senders are not affected
+
+    clock[0] += 0.5  # one token refilled
+    assert limiter.allow(1)
+    assert not limiter.allow(1)
+
+    clock[0] += 2.0  # bucket full again: episode over
+    assert limiter.allow(1)
+    assert limiter.state(1) is FloodState.OK
+    stats = limiter.stats(1)
+    assert (stats.passed, stats.dropped, stats.suppressed) == (5, 2, 0)
+
+
+def test_quarantine_until_quiet(clock):
+    limiter = SenderRateLimiter(rate=1.0, burst=2, quarantine_after=3)
+    for _ in range(5):
+        limiter.allow(1)
+    assert limiter.state(1) is FloodState.QUARANTINED
+    assert limiter.stats(1).quarantines == 1
+
+    clock[0] += 1.0  # tokens available, but still quarantined
+    assert not limiter.allow(1)
+    assert limiter.stats(1).suppressed == 1
+
+    clock[0] += 5.0
+    assert limiter.allow(1)
+    assert limiter.state(1) is FloodState.OK
+
+
+def test_release_and_forget(clock):
+    limiter = SenderRateLimiter(rate=1.0, burst=1, quarantine_after=1)
+    limiter.allow(1)
+    limiter.allow(1)
+    assert limiter.state(_SENSOR) is FloodState.OK
+    assert limiter.state(1) is FloodState.QUARANTINED
+    limiter.release(1)
+    assert limiter.allow(1)
+    limiter.forget(1)
+    assert limiter.stats(1) is None
+
+
+def test_idle_senders_are_pruned(clock):
+    limiter = SenderRateLimiter(rate=1.0, burst=1, max_senders=2)
+    limiter.allow(1)
+    clock[0] += 5.0
+    limiter.allow(2)
+    limiter.allow(3)
+    assert limiter.stats(1) is None
+    assert limiter.stats(2) is not None
+    assert limiter.stats(3) is not None
+
+
+def _temperature():
+    return ERP1Telegram(
+        rorg=RORG.RORG_4BS, telegram_data=b"\x00\x00\x80\x08", sender=_SENSOR
+    ).to_esp3()
+
+
+async def test_gateway_drops_flooding_sender(gateway: Gateway):
+    gateway.add_device(_SENSOR, device_type_for_eep(EEP("A5-02-05")))
+    gateway.rate_limiter.rate = 1.0
+    gateway.rate_limiter.burst = 2
+    received, observations = [], []
+    gateway.add_erp1_received_callback(received.append)
+    gateway.add_observation_callback(observations.append)
+
+    for _ in range(5):
+        gateway.process_esp3_packet(_temperature())
+    await asyncio.sleep(0.01)
+
+    assert len(received) == 2
+    assert gateway.rate_limiter.stats(_SENSOR).dropped == 3
+    flood_states = [
+        o.values[Observable.FLOOD_STATE]
+        for o in observations
+        if o.entity == "flood_state"
+    ]
+    assert flood_states == ["limited"]  # reported once per state change
+    entity_ids = {e.id for e in gateway.device_spec(_SENSOR).entities}
+    assert {"telegrams_dropped", "flood_state"} <= entity_ids
+
+
+async def test_quarantined_sender_keeps_metadata_counting(gateway: Gateway):
+    gateway.add_device(_SENSOR, device_type_for_eep(EEP("A5-02-05")))
+    gateway.rate_limiter.rate = 1.0
+    gateway.rate_limiter.burst = 2
+    gateway.rate_limiter.quarantine_after = 1
+    observations = []
+    gateway.add_observation_callback(observations.append)
+
+    for _ in range(5):
+        gateway.process_esp3_packet(_temperature())
+    await asyncio.sleep(0.01)
+
+    assert gateway.rate_limiter.state(_SENSOR) is FloodState.QUARANTINED
+    counts = [
+        o.values[Observable.TELEGRAM_COUNT]
+        for o in observations
+        if o.entity == "telegram_count"
+    ]
+    assert counts[-1] == 5
+    # only the telegrams within the rate limit are decoded
+    assert sum(Observable.TEMPERATURE in o.values for o in observations) == 2
@@ -0,0 +1,173 @@
+"""Tests for change-only reporting of scalar observations (ReportPolicy, Deadband)."""
+
+import asyncio
+
+import pytest
+
+from enocean_async.address import EURID
+from enocean_async.eep import device_type_for_eep
+from enocean_async.eep.id import EEP
+from enocean_async.eep.message import EEPMessage, ValueWithContext
+from enocean_async.gateway import Gateway
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+from enocean_async.semantics.observable import Observable
+from enocean_async.semantics.observers import scalar
+from enocean_async.semantics.observers.scalar import ScalarObserver
+from enocean_async.semantics.reporting import Deadband, ReportPolicy
+
+_DEVICE = EURID("01:23:45:67")
+
+
+def test_deadband():
+    assert Deadband().suppresses(21.0, 21.0)
+    assert not Deadband().suppresses(21.0, 21.1)
+    assert Deadband(absolute=0.5).suppresses(21.0, 21.4)
+    assert not Deadband(absolute=0.5).suppresses(21.0, 20.5)
+    assert Deadband(relative=0.01).suppresses(1000, 1009)
+    assert not Deadband(relative=0.01).suppresses(1000, 1010)
+    # non-numeric values are reported on any change
+    assert Deadband(absolute=5).suppresses("on", "on")
+    assert not Deadband(absolute=5).suppresses("on", "off")
+    assert not Deadband(absolute=5).suppresses(True, False)
+
+
+def _message(value, io: int | None = None) -> EEPMessage:
+    return EEPMessage(
+        sender=_DEVICE,
+        raw={} if io is None else {"I/O": io},
+        values={Observable.TEMPERATURE: ValueWithContext(value=value)},
+    )
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(scalar, "time", lambda: now[0])
+    return now
+
+
+async def _decode(observer: ScalarObserver, *values, io=None) -> None:
+    for value in values:
+        observer.decode(_message(value, io))
+    await asyncio.sleep(0)
+
+
+async def test_observer_reports_changes_beyond_deadband(clock):
+    received = []
+    observer = ScalarObserver(
+        device_address=_DEVICE,
+        on_observation=received.append,
+        observable=Observable.TEMPERATURE,
+        report_policy=ReportPolicy(enabled=True),
+    )
+    await _decode(observer, 21.0, 21.0, 21.05, 21.09, 21.1, 21.15, 20.9)
+    # changes are measured against the last reported value
+    assert [o.values[Observable.TEMPERATURE] for o in received] == [21.0, 21.1, 20.9]
+
+
+async def test_observer_reports_every_telegram_while_disabled(clock):
+    received = []
+    observer = ScalarObserver(
+        device_address=_DEVICE,
+        on_observation=received.append,
+        observable=Observable.TEMPERATURE,
+        report_policy=ReportPolicy(),
+    )
+    await _decode(observer, 21.0, 21.0, 21.0)
+    assert len(received) == 3
+
+
+async def test_max_silence_forces_refresh(clock):
+    received = []
+    observer = ScalarObserver(
+        device_address=_DEVICE,
+        on_observation=received.append,
+        observable=Observable.TEMPERATURE,
+        report_policy=ReportPolicy(enabled=True, max_silence=600),
+    )
+    await _decode(observer, 21.0)
+    clock[0] += 599
+    await _decode(observer, 21.0)
+    clock[0] += 1
+    await _decode(observer, 21.0)
+    clock[0] += 599
+    await _decode(observer, 21.0)
+    assert [o.timestamp for o in received] == [1000.0, 1600.0]
+
+
+async def test_entities_are_tracked_separately(clock):
+    received = []
+    observer = ScalarObserver(
+        device_address=_DEVICE,
+        on_observation=received.append,
+        observable=Observable.TEMPERATURE,
+        entity_id_field="I/O",
+        entity_id_prefix="ch",
+        entity_id_offset=1,
+        report_policy=ReportPolicy(enabled=True),
+    )
+    await _decode(observer, 21.0, io=0)
+    await _decode(observer, 21.0, io=1)
+    await _decode(observer, 21.0, io=0)
+    assert [o.entity for o in received] == ["ch1", "ch2"]
+
+
+async def test_device_config_overrides(clock):
+    received = []
+    config = {"temperature_deadband": 1.0, "report_max_silence": 0}
+    observer = ScalarObserver(
+        device_address=_DEVICE,
+        on_observation=received.append,
+        observable=Observable.TEMPERATURE,
+        report_policy=ReportPolicy(enabled=True, max_silence=60),
+        device_config=config,
+    )
+    await _decode(observer, 21.0, 21.5)
+    clock[0] += 3600
+    await _decode(observer, 21.9, 22.0)
+    assert [o.values[Observable.TEMPERATURE] for o in received] == [21.0, 22.0]
+
+    policy = ReportPolicy(deadbands={Observable.TEMPERATURE: Deadband(relative=0.1)})
+    assert policy.deadband(Observable.TEMPERATURE, {"temperature_deadband": 5}) == (
+        Deadband(relative=0.05)
+    )
+
+
+def _esp3(temperature: int):
+    return ERP1Telegram(
+        rorg=RORG.RORG_4BS,
+        telegram_data=bytes([0x00, 0x00, temperature, 0x08]),
+        sender=_DEVICE,
+    ).to_esp3()
+
+
+async def test_gateway_report_policy(gateway: Gateway):
+    assert not gateway.report_policy.enabled
+    gateway.add_device(_DEVICE, device_type_for_eep(EEP("A5-02-05")))
+    ids = {e.id for e in gateway.device_spec(_DEVICE).entities}
+    assert "report_max_silence" not in ids
+
+    gateway.report_policy.enabled = True
+    gateway.repeat_filter.ttl = 0
+    entities = {e.id: e for e in gateway.device_spec(_DEVICE).entities}
+    assert entities["temperature_deadband"].config_spec.default == 0.1
+    assert entities["temperature_deadband"].config_spec.unit == "°C"
+    assert entities["report_max_silence"].config_spec.default == 3600.0
+
+    observations = []
+    gateway.add_observation_callback(observations.append)
+    # A5-02-05: 0..40 °C over raw 255..0, i.e. about 0.157 °C per step
+    for raw in (0x80, 0x80, 0x7F, 0x7F):
+        gateway.process_esp3_packet(_esp3(raw))
+    gateway.set_device_config(_DEVICE, "temperature_deadband", 1.0)
+    for raw in (0x7E, 0x7D, 0x70):
+        gateway.process_esp3_packet(_esp3(raw))
+    await asyncio.sleep(0.01)
+
+    temperatures = [
+        round(o.values[Observable.TEMPERATURE], 2)
+        for o in observations
+        if o.entity == "temperature"
+    ]
+    assert temperatures == [19.92, 20.08, 22.43]
@@ -0,0 +1,172 @@
+"""Tests for the precompiled field extraction and scaling used by EEPHandler.decode."""
+
+import random
+
+import pytest
+
+from enocean_async.address import EURID
+from enocean_async.eep import EEP_SPECIFICATIONS
+from enocean_async.eep.handler import EEPHandler
+from enocean_async.eep.id import EEP
+from enocean_async.eep.profile import EEPDataField, EEPTelegram
+from enocean_async.eep.unpacker import TelegramUnpacker
+from enocean_async.protocol.erp1.rorg import RORG
+from enocean_async.protocol.erp1.telegram import ERP1Telegram
+
+
+def _reference_decode(telegram_def: EEPTelegram, erp1: ERP1Telegram) -> dict:
+    """Field-by-field decoding via ERP1Telegram.bitstring_raw_value / bitstring_scaled_value."""
+    raw = {
+        f.id: erp1.bitstring_raw_value(offset=f.offset, size=f.size)
+        for f in telegram_def.datafields
+    }
+    decoded = {}
+    for f in telegram_def.datafields:
+        if f.range_enum is not None:
+            value = f.range_enum.get(raw[f.id], f"Unknown({raw[f.id]})")
+        else:
+            value = erp1.bitstring_scaled_value(
+                offset=f.offset,
+                size=f.size,
+                range_min=f.range_min,
+                range_max=f.range_max,
+                scale_min=f.scale_min_fn(raw),
+                scale_max=f.scale_max_fn(raw),
+            )
+        decoded[f.id] = (value, f.unit_fn(raw) or None)
+    return decoded
+
+
+@pytest.mark.parametrize("eep", list(EEP_SPECIFICATIONS), ids=str)
+def test_decode_matches_field_by_field_decoding(eep):
+    spec = EEP_SPECIFICATIONS[eep]
+    handler = EEPHandler(spec)
+    rng = random.Random(str(eep))
+
+    for cmd_value, telegram_def in spec.telegrams.items():
+        packer = handler.packer(cmd_value)
+        for _ in range(5):
+            raw = {f.id: rng.randrange(1 << f.size) for f in telegram_def.datafields}
+            erp1 = ERP1Telegram(
+                rorg=RORG(spec.eep.rorg),
+                telegram_data=packer.pack(raw),
+                sender=EURID("01:23:45:67"),
+            )
+            try:
+                expected = _reference_decode(telegram_def, erp1)
+            except ValueError:
+                with pytest.raises(ValueError):
+                    handler.decode(erp1)
+                continue
+
+            message = handler.decode(erp1)
+            if message.message_type is None or message.message_type.id != cmd_value:
+                continue  # another telegram type claims these CMD bits
+            assert {
+                field_id: (v.value, v.unit) for field_id, v in message.decoded.items()
+            } == expected
+
+
+def test_unpacker_handles_longer_telegram_data():
+    telegram = EEPTelegram(
+        name=None,
+        datafields=[
+            EEPDataField(id="A", name="A", offset=0, size=4),
+            EEPDataField(id="B", name="B", offset=4, size=8),
+        ],
+    )
+    unpacker = TelegramUnpacker(telegram)
+    assert unpacker.unpack(b"\xab\xcd") == {"A": 0xA, "B": 0xBC}
+    assert unpacker.unpack(b"\xab\xcd\xef") == {"A": 0xA, "B": 0xBC}
+    with pytest.raises(ValueError):
+        unpacker.unpack(b"\xab")
+
+
+def test_constant_and_dependent_scaling_are_equivalent():
+    constant = EEPDataField(
+        id="T",
+        name="T",
+        offset=0,
+        size=8,
+        range_min=255,
+        range_max=0,
+        scale_min_fn=lambda _: -40.0,
+        scale_max_fn=lambda _: 0.0,
+        unit_fn=lambda _: "°C",
+    )
+    dependent = EEPDataField(
+        id="T",
+        name="T",
+        offset=0,
+        size=8,
+        range_min=255,
+        range_max=0,
+        scale_min_fn=lambda raw: -40.0 if raw.get("X", 0) == 0 else 0.0,
+        scale_max_fn=lambda _: 0.0,
+        unit_fn=lambda raw: "°C" if raw.get("X", 0) == 0 else "",
+    )
+    for raw in (0, 100, 255):
+        assert constant.scaled_value(raw, {"T": raw}) == dependent.scaled_value(
+            raw, {"T": raw}
+        )
+    assert constant.unit_for({}) == dependent.unit_for({}) == "°C"
+    assert dependent.unit_for({"X": 1}) is None
+
+    invalid = EEPDataField(
+        id="T", name="T", offset=0, size=8, scale_max_fn=lambda _: -1.0
+    )
+    with pytest.raises(ValueError):
+        invalid.scaled_value(1, {})
+
+
+def test_value_tables_match_scaled_values():
+    for spec in EEP_SPECIFICATIONS.values():
+        for telegram_def in spec.telegrams.values():
+            for f in telegram_def.datafields:
+                table = f.value_table
+                if table is None:
+                    continue
+                assert f.size <= 8
+                assert len(table) == 1 << f.size
+                for raw, entry in enumerate(table):
+                    if f.range_enum is not None:
+                        value = f.range_enum.get(raw, f"Unknown({raw})")
+                    else:
+                        value = f.scaled_value(raw, {})
+                    assert entry == (value, f.unit_for({}), f.name or f.id)
+
+
+def test_value_table_only_for_narrow_constant_fields():
+    mr = next(
+        f
+        for f in EEP_SPECIFICATIONS[EEP("A5-12-01")].telegrams[0].datafields
+        if f.id == "MR"
+    )
+    assert mr.value_table is None  # scale depends on DIV
+
+    wide = EEPDataField(id="W", name="W", offset=0, size=10)
+    assert wide.value_table is None
+
+    dependent_unit = EEPDataField(
+        id="E",
+        name="E",
+        offset=0,
+        size=1,
+        range_enum={0: "a", 1: "b"},
+        unit_fn=lambda raw: "x" if raw["F"] else "",
+    )
+    assert dependent_unit.value_table is None
+
+    invalid = EEPDataField(
+        id="I", name="I", offset=0, size=8, scale_max_fn=lambda _: -1.0
+    )
+    assert invalid.value_table is None
+
+    narrow = EEPDataField(id="N", name="", offset=0, size=2, range_enum={0: "off"})
+    assert narrow.value_table == (
+        ("off", None, "N"),
+        ("Unknown(1)", None, "N"),
+        ("Unknown(2)", None, "N"),
+        ("Unknown(3)", None, "N"),
+    )
+    assert narrow.value_table is narrow.value_table  # built once